@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 import json
 import logging
 import warnings
@@ -77,6 +78,9 @@ class AssistantAgentConfig(BaseModel):
     tool_call_summary_format: str
     metadata: Dict[str, str] | None = None
     structured_message_factory: ComponentModel | None = None
+    stream_tool_call_results: bool = False
+    max_concurrent_tool_calls: int | None = None
+    speculative_tool_execution: bool = False
 
 
 class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
@@ -136,6 +140,13 @@ class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
         - `reflect_on_tool_use` is set to `True` by default when `output_content_type` is set.
         - `reflect_on_tool_use` is set to `False` by default when `output_content_type` is not set.
     * If the model returns multiple tool calls, they will be executed concurrently. To disable parallel tool calls you need to configure the model client. For example, set `parallel_tool_calls=False` for :class:`~autogen_ext.models.openai.OpenAIChatCompletionClient` and :class:`~autogen_ext.models.openai.AzureOpenAIChatCompletionClient`.
+      Use `max_concurrent_tool_calls` to limit how many of them run at the same time.
+    * By default, a single :class:`~autogen_agentchat.messages.ToolCallExecutionEvent` with all the results is yielded after every tool call has completed.
+      When `stream_tool_call_results` is True, a :class:`~autogen_agentchat.messages.ToolCallExecutionEvent` with a single result is yielded as soon as each tool call completes,
+      so the results of fast tools do not wait for the slowest one. The results are added to the model context in the order of the tool calls in both cases.
+    * When `speculative_tool_execution` is True, a tool call starts as soon as the model client has streamed its arguments, so tool latency overlaps with
+      the rest of the model response. A started tool call that is not part of the final model response is cancelled as soon as the response is complete,
+      but it may already have run by then. Only enable speculation for tools without side effects.
 
     .. tip::
         By default, the tool call results are returned as response when tool calls are made.
@@ -208,6 +219,15 @@ class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
             For example, `"{tool_name}: {result}"` will create a summary like `"tool_name: result"`.
         memory (Sequence[Memory] | None, optional): The memory store to use for the agent. Defaults to `None`.
         metadata (Dict[str, str] | None, optional): Optional metadata for tracking.
+        stream_tool_call_results (bool, optional): If `True`, a :class:`~autogen_agentchat.messages.ToolCallExecutionEvent` is yielded for each tool call
+            as soon as it completes, instead of a single event after all tool calls have completed. Defaults to `False`.
+        max_concurrent_tool_calls (int | None, optional): The maximum number of tool calls of a model response executed at the same time.
+            Defaults to `None`, meaning all tool calls are executed concurrently.
+        speculative_tool_execution (bool, optional): If `True`, each tool call is started as soon as its arguments have been streamed,
+            while the rest of the model response is still streaming. Requires `model_client_stream` to be `True` and a model client
+            whose `create_stream` method accepts an `on_function_call` callback, such as :class:`~autogen_ext.models.openai.OpenAIChatCompletionClient`.
+            Only safe for tools without side effects, since a tool call that is not part of the final model response may already have run.
+            Defaults to `False`.
 
     Raises:
         ValueError: If tool names are not unique.
@@ -656,8 +676,18 @@ def __init__(
         output_content_type_format: str | None = None,
         memory: Sequence[Memory] | None = None,
         metadata: Dict[str, str] | None = None,
+        stream_tool_call_results: bool = False,
+        max_concurrent_tool_calls: int | None = None,
+        speculative_tool_execution: bool = False,
     ):
         super().__init__(name=name, description=description)
+        if max_concurrent_tool_calls is not None and max_concurrent_tool_calls < 1:
+            raise ValueError("max_concurrent_tool_calls must be at least 1.")
+        if speculative_tool_execution:
+            if not model_client_stream:
+                raise ValueError("Speculative tool execution requires model_client_stream to be True.")
+            if "on_function_call" not in inspect.signature(model_client.create_stream).parameters:
+                raise ValueError("The model client does not support streaming function calls.")
         self._metadata = metadata or {}
         self._model_client = model_client
         self._model_client_stream = model_client_stream
@@ -730,8 +760,10 @@ def __init__(
             if self._tools:
                 raise ValueError("Tools cannot be used with a workbench.")
             self._workbench = workbench
+            self._owns_workbench = False
         else:
             self._workbench = StaticWorkbench(self._tools)
+            self._owns_workbench = True
 
         if model_context is not None:
             self._model_context = model_context
@@ -756,6 +788,9 @@ def __init__(
                 stacklevel=2,
             )
         self._tool_call_summary_format = tool_call_summary_format
+        self._stream_tool_call_results = stream_tool_call_results
+        self._max_concurrent_tool_calls = max_concurrent_tool_calls
+        self._speculative_tool_execution = speculative_tool_execution
         self._is_running = False
 
     @property
@@ -805,6 +840,9 @@ async def on_messages_stream(
         tool_call_summary_format = self._tool_call_summary_format
         output_content_type = self._output_content_type
         format_string = self._output_content_type_format
+        stream_tool_call_results = self._stream_tool_call_results
+        max_concurrent_tool_calls = self._max_concurrent_tool_calls
+        speculative_tool_execution = self._speculative_tool_execution
 
         # STEP 1: Add new user/handoff messages to the model context
         await self._add_messages_to_context(
@@ -822,61 +860,93 @@ async def on_messages_stream(
             inner_messages.append(event_msg)
             yield event_msg
 
-        # STEP 3: Run the first inference
-        model_result = None
-        async for inference_output in self._call_llm(
-            model_client=model_client,
-            model_client_stream=model_client_stream,
-            system_messages=system_messages,
-            model_context=model_context,
-            workbench=workbench,
-            handoff_tools=handoff_tools,
-            agent_name=agent_name,
-            cancellation_token=cancellation_token,
-            output_content_type=output_content_type,
-        ):
-            if isinstance(inference_output, CreateResult):
-                model_result = inference_output
-            else:
-                # Streaming chunk event
-                yield inference_output
-
-        assert model_result is not None, "No model result was produced."
+        # Tool calls started while the model response is streaming, in the order of the response.
+        started_tool_calls: List[Tuple[FunctionCall, asyncio.Task[Tuple[FunctionCall, FunctionExecutionResult]]]] = []
+        tool_call_semaphore = (
+            asyncio.Semaphore(max_concurrent_tool_calls) if max_concurrent_tool_calls is not None else None
+        )
 
-        # --- NEW: If the model produced a hidden "thought," yield it as an event ---
-        if model_result.thought:
-            thought_event = ThoughtEvent(content=model_result.thought, source=agent_name)
-            yield thought_event
-            inner_messages.append(thought_event)
+        def _start_tool_call(tool_call: FunctionCall) -> None:
+            started_tool_calls.append(
+                (
+                    tool_call,
+                    self._start_tool_call(
+                        tool_call, workbench, handoff_tools, agent_name, cancellation_token, tool_call_semaphore
+                    ),
+                )
+            )
 
-        # Add the assistant message to the model context (including thought if present)
-        await model_context.add_message(
-            AssistantMessage(
-                content=model_result.content,
-                source=agent_name,
-                thought=getattr(model_result, "thought", None),
+        try:
+            # STEP 3: Run the first inference
+            model_result = None
+            async for inference_output in self._call_llm(
+                model_client=model_client,
+                model_client_stream=model_client_stream,
+                system_messages=system_messages,
+                model_context=model_context,
+                workbench=workbench,
+                handoff_tools=handoff_tools,
+                agent_name=agent_name,
+                cancellation_token=cancellation_token,
+                output_content_type=output_content_type,
+                on_function_call=_start_tool_call if speculative_tool_execution else None,
+            ):
+                if isinstance(inference_output, CreateResult):
+                    model_result = inference_output
+                else:
+                    # Streaming chunk event
+                    yield inference_output
+
+            assert model_result is not None, "No model result was produced."
+
+            # Cancel the started tool calls that are not part of the final model response right away,
+            # so they do not keep running while the response is processed.
+            final_tool_calls = model_result.content if isinstance(model_result.content, list) else []
+            for index, (tool_call, task) in enumerate(started_tool_calls):
+                if index >= len(final_tool_calls) or final_tool_calls[index] != tool_call:
+                    task.cancel()
+
+            # --- NEW: If the model produced a hidden "thought," yield it as an event ---
+            if model_result.thought:
+                thought_event = ThoughtEvent(content=model_result.thought, source=agent_name)
+                yield thought_event
+                inner_messages.append(thought_event)
+
+            # Add the assistant message to the model context (including thought if present)
+            await model_context.add_message(
+                AssistantMessage(
+                    content=model_result.content,
+                    source=agent_name,
+                    thought=getattr(model_result, "thought", None),
+                )
             )
-        )
 
-        # STEP 4: Process the model output
-        async for output_event in self._process_model_result(
-            model_result=model_result,
-            inner_messages=inner_messages,
-            cancellation_token=cancellation_token,
-            agent_name=agent_name,
-            system_messages=system_messages,
-            model_context=model_context,
-            workbench=workbench,
-            handoff_tools=handoff_tools,
-            handoffs=handoffs,
-            model_client=model_client,
-            model_client_stream=model_client_stream,
-            reflect_on_tool_use=reflect_on_tool_use,
-            tool_call_summary_format=tool_call_summary_format,
-            output_content_type=output_content_type,
-            format_string=format_string,
-        ):
-            yield output_event
+            # STEP 4: Process the model output
+            async for output_event in self._process_model_result(
+                model_result=model_result,
+                inner_messages=inner_messages,
+                cancellation_token=cancellation_token,
+                agent_name=agent_name,
+                system_messages=system_messages,
+                model_context=model_context,
+                workbench=workbench,
+                handoff_tools=handoff_tools,
+                handoffs=handoffs,
+                model_client=model_client,
+                model_client_stream=model_client_stream,
+                reflect_on_tool_use=reflect_on_tool_use,
+                tool_call_summary_format=tool_call_summary_format,
+                output_content_type=output_content_type,
+                format_string=format_string,
+                stream_tool_call_results=stream_tool_call_results,
+                tool_call_semaphore=tool_call_semaphore,
+                started_tool_calls=started_tool_calls,
+            ):
+                yield output_event
+        finally:
+            # Cancel the started tool calls still running if the model call or the processing failed.
+            for _, task in started_tool_calls:
+                task.cancel()
 
     @staticmethod
     async def _add_messages_to_context(
@@ -925,9 +995,12 @@ async def _call_llm(
         agent_name: str,
         cancellation_token: CancellationToken,
         output_content_type: type[BaseModel] | None,
+        on_function_call: Callable[[FunctionCall], None] | None = None,
     ) -> AsyncGenerator[Union[CreateResult, ModelClientStreamingChunkEvent], None]:
         """
         Perform a model inference and yield either streaming chunk events or the final CreateResult.
+        In streaming mode, `on_function_call` is passed to the model client to be called with each function call
+        of the response as soon as its arguments are complete.
         """
         all_messages = await model_context.get_messages()
         llm_messages = cls._get_compatible_context(model_client=model_client, messages=system_messages + all_messages)
@@ -936,11 +1009,14 @@ async def _call_llm(
 
         if model_client_stream:
             model_result: Optional[CreateResult] = None
+            # Only passed when set, as most model clients do not support it.
+            stream_args: Dict[str, Any] = {"on_function_call": on_function_call} if on_function_call is not None else {}
             async for chunk in model_client.create_stream(
                 llm_messages,
                 tools=tools,
                 json_output=output_content_type,
                 cancellation_token=cancellation_token,
+                **stream_args,
             ):
                 if isinstance(chunk, CreateResult):
                     model_result = chunk
@@ -978,6 +1054,11 @@ async def _process_model_result(
         tool_call_summary_format: str,
         output_content_type: type[BaseModel] | None,
         format_string: str | None = None,
+        stream_tool_call_results: bool = False,
+        tool_call_semaphore: asyncio.Semaphore | None = None,
+        started_tool_calls: Sequence[
+            Tuple[FunctionCall, "asyncio.Task[Tuple[FunctionCall, FunctionExecutionResult]]"]
+        ] = (),
     ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | Response, None]:
         """
         Handle final or partial responses from model_result, including tool calls, handoffs,
@@ -1024,29 +1105,40 @@ async def _process_model_result(
         yield tool_call_msg
 
         # STEP 4B: Execute tool calls
-        executed_calls_and_results = await asyncio.gather(
-            *[
-                cls._execute_tool_call(
-                    tool_call=call,
-                    workbench=workbench,
-                    handoff_tools=handoff_tools,
-                    agent_name=agent_name,
-                    cancellation_token=cancellation_token,
-                )
-                for call in model_result.content
-            ]
+        completed_calls_and_results: List[Tuple[FunctionCall, FunctionExecutionResult] | None] = [None] * len(
+            model_result.content
         )
+        async for index, call_and_result in cls._execute_tool_calls(
+            tool_calls=model_result.content,
+            workbench=workbench,
+            handoff_tools=handoff_tools,
+            agent_name=agent_name,
+            cancellation_token=cancellation_token,
+            semaphore=tool_call_semaphore,
+            started_tool_calls=started_tool_calls,
+        ):
+            completed_calls_and_results[index] = call_and_result
+            if stream_tool_call_results:
+                # Yield a ToolCallExecutionEvent for each tool call as it completes
+                call_result_msg = ToolCallExecutionEvent(content=[call_and_result[1]], source=agent_name)
+                event_logger.debug(call_result_msg)
+                inner_messages.append(call_result_msg)
+                yield call_result_msg
+        executed_calls_and_results = [
+            call_and_result for call_and_result in completed_calls_and_results if call_and_result is not None
+        ]
         exec_results = [result for _, result in executed_calls_and_results]
-
-        # Yield ToolCallExecutionEvent
-        tool_call_result_msg = ToolCallExecutionEvent(
-            content=exec_results,
-            source=agent_name,
-        )
-        event_logger.debug(tool_call_result_msg)
         await model_context.add_message(FunctionExecutionResultMessage(content=exec_results))
-        inner_messages.append(tool_call_result_msg)
-        yield tool_call_result_msg
+
+        if not stream_tool_call_results:
+            # Yield ToolCallExecutionEvent
+            tool_call_result_msg = ToolCallExecutionEvent(
+                content=exec_results,
+                source=agent_name,
+            )
+            event_logger.debug(tool_call_result_msg)
+            inner_messages.append(tool_call_result_msg)
+            yield tool_call_result_msg
 
         # STEP 4C: Check for handoff
         handoff_output = cls._check_and_handle_handoff(
@@ -1257,6 +1349,60 @@ def _summarize_tool_use(
             inner_messages=inner_messages,
         )
 
+    @classmethod
+    def _start_tool_call(
+        cls,
+        tool_call: FunctionCall,
+        workbench: Workbench,
+        handoff_tools: List[BaseTool[Any, Any]],
+        agent_name: str,
+        cancellation_token: CancellationToken,
+        semaphore: asyncio.Semaphore | None,
+    ) -> "asyncio.Task[Tuple[FunctionCall, FunctionExecutionResult]]":
+        """Start executing a tool call in a task, waiting for the semaphore first if there is one."""
+
+        async def _execute() -> Tuple[FunctionCall, FunctionExecutionResult]:
+            if semaphore is None:
+                return await cls._execute_tool_call(tool_call, workbench, handoff_tools, agent_name, cancellation_token)
+            async with semaphore:
+                return await cls._execute_tool_call(tool_call, workbench, handoff_tools, agent_name, cancellation_token)
+
+        return asyncio.create_task(_execute())
+
+    @classmethod
+    async def _execute_tool_calls(
+        cls,
+        tool_calls: List[FunctionCall],
+        workbench: Workbench,
+        handoff_tools: List[BaseTool[Any, Any]],
+        agent_name: str,
+        cancellation_token: CancellationToken,
+        semaphore: asyncio.Semaphore | None,
+        started_tool_calls: Sequence[Tuple[FunctionCall, "asyncio.Task[Tuple[FunctionCall, FunctionExecutionResult]]"]],
+    ) -> AsyncGenerator[Tuple[int, Tuple[FunctionCall, FunctionExecutionResult]], None]:
+        """Execute the tool calls concurrently and yield the index of each tool call with its result
+        as soon as it completes. A tool call already started while the model response was streaming
+        is not started again."""
+        tasks: List[asyncio.Task[Tuple[FunctionCall, FunctionExecutionResult]]] = []
+        for index, tool_call in enumerate(tool_calls):
+            if index < len(started_tool_calls) and started_tool_calls[index][0] == tool_call:
+                tasks.append(started_tool_calls[index][1])
+            else:
+                tasks.append(
+                    cls._start_tool_call(tool_call, workbench, handoff_tools, agent_name, cancellation_token, semaphore)
+                )
+        indices = {task: index for index, task in enumerate(tasks)}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=indices.__getitem__):
+                    yield indices[task], task.result()
+        finally:
+            # Cancel the tool calls still running if the caller stops early or a tool call raised.
+            for task in tasks:
+                task.cancel()
+
     @staticmethod
     async def _execute_tool_call(
         tool_call: FunctionCall,
@@ -1328,6 +1474,12 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
         # Load the model context state.
         await self._model_context.load_state(assistant_agent_state.llm_context)
 
+    async def close(self) -> None:
+        """Release the resources held by the tools of the agent.
+        A workbench passed to the agent is not stopped, as it may be shared with other agents."""
+        if self._owns_workbench:
+            await self._workbench.stop()
+
     @staticmethod
     def _get_compatible_context(model_client: ChatCompletionClient, messages: List[LLMMessage]) -> Sequence[LLMMessage]:
         """Ensure that the messages are compatible with the underlying client, by removing images if needed."""
@@ -1358,6 +1510,9 @@ def _to_config(self) -> AssistantAgentConfig:
             if self._structured_message_factory
             else None,
             metadata=self._metadata,
+            stream_tool_call_results=self._stream_tool_call_results,
+            max_concurrent_tool_calls=self._max_concurrent_tool_calls,
+            speculative_tool_execution=self._speculative_tool_execution,
         )
 
     @classmethod
@@ -1388,4 +1543,7 @@ def _from_config(cls, config: AssistantAgentConfig) -> Self:
             output_content_type=output_content_type,
             output_content_type_format=format_string,
             metadata=config.metadata,
+            stream_tool_call_results=config.stream_tool_call_results,
+            max_concurrent_tool_calls=config.max_concurrent_tool_calls,
+            speculative_tool_execution=config.speculative_tool_execution,
         )
@@ -31,6 +31,7 @@
     BaseAgentEvent,
     BaseChatMessage,
     CodeExecutionEvent,
+    CodeExecutionStreamingChunkEvent,
     CodeGenerationEvent,
     HandoffMessage,
     ModelClientStreamingChunkEvent,
@@ -53,6 +54,7 @@ class CodeExecutorAgentConfig(BaseModel):
     sources: List[str] | None = None
     system_message: str | None = None
     model_client_stream: bool = False
+    code_execution_stream: bool = False
     model_context: ComponentModel | None = None
 
 
@@ -100,6 +102,11 @@ class CodeExecutorAgent(BaseChatAgent, Component[CodeExecutorAgentConfig]):
             :meth:`on_messages_stream` and :meth:`BaseChatAgent.run_stream` methods will
             also yield :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent`
             messages as the model client produces chunks of response. Defaults to `False`.
+        code_execution_stream (bool, optional): If `True`, the code is executed with
+            :meth:`~autogen_core.code_executor.CodeExecutor.execute_code_blocks_stream`.
+            :meth:`on_messages_stream` and :meth:`BaseChatAgent.run_stream` methods will
+            also yield :class:`~autogen_agentchat.messages.CodeExecutionStreamingChunkEvent`
+            messages as the code writes its output. Defaults to `False`.
         description (str, optional): The description of the agent. If not provided,
             :class:`~autogen_agentchat.agents.CodeExecutorAgent.DEFAULT_AGENT_DESCRIPTION` will be used.
         system_message (str, optional): The system message for the model. If provided, it will be prepended to the messages in the model context when making an inference. Set to `None` to disable.
@@ -341,6 +348,7 @@ def __init__(
         model_client: ChatCompletionClient | None = None,
         model_context: ChatCompletionContext | None = None,
         model_client_stream: bool = False,
+        code_execution_stream: bool = False,
         max_retries_on_error: int = 0,
         description: str | None = None,
         system_message: str | None = DEFAULT_SYSTEM_MESSAGE,
@@ -356,6 +364,7 @@ def __init__(
         self._code_executor = code_executor
         self._sources = sources
         self._model_client_stream = model_client_stream
+        self._code_execution_stream = code_execution_stream
         self._max_retries_on_error = max_retries_on_error
 
         self._model_client = None
@@ -424,7 +433,12 @@ async def on_messages_stream(
                     )
                 )
                 return
-            execution_result = await self.execute_code_block(code_blocks, cancellation_token)
+            async for execution_output in self._execute_code_block_flow(code_blocks, 0, cancellation_token):
+                if isinstance(execution_output, CodeResult):
+                    execution_result = execution_output
+                else:
+                    yield execution_output
+            assert execution_result is not None
             yield Response(chat_message=TextMessage(content=execution_result.output, source=self.name))
             return
 
@@ -495,7 +509,15 @@ async def on_messages_stream(
             yield inferred_text_message
 
             # Step 8: Execute the extracted code blocks
-            execution_result = await self.execute_code_block(inferred_text_message.code_blocks, cancellation_token)
+            execution_result = None
+            async for execution_output in self._execute_code_block_flow(
+                inferred_text_message.code_blocks, nth_try, cancellation_token
+            ):
+                if isinstance(execution_output, CodeResult):
+                    execution_result = execution_output
+                else:
+                    yield execution_output
+            assert execution_result is not None
 
             # Step 9: Update model context with the code execution result
             await model_context.add_message(
@@ -574,7 +596,35 @@ async def execute_code_block(
     ) -> CodeResult:
         # Execute the code blocks.
         result = await self._code_executor.execute_code_blocks(code_blocks, cancellation_token=cancellation_token)
+        return self._format_code_result(result)
 
+    async def execute_code_block_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[str | CodeResult, None]:
+        """Execute the code blocks, yielding the output of the code as it is written, then the result."""
+        async for item in self._code_executor.execute_code_blocks_stream(
+            code_blocks, cancellation_token=cancellation_token
+        ):
+            if isinstance(item, CodeResult):
+                yield self._format_code_result(item)
+            else:
+                yield item
+
+    async def _execute_code_block_flow(
+        self, code_blocks: List[CodeBlock], retry_attempt: int, cancellation_token: CancellationToken
+    ) -> AsyncGenerator[CodeExecutionStreamingChunkEvent | CodeResult, None]:
+        """Execute the code blocks, yielding the streaming chunk events if streaming is enabled, then the result."""
+        if not self._code_execution_stream:
+            yield await self.execute_code_block(code_blocks, cancellation_token)
+            return
+        async for item in self.execute_code_block_stream(code_blocks, cancellation_token):
+            if isinstance(item, CodeResult):
+                yield item
+            else:
+                yield CodeExecutionStreamingChunkEvent(retry_attempt=retry_attempt, content=item, source=self.name)
+
+    @staticmethod
+    def _format_code_result(result: CodeResult) -> CodeResult:
         if result.output.strip() == "":
             # No output
             result.output = f"The script ran but produced no output to console. The POSIX exit code was: {result.exit_code}. If you were expecting output, consider revising the script to ensure content is printed to stdout."
@@ -611,6 +661,7 @@ def _to_config(self) -> CodeExecutorAgentConfig:
                 else None
             ),
             model_client_stream=self._model_client_stream,
+            code_execution_stream=self._code_execution_stream,
             model_context=self._model_context.dump_component(),
         )
 
@@ -626,6 +677,7 @@ def _from_config(cls, config: CodeExecutorAgentConfig) -> Self:
             sources=config.sources,
             system_message=config.system_message,
             model_client_stream=config.model_client_stream,
+            code_execution_stream=config.code_execution_stream,
             model_context=ChatCompletionContext.load_component(config.model_context) if config.model_context else None,
         )
 
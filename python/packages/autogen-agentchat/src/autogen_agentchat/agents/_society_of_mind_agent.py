@@ -16,6 +16,7 @@
 from ..messages import (
     BaseAgentEvent,
     BaseChatMessage,
+    CodeExecutionStreamingChunkEvent,
     HandoffMessage,
     ModelClientStreamingChunkEvent,
     TextMessage,
@@ -201,8 +202,8 @@ async def on_messages_stream(
                     # Skip the task messages.
                     continue
                 yield inner_msg
-                if isinstance(inner_msg, ModelClientStreamingChunkEvent):
-                    # Skip the model client streaming chunk events.
+                if isinstance(inner_msg, (ModelClientStreamingChunkEvent, CodeExecutionStreamingChunkEvent)):
+                    # Skip the streaming chunk events.
                     continue
                 inner_messages.append(inner_msg)
         assert result is not None
@@ -1,6 +1,7 @@
 import asyncio
 import time
-from typing import Awaitable, Callable, List, Sequence
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
 
 from autogen_core import Component
 from pydantic import BaseModel
@@ -405,6 +406,9 @@ class ExternalTermination(TerminationCondition, Component[ExternalTerminationCon
     """A termination condition that is externally controlled
     by calling the :meth:`set` method.
 
+    Setting the condition also sets its deep copies, so it stops the sessions of a team,
+    which run on copies of the termination condition.
+
     Example:
 
     .. code-block:: python
@@ -427,14 +431,23 @@ class ExternalTermination(TerminationCondition, Component[ExternalTerminationCon
     def __init__(self) -> None:
         self._terminated = False
         self._setted = False
+        # Deep copies, such as the ones made for the sessions of a team, are set with this condition.
+        self._copies: weakref.WeakSet[ExternalTermination] = weakref.WeakSet()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Self:
+        copy = type(self)()
+        self._copies.add(copy)
+        return copy
 
     @property
     def terminated(self) -> bool:
         return self._terminated
 
     def set(self) -> None:
-        """Set the termination condition to terminated."""
+        """Set the termination condition to terminated, along with its deep copies."""
         self._setted = True
+        for copy in list(self._copies):
+            copy.set()
 
     async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> StopMessage | None:
         if self._terminated:
@@ -28,6 +28,10 @@ class BaseGroupChatManagerState(BaseState):
     """Base state for all group chat managers."""
 
     message_thread: List[Mapping[str, Any]] = Field(default_factory=list)
+    message_thread_offset: int = Field(default=0)
+    """The number of messages of the conversation before the first message of :attr:`message_thread`."""
+    incremental: bool = Field(default=False)
+    """Whether :attr:`message_thread` only contains the messages added since the previous state was saved."""
     current_turn: int = Field(default=0)
     type: str = Field(default="BaseGroupChatManagerState")
 
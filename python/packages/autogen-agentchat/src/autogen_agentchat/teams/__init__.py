@@ -12,6 +12,7 @@
     GraphFlow,
 )
 from ._group_chat._magentic_one import MagenticOneGroupChat
+from ._group_chat._message_thread import MessageThreadPolicy
 from ._group_chat._round_robin_group_chat import RoundRobinGroupChat
 from ._group_chat._selector_group_chat import SelectorGroupChat
 from ._group_chat._swarm_group_chat import Swarm
@@ -27,4 +28,5 @@
     "DiGraphNode",
     "DiGraphEdge",
     "GraphFlow",
+    "MessageThreadPolicy",
 ]
@@ -1,10 +1,13 @@
 import asyncio
 import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any, AsyncGenerator, Callable, Dict, List, Mapping, Sequence
 
 from autogen_core import (
     AgentId,
+    AgentInstantiationContext,
     AgentRuntime,
     AgentType,
     CancellationToken,
@@ -18,6 +21,7 @@
 from ...messages import (
     BaseAgentEvent,
     BaseChatMessage,
+    CodeExecutionStreamingChunkEvent,
     MessageFactory,
     ModelClientStreamingChunkEvent,
     StopMessage,
@@ -34,7 +38,24 @@
     GroupChatTermination,
     SerializableException,
 )
+from ._message_thread import MessageThreadPolicy
 from ._sequential_routed_agent import SequentialRoutedAgent
+from ._session import SupportsRemoveAgent, copy_for_session
+
+# The number of closed session IDs remembered by a team whose runtime cannot remove agent instances.
+_MAX_CLOSED_SESSIONS = 10000
+
+
+@dataclass
+class _TeamSession:
+    """The participants, termination condition and output queue of one session of a team."""
+
+    participants: List[ChatAgent]
+    termination_condition: TerminationCondition | None
+    output_message_queue: asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination] = field(
+        default_factory=asyncio.Queue
+    )
+    is_running: bool = False
 
 
 class BaseGroupChat(Team, ABC, ComponentBase[BaseModel]):
@@ -42,6 +63,50 @@ class BaseGroupChat(Team, ABC, ComponentBase[BaseModel]):
 
     To implement a group chat team, first create a subclass of :class:`BaseGroupChatManager` and then
     create a subclass of :class:`BaseGroupChat` that uses the group chat manager.
+
+    A team created with a ``runtime`` can run many conversations at the same time, each identified
+    by a ``session_id`` passed to :meth:`run`, :meth:`run_stream` and the other methods of the team.
+    Each session has its own group chat manager, output stream, copy of the termination condition,
+    and copies of the participants, which are the agent instances of the session key in the runtime.
+    The copies share the model clients, tools, workbenches, code executors, memories and nested teams of the
+    original participants. Setting an :class:`~autogen_agentchat.conditions.ExternalTermination` of the team
+    stops the sessions as well. Without a ``session_id``, the methods use the original participants and
+    termination condition.
+
+    .. code-block:: python
+
+        import asyncio
+
+        from autogen_agentchat.agents import AssistantAgent
+        from autogen_agentchat.conditions import MaxMessageTermination
+        from autogen_agentchat.teams import RoundRobinGroupChat
+        from autogen_core import SingleThreadedAgentRuntime
+        from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+
+        async def main() -> None:
+            model_client = OpenAIChatCompletionClient(model="gpt-4o")
+            runtime = SingleThreadedAgentRuntime()
+            runtime.start()
+            agent1 = AssistantAgent("Assistant1", model_client=model_client)
+            agent2 = AssistantAgent("Assistant2", model_client=model_client)
+            team = RoundRobinGroupChat([agent1, agent2], termination_condition=MaxMessageTermination(3), runtime=runtime)
+
+            # Two independent conversations with the same team.
+            results = await asyncio.gather(
+                team.run(task="Write a haiku about the sea.", session_id="user-1"),
+                team.run(task="Write a haiku about the mountains.", session_id="user-2"),
+            )
+            for result in results:
+                print(result)
+
+            # Release the session when the conversation is over.
+            await team.close_session("user-1")
+            await team.close_session("user-2")
+            await runtime.stop()
+
+
+        asyncio.run(main())
     """
 
     component_type = "team"
@@ -56,6 +121,7 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ):
         if len(participants) == 0:
             raise ValueError("At least one participant is required.")
@@ -125,9 +191,19 @@ def __init__(
         # Flag to track if the group chat is running.
         self._is_running = False
 
+        # The sessions of the team by session ID, which is the key of their agents in the runtime.
+        self._sessions: Dict[str, _TeamSession] = {}
+        # The most recently closed session IDs, when the runtime cannot remove the agent instances of a
+        # closed session. They cannot be reused, as the agent instances of the session stay in the runtime.
+        self._closed_sessions: OrderedDict[str, None] = OrderedDict()
+        self._init_lock = asyncio.Lock()
+
         # Flag to track if the team events should be emitted.
         self._emit_team_events = emit_team_events
 
+        # How the group chat manager retains its message thread.
+        self._message_thread_policy = message_thread_policy
+
     @abstractmethod
     def _create_group_chat_manager_factory(
         self,
@@ -156,20 +232,119 @@ def _factory() -> ChatAgentContainer:
 
         return _factory
 
+    def _instantiating_session(self) -> _TeamSession | None:
+        """Return the session of the agent being instantiated by the runtime, or None for the agents of the team ID."""
+        key = AgentInstantiationContext.current_agent_id().key
+        if key == self._team_id:
+            return None
+        session = self._sessions.get(key)
+        if session is None:
+            raise RuntimeError(f"Session {key} of the team does not exist or has been closed.")
+        return session
+
+    def _create_session_participant_factory(self, index: int) -> Callable[[], ChatAgentContainer]:
+        default_factory = self._create_participant_factory(
+            self._group_topic_type, self._output_topic_type, self._participants[index], self._message_factory
+        )
+
+        def _factory() -> ChatAgentContainer:
+            session = self._instantiating_session()
+            if session is None:
+                return default_factory()
+            return self._create_participant_factory(
+                self._group_topic_type, self._output_topic_type, session.participants[index], self._message_factory
+            )()
+
+        return _factory
+
+    def _create_session_group_chat_manager_factory(self) -> Callable[[], SequentialRoutedAgent]:
+        def _create(
+            output_message_queue: asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination],
+            termination_condition: TerminationCondition | None,
+        ) -> Callable[[], SequentialRoutedAgent]:
+            return self._create_group_chat_manager_factory(
+                name=self._group_chat_manager_name,
+                group_topic_type=self._group_topic_type,
+                output_topic_type=self._output_topic_type,
+                participant_names=self._participant_names,
+                participant_topic_types=self._participant_topic_types,
+                participant_descriptions=self._participant_descriptions,
+                output_message_queue=output_message_queue,
+                termination_condition=termination_condition,
+                max_turns=self._max_turns,
+                message_factory=self._message_factory,
+            )
+
+        default_factory = _create(self._output_message_queue, self._termination_condition)
+
+        def _factory() -> SequentialRoutedAgent:
+            session = self._instantiating_session()
+            if session is None:
+                return default_factory()
+            return _create(session.output_message_queue, session.termination_condition)()
+
+        return _factory
+
+    def _session(self, session_id: str) -> _TeamSession:
+        """Get the session, creating it with copies of the participants and the termination condition if it is new."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            if session_id in self._closed_sessions:
+                raise ValueError(f"Session {session_id} has been closed and cannot be reused.")
+            if self._embedded_runtime:
+                raise ValueError("Sessions are only supported by teams created with a runtime.")
+            if session_id == self._team_id:
+                raise ValueError(f"Invalid session ID: {session_id}.")
+            session = _TeamSession(
+                participants=[copy_for_session(participant) for participant in self._participants],
+                termination_condition=copy_for_session(self._termination_condition),
+            )
+            self._sessions[session_id] = session
+        return session
+
+    def _check_session_exists(self, session_id: str | None) -> None:
+        if session_id is not None and session_id not in self._sessions:
+            raise ValueError(f"Session {session_id} does not exist or has been closed.")
+
+    def _agent_key(self, session_id: str | None) -> str:
+        return self._team_id if session_id is None else session_id
+
+    def _get_output_message_queue(
+        self, session_id: str | None
+    ) -> asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination]:
+        if session_id is None:
+            return self._output_message_queue
+        return self._session(session_id).output_message_queue
+
+    def _get_is_running(self, session_id: str | None) -> bool:
+        if session_id is None:
+            return self._is_running
+        return self._session(session_id).is_running
+
+    def _set_is_running(self, session_id: str | None, is_running: bool) -> None:
+        if session_id is None:
+            self._is_running = is_running
+        else:
+            self._session(session_id).is_running = is_running
+
+    async def _ensure_initialized(self) -> None:
+        # Concurrent sessions may start at the same time.
+        async with self._init_lock:
+            if not self._initialized:
+                await self._init(self._runtime)
+
     async def _init(self, runtime: AgentRuntime) -> None:
         # Constants for the group chat manager.
         group_chat_manager_agent_type = AgentType(self._group_chat_manager_topic_type)
 
         # Register participants.
         # Use the participant topic type as the agent type.
-        for participant, agent_type in zip(self._participants, self._participant_topic_types, strict=True):
+        for index, agent_type in enumerate(self._participant_topic_types):
             # Register the participant factory.
             await ChatAgentContainer.register(
                 runtime,
                 type=agent_type,
-                factory=self._create_participant_factory(
-                    self._group_topic_type, self._output_topic_type, participant, self._message_factory
-                ),
+                factory=self._create_session_participant_factory(index),
             )
             # Add subscriptions for the participant.
             # The participant should be able to receive messages from its own topic.
@@ -181,18 +356,7 @@ async def _init(self, runtime: AgentRuntime) -> None:
         await self._base_group_chat_manager_class.register(
             runtime,
             type=group_chat_manager_agent_type.type,
-            factory=self._create_group_chat_manager_factory(
-                name=self._group_chat_manager_name,
-                group_topic_type=self._group_topic_type,
-                output_topic_type=self._output_topic_type,
-                participant_names=self._participant_names,
-                participant_topic_types=self._participant_topic_types,
-                participant_descriptions=self._participant_descriptions,
-                output_message_queue=self._output_message_queue,
-                termination_condition=self._termination_condition,
-                max_turns=self._max_turns,
-                message_factory=self._message_factory,
-            ),
+            factory=self._create_session_group_chat_manager_factory(),
         )
         # Add subscriptions for the group chat manager.
         # The group chat manager should be able to receive messages from the its own topic.
@@ -217,6 +381,7 @@ async def run(
         *,
         task: str | BaseChatMessage | Sequence[BaseChatMessage] | None = None,
         cancellation_token: CancellationToken | None = None,
+        session_id: str | None = None,
     ) -> TaskResult:
         """Run the team and return the result. The base implementation uses
         :meth:`run_stream` to run the team and then returns the final result.
@@ -228,6 +393,8 @@ async def run(
                 Setting the cancellation token potentially put the team in an inconsistent state,
                 and it may not reset the termination condition.
                 To gracefully stop the team, use :class:`~autogen_agentchat.conditions.ExternalTermination` instead.
+            session_id (str | None): The session to run. Sessions run independently of each other and of the team run without a session.
+                The session is created on first use. Only supported by teams created with a runtime. Defaults to None.
 
         Returns:
             result: The result of the task as :class:`~autogen_agentchat.base.TaskResult`. The result contains the messages produced by the team and the stop reason.
@@ -307,6 +474,7 @@ async def main() -> None:
         async for message in self.run_stream(
             task=task,
             cancellation_token=cancellation_token,
+            session_id=session_id,
         ):
             if isinstance(message, TaskResult):
                 result = message
@@ -319,6 +487,7 @@ async def run_stream(
         *,
         task: str | BaseChatMessage | Sequence[BaseChatMessage] | None = None,
         cancellation_token: CancellationToken | None = None,
+        session_id: str | None = None,
     ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | TaskResult, None]:
         """Run the team and produces a stream of messages and the final result
         of the type :class:`~autogen_agentchat.base.TaskResult` as the last item in the stream. Once the
@@ -336,6 +505,8 @@ async def run_stream(
                 Setting the cancellation token potentially put the team in an inconsistent state,
                 and it may not reset the termination condition.
                 To gracefully stop the team, use :class:`~autogen_agentchat.conditions.ExternalTermination` instead.
+            session_id (str | None): The session to run. Sessions run independently of each other and of the team run without a session.
+                The session is created on first use. Only supported by teams created with a runtime. Defaults to None.
 
         Returns:
             stream: an :class:`~collections.abc.AsyncGenerator` that yields :class:`~autogen_agentchat.messages.BaseAgentEvent`, :class:`~autogen_agentchat.messages.BaseChatMessage`, and the final result :class:`~autogen_agentchat.base.TaskResult` as the last item in the stream.
@@ -445,17 +616,17 @@ async def main() -> None:
                         "custom_message_types list when creating the team."
                     )
 
-        if self._is_running:
+        if self._get_is_running(session_id):
             raise ValueError("The team is already running, it cannot run again until it is stopped.")
-        self._is_running = True
+        self._set_is_running(session_id, True)
+        output_message_queue = self._get_output_message_queue(session_id)
 
         if self._embedded_runtime:
             # Start the embedded runtime.
             assert isinstance(self._runtime, SingleThreadedAgentRuntime)
             self._runtime.start()
 
-        if not self._initialized:
-            await self._init(self._runtime)
+        await self._ensure_initialized()
 
         shutdown_task: asyncio.Task[None] | None = None
         if self._embedded_runtime:
@@ -498,7 +669,7 @@ async def stop_runtime() -> None:
             # and the group chat manager.
             await self._runtime.send_message(
                 GroupChatStart(messages=messages),
-                recipient=AgentId(type=self._group_chat_manager_topic_type, key=self._team_id),
+                recipient=AgentId(type=self._group_chat_manager_topic_type, key=self._agent_key(session_id)),
                 cancellation_token=cancellation_token,
             )
             # Collect the output messages in order.
@@ -506,7 +677,7 @@ async def stop_runtime() -> None:
             stop_reason: str | None = None
             # Yield the messsages until the queue is empty.
             while True:
-                message_future = asyncio.ensure_future(self._output_message_queue.get())
+                message_future = asyncio.ensure_future(output_message_queue.get())
                 if cancellation_token is not None:
                     cancellation_token.link_future(message_future)
                 # Wait for the next message, this will raise an exception if the task is cancelled.
@@ -519,8 +690,8 @@ async def stop_runtime() -> None:
                     stop_reason = message.message.content
                     break
                 yield message
-                if isinstance(message, ModelClientStreamingChunkEvent):
-                    # Skip the model client streaming chunk events.
+                if isinstance(message, (ModelClientStreamingChunkEvent, CodeExecutionStreamingChunkEvent)):
+                    # Skip the streaming chunk events.
                     continue
                 output_messages.append(message)
 
@@ -535,17 +706,20 @@ async def stop_runtime() -> None:
                     await shutdown_task
             finally:
                 # Clear the output message queue.
-                while not self._output_message_queue.empty():
-                    self._output_message_queue.get_nowait()
+                while not output_message_queue.empty():
+                    output_message_queue.get_nowait()
 
                 # Indicate that the team is no longer running.
-                self._is_running = False
+                self._set_is_running(session_id, False)
 
-    async def reset(self) -> None:
+    async def reset(self, session_id: str | None = None) -> None:
         """Reset the team and its participants to their initial state.
 
         The team must be stopped before it can be reset.
 
+        Args:
+            session_id (str | None): The session to reset. Defaults to None, which resets the team run without a session.
+
         Raises:
             RuntimeError: If the team has not been initialized or is currently running.
 
@@ -581,12 +755,12 @@ async def main() -> None:
             asyncio.run(main())
         """
 
-        if not self._initialized:
-            await self._init(self._runtime)
+        await self._ensure_initialized()
 
-        if self._is_running:
+        if self._get_is_running(session_id):
             raise RuntimeError("The group chat is currently running. It must be stopped before it can be reset.")
-        self._is_running = True
+        self._set_is_running(session_id, True)
+        output_message_queue = self._get_output_message_queue(session_id)
 
         if self._embedded_runtime:
             # Start the runtime.
@@ -598,12 +772,12 @@ async def main() -> None:
             for participant_topic_type in self._participant_topic_types:
                 await self._runtime.send_message(
                     GroupChatReset(),
-                    recipient=AgentId(type=participant_topic_type, key=self._team_id),
+                    recipient=AgentId(type=participant_topic_type, key=self._agent_key(session_id)),
                 )
             # Send a reset message to the group chat manager.
             await self._runtime.send_message(
                 GroupChatReset(),
-                recipient=AgentId(type=self._group_chat_manager_topic_type, key=self._team_id),
+                recipient=AgentId(type=self._group_chat_manager_topic_type, key=self._agent_key(session_id)),
             )
         finally:
             if self._embedded_runtime:
@@ -612,13 +786,13 @@ async def main() -> None:
                 await self._runtime.stop_when_idle()
 
             # Reset the output message queue.
-            while not self._output_message_queue.empty():
-                self._output_message_queue.get_nowait()
+            while not output_message_queue.empty():
+                output_message_queue.get_nowait()
 
             # Indicate that the team is no longer running.
-            self._is_running = False
+            self._set_is_running(session_id, False)
 
-    async def pause(self) -> None:
+    async def pause(self, session_id: str | None = None) -> None:
         """Pause its participants when the team is running by calling their
         :meth:`~autogen_agentchat.base.ChatAgent.on_pause` method via direct RPC calls.
 
@@ -643,28 +817,33 @@ async def pause(self) -> None:
             method in your agent class for custom pause behavior.
             By default, the agent will not do anything when called.
 
+        Args:
+            session_id (str | None): The session to pause. Defaults to None, which pauses the team run without a session.
+
         Raises:
             RuntimeError: If the team has not been initialized. Exceptions from
                 the participants when calling their implementations of
                 :class:`~autogen_agentchat.base.ChatAgent.on_pause` are
                 propagated to this method and raised.
+            ValueError: If the session does not exist or has been closed.
         """
         if not self._initialized:
             raise RuntimeError("The group chat has not been initialized. It must be run before it can be paused.")
+        self._check_session_exists(session_id)
 
         # Send a pause message to all participants.
         for participant_topic_type in self._participant_topic_types:
             await self._runtime.send_message(
                 GroupChatPause(),
-                recipient=AgentId(type=participant_topic_type, key=self._team_id),
+                recipient=AgentId(type=participant_topic_type, key=self._agent_key(session_id)),
             )
         # Send a pause message to the group chat manager.
         await self._runtime.send_message(
             GroupChatPause(),
-            recipient=AgentId(type=self._group_chat_manager_topic_type, key=self._team_id),
+            recipient=AgentId(type=self._group_chat_manager_topic_type, key=self._agent_key(session_id)),
         )
 
-    async def resume(self) -> None:
+    async def resume(self, session_id: str | None = None) -> None:
         """Resume its participants when the team is running and paused by calling their
         :meth:`~autogen_agentchat.base.ChatAgent.on_resume` method via direct RPC calls.
 
@@ -688,28 +867,32 @@ async def resume(self) -> None:
             Make sure to implement the :meth:`~autogen_agentchat.agents.BaseChatAgent.on_resume`
             method in your agent class for custom resume behavior.
 
+        Args:
+            session_id (str | None): The session to resume. Defaults to None, which resumes the team run without a session.
+
         Raises:
             RuntimeError: If the team has not been initialized. Exceptions from
                 the participants when calling their implementations of :class:`~autogen_agentchat.base.ChatAgent.on_resume`
                 method are propagated to this method and raised.
-
+            ValueError: If the session does not exist or has been closed.
         """
         if not self._initialized:
             raise RuntimeError("The group chat has not been initialized. It must be run before it can be resumed.")
+        self._check_session_exists(session_id)
 
         # Send a resume message to all participants.
         for participant_topic_type in self._participant_topic_types:
             await self._runtime.send_message(
                 GroupChatResume(),
-                recipient=AgentId(type=participant_topic_type, key=self._team_id),
+                recipient=AgentId(type=participant_topic_type, key=self._agent_key(session_id)),
             )
         # Send a resume message to the group chat manager.
         await self._runtime.send_message(
             GroupChatResume(),
-            recipient=AgentId(type=self._group_chat_manager_topic_type, key=self._team_id),
+            recipient=AgentId(type=self._group_chat_manager_topic_type, key=self._agent_key(session_id)),
         )
 
-    async def save_state(self) -> Mapping[str, Any]:
+    async def save_state(self, session_id: str | None = None) -> Mapping[str, Any]:
         """Save the state of the group chat team.
 
         The state is saved by calling the :meth:`~autogen_core.AgentRuntime.agent_save_state` method
@@ -740,9 +923,14 @@ async def save_state(self) -> Mapping[str, Any]:
             while it is running, the state may not be consistent and may result in an unexpected state.
             It is recommended to call this method when the team is not running or after it is stopped.
 
+        Args:
+            session_id (str | None): The session to save. Defaults to None, which saves the team run without a session.
+
+        Raises:
+            ValueError: If the session does not exist or has been closed.
         """
-        if not self._initialized:
-            await self._init(self._runtime)
+        await self._ensure_initialized()
+        self._check_session_exists(session_id)
 
         # Store state of each agent by their name.
         # NOTE: we don't use the agent ID as the key here because we need to be able to decouple
@@ -750,39 +938,43 @@ async def save_state(self) -> Mapping[str, Any]:
         agent_states: Dict[str, Mapping[str, Any]] = {}
         # Save the state of all participants.
         for name, agent_type in zip(self._participant_names, self._participant_topic_types, strict=True):
-            agent_id = AgentId(type=agent_type, key=self._team_id)
+            agent_id = AgentId(type=agent_type, key=self._agent_key(session_id))
             # NOTE: We are using the runtime's save state method rather than the agent instance's
             # save_state method because we want to support saving state of remote agents.
             agent_states[name] = await self._runtime.agent_save_state(agent_id)
         # Save the state of the group chat manager.
-        agent_id = AgentId(type=self._group_chat_manager_topic_type, key=self._team_id)
+        agent_id = AgentId(type=self._group_chat_manager_topic_type, key=self._agent_key(session_id))
         agent_states[self._group_chat_manager_name] = await self._runtime.agent_save_state(agent_id)
         return TeamState(agent_states=agent_states).model_dump()
 
-    async def load_state(self, state: Mapping[str, Any]) -> None:
+    async def load_state(self, state: Mapping[str, Any], session_id: str | None = None) -> None:
         """Load an external state and overwrite the current state of the group chat team.
 
         The state is loaded by calling the :meth:`~autogen_core.AgentRuntime.agent_load_state` method
         on each participant and the group chat manager with their internal agent ID.
         See :meth:`~autogen_agentchat.teams.BaseGroupChat.save_state` for the expected format of the state.
+
+        Args:
+            state (Mapping[str, Any]): The state to load.
+            session_id (str | None): The session to load the state into, which is created if it does not exist.
+                Defaults to None, which loads the state into the team run without a session.
         """
-        if not self._initialized:
-            await self._init(self._runtime)
+        await self._ensure_initialized()
 
-        if self._is_running:
+        if self._get_is_running(session_id):
             raise RuntimeError("The team cannot be loaded while it is running.")
-        self._is_running = True
+        self._set_is_running(session_id, True)
 
         try:
             team_state = TeamState.model_validate(state)
             # Load the state of all participants.
             for name, agent_type in zip(self._participant_names, self._participant_topic_types, strict=True):
-                agent_id = AgentId(type=agent_type, key=self._team_id)
+                agent_id = AgentId(type=agent_type, key=self._agent_key(session_id))
                 if name not in team_state.agent_states:
                     raise ValueError(f"Agent state for {name} not found in the saved state.")
                 await self._runtime.agent_load_state(agent_id, team_state.agent_states[name])
             # Load the state of the group chat manager.
-            agent_id = AgentId(type=self._group_chat_manager_topic_type, key=self._team_id)
+            agent_id = AgentId(type=self._group_chat_manager_topic_type, key=self._agent_key(session_id))
             if self._group_chat_manager_name not in team_state.agent_states:
                 raise ValueError(f"Agent state for {self._group_chat_manager_name} not found in the saved state.")
             await self._runtime.agent_load_state(agent_id, team_state.agent_states[self._group_chat_manager_name])
@@ -795,4 +987,32 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
 
         finally:
             # Indicate that the team is no longer running.
-            self._is_running = False
+            self._set_is_running(session_id, False)
+
+    async def close_session(self, session_id: str) -> None:
+        """Close a session and release its copies of the participants and termination condition.
+
+        The agent instances of the session are removed from the runtime if it supports it, like
+        :class:`~autogen_core.SingleThreadedAgentRuntime`, and the session ID can then be used again for a new session.
+        With other runtimes, the agent instances stay in the runtime until it evicts them, messages for the
+        closed session raise an error, and the session ID cannot be used again.
+
+        Args:
+            session_id (str): The session to close.
+
+        Raises:
+            RuntimeError: If the session is running.
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            return
+        if session.is_running:
+            raise RuntimeError("The session is currently running. It must be stopped before it can be closed.")
+        del self._sessions[session_id]
+        if isinstance(self._runtime, SupportsRemoveAgent):
+            for agent_type in [*self._participant_topic_types, self._group_chat_manager_topic_type]:
+                await self._runtime.remove_agent(AgentId(agent_type, session_id))
+        else:
+            self._closed_sessions[session_id] = None
+            if len(self._closed_sessions) > _MAX_CLOSED_SESSIONS:
+                self._closed_sessions.popitem(last=False)
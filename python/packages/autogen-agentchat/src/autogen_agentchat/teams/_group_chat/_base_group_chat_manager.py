@@ -1,6 +1,6 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, List, Sequence
+from typing import Any, Dict, List, Mapping, Sequence
 
 from autogen_core import DefaultTopicId, MessageContext, event, rpc
 
@@ -18,6 +18,7 @@
     GroupChatTermination,
     SerializableException,
 )
+from ._message_thread import MessageThreadPolicy
 from ._sequential_routed_agent import SequentialRoutedAgent
 
 
@@ -46,6 +47,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool = False,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ):
         super().__init__(
             description="Group chat manager",
@@ -73,6 +75,13 @@ def __init__(
         }
         self._participant_descriptions = participant_descriptions
         self._message_thread: List[BaseAgentEvent | BaseChatMessage] = []
+        self._message_thread_policy = message_thread_policy or MessageThreadPolicy()
+        # The number of messages dropped from the thread by the policy, not counting the dropped events.
+        self._message_thread_offset = 0
+        # The number of messages at the start of the thread that are never dropped.
+        self._num_pinned_messages = 0
+        # The number of messages of the thread written in saved states, or None if the next state must be complete.
+        self._num_saved_messages: int | None = None
         self._output_message_queue = output_message_queue
         self._termination_condition = termination_condition
         self._max_turns = max_turns
@@ -115,7 +124,7 @@ async def handle_start(self, message: GroupChatStart, ctx: MessageContext) -> No
             )
 
             # Append all messages to thread
-            self._message_thread.extend(message.messages)
+            self._add_to_message_thread(message.messages)
 
             # Check termination condition after processing all messages
             if await self._apply_termination_condition(message.messages):
@@ -142,14 +151,13 @@ async def handle_start(self, message: GroupChatStart, ctx: MessageContext) -> No
     @event
     async def handle_agent_response(self, message: GroupChatAgentResponse, ctx: MessageContext) -> None:
         try:
-            # Append the message to the message thread and construct the delta.
+            # Construct the delta and append it to the message thread.
             delta: List[BaseAgentEvent | BaseChatMessage] = []
             if message.agent_response.inner_messages is not None:
                 for inner_message in message.agent_response.inner_messages:
-                    self._message_thread.append(inner_message)
                     delta.append(inner_message)
-            self._message_thread.append(message.agent_response.chat_message)
             delta.append(message.agent_response.chat_message)
+            self._add_to_message_thread(delta)
 
             # Check if the conversation should be terminated.
             if await self._apply_termination_condition(delta, increment_turn_count=True):
@@ -179,6 +187,68 @@ async def handle_agent_response(self, message: GroupChatAgentResponse, ctx: Mess
             # Raise the exception to the runtime.
             raise
 
+    def _add_to_message_thread(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> None:
+        """Append messages to the message thread, and drop the messages the message thread policy does not retain."""
+        if self._message_thread_policy.keep_events:
+            self._message_thread.extend(messages)
+        else:
+            self._message_thread.extend(message for message in messages if isinstance(message, BaseChatMessage))
+        if self._message_thread_policy.max_messages is not None:
+            num_dropped = len(self._message_thread) - max(
+                self._message_thread_policy.max_messages, self._num_pinned_messages
+            )
+            if num_dropped > 0:
+                del self._message_thread[self._num_pinned_messages : self._num_pinned_messages + num_dropped]
+                self._message_thread_offset += num_dropped
+
+    def _clear_message_thread(self) -> None:
+        self._message_thread.clear()
+        self._message_thread_offset = 0
+        self._num_pinned_messages = 0
+        self._num_saved_messages = None
+
+    def _dump_message_thread(self) -> Dict[str, Any]:
+        """Return the message thread fields of the state of the group chat manager.
+
+        With an incremental state policy, only the messages added since the previous call are included,
+        unless the message thread has been cleared since then, or messages added since then have been dropped."""
+        num_messages = self._message_thread_offset + len(self._message_thread)
+        incremental = self._message_thread_policy.incremental_state and self._num_saved_messages is not None
+        messages = self._message_thread
+        if incremental:
+            assert self._num_saved_messages is not None
+            num_new_messages = num_messages - self._num_saved_messages
+            if num_new_messages > len(self._message_thread) - self._num_pinned_messages:
+                # Some new messages were dropped, so the state would not follow on from the previous one.
+                incremental = False
+            else:
+                messages = self._message_thread[len(self._message_thread) - num_new_messages :]
+        self._num_saved_messages = num_messages
+        return {
+            "message_thread": [message.dump() for message in messages],
+            "message_thread_offset": num_messages - len(messages),
+            "incremental": incremental,
+        }
+
+    def _load_message_thread(self, message_thread: List[Mapping[str, Any]], offset: int, incremental: bool) -> None:
+        """Load the message thread fields of a state saved by :meth:`_dump_message_thread`."""
+        messages = [self._message_factory.create(message) for message in message_thread]
+        if incremental:
+            if self._num_saved_messages is None:
+                raise ValueError("An incremental state must be loaded after the state saved before it.")
+            num_messages = self._message_thread_offset + len(self._message_thread)
+            if offset != num_messages:
+                raise ValueError(
+                    f"The incremental state starts at message {offset}, but {num_messages} messages have been "
+                    "loaded. Incremental states must all be loaded, in the order they were saved."
+                )
+        else:
+            self._message_thread = []
+            self._message_thread_offset = offset
+            self._num_pinned_messages = 0
+        self._add_to_message_thread(messages)
+        self._num_saved_messages = self._message_thread_offset + len(self._message_thread)
+
     async def _apply_termination_condition(
         self, delta: Sequence[BaseAgentEvent | BaseChatMessage], increment_turn_count: bool = False
     ) -> bool:
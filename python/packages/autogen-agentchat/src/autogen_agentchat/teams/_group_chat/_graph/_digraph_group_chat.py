@@ -21,6 +21,7 @@
 
 from ..._group_chat._base_group_chat_manager import BaseGroupChatManager
 from ..._group_chat._events import GroupChatTermination
+from ..._group_chat._message_thread import MessageThreadPolicy
 
 _DIGRAPH_STOP_AGENT_NAME = "DiGraphStopAgent"
 _DIGRAPH_STOP_AGENT_MESSAGE = "Digraph execution is complete"
@@ -194,6 +195,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         graph: DiGraph,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ) -> None:
         """Initialize the graph-based execution manager."""
         super().__init__(
@@ -207,6 +209,7 @@ def __init__(
             termination_condition=termination_condition,
             max_turns=max_turns,
             message_factory=message_factory,
+            message_thread_policy=message_thread_policy,
         )
         self._graph = graph
         self._graph.graph_validate()
@@ -363,7 +366,7 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
     async def save_state(self) -> Mapping[str, Any]:
         """Save the execution state."""
         state = {
-            "message_thread": [message.dump() for message in self._message_thread],
+            **self._dump_message_thread(),
             "current_turn": self._current_turn,
             "active_nodes": list(self._active_nodes),
             "pending_execution": self._pending_execution,
@@ -374,7 +377,9 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         """Restore execution state from saved data."""
-        self._message_thread = [self._message_factory.create(msg) for msg in state["message_thread"]]
+        self._load_message_thread(
+            state["message_thread"], state.get("message_thread_offset", 0), state.get("incremental", False)
+        )
         self._current_turn = state["current_turn"]
         self._active_nodes = set(state["active_nodes"])
         self._pending_execution = state["pending_execution"]
@@ -384,7 +389,7 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
     async def reset(self) -> None:
         """Reset execution state to the start of the graph."""
         self._current_turn = 0
-        self._message_thread.clear()
+        self._clear_message_thread()
         if self._termination_condition:
             await self._termination_condition.reset()
 
@@ -416,6 +421,7 @@ class GraphFlowConfig(BaseModel):
     termination_condition: ComponentModel | None = None
     max_turns: int | None = None
     graph: DiGraph  # The execution graph for agents
+    message_thread_policy: MessageThreadPolicy | None = None
 
 
 class GraphFlow(BaseGroupChat, Component[GraphFlowConfig]):
@@ -453,6 +459,8 @@ class GraphFlow(BaseGroupChat, Component[GraphFlowConfig]):
         termination_condition (TerminationCondition, optional): Termination condition for the chat.
         max_turns (int, optional): Maximum number of turns before forcing termination.
         graph (DiGraph): Directed execution graph defining node flow and conditions.
+        message_thread_policy (MessageThreadPolicy, optional): How the graph manager retains its message thread and saves it in the state of the team.
+            Defaults to None, meaning the whole thread is kept and saved.
 
     Raises:
         ValueError: If participant names are not unique, or if graph validation fails (e.g., cycles without exit).
@@ -645,6 +653,7 @@ def __init__(
         max_turns: int | None = None,
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ) -> None:
         stop_agent = _StopAgent()
         stop_agent_termination = StopMessageTermination()
@@ -663,6 +672,7 @@ def __init__(
             max_turns=max_turns,
             runtime=runtime,
             custom_message_types=custom_message_types,
+            message_thread_policy=message_thread_policy,
         )
         self._graph = graph
 
@@ -694,6 +704,7 @@ def _factory() -> GraphFlowManager:
                 max_turns=max_turns,
                 message_factory=message_factory,
                 graph=self._graph,
+                message_thread_policy=self._message_thread_policy,
             )
 
         return _factory
@@ -707,6 +718,7 @@ def _to_config(self) -> GraphFlowConfig:
             termination_condition=termination_condition,
             max_turns=self._max_turns,
             graph=self._graph,
+            message_thread_policy=self._message_thread_policy,
         )
 
     @classmethod
@@ -717,5 +729,9 @@ def _from_config(cls, config: GraphFlowConfig) -> Self:
             TerminationCondition.load_component(config.termination_condition) if config.termination_condition else None
         )
         return cls(
-            participants, graph=config.graph, termination_condition=termination_condition, max_turns=config.max_turns
+            participants,
+            graph=config.graph,
+            termination_condition=termination_condition,
+            max_turns=config.max_turns,
+            message_thread_policy=config.message_thread_policy,
         )
@@ -12,6 +12,7 @@
 from ....messages import BaseAgentEvent, BaseChatMessage, MessageFactory
 from .._base_group_chat import BaseGroupChat
 from .._events import GroupChatTermination
+from .._message_thread import MessageThreadPolicy
 from ._magentic_one_orchestrator import MagenticOneOrchestrator
 from ._prompts import ORCHESTRATOR_FINAL_ANSWER_PROMPT
 
@@ -29,6 +30,7 @@ class MagenticOneGroupChatConfig(BaseModel):
     max_stalls: int
     final_answer_prompt: str
     emit_team_events: bool = False
+    message_thread_policy: MessageThreadPolicy | None = None
 
 
 class MagenticOneGroupChat(BaseGroupChat, Component[MagenticOneGroupChatConfig]):
@@ -51,6 +53,8 @@ class MagenticOneGroupChat(BaseGroupChat, Component[MagenticOneGroupChatConfig])
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread_policy (MessageThreadPolicy, optional): How the orchestrator retains its message thread and saves it in the state of the team.
+            Defaults to None, meaning the whole thread is kept and saved.
 
     Raises:
         ValueError: In orchestration logic if progress ledger does not have required keys or if next speaker is not valid.
@@ -110,6 +114,7 @@ def __init__(
         final_answer_prompt: str = ORCHESTRATOR_FINAL_ANSWER_PROMPT,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ):
         super().__init__(
             participants,
@@ -120,6 +125,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread_policy=message_thread_policy,
         )
 
         # Validate the participants.
@@ -157,6 +163,7 @@ def _create_group_chat_manager_factory(
             output_message_queue,
             termination_condition,
             self._emit_team_events,
+            message_thread_policy=self._message_thread_policy,
         )
 
     def _to_config(self) -> MagenticOneGroupChatConfig:
@@ -170,6 +177,7 @@ def _to_config(self) -> MagenticOneGroupChatConfig:
             max_stalls=self._max_stalls,
             final_answer_prompt=self._final_answer_prompt,
             emit_team_events=self._emit_team_events,
+            message_thread_policy=self._message_thread_policy,
         )
 
     @classmethod
@@ -187,4 +195,5 @@ def _from_config(cls, config: MagenticOneGroupChatConfig) -> Self:
             max_stalls=config.max_stalls,
             final_answer_prompt=config.final_answer_prompt,
             emit_team_events=config.emit_team_events,
+            message_thread_policy=config.message_thread_policy,
         )
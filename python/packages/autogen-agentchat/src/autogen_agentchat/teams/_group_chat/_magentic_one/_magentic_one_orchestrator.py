@@ -38,6 +38,7 @@
     GroupChatStart,
     GroupChatTermination,
 )
+from .._message_thread import MessageThreadPolicy
 from ._prompts import (
     ORCHESTRATOR_FINAL_ANSWER_PROMPT,
     ORCHESTRATOR_PROGRESS_LEDGER_PROMPT,
@@ -70,6 +71,7 @@ def __init__(
         output_message_queue: asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination],
         termination_condition: TerminationCondition | None,
         emit_team_events: bool,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ):
         super().__init__(
             name,
@@ -83,6 +85,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events=emit_team_events,
+            message_thread_policy=message_thread_policy,
         )
         self._model_client = model_client
         self._max_stalls = max_stalls
@@ -191,7 +194,7 @@ async def handle_agent_response(self, message: GroupChatAgentResponse, ctx: Mess
         if message.agent_response.inner_messages is not None:
             for inner_message in message.agent_response.inner_messages:
                 delta.append(inner_message)
-        self._message_thread.append(message.agent_response.chat_message)
+        self._add_to_message_thread([message.agent_response.chat_message])
         delta.append(message.agent_response.chat_message)
 
         if self._termination_condition is not None:
@@ -209,7 +212,7 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
 
     async def save_state(self) -> Mapping[str, Any]:
         state = MagenticOneOrchestratorState(
-            message_thread=[msg.dump() for msg in self._message_thread],
+            **self._dump_message_thread(),
             current_turn=self._current_turn,
             task=self._task,
             facts=self._facts,
@@ -221,7 +224,13 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         orchestrator_state = MagenticOneOrchestratorState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in orchestrator_state.message_thread]
+        self._load_message_thread(
+            orchestrator_state.message_thread,
+            orchestrator_state.message_thread_offset,
+            orchestrator_state.incremental,
+        )
+        # The thread starts with the task ledger, which is kept when older messages are dropped.
+        self._num_pinned_messages = min(len(self._message_thread), 1)
         self._current_turn = orchestrator_state.current_turn
         self._task = orchestrator_state.task
         self._facts = orchestrator_state.facts
@@ -235,7 +244,7 @@ async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -
 
     async def reset(self) -> None:
         """Reset the group chat manager."""
-        self._message_thread.clear()
+        self._clear_message_thread()
         if self._termination_condition is not None:
             await self._termination_condition.reset()
         self._n_rounds = 0
@@ -254,7 +263,7 @@ async def _reenter_outer_loop(self, cancellation_token: CancellationToken) -> No
                 cancellation_token=cancellation_token,
             )
         # Reset partially the group chat manager
-        self._message_thread.clear()
+        self._clear_message_thread()
 
         # Prepare the ledger
         ledger_message = TextMessage(
@@ -262,8 +271,9 @@ async def _reenter_outer_loop(self, cancellation_token: CancellationToken) -> No
             source=self._name,
         )
 
-        # Save my copy
-        self._message_thread.append(ledger_message)
+        # Save my copy, keeping it when older messages are dropped from the thread.
+        self._add_to_message_thread([ledger_message])
+        self._num_pinned_messages = 1
 
         # Log it to the output topic.
         await self.publish_message(
@@ -376,7 +386,7 @@ async def _orchestrate_step(self, cancellation_token: CancellationToken) -> None
 
         # Broadcast the next step
         message = TextMessage(content=progress_ledger["instruction_or_question"]["answer"], source=self._name)
-        self._message_thread.append(message)  # My copy
+        self._add_to_message_thread([message])  # My copy
 
         await self._log_message(f"Next Speaker: {progress_ledger['next_speaker']['answer']}")
         # Log it to the output topic.
@@ -458,7 +468,7 @@ async def _prepare_final_answer(self, reason: str, cancellation_token: Cancellat
         assert isinstance(response.content, str)
         message = TextMessage(content=response.content, source=self._name)
 
-        self._message_thread.append(message)  # My copy
+        self._add_to_message_thread([message])  # My copy
 
         # Log it to the output topic.
         await self.publish_message(
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field
+
+
+class MessageThreadPolicy(BaseModel):
+    """How the group chat manager of a team retains its message thread and saves it in the state of the team.
+
+    The message thread is the conversation as seen by the group chat manager: the speaker selection of the team
+    uses it, and it is part of the saved state of the team. By default every message is kept until the team is
+    reset and every saved state contains the whole thread, so both grow with the length of the run.
+    The termination condition is not affected by the policy, it always receives every new message.
+
+    Example:
+
+        .. code-block:: python
+
+            from autogen_agentchat.teams import MessageThreadPolicy, RoundRobinGroupChat
+
+            # Keep the last 50 chat messages, and only write the new messages in each saved state.
+            policy = MessageThreadPolicy(max_messages=50, keep_events=False, incremental_state=True)
+            team = RoundRobinGroupChat(participants, termination_condition=termination, message_thread_policy=policy)
+    """
+
+    max_messages: int | None = Field(default=None, ge=1)
+    """The maximum number of messages kept in the thread. The oldest messages are dropped first.
+    Defaults to None, meaning no limit."""
+
+    keep_events: bool = True
+    """Whether agent events, such as tool call requests and their results, are kept in the thread.
+    Only chat messages are kept if False. Defaults to True."""
+
+    incremental_state: bool = False
+    """Whether a saved state only contains the messages added to the thread since the previous state was saved.
+    The first state saved after the team is created or reset contains the whole thread.
+    An incremental state must be loaded after the states saved before it, in the same order. Defaults to False."""
@@ -11,6 +11,7 @@
 from ._base_group_chat import BaseGroupChat
 from ._base_group_chat_manager import BaseGroupChatManager
 from ._events import GroupChatTermination
+from ._message_thread import MessageThreadPolicy
 
 
 class RoundRobinGroupChatManager(BaseGroupChatManager):
@@ -29,6 +30,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -42,6 +44,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events,
+            message_thread_policy=message_thread_policy,
         )
         self._next_speaker_index = 0
 
@@ -50,14 +53,14 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
 
     async def reset(self) -> None:
         self._current_turn = 0
-        self._message_thread.clear()
+        self._clear_message_thread()
         if self._termination_condition is not None:
             await self._termination_condition.reset()
         self._next_speaker_index = 0
 
     async def save_state(self) -> Mapping[str, Any]:
         state = RoundRobinManagerState(
-            message_thread=[message.dump() for message in self._message_thread],
+            **self._dump_message_thread(),
             current_turn=self._current_turn,
             next_speaker_index=self._next_speaker_index,
         )
@@ -65,7 +68,9 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         round_robin_state = RoundRobinManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in round_robin_state.message_thread]
+        self._load_message_thread(
+            round_robin_state.message_thread, round_robin_state.message_thread_offset, round_robin_state.incremental
+        )
         self._current_turn = round_robin_state.current_turn
         self._next_speaker_index = round_robin_state.next_speaker_index
 
@@ -84,6 +89,7 @@ class RoundRobinGroupChatConfig(BaseModel):
     termination_condition: ComponentModel | None = None
     max_turns: int | None = None
     emit_team_events: bool = False
+    message_thread_policy: MessageThreadPolicy | None = None
 
 
 class RoundRobinGroupChat(BaseGroupChat, Component[RoundRobinGroupChatConfig]):
@@ -101,6 +107,8 @@ class RoundRobinGroupChat(BaseGroupChat, Component[RoundRobinGroupChatConfig]):
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread_policy (MessageThreadPolicy, optional): How the group chat manager retains its message thread and saves it in the state of the team.
+            Defaults to None, meaning the whole thread is kept and saved.
 
     Raises:
         ValueError: If no participants are provided or if participant names are not unique.
@@ -175,6 +183,7 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ) -> None:
         super().__init__(
             participants,
@@ -185,6 +194,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread_policy=message_thread_policy,
         )
 
     def _create_group_chat_manager_factory(
@@ -213,6 +223,7 @@ def _factory() -> RoundRobinGroupChatManager:
                 max_turns,
                 message_factory,
                 self._emit_team_events,
+                message_thread_policy=self._message_thread_policy,
             )
 
         return _factory
@@ -225,6 +236,7 @@ def _to_config(self) -> RoundRobinGroupChatConfig:
             termination_condition=termination_condition,
             max_turns=self._max_turns,
             emit_team_events=self._emit_team_events,
+            message_thread_policy=self._message_thread_policy,
         )
 
     @classmethod
@@ -238,4 +250,5 @@ def _from_config(cls, config: RoundRobinGroupChatConfig) -> Self:
             termination_condition=termination_condition,
             max_turns=config.max_turns,
             emit_team_events=config.emit_team_events,
+            message_thread_policy=config.message_thread_policy,
         )
@@ -1,8 +1,10 @@
 import asyncio
+import bisect
+import functools
 import logging
 import re
 from inspect import iscoroutinefunction
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Union, cast
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast
 
 from autogen_core import AgentRuntime, Component, ComponentModel
 from autogen_core.models import (
@@ -30,6 +32,7 @@
 from ._base_group_chat import BaseGroupChat
 from ._base_group_chat_manager import BaseGroupChatManager
 from ._events import GroupChatTermination
+from ._message_thread import MessageThreadPolicy
 
 trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
 
@@ -42,6 +45,20 @@
 CandidateFuncType = Union[SyncCandidateFunc | AsyncCandidateFunc]
 
 
+@functools.lru_cache(maxsize=32)
+def _mention_pattern(agent_names: Tuple[str, ...]) -> Tuple[re.Pattern[str], Dict[str, str]]:
+    """Compile one pattern that matches a mention of any of the agent names,
+    and return it with a mapping from each matched spelling to the agent name."""
+    spellings: Dict[str, str] = {}
+    for name in agent_names:
+        for spelling in (name, name.replace("_", " "), name.replace("_", r"\_")):
+            spellings.setdefault(spelling, name)
+    # Longer spellings first, so a name is not matched as part of a longer name.
+    alternatives = sorted(spellings, key=len, reverse=True)
+    pattern = re.compile(r"(?<=\W)(" + "|".join(re.escape(spelling) for spelling in alternatives) + r")(?=\W)")
+    return pattern, spellings
+
+
 class SelectorGroupChatManager(BaseGroupChatManager):
     """A group chat manager that selects the next speaker using a ChatCompletion
     model and a custom selector function."""
@@ -66,6 +83,9 @@ def __init__(
         candidate_func: Optional[CandidateFuncType],
         emit_team_events: bool,
         model_client_streaming: bool = False,
+        max_selector_history_messages: int | None = None,
+        max_selector_history_tokens: int | None = None,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -79,6 +99,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events,
+            message_thread_policy=message_thread_policy,
         )
         self._model_client = model_client
         self._selector_prompt = selector_prompt
@@ -90,20 +111,36 @@ def __init__(
         self._candidate_func = candidate_func
         self._is_candidate_func_async = iscoroutinefunction(self._candidate_func)
         self._model_client_streaming = model_client_streaming
+        self._max_selector_history_messages = max_selector_history_messages
+        self._max_selector_history_tokens = max_selector_history_tokens
+        # Each agent should appear on a single line.
+        self._roles = "\n".join(
+            re.sub(r"\s+", " ", f"{topic_type}: {description}").strip()
+            for topic_type, description in zip(self._participant_names, self._participant_descriptions, strict=True)
+        )
+        # The transcript of the chat messages in the thread, rendered as they are added to the thread.
+        self._history_entries: List[str] = []
+        # The token counts of the history entries, counted when a token limit is set.
+        self._history_entry_tokens: List[int] = []
+        # The positions in the conversation of the messages of the history entries.
+        self._history_entry_positions: List[int] = []
+        self._num_rendered_messages = 0
+        self._last_rendered_message: BaseAgentEvent | BaseChatMessage | None = None
 
     async def validate_group_state(self, messages: List[BaseChatMessage] | None) -> None:
         pass
 
     async def reset(self) -> None:
         self._current_turn = 0
-        self._message_thread.clear()
+        self._clear_message_thread()
         if self._termination_condition is not None:
             await self._termination_condition.reset()
         self._previous_speaker = None
+        self._clear_history()
 
     async def save_state(self) -> Mapping[str, Any]:
         state = SelectorManagerState(
-            message_thread=[msg.dump() for msg in self._message_thread],
+            **self._dump_message_thread(),
             current_turn=self._current_turn,
             previous_speaker=self._previous_speaker,
         )
@@ -111,9 +148,12 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         selector_state = SelectorManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(msg) for msg in selector_state.message_thread]
+        self._load_message_thread(
+            selector_state.message_thread, selector_state.message_thread_offset, selector_state.incremental
+        )
         self._current_turn = selector_state.current_turn
         self._previous_speaker = selector_state.previous_speaker
+        self._clear_history()
 
     async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -> str:
         """Selects the next speaker in a group chat using a ChatCompletion client,
@@ -163,34 +203,71 @@ async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -
 
         assert len(participants) > 0
 
-        # Construct the history of the conversation.
-        history_messages: List[str] = []
-        for msg in thread:
-            if not isinstance(msg, BaseChatMessage):
-                # Only process chat messages.
-                continue
-            message = f"{msg.source}: {msg.to_model_text()}"
-            history_messages.append(
-                message.rstrip() + "\n\n"
-            )  # Create some consistency for how messages are separated in the transcript
-        history = "\n".join(history_messages)
-
-        # Construct agent roles.
-        # Each agent sould appear on a single line.
-        roles = ""
-        for topic_type, description in zip(self._participant_names, self._participant_descriptions, strict=True):
-            roles += re.sub(r"\s+", " ", f"{topic_type}: {description}").strip() + "\n"
-        roles = roles.strip()
+        history = self._selector_history(thread)
 
         # Select the next speaker.
         if len(participants) > 1:
-            agent_name = await self._select_speaker(roles, participants, history, self._max_selector_attempts)
+            agent_name = await self._select_speaker(self._roles, participants, history, self._max_selector_attempts)
         else:
             agent_name = participants[0]
         self._previous_speaker = agent_name
         trace_logger.debug(f"Selected speaker: {agent_name}")
         return agent_name
 
+    def _clear_history(self) -> None:
+        self._history_entries.clear()
+        self._history_entry_tokens.clear()
+        self._history_entry_positions.clear()
+        self._num_rendered_messages = 0
+        self._last_rendered_message = None
+
+    def _selector_history(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> str:
+        """Return the conversation history for the selector prompt, rendering only the messages
+        added to the thread since the last call, and keeping only the most recent messages
+        that fit the history limits."""
+        # Positions in the thread are counted from the start of the conversation, so that they
+        # remain valid when the message thread policy drops the oldest messages.
+        offset = self._message_thread_offset if thread is self._message_thread else 0
+        start = self._num_rendered_messages - offset
+        if start < 0 or start > len(thread) or (start > 0 and thread[start - 1] is not self._last_rendered_message):
+            # The thread is not the one rendered so far.
+            self._clear_history()
+            start = 0
+        for position, msg in enumerate(thread[start:], start=offset + start):
+            if not isinstance(msg, BaseChatMessage):
+                # Only process chat messages.
+                continue
+            message = f"{msg.source}: {msg.to_model_text()}"
+            # Create some consistency for how messages are separated in the transcript
+            self._history_entries.append(message.rstrip() + "\n\n")
+            self._history_entry_positions.append(position)
+        self._num_rendered_messages = offset + len(thread)
+        self._last_rendered_message = thread[-1] if thread else None
+        # Forget the entries of the messages dropped from the thread.
+        num_dropped = bisect.bisect_left(self._history_entry_positions, offset)
+        if num_dropped > 0:
+            del self._history_entries[:num_dropped]
+            del self._history_entry_positions[:num_dropped]
+            del self._history_entry_tokens[:num_dropped]
+
+        entries = self._history_entries
+        if self._max_selector_history_messages is not None:
+            entries = entries[-self._max_selector_history_messages :]
+        if self._max_selector_history_tokens is not None:
+            for entry in self._history_entries[len(self._history_entry_tokens) :]:
+                self._history_entry_tokens.append(
+                    self._model_client.count_tokens([UserMessage(content=entry, source="user")])
+                )
+            num_tokens = 0
+            num_entries = 0
+            for entry_tokens in reversed(self._history_entry_tokens[len(self._history_entries) - len(entries) :]):
+                if num_tokens + entry_tokens > self._max_selector_history_tokens:
+                    break
+                num_tokens += entry_tokens
+                num_entries += 1
+            entries = entries[len(entries) - num_entries :]
+        return "\n".join(entries)
+
     async def _select_speaker(self, roles: str, participants: List[str], history: str, max_attempts: int) -> str:
         select_speaker_prompt = self._selector_prompt.format(
             roles=roles, participants=str(participants), history=history
@@ -279,23 +356,12 @@ def _mentioned_agents(self, message_content: str, agent_names: List[str]) -> Dic
         Returns:
             Dict: a counter for mentioned agents.
         """
+        pattern, spellings = _mention_pattern(tuple(agent_names))
         mentions: Dict[str, int] = dict()
-        for name in agent_names:
-            # Finds agent mentions, taking word boundaries into account,
-            # accommodates escaping underscores and underscores as spaces
-            regex = (
-                r"(?<=\W)("
-                + re.escape(name)
-                + r"|"
-                + re.escape(name.replace("_", " "))
-                + r"|"
-                + re.escape(name.replace("_", r"\_"))
-                + r")(?=\W)"
-            )
-            # Pad the message to help with matching
-            count = len(re.findall(regex, f" {message_content} "))
-            if count > 0:
-                mentions[name] = count
+        # Pad the message to help with matching
+        for spelling in pattern.findall(f" {message_content} "):
+            name = spellings[spelling]
+            mentions[name] = mentions.get(name, 0) + 1
         return mentions
 
 
@@ -312,6 +378,9 @@ class SelectorGroupChatConfig(BaseModel):
     max_selector_attempts: int = 3
     emit_team_events: bool = False
     model_client_streaming: bool = False
+    max_selector_history_messages: int | None = None
+    max_selector_history_tokens: int | None = None
+    message_thread_policy: MessageThreadPolicy | None = None
 
 
 class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
@@ -349,6 +418,13 @@ class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
         model_client_streaming (bool, optional): Whether to use streaming for the model client. (This is useful for reasoning models like QwQ). Defaults to False.
+        max_selector_history_messages (int, optional): The maximum number of the most recent messages included in `{history}` of the selector prompt.
+            Defaults to None, meaning all messages are included.
+        max_selector_history_tokens (int, optional): The maximum number of tokens of the messages included in `{history}` of the selector prompt,
+            counted with the `count_tokens` method of the model client. The most recent messages that fit are included.
+            Defaults to None, meaning no limit.
+        message_thread_policy (MessageThreadPolicy, optional): How the group chat manager retains its message thread and saves it in the state of the team.
+            Defaults to None, meaning the whole thread is kept and saved.
 
     Raises:
         ValueError: If the number of participants is less than two or if the selector prompt is invalid.
@@ -492,6 +568,9 @@ def __init__(
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
         model_client_streaming: bool = False,
+        max_selector_history_messages: int | None = None,
+        max_selector_history_tokens: int | None = None,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ):
         super().__init__(
             participants,
@@ -502,10 +581,15 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread_policy=message_thread_policy,
         )
         # Validate the participants.
         if len(participants) < 2:
             raise ValueError("At least two participants are required for SelectorGroupChat.")
+        if max_selector_history_messages is not None and max_selector_history_messages < 1:
+            raise ValueError("max_selector_history_messages must be at least 1.")
+        if max_selector_history_tokens is not None and max_selector_history_tokens < 1:
+            raise ValueError("max_selector_history_tokens must be at least 1.")
         self._selector_prompt = selector_prompt
         self._model_client = model_client
         self._allow_repeated_speaker = allow_repeated_speaker
@@ -513,6 +597,8 @@ def __init__(
         self._max_selector_attempts = max_selector_attempts
         self._candidate_func = candidate_func
         self._model_client_streaming = model_client_streaming
+        self._max_selector_history_messages = max_selector_history_messages
+        self._max_selector_history_tokens = max_selector_history_tokens
 
     def _create_group_chat_manager_factory(
         self,
@@ -546,6 +632,9 @@ def _create_group_chat_manager_factory(
             self._candidate_func,
             self._emit_team_events,
             self._model_client_streaming,
+            self._max_selector_history_messages,
+            self._max_selector_history_tokens,
+            message_thread_policy=self._message_thread_policy,
         )
 
     def _to_config(self) -> SelectorGroupChatConfig:
@@ -560,6 +649,9 @@ def _to_config(self) -> SelectorGroupChatConfig:
             # selector_func=self._selector_func.dump_component() if self._selector_func else None,
             emit_team_events=self._emit_team_events,
             model_client_streaming=self._model_client_streaming,
+            max_selector_history_messages=self._max_selector_history_messages,
+            max_selector_history_tokens=self._max_selector_history_tokens,
+            message_thread_policy=self._message_thread_policy,
         )
 
     @classmethod
@@ -579,4 +671,7 @@ def _from_config(cls, config: SelectorGroupChatConfig) -> Self:
             # else None,
             emit_team_events=config.emit_team_events,
             model_client_streaming=config.model_client_streaming,
+            max_selector_history_messages=config.max_selector_history_messages,
+            max_selector_history_tokens=config.max_selector_history_tokens,
+            message_thread_policy=config.message_thread_policy,
         )
@@ -0,0 +1,53 @@
+import copy
+from typing import Any, Dict, Protocol, Set, TypeVar, runtime_checkable
+
+from autogen_core import AgentId, AgentRuntime
+from autogen_core.code_executor import CodeExecutor
+from autogen_core.memory import Memory
+from autogen_core.models import ChatCompletionClient
+from autogen_core.tools import BaseTool, Workbench
+
+from ...base import Team
+
+T = TypeVar("T")
+
+# Objects of these types are shared between the copies made for sessions instead of being copied.
+# They hold connections, processes or teams of their own, which must not be duplicated.
+_SHARED_TYPES = (ChatCompletionClient, BaseTool, Workbench, CodeExecutor, Memory, Team, AgentRuntime)
+
+
+def _share_resources(value: Any, memo: Dict[int, Any], visited: Set[int]) -> None:
+    """Add the shared objects reachable from the value to the memo of :func:`copy.deepcopy`."""
+    if id(value) in visited or isinstance(value, (str, bytes, int, float, bool, type(None), type)):
+        return
+    visited.add(id(value))
+    if isinstance(value, _SHARED_TYPES):
+        memo[id(value)] = value
+        return
+    if isinstance(value, dict):
+        for item in value.values():  # type: ignore[reportUnknownVariableType]
+            _share_resources(item, memo, visited)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:  # type: ignore[reportUnknownVariableType]
+            _share_resources(item, memo, visited)
+    elif hasattr(value, "__dict__"):
+        for item in vars(value).values():
+            _share_resources(item, memo, visited)
+
+
+def copy_for_session(value: T) -> T:
+    """Deep copy a participant or termination condition for a session of a team.
+
+    Model clients, tools, workbenches, code executors, memories, nested teams and runtimes are shared with
+    the original instead of being copied, so the copy has its own conversation state, such as its model
+    context, but uses the same connections and resources."""
+    memo: Dict[int, Any] = {}
+    _share_resources(value, memo, set())
+    return copy.deepcopy(value, memo)
+
+
+@runtime_checkable
+class SupportsRemoveAgent(Protocol):
+    """A runtime that can remove agent instances, such as :class:`~autogen_core.SingleThreadedAgentRuntime`."""
+
+    async def remove_agent(self, id: AgentId) -> None: ...
@@ -10,6 +10,7 @@
 from ._base_group_chat import BaseGroupChat
 from ._base_group_chat_manager import BaseGroupChatManager
 from ._events import GroupChatTermination
+from ._message_thread import MessageThreadPolicy
 
 
 class SwarmGroupChatManager(BaseGroupChatManager):
@@ -28,6 +29,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -41,6 +43,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events,
+            message_thread_policy=message_thread_policy,
         )
         self._current_speaker = self._participant_names[0]
 
@@ -74,7 +77,7 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
 
     async def reset(self) -> None:
         self._current_turn = 0
-        self._message_thread.clear()
+        self._clear_message_thread()
         if self._termination_condition is not None:
             await self._termination_condition.reset()
         self._current_speaker = self._participant_names[0]
@@ -94,7 +97,7 @@ async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -
 
     async def save_state(self) -> Mapping[str, Any]:
         state = SwarmManagerState(
-            message_thread=[msg.dump() for msg in self._message_thread],
+            **self._dump_message_thread(),
             current_turn=self._current_turn,
             current_speaker=self._current_speaker,
         )
@@ -102,7 +105,9 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         swarm_state = SwarmManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in swarm_state.message_thread]
+        self._load_message_thread(
+            swarm_state.message_thread, swarm_state.message_thread_offset, swarm_state.incremental
+        )
         self._current_turn = swarm_state.current_turn
         self._current_speaker = swarm_state.current_speaker
 
@@ -114,6 +119,7 @@ class SwarmConfig(BaseModel):
     termination_condition: ComponentModel | None = None
     max_turns: int | None = None
     emit_team_events: bool = False
+    message_thread_policy: MessageThreadPolicy | None = None
 
 
 class Swarm(BaseGroupChat, Component[SwarmConfig]):
@@ -133,6 +139,8 @@ class Swarm(BaseGroupChat, Component[SwarmConfig]):
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread_policy (MessageThreadPolicy, optional): How the group chat manager retains its message thread and saves it in the state of the team.
+            Defaults to None, meaning the whole thread is kept and saved.
 
     Basic example:
 
@@ -221,6 +229,7 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread_policy: MessageThreadPolicy | None = None,
     ) -> None:
         super().__init__(
             participants,
@@ -231,6 +240,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread_policy=message_thread_policy,
         )
         # The first participant must be able to produce handoff messages.
         first_participant = self._participants[0]
@@ -263,6 +273,7 @@ def _factory() -> SwarmGroupChatManager:
                 max_turns,
                 message_factory,
                 self._emit_team_events,
+                message_thread_policy=self._message_thread_policy,
             )
 
         return _factory
@@ -275,6 +286,7 @@ def _to_config(self) -> SwarmConfig:
             termination_condition=termination_condition,
             max_turns=self._max_turns,
             emit_team_events=self._emit_team_events,
+            message_thread_policy=self._message_thread_policy,
         )
 
     @classmethod
@@ -288,4 +300,5 @@ def _from_config(cls, config: SwarmConfig) -> "Swarm":
             termination_condition=termination_condition,
             max_turns=config.max_turns,
             emit_team_events=config.emit_team_events,
+            message_thread_policy=config.message_thread_policy,
         )
@@ -13,6 +13,7 @@
 from autogen_agentchat.messages import (
     BaseAgentEvent,
     BaseChatMessage,
+    CodeExecutionStreamingChunkEvent,
     ModelClientStreamingChunkEvent,
     MultiModalMessage,
     UserInputRequestedEvent,
@@ -113,8 +114,15 @@ async def Console(
     last_processed: Optional[T] = None
 
     streaming_chunks: List[str] = []
+    code_execution_chunks: List[str] = []
 
     async for message in stream:
+        if code_execution_chunks and not isinstance(message, CodeExecutionStreamingChunkEvent):
+            # The code output is already printed, so we just end its last line before the next message.
+            if not code_execution_chunks[-1].endswith("\n"):
+                await aprint("", end="\n", flush=True)
+            code_execution_chunks.clear()
+
         if isinstance(message, TaskResult):
             duration = time.time() - start_time
             if output_stats:
@@ -168,6 +176,15 @@ async def Console(
         elif isinstance(message, UserInputRequestedEvent):
             if user_input_manager is not None:
                 user_input_manager.notify_event_received(message.request_id)
+        # The code output is printed as it is produced, and the final CodeExecutionEvent is still printed in full.
+        elif isinstance(message, CodeExecutionStreamingChunkEvent):
+            if not code_execution_chunks:
+                # Print message sender.
+                await aprint(
+                    f"{'-' * 10} {message.__class__.__name__} ({message.source}) {'-' * 10}", end="\n", flush=True
+                )
+            await aprint(message.to_text(), end="", flush=True)
+            code_execution_chunks.append(message.content)
         else:
             # Cast required for mypy to be happy
             message = cast(BaseAgentEvent | BaseChatMessage, message)  # type: ignore
@@ -1,6 +1,7 @@
+import asyncio
 import json
 import logging
-from typing import Dict, List
+from typing import Any, AsyncGenerator, Callable, Dict, List, Mapping, Optional, Sequence, Union
 
 import pytest
 from autogen_agentchat import EVENT_LOGGER_NAME
@@ -19,7 +20,7 @@
     ToolCallRequestEvent,
     ToolCallSummaryMessage,
 )
-from autogen_core import ComponentModel, FunctionCall, Image
+from autogen_core import CancellationToken, ComponentModel, FunctionCall, Image
 from autogen_core.memory import ListMemory, Memory, MemoryContent, MemoryMimeType, MemoryQueryResult
 from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import (
@@ -33,7 +34,7 @@
     UserMessage,
 )
 from autogen_core.models._model_client import ModelFamily
-from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench
+from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench, Tool, ToolSchema
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_ext.models.replay import ReplayChatCompletionClient
 from autogen_ext.tools.mcp import (
@@ -405,6 +406,212 @@ async def test_run_with_parallel_tools_with_empty_call_ids() -> None:
     assert state == state2
 
 
+@pytest.mark.asyncio
+async def test_run_with_parallel_tools_streaming_results() -> None:
+    num_running = 0
+    max_num_running = 0
+
+    async def _sleep_function(seconds: float) -> str:
+        nonlocal num_running, max_num_running
+        num_running += 1
+        max_num_running = max(max_num_running, num_running)
+        await asyncio.sleep(seconds)
+        num_running -= 1
+        return f"slept {seconds}"
+
+    model_client = ReplayChatCompletionClient(
+        [
+            CreateResult(
+                finish_reason="function_calls",
+                content=[
+                    FunctionCall(id="1", arguments=json.dumps({"seconds": 0.3}), name="_sleep_function"),
+                    FunctionCall(id="2", arguments=json.dumps({"seconds": 0.01}), name="_sleep_function"),
+                    FunctionCall(id="3", arguments=json.dumps({"seconds": 0.1}), name="_sleep_function"),
+                ],
+                usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                cached=False,
+            ),
+        ],
+        model_info={
+            "function_calling": True,
+            "vision": True,
+            "json_output": True,
+            "family": ModelFamily.GPT_4O,
+            "structured_output": True,
+        },
+    )
+    agent = AssistantAgent(
+        "tool_use_agent",
+        model_client=model_client,
+        tools=[_sleep_function],
+        stream_tool_call_results=True,
+        max_concurrent_tool_calls=2,
+    )
+    result = await agent.run(task="task")
+
+    assert max_num_running == 2
+    assert len(result.messages) == 6
+    assert isinstance(result.messages[1], ToolCallRequestEvent)
+    # One execution event per tool call, in the order they complete.
+    execution_events = result.messages[2:5]
+    assert all(isinstance(event, ToolCallExecutionEvent) for event in execution_events)
+    assert [event.content[0].call_id for event in execution_events] == ["2", "3", "1"]  # type: ignore[union-attr]
+    assert isinstance(result.messages[5], ToolCallSummaryMessage)
+    assert result.messages[5].content == "slept 0.3\nslept 0.01\nslept 0.1"
+
+    # The model context gets the results in the order of the tool calls.
+    messages = await agent.model_context.get_messages()
+    assert isinstance(messages[-1], FunctionExecutionResultMessage)
+    assert [result.call_id for result in messages[-1].content] == ["1", "2", "3"]
+
+    with pytest.raises(ValueError):
+        AssistantAgent("agent", model_client=model_client, max_concurrent_tool_calls=0)
+
+
+@pytest.mark.asyncio
+async def test_run_with_speculative_tool_execution() -> None:
+    stream_done = False
+    tool_calls_started: List[bool] = []
+
+    async def _echo_function(input: str) -> str:
+        tool_calls_started.append(stream_done)
+        return input
+
+    class _FunctionCallReplayChatCompletionClient(ReplayChatCompletionClient):
+        async def create_stream(  # type: ignore[override]
+            self,
+            messages: Sequence[LLMMessage],
+            *,
+            tools: Sequence[Tool | ToolSchema] = [],
+            json_output: Optional[bool | type[BaseModel]] = None,
+            extra_create_args: Mapping[str, Any] = {},
+            cancellation_token: Optional[CancellationToken] = None,
+            on_function_call: Callable[[FunctionCall], None] | None = None,
+        ) -> AsyncGenerator[Union[str, CreateResult], None]:
+            nonlocal stream_done
+            stream_done = False
+            response = self.chat_completions[self._current_index]
+            if on_function_call is not None and isinstance(response, CreateResult):
+                assert isinstance(response.content, list)
+                for call in response.content:
+                    on_function_call(call)
+            await asyncio.sleep(0.05)
+            stream_done = True
+            async for chunk in super().create_stream(messages, tools=tools, cancellation_token=cancellation_token):
+                yield chunk
+
+    model_client = _FunctionCallReplayChatCompletionClient(
+        [
+            CreateResult(
+                finish_reason="function_calls",
+                content=[
+                    FunctionCall(id="1", arguments=json.dumps({"input": "a"}), name="_echo_function"),
+                    FunctionCall(id="2", arguments=json.dumps({"input": "b"}), name="_echo_function"),
+                ],
+                usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                cached=False,
+            ),
+        ],
+        model_info={
+            "function_calling": True,
+            "vision": True,
+            "json_output": True,
+            "family": ModelFamily.GPT_4O,
+            "structured_output": True,
+        },
+    )
+    agent = AssistantAgent(
+        "tool_use_agent",
+        model_client=model_client,
+        tools=[_echo_function],
+        model_client_stream=True,
+        speculative_tool_execution=True,
+    )
+    result = await agent.run(task="task")
+
+    # Each tool call ran once, and started before the model finished streaming.
+    assert tool_calls_started == [False, False]
+    assert isinstance(result.messages[-1], ToolCallSummaryMessage)
+    assert result.messages[-1].content == "a\nb"
+
+    with pytest.raises(ValueError):
+        AssistantAgent("agent", model_client=model_client, speculative_tool_execution=True)
+    with pytest.raises(ValueError):
+        AssistantAgent(
+            "agent",
+            model_client=ReplayChatCompletionClient(["Hello"]),
+            model_client_stream=True,
+            speculative_tool_execution=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_speculative_tool_execution_cancels_mismatched_tool_calls() -> None:
+    events: List[str] = []
+
+    async def _slow_function(input: str) -> str:
+        events.append("slow started")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            events.append("slow cancelled")
+            raise
+        return input
+
+    async def _echo_function(input: str) -> str:
+        events.append("echo")
+        return input
+
+    class _FunctionCallReplayChatCompletionClient(ReplayChatCompletionClient):
+        async def create_stream(  # type: ignore[override]
+            self,
+            messages: Sequence[LLMMessage],
+            *,
+            tools: Sequence[Tool | ToolSchema] = [],
+            json_output: Optional[bool | type[BaseModel]] = None,
+            extra_create_args: Mapping[str, Any] = {},
+            cancellation_token: Optional[CancellationToken] = None,
+            on_function_call: Callable[[FunctionCall], None] | None = None,
+        ) -> AsyncGenerator[Union[str, CreateResult], None]:
+            # Report a tool call that is not part of the final response.
+            if on_function_call is not None:
+                on_function_call(FunctionCall(id="0", arguments=json.dumps({"input": "x"}), name="_slow_function"))
+            await asyncio.sleep(0.05)
+            async for chunk in super().create_stream(messages, tools=tools, cancellation_token=cancellation_token):
+                yield chunk
+
+    model_client = _FunctionCallReplayChatCompletionClient(
+        [
+            CreateResult(
+                finish_reason="function_calls",
+                content=[FunctionCall(id="1", arguments=json.dumps({"input": "a"}), name="_echo_function")],
+                usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                cached=False,
+            ),
+        ],
+        model_info={
+            "function_calling": True,
+            "vision": True,
+            "json_output": True,
+            "family": ModelFamily.GPT_4O,
+            "structured_output": True,
+        },
+    )
+    agent = AssistantAgent(
+        "tool_use_agent",
+        model_client=model_client,
+        tools=[_slow_function, _echo_function],
+        model_client_stream=True,
+        speculative_tool_execution=True,
+    )
+    result = await agent.run(task="task")
+
+    # The mismatched tool call is cancelled before the tool calls of the final response run.
+    assert events == ["slow started", "slow cancelled", "echo"]
+    assert isinstance(result.messages[-1], ToolCallSummaryMessage)
+    assert result.messages[-1].content == "a"
+
+
 @pytest.mark.asyncio
 async def test_run_with_workbench() -> None:
     model_client = ReplayChatCompletionClient(
@@ -3,9 +3,11 @@
 from autogen_agentchat.base import Response
 from autogen_agentchat.messages import (
     CodeExecutionEvent,
+    CodeExecutionStreamingChunkEvent,
     CodeGenerationEvent,
     TextMessage,
 )
+from autogen_agentchat.ui import Console
 from autogen_core import CancellationToken
 from autogen_core.models import ModelFamily, ModelInfo
 from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
@@ -399,6 +401,64 @@ async def test_code_execution_multiple_blocks() -> None:
     assert "ValueError: math domain error" in response.chat_message.content
 
 
+@pytest.mark.asyncio
+async def test_code_execution_stream() -> None:
+    """Test streaming the output of the code as it is executed"""
+
+    agent = CodeExecutorAgent(
+        name="code_executor", code_executor=LocalCommandLineCodeExecutor(), code_execution_stream=True
+    )
+
+    messages = [
+        TextMessage(
+            content="""
+```python
+import time
+
+for i in range(3):
+    print("step", i, flush=True)
+    time.sleep(0.1)
+```
+""".strip(),
+            source="assistant",
+        )
+    ]
+    chunks: list[str] = []
+    response: Response | None = None
+    async for message in agent.on_messages_stream(messages, CancellationToken()):
+        if isinstance(message, CodeExecutionStreamingChunkEvent):
+            assert response is None
+            assert message.source == "code_executor"
+            chunks.append(message.content)
+        elif isinstance(message, Response):
+            response = message
+
+    assert "".join(chunks) == "step 0\nstep 1\nstep 2\n"
+    assert response is not None
+    assert isinstance(response.chat_message, TextMessage)
+    assert response.chat_message.content == "step 0\nstep 1\nstep 2\n"
+
+    # The chunks are not part of the task result.
+    result = await agent.run(task=messages[0])
+    assert not any(isinstance(message, CodeExecutionStreamingChunkEvent) for message in result.messages)
+
+
+@pytest.mark.asyncio
+async def test_code_execution_stream_console(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that the console prints the final message in full after the streamed code output"""
+
+    agent = CodeExecutorAgent(
+        name="code_executor", code_executor=LocalCommandLineCodeExecutor(), code_execution_stream=True
+    )
+    task = TextMessage(content="```python\nprint('hello', end='')\n```", source="assistant")
+    result = await Console(agent.run_stream(task=task))
+
+    assert isinstance(result.messages[-1], TextMessage)
+    output = capsys.readouterr().out
+    assert "---------- CodeExecutionStreamingChunkEvent (code_executor) ----------\nhello\n" in output
+    assert "---------- TextMessage (code_executor) ----------\nhello\n" in output
+
+
 @pytest.mark.asyncio
 async def test_code_execution_agent_serialization() -> None:
     """Test agent config serialization"""
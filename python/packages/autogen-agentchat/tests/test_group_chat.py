@@ -14,6 +14,7 @@
 )
 from autogen_agentchat.base import Handoff, Response, TaskResult, TerminationCondition
 from autogen_agentchat.conditions import (
+    ExternalTermination,
     HandoffTermination,
     MaxMessageTermination,
     StopMessageTermination,
@@ -34,12 +35,19 @@
     ToolCallRequestEvent,
     ToolCallSummaryMessage,
 )
-from autogen_agentchat.teams import MagenticOneGroupChat, RoundRobinGroupChat, SelectorGroupChat, Swarm
+from autogen_agentchat.teams import (
+    MagenticOneGroupChat,
+    MessageThreadPolicy,
+    RoundRobinGroupChat,
+    SelectorGroupChat,
+    Swarm,
+)
 from autogen_agentchat.teams._group_chat._round_robin_group_chat import RoundRobinGroupChatManager
 from autogen_agentchat.teams._group_chat._selector_group_chat import SelectorGroupChatManager
 from autogen_agentchat.teams._group_chat._swarm_group_chat import SwarmGroupChatManager
 from autogen_agentchat.ui import Console
 from autogen_core import AgentId, AgentRuntime, CancellationToken, FunctionCall, SingleThreadedAgentRuntime
+from autogen_core.memory import ListMemory
 from autogen_core.models import (
     AssistantMessage,
     CreateResult,
@@ -441,6 +449,135 @@ async def test_round_robin_group_chat_state(task: TaskType, runtime: AgentRuntim
     assert manager_1._message_thread == manager_2._message_thread  # pyright: ignore
 
 
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_sessions() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.start()
+    model_client = ReplayChatCompletionClient(["Hello"] * 10)
+    memory = ListMemory()
+    agent1 = _EchoAgent("agent1", description="echo agent 1")
+    agent2 = AssistantAgent("agent2", model_client=model_client, memory=[memory])
+    code_executor = LocalCommandLineCodeExecutor()
+    agent3 = CodeExecutorAgent("agent3", code_executor=code_executor)
+    team = RoundRobinGroupChat(
+        participants=[agent1, agent2, agent3],
+        termination_condition=MaxMessageTermination(3),
+        runtime=runtime,
+    )
+    result_a, result_b = await asyncio.gather(
+        team.run(task="Task A", session_id="a"),
+        team.run(task="Task B", session_id="b"),
+    )
+    assert [message.to_text() for message in result_a.messages] == ["Task A", "Task A", "Hello"]
+    assert [message.to_text() for message in result_b.messages] == ["Task B", "Task B", "Hello"]
+
+    # The original participants are not used by the sessions.
+    assert agent1.total_messages == 0
+    assert await agent2._model_context.get_messages() == []  # pyright: ignore
+    # The copies share the model client, the memory and the code executor.
+    session_agent = team._sessions["a"].participants[1]  # pyright: ignore
+    assert isinstance(session_agent, AssistantAgent)
+    assert session_agent._model_client is model_client  # pyright: ignore
+    assert session_agent._memory is not None and session_agent._memory[0] is memory  # pyright: ignore
+    session_code_executor_agent = team._sessions["a"].participants[2]  # pyright: ignore
+    assert isinstance(session_code_executor_agent, CodeExecutorAgent)
+    assert session_code_executor_agent._code_executor is code_executor  # pyright: ignore
+
+    # Continue session "a" without a task.
+    result = await team.run(session_id="a")
+    assert [message.source for message in result.messages] == ["agent3", "agent1", "agent2"]
+    assert team._sessions["a"].participants[0].total_messages == 2  # type: ignore
+    assert team._sessions["b"].participants[0].total_messages == 1  # type: ignore
+
+    # The state of a session can be saved and loaded into another session.
+    state = await team.save_state(session_id="b")
+    await team.load_state(state, session_id="c")
+    assert await team.save_state(session_id="c") == state
+
+    await team.reset(session_id="a")
+    await team.close_session("a")
+    await runtime.stop()
+
+    with pytest.raises(ValueError):
+        await RoundRobinGroupChat(participants=[agent1, agent2]).run(task="Task", session_id="a")
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_close_session() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.start()
+    team = RoundRobinGroupChat(
+        participants=[
+            _EchoAgent("agent1", description="echo agent 1"),
+            _EchoAgent("agent2", description="echo agent 2"),
+        ],
+        termination_condition=MaxMessageTermination(2),
+        runtime=runtime,
+    )
+    await team.run(task="Task", session_id="a")
+    await team.close_session("a")
+
+    # The agent instances of the closed session are removed from the runtime.
+    with pytest.raises(ValueError, match="does not exist"):
+        await team.save_state(session_id="a")
+    agent_ids = [AgentId(agent_type, "a") for agent_type in team._participant_topic_types]  # pyright: ignore
+    assert not any(agent_id in runtime._instantiated_agents for agent_id in agent_ids)  # pyright: ignore
+
+    # So the ID can be used again for a new session.
+    result = await asyncio.wait_for(team.run(task="Task 2", session_id="a"), timeout=5)
+    assert [message.to_text() for message in result.messages] == ["Task 2", "Task 2"]
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_session_external_termination() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.start()
+    termination = ExternalTermination()
+    team = RoundRobinGroupChat(
+        participants=[
+            _EchoAgent("agent1", description="echo agent 1"),
+            _EchoAgent("agent2", description="echo agent 2"),
+        ],
+        termination_condition=termination | MaxMessageTermination(3000),
+        runtime=runtime,
+    )
+    run = asyncio.create_task(team.run(task="Task", session_id="a"))
+    await asyncio.sleep(0.1)
+    termination.set()
+
+    result = await asyncio.wait_for(run, timeout=5)
+    assert result.stop_reason == "External termination requested"
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_pause_resume_unknown_session() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.start()
+    team = RoundRobinGroupChat(
+        participants=[
+            _EchoAgent("agent1", description="echo agent 1"),
+            _EchoAgent("agent2", description="echo agent 2"),
+        ],
+        termination_condition=MaxMessageTermination(2),
+        runtime=runtime,
+    )
+    await team.run(task="Task", session_id="a")
+
+    with pytest.raises(ValueError, match="does not exist"):
+        await team.pause(session_id="unknown")
+    with pytest.raises(ValueError, match="does not exist"):
+        await team.resume(session_id="unknown")
+    with pytest.raises(ValueError, match="does not exist"):
+        await team.save_state(session_id="unknown")
+
+    # Known sessions can be paused and resumed.
+    await team.pause(session_id="a")
+    await team.resume(session_id="a")
+    await runtime.stop()
+
+
 @pytest.mark.asyncio
 async def test_round_robin_group_chat_with_tools(runtime: AgentRuntime | None) -> None:
     model_client = ReplayChatCompletionClient(
@@ -509,6 +646,148 @@ async def test_round_robin_group_chat_with_tools(runtime: AgentRuntime | None) -
     assert result2 == result
 
 
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_message_thread_policy(runtime: AgentRuntime | None) -> None:
+    model_client = ReplayChatCompletionClient(
+        chat_completions=[
+            CreateResult(
+                finish_reason="function_calls",
+                content=[FunctionCall(id="1", name="pass", arguments=json.dumps({"input": "pass"}))],
+                usage=RequestUsage(prompt_tokens=0, completion_tokens=0),
+                cached=False,
+            ),
+            "Hello",
+            "TERMINATE",
+        ],
+        model_info={
+            "family": "gpt-4.1-nano",
+            "function_calling": True,
+            "json_output": True,
+            "vision": True,
+            "structured_output": True,
+        },
+    )
+    tool = FunctionTool(_pass_function, name="pass", description="pass function")
+    tool_use_agent = AssistantAgent("tool_use_agent", model_client=model_client, tools=[tool])
+    echo_agent = _EchoAgent("echo_agent", description="echo agent")
+    team = RoundRobinGroupChat(
+        participants=[tool_use_agent, echo_agent],
+        termination_condition=TextMentionTermination("TERMINATE"),
+        runtime=runtime,
+        message_thread_policy=MessageThreadPolicy(max_messages=3, keep_events=False),
+    )
+    result = await team.run(task="Write a program that prints 'Hello, world!'")
+    # The policy does not change the messages of the run.
+    assert len(result.messages) == 8
+    assert result.stop_reason == "Text 'TERMINATE' mentioned"
+
+    manager = await team._runtime.try_get_underlying_agent_instance(  # pyright: ignore
+        AgentId(f"{team._group_chat_manager_name}_{team._team_id}", team._team_id),  # pyright: ignore
+        RoundRobinGroupChatManager,  # pyright: ignore
+    )
+    chat_messages = [message for message in result.messages if isinstance(message, BaseChatMessage)]
+    assert manager._message_thread == chat_messages[-3:]  # pyright: ignore
+    state = await team.save_state()
+    manager_state = state["agent_states"]["RoundRobinGroupChatManager"]
+    assert manager_state["message_thread_offset"] == len(chat_messages) - 3
+    assert [message["content"] for message in manager_state["message_thread"]] == ["Hello", "Hello", "TERMINATE"]
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_incremental_state(runtime: AgentRuntime | None) -> None:
+    def create_team() -> RoundRobinGroupChat:
+        return RoundRobinGroupChat(
+            participants=[_EchoAgent("agent1", description="echo agent 1"), _EchoAgent("agent2", description="echo")],
+            termination_condition=MaxMessageTermination(3),
+            runtime=runtime,
+            message_thread_policy=MessageThreadPolicy(incremental_state=True),
+        )
+
+    team = create_team()
+    await team.run(task="Task 1")
+    state1 = await team.save_state()
+    await team.run(task="Task 2")
+    state2 = await team.save_state()
+    manager_state1 = state1["agent_states"]["RoundRobinGroupChatManager"]
+    manager_state2 = state2["agent_states"]["RoundRobinGroupChatManager"]
+    # The first state is complete, the second one only has the messages of the second run.
+    assert not manager_state1["incremental"]
+    assert [message["content"] for message in manager_state1["message_thread"]] == ["Task 1", "Task 1", "Task 1"]
+    assert manager_state2["incremental"]
+    assert manager_state2["message_thread_offset"] == 3
+    assert len(manager_state2["message_thread"]) == 3
+    assert manager_state2["message_thread"][0]["content"] == "Task 2"
+
+    team2 = create_team()
+    await team2.load_state(state1)
+    await team2.load_state(state2)
+    manager = await team._runtime.try_get_underlying_agent_instance(  # pyright: ignore
+        AgentId(f"{team._group_chat_manager_name}_{team._team_id}", team._team_id),  # pyright: ignore
+        RoundRobinGroupChatManager,  # pyright: ignore
+    )
+    manager2 = await team2._runtime.try_get_underlying_agent_instance(  # pyright: ignore
+        AgentId(f"{team2._group_chat_manager_name}_{team2._team_id}", team2._team_id),  # pyright: ignore
+        RoundRobinGroupChatManager,  # pyright: ignore
+    )
+    assert manager2._message_thread == manager._message_thread  # pyright: ignore
+
+    # Incremental states must be loaded in order.
+    with pytest.raises(ValueError):
+        await team2.load_state(state2)
+    with pytest.raises(ValueError):
+        await create_team().load_state(state2)
+
+    # Skipping an incremental state is rejected.
+    await team.run(task="Task 3")
+    state3 = await team.save_state()
+    team3 = create_team()
+    await team3.load_state(state1)
+    with pytest.raises(ValueError, match="must all be loaded"):
+        await team3.load_state(state3)
+
+    # The first state saved after a reset is complete.
+    await team.reset()
+    await team.run(task="Task 3")
+    state3 = await team.save_state()
+    assert not state3["agent_states"]["RoundRobinGroupChatManager"]["incremental"]
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_incremental_state_after_dropped_messages(runtime: AgentRuntime | None) -> None:
+    def create_team() -> RoundRobinGroupChat:
+        return RoundRobinGroupChat(
+            participants=[_EchoAgent("agent1", description="echo agent 1"), _EchoAgent("agent2", description="echo")],
+            termination_condition=MaxMessageTermination(3),
+            runtime=runtime,
+            message_thread_policy=MessageThreadPolicy(max_messages=2, incremental_state=True),
+        )
+
+    team = create_team()
+    await team.run(task="Task 1")
+    state1 = await team.save_state()
+    await team.run(task="Task 2")
+    state2 = await team.save_state()
+    # More messages were added than retained, so the second state is complete.
+    manager_state2 = state2["agent_states"]["RoundRobinGroupChatManager"]
+    assert not manager_state2["incremental"]
+    assert manager_state2["message_thread_offset"] == 4
+    assert len(manager_state2["message_thread"]) == 2
+
+    team2 = create_team()
+    await team2.load_state(state1)
+    await team2.load_state(state2)
+    manager = await team._runtime.try_get_underlying_agent_instance(  # pyright: ignore
+        AgentId(f"{team._group_chat_manager_name}_{team._team_id}", team._team_id),  # pyright: ignore
+        RoundRobinGroupChatManager,  # pyright: ignore
+    )
+    manager2 = await team2._runtime.try_get_underlying_agent_instance(  # pyright: ignore
+        AgentId(f"{team2._group_chat_manager_name}_{team2._team_id}", team2._team_id),  # pyright: ignore
+        RoundRobinGroupChatManager,  # pyright: ignore
+    )
+    assert manager2._message_thread == manager._message_thread  # pyright: ignore
+    assert manager2._message_thread_offset == manager._message_thread_offset  # pyright: ignore
+
+
 @pytest.mark.asyncio
 async def test_round_robin_group_chat_with_resume_and_reset(runtime: AgentRuntime | None) -> None:
     agent_1 = _EchoAgent("agent_1", description="echo agent 1")
@@ -984,6 +1263,71 @@ async def test_selector_group_chat_fall_back_to_previous_after_3_attempts(runtim
     assert result.messages[2].source == "agent2"
 
 
+@pytest.mark.asyncio
+async def test_selector_group_chat_mention_longest_name(runtime: AgentRuntime | None) -> None:
+    model_client = ReplayChatCompletionClient(["agent 2", "agent\\_2, agent", "agent_2"])
+    agent1 = _EchoAgent("agent", description="echo agent 1")
+    agent2 = _EchoAgent("agent_2", description="echo agent 2")
+    agent3 = _EchoAgent("agent3", description="echo agent 3")
+    team = SelectorGroupChat(
+        participants=[agent1, agent2, agent3],
+        model_client=model_client,
+        max_turns=1,
+        runtime=runtime,
+    )
+    result = await team.run(task="Write a program that prints 'Hello, world!'")
+    # "agent 2" is a mention of agent_2 only.
+    assert result.messages[1].source == "agent_2"
+    assert len(model_client.create_calls) == 1
+
+    model_client.reset()
+    await team.reset()
+    result = await team.run(task="Write a program that prints 'Hello, world!'")
+    # Two names are mentioned in the first response.
+    assert result.messages[1].source == "agent_2"
+    assert len(model_client.create_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_selector_group_chat_history_limits(runtime: AgentRuntime | None) -> None:
+    model_client = ReplayChatCompletionClient(["agent1", "agent2", "agent1", "agent2"])
+    agent1 = _EchoAgent("agent1", description="echo agent 1")
+    agent2 = _EchoAgent("agent2", description="echo agent 2")
+    agent3 = _EchoAgent("agent3", description="echo agent 3")
+    team = SelectorGroupChat(
+        participants=[agent1, agent2, agent3],
+        model_client=model_client,
+        max_turns=3,
+        selector_prompt="{history}",
+        max_selector_history_messages=2,
+        runtime=runtime,
+    )
+    await team.run(task=TextMessage(content="task message", source="user"))
+    prompts = [call["messages"][0].content for call in model_client.create_calls]
+    assert prompts == [
+        "user: task message\n\n",
+        "user: task message\n\n\nagent1: task message\n\n",
+        "agent1: task message\n\n\nagent2: task message\n\n",
+    ]
+
+    # The token limit keeps the most recent messages that fit. Each message is 3 tokens.
+    model_client = ReplayChatCompletionClient(["agent1", "agent2", "agent1", "agent2"])
+    team = SelectorGroupChat(
+        participants=[agent1, agent2, agent3],
+        model_client=model_client,
+        max_turns=3,
+        selector_prompt="{history}",
+        max_selector_history_tokens=8,
+        runtime=runtime,
+    )
+    await team.run(task=TextMessage(content="task message", source="user"))
+    prompts = [call["messages"][0].content for call in model_client.create_calls]
+    assert prompts[-1] == "agent1: task message\n\n\nagent2: task message\n\n"
+
+    with pytest.raises(ValueError):
+        SelectorGroupChat(participants=[agent1, agent2], model_client=model_client, max_selector_history_messages=0)
+
+
 @pytest.mark.asyncio
 async def test_selector_group_chat_custom_selector(runtime: AgentRuntime | None) -> None:
     model_client = ReplayChatCompletionClient(["agent3"])
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 from typing import Sequence
 
 import pytest
@@ -312,6 +313,13 @@ async def test_external_termination() -> None:
     await termination.reset()
     assert await termination([]) is None
 
+    # Deep copies are set with the original, and terminate independently of it.
+    termination_copy = copy.deepcopy(termination)
+    termination.set()
+    assert await termination_copy([]) is not None
+    await termination_copy.reset()
+    assert await termination([]) is not None
+
 
 @pytest.mark.asyncio
 async def test_source_match_termination() -> None:
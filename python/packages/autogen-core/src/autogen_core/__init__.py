@@ -5,6 +5,7 @@
 from ._agent import Agent
 from ._agent_id import AgentId
 from ._agent_instantiation import AgentInstantiationContext
+from ._agent_lifecycle import AgentCacheStats, AgentLifecyclePolicy
 from ._agent_metadata import AgentMetadata
 from ._agent_proxy import AgentProxy
 from ._agent_runtime import AgentRuntime
@@ -16,6 +17,7 @@
 from ._component_config import (
     Component,
     ComponentBase,
+    ComponentCache,
     ComponentFromConfig,
     ComponentLoader,
     ComponentModel,
@@ -90,6 +92,8 @@
     "InMemoryStore",
     "CancellationToken",
     "AgentInstantiationContext",
+    "AgentLifecyclePolicy",
+    "AgentCacheStats",
     "TopicId",
     "Subscription",
     "MessageContext",
@@ -122,6 +126,7 @@
     "Component",
     "ComponentBase",
     "ComponentFromConfig",
+    "ComponentCache",
     "ComponentLoader",
     "ComponentModel",
     "ComponentSchemaType",
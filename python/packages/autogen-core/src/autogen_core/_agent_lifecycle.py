@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from ._cache_store import CacheStore
+
+
+@dataclass
+class AgentLifecyclePolicy:
+    """Bounds the number of agent instances a runtime keeps alive.
+
+    When an agent is evicted, the runtime calls :meth:`~autogen_core.Agent.save_state`, puts the state in
+    :attr:`state_store` under the string form of the agent's :class:`~autogen_core.AgentId`, and calls
+    :meth:`~autogen_core.Agent.close`. The next message for that agent re-runs the agent factory and calls
+    :meth:`~autogen_core.Agent.load_state` with the stored state.
+
+    Agents that are handling a message are never evicted. Idle agents are checked for expiry whenever the
+    runtime looks up an agent instance.
+
+    Example:
+
+        .. code-block:: python
+
+            from autogen_core import AgentLifecyclePolicy, SingleThreadedAgentRuntime
+
+            # Keep at most 1000 agents alive and evict agents idle for more than 10 minutes.
+            runtime = SingleThreadedAgentRuntime(
+                agent_lifecycle_policy=AgentLifecyclePolicy(max_live_agents=1000, idle_ttl=600),
+            )
+
+    Args:
+        max_live_agents (int | None, optional): The maximum number of live agent instances. The least recently
+            used agents are evicted first. Defaults to None, no limit.
+        idle_ttl (float | None, optional): The number of seconds an agent can stay unused before it is evicted.
+            Defaults to None, no expiry.
+        state_store (CacheStore[Mapping[str, Any]] | None, optional): The store that holds the state of evicted
+            agents. Defaults to None, in which case an :class:`~autogen_core.InMemoryStore` is used.
+    """
+
+    max_live_agents: int | None = None
+    idle_ttl: float | None = None
+    state_store: CacheStore[Mapping[str, Any]] | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_live_agents is not None and self.max_live_agents < 1:
+            raise ValueError("max_live_agents must be a positive integer or None")
+        if self.idle_ttl is not None and self.idle_ttl <= 0:
+            raise ValueError("idle_ttl must be a positive number or None")
+
+
+@dataclass
+class AgentCacheStats:
+    """Counters of the agent instance cache of a runtime."""
+
+    hits: int = 0
+    """Number of lookups served by a live agent instance."""
+    misses: int = 0
+    """Number of lookups that had to run the agent factory."""
+    evictions: int = 0
+    """Number of agent instances evicted by the :class:`AgentLifecyclePolicy`."""
+    restores: int = 0
+    """Number of re-created agent instances that were loaded with their evicted state."""
@@ -1,5 +1,8 @@
+import heapq
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, Optional, TypeVar
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -14,6 +17,10 @@ class CacheStore(ABC, Generic[T], ComponentBase[BaseModel]):
     This protocol defines the basic interface for store/cache operations.
 
     Sub-classes should handle the lifecycle of underlying storage.
+
+    :meth:`aget` and :meth:`aset` are the async variants used from the event loop. By default they call
+    :meth:`get` and :meth:`set` directly. Stores backed by network or disk I/O should override them so the
+    event loop is not blocked.
     """
 
     component_type = "cache_store"
@@ -44,27 +51,124 @@ def set(self, key: str, value: T) -> None:
         """
         ...
 
+    async def aget(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        """
+        Retrieve an item from the store without blocking the event loop.
+
+        Args:
+            key: The key identifying the item in the store.
+            default (optional): The default value to return if the key is not found.
+                                Defaults to None.
+
+        Returns:
+            The value associated with the key if found, else the default value.
+        """
+        return self.get(key, default)
+
+    async def aset(self, key: str, value: T) -> None:
+        """
+        Set an item in the store without blocking the event loop.
+
+        Args:
+            key: The key under which the item is to be stored.
+            value: The value to be stored in the store.
+        """
+        self.set(key, value)
+
 
 class InMemoryStoreConfig(BaseModel):
-    pass
+    max_size: int | None = None
+    ttl: float | None = None
 
 
 class InMemoryStore(CacheStore[T], Component[InMemoryStoreConfig]):
+    """A :class:`CacheStore` that keeps items in a dictionary.
+
+    Expired items are dropped when they are read and whenever an item is set, so items that are never read again
+    do not accumulate.
+
+    Args:
+        max_size (int | None, optional): The maximum number of items. When the store is full, the least recently
+            used item is evicted. Defaults to None, no limit.
+        ttl (float | None, optional): The number of seconds an item is kept after it is set. Defaults to None,
+            items do not expire.
+    """
+
     component_provider_override = "autogen_core.InMemoryStore"
     component_config_schema = InMemoryStoreConfig
 
-    def __init__(self) -> None:
-        self.store: Dict[str, T] = {}
+    def __init__(
+        self, max_size: int | None = None, ttl: float | None = None, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be a positive integer or None")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number or None")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        # Ordered from least to most recently used.
+        self._store: OrderedDict[str, T] = OrderedDict()
+        self._expires_at: Dict[str, float] = {}
+        # (expiry time, key) of the items set with a ttl. Entries of items that were set again or removed are
+        # skipped when they are popped.
+        self._expiry_heap: List[Tuple[float, str]] = []
+
+    @property
+    def store(self) -> Dict[str, T]:
+        """The items of the store by key. Items added to it directly do not expire and do not count as used."""
+        return self._store
 
     def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
-        return self.store.get(key, default)
+        if key not in self._store:
+            return default
+        expires_at = self._expires_at.get(key)
+        if expires_at is not None and expires_at <= self._clock():
+            self._remove(key)
+            return default
+        if self._max_size is not None:
+            self._store.move_to_end(key)
+        return self._store[key]
+
+    def set(self, key: str, value: T, ttl: float | None = None) -> None:
+        """Set an item in the store.
 
-    def set(self, key: str, value: T) -> None:
-        self.store[key] = value
+        Args:
+            key: The key under which the item is to be stored.
+            value: The value to be stored in the store.
+            ttl (optional): The number of seconds to keep this item, instead of the ttl of the store.
+        """
+        ttl = ttl if ttl is not None else self._ttl
+        now = self._clock()
+        self._purge_expired(now)
+        self._store[key] = value
+        self._store.move_to_end(key)
+        if ttl is not None:
+            expires_at = now + ttl
+            self._expires_at[key] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            if len(self._expiry_heap) > 2 * len(self._expires_at) + 16:
+                # Too many skipped entries from items set again, rebuild the heap from the live items.
+                self._expiry_heap = [(expires_at, key) for key, expires_at in self._expires_at.items()]
+                heapq.heapify(self._expiry_heap)
+        else:
+            self._expires_at.pop(key, None)
+        while self._max_size is not None and len(self._store) > self._max_size:
+            self._remove(next(iter(self._store)))
+
+    def _purge_expired(self, now: float) -> None:
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            if self._expires_at.get(key) == expires_at:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        self._store.pop(key, None)
+        self._expires_at.pop(key, None)
 
     def _to_config(self) -> InMemoryStoreConfig:
-        return InMemoryStoreConfig()
+        return InMemoryStoreConfig(max_size=self._max_size, ttl=self._ttl)
 
     @classmethod
     def _from_config(cls, config: InMemoryStoreConfig) -> Self:
-        return cls()
+        return cls(max_size=config.max_size, ttl=config.ttl)
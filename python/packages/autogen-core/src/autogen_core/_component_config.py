@@ -1,8 +1,28 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
+import json
+import sys
 import warnings
-from typing import Any, ClassVar, Dict, Generic, Literal, Type, TypeGuard, cast, overload
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import ModuleType
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterator,
+    Literal,
+    Sequence,
+    Tuple,
+    Type,
+    TypeGuard,
+    cast,
+    overload,
+)
 
 from pydantic import BaseModel
 from typing_extensions import Self, TypeVar
@@ -162,6 +182,131 @@ def dump_component(self) -> ComponentModel:
 
 ExpectedType = TypeVar("ExpectedType")
 
+# Resolved component classes by provider, with the module they were resolved from.
+_component_classes: Dict[str, Tuple[ModuleType, Type[_ConcreteComponent[BaseModel]]]] = {}
+
+
+def _resolve_component_class(provider: str) -> Type[_ConcreteComponent[BaseModel]]:
+    """Import the class of a provider and check that it is a component class.
+
+    Resolved classes are cached by provider. A cached class is only used while it is still the class of that name
+    in its module, so a class that is redefined, for example in a notebook, is resolved again.
+    """
+    output = provider.rsplit(".", maxsplit=1)
+    if len(output) != 2:
+        raise ValueError("Invalid")
+
+    module_path, class_name = output
+    cached = _component_classes.get(provider)
+    if cached is not None:
+        cached_module, cached_class = cached
+        if sys.modules.get(module_path) is cached_module and cached_module.__dict__.get(class_name) is cached_class:
+            return cached_class
+
+    module = importlib.import_module(module_path)
+    component_class = module.__getattribute__(class_name)
+
+    if not is_component_class(component_class):
+        raise TypeError("Invalid component class")
+
+    # We need to check the schema is valid
+    if not hasattr(component_class, "component_config_schema"):
+        raise AttributeError("component_config_schema not defined")
+
+    if not hasattr(component_class, "component_type"):
+        raise AttributeError("component_type not defined")
+
+    _component_classes[provider] = (module, component_class)
+    return component_class
+
+
+_active_component_cache: ContextVar[ComponentCache | None] = ContextVar("_active_component_cache", default=None)
+
+
+class ComponentCache:
+    """A cache used by :py:meth:`ComponentLoader.load_component` while it is active.
+
+    Loading a component validates its config against the config schema of the component class. While the cache
+    is active, the validated configs are kept by component class and a hash of the config, so loading an identical
+    config again, including a nested one such as the model client of an agent, skips the validation.
+
+    The cache can also share the instances of stateless components. Loading a component whose type is in
+    `share_component_types` with the same config as a component loaded before through this cache returns the
+    same instance. For example, the agents of a team that use identical model client configs then share one
+    client instead of each creating their own HTTP client. A shared instance is shared by all its users, including
+    being closed for all of them when one closes it, so only share components that hold no per-user state.
+
+    Args:
+        share_component_types (Sequence[ComponentType], optional): The types of the components whose instances are shared, for example ``["model"]``. Defaults to no types.
+        max_size (int, optional): The maximum number of validated configs, and of shared instances, kept. The least recently used are dropped first. Defaults to 256.
+
+    Example:
+
+        .. code-block:: python
+
+            from autogen_agentchat.teams import BaseGroupChat
+            from autogen_core import ComponentCache, ComponentModel
+
+            team_config: ComponentModel = ...  # type: ignore
+
+            cache = ComponentCache(share_component_types=["model"])
+            with cache.activate():
+                team = BaseGroupChat.load_component(team_config)
+    """
+
+    def __init__(self, share_component_types: Sequence[ComponentType] = (), max_size: int = 256) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._share_component_types = frozenset(share_component_types)
+        self._max_size = max_size
+        self._configs: OrderedDict[Tuple[Type[Any], str], BaseModel] = OrderedDict()
+        self._instances: OrderedDict[Tuple[Type[Any], str], Any] = OrderedDict()
+
+    @contextmanager
+    def activate(self) -> Iterator[Self]:
+        """Use this cache for the components loaded in the current context until the context manager exits."""
+        token = _active_component_cache.set(self)
+        try:
+            yield self
+        finally:
+            _active_component_cache.reset(token)
+
+    def clear(self) -> None:
+        """Drop all validated configs and shared instances."""
+        self._configs.clear()
+        self._instances.clear()
+
+    def _put(self, entries: OrderedDict[Tuple[Type[Any], str], Any], key: Tuple[Type[Any], str], value: Any) -> None:
+        entries[key] = value
+        if len(entries) > self._max_size:
+            entries.popitem(last=False)
+
+    def _load(self, component_class: Type[_ConcreteComponent[BaseModel]], config: Dict[str, Any]) -> Any:
+        try:
+            config_json = json.dumps(config, sort_keys=True)
+        except (TypeError, ValueError):
+            # Configs holding values that are not JSON serializable are not cached.
+            return component_class._from_config(component_class.component_config_schema.model_validate(config))
+        key = (component_class, hashlib.sha256(config_json.encode()).hexdigest())
+
+        shared = component_class.component_type in self._share_component_types
+        if shared and key in self._instances:
+            self._instances.move_to_end(key)
+            return self._instances[key]
+
+        validated_config = self._configs.get(key)
+        if validated_config is None:
+            validated_config = component_class.component_config_schema.model_validate(config)
+            self._put(self._configs, key, validated_config)
+        else:
+            self._configs.move_to_end(key)
+
+        # Each instance gets its own copy of the config, as components may keep it.
+        instance = component_class._from_config(validated_config.model_copy())
+        if shared:
+            self._put(self._instances, key, instance)
+        return instance
+
 
 class ComponentLoader:
     @overload
@@ -218,23 +363,7 @@ def load_component(
         if loaded_model.provider in WELL_KNOWN_PROVIDERS:
             loaded_model.provider = WELL_KNOWN_PROVIDERS[loaded_model.provider]
 
-        output = loaded_model.provider.rsplit(".", maxsplit=1)
-        if len(output) != 2:
-            raise ValueError("Invalid")
-
-        module_path, class_name = output
-        module = importlib.import_module(module_path)
-        component_class = module.__getattribute__(class_name)
-
-        if not is_component_class(component_class):
-            raise TypeError("Invalid component class")
-
-        # We need to check the schema is valid
-        if not hasattr(component_class, "component_config_schema"):
-            raise AttributeError("component_config_schema not defined")
-
-        if not hasattr(component_class, "component_type"):
-            raise AttributeError("component_type not defined")
+        component_class = _resolve_component_class(loaded_model.provider)
 
         loaded_config_version = loaded_model.component_version or component_class.component_version
         if loaded_config_version < component_class.component_version:
@@ -244,12 +373,14 @@ def load_component(
                 raise NotImplementedError(
                     f"Tried to load component {component_class} which is on version {component_class.component_version} with a config on version {loaded_config_version} but _from_config_past_version is not implemented"
                 ) from e
+        elif (cache := _active_component_cache.get()) is not None:
+            instance = cache._load(component_class, loaded_model.config)
         else:
-            schema = component_class.component_config_schema  # type: ignore
+            schema = component_class.component_config_schema
             validated_config = schema.model_validate(loaded_model.config)
 
             # We're allowed to use the private method here
-            instance = component_class._from_config(validated_config)  # type: ignore
+            instance = component_class._from_config(validated_config)
 
         if expected is None and not isinstance(instance, cls):
             raise TypeError("Expected type does not match")
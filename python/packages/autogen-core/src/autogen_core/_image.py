@@ -11,10 +11,25 @@
 from pydantic_core import core_schema
 from typing_extensions import Literal
 
+_MIME_TYPES: Dict[str, Literal["image/png", "image/jpeg", "image/gif", "image/webp"]] = {
+    "PNG": "image/png",
+    "JPEG": "image/jpeg",
+    "GIF": "image/gif",
+    "WEBP": "image/webp",
+}
+"""The MIME types of the formats that are kept in their original encoding, by PIL format name."""
+
+_DATA_URI_PREFIX = r"data:image/(?:png|jpeg|gif|webp);base64,"
+
 
 class Image:
     """Represents an image.
 
+    An image created from encoded data, for example with :meth:`from_base64` or :meth:`from_file`, keeps its
+    original encoding and only decodes its pixels when :attr:`image` is accessed. An image created from a
+    PIL image is encoded as PNG the first time its encoding is needed. The encoding, its base64 form and
+    the data URI are computed once and cached.
+
 
     Example:
 
@@ -32,7 +47,7 @@ async def from_url(url: str) -> Image:
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url) as response:
                         content = await response.read()
-                        return Image.from_pil(PILImage.open(content))
+                        return Image.from_bytes(content)
 
 
             image = asyncio.run(from_url("https://example.com/image"))
@@ -40,7 +55,15 @@ async def from_url(url: str) -> Image:
     """
 
     def __init__(self, image: PILImage.Image):
-        self.image: PILImage.Image = image.convert("RGB")
+        self._set_image(image)
+
+    def _set_image(self, image: PILImage.Image) -> None:
+        self._image: PILImage.Image | None = image.convert("RGB")
+        self._data: bytes | None = None
+        self._format = "PNG"
+        self._size = self._image.size
+        self._base64: str | None = None
+        self._data_uri: str | None = None
 
     @classmethod
     def from_pil(cls, pil_image: PILImage.Image) -> Image:
@@ -48,26 +71,87 @@ def from_pil(cls, pil_image: PILImage.Image) -> Image:
 
     @classmethod
     def from_uri(cls, uri: str) -> Image:
-        if not re.match(r"data:image/(?:png|jpeg);base64,", uri):
+        if not re.match(_DATA_URI_PREFIX, uri):
             raise ValueError("Invalid URI format. It should be a base64 encoded image URI.")
 
         # A URI. Remove the prefix and decode the base64 string.
-        base64_data = re.sub(r"data:image/(?:png|jpeg);base64,", "", uri)
+        base64_data = re.sub(_DATA_URI_PREFIX, "", uri)
         return cls.from_base64(base64_data)
 
     @classmethod
     def from_base64(cls, base64_str: str) -> Image:
-        return cls(PILImage.open(BytesIO(base64.b64decode(base64_str))))
+        return cls.from_bytes(base64.b64decode(base64_str))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Image:
+        """Create an image from its encoded bytes, for example the content of a PNG or JPEG file.
+
+        PNG, JPEG, GIF and WebP images are kept in their original encoding, and their pixels are only decoded
+        when :attr:`image` is first accessed. Images in other formats, animated images and images in other color
+        modes than RGB, grayscale or palette are converted to RGB and encoded as PNG, as model APIs may not accept them.
+        """
+        # Opening an image only reads its header.
+        header = PILImage.open(BytesIO(data))
+        if (
+            header.format not in _MIME_TYPES
+            or getattr(header, "is_animated", False)
+            or header.mode not in ("RGB", "RGBA", "L", "LA", "P")
+        ):
+            return cls(header)
+        image = cls.__new__(cls)
+        image._image = None
+        image._data = data
+        image._format = header.format
+        image._size = header.size
+        image._base64 = None
+        image._data_uri = None
+        return image
+
+    @property
+    def image(self) -> PILImage.Image:
+        """The image as an RGB PIL image.
+
+        The image must not be modified in place, as its encoding is cached. Assign a new image instead."""
+        if self._image is None:
+            assert self._data is not None
+            self._image = PILImage.open(BytesIO(self._data)).convert("RGB")
+        return self._image
+
+    @image.setter
+    def image(self, image: PILImage.Image) -> None:
+        self._set_image(image)
+
+    @property
+    def width(self) -> int:
+        """The width of the image in pixels, read without decoding the image."""
+        return self._image.width if self._image is not None else self._size[0]
+
+    @property
+    def height(self) -> int:
+        """The height of the image in pixels, read without decoding the image."""
+        return self._image.height if self._image is not None else self._size[1]
+
+    @property
+    def mime_type(self) -> Literal["image/png", "image/jpeg", "image/gif", "image/webp"]:
+        """The MIME type of the encoded image."""
+        return _MIME_TYPES[self._format]
+
+    def to_bytes(self) -> bytes:
+        """Return the encoded image. The image is encoded as PNG on the first call if it has no encoding yet."""
+        if self._data is None:
+            buffered = BytesIO()
+            self.image.save(buffered, format="PNG")
+            self._data = buffered.getvalue()
+        return self._data
 
     def to_base64(self) -> str:
-        buffered = BytesIO()
-        self.image.save(buffered, format="PNG")
-        content = buffered.getvalue()
-        return base64.b64encode(content).decode("utf-8")
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.to_bytes()).decode("utf-8")
+        return self._base64
 
     @classmethod
     def from_file(cls, file_path: Path) -> Image:
-        return cls(PILImage.open(file_path))
+        return cls.from_bytes(Path(file_path).read_bytes())
 
     def _repr_html_(self) -> str:
         # Show the image in Jupyter notebook
@@ -75,7 +159,9 @@ def _repr_html_(self) -> str:
 
     @property
     def data_uri(self) -> str:
-        return _convert_base64_to_data_uri(self.to_base64())
+        if self._data_uri is None:
+            self._data_uri = f"data:{self.mime_type};base64,{self.to_base64()}"
+        return self._data_uri
 
     # Returns openai.types.chat.ChatCompletionContentPartImageParam, which is a TypedDict
     # We don't use the explicit type annotation so that we can avoid a dependency on the OpenAI Python SDK in this package.
@@ -105,23 +191,3 @@ def serialize(value: Image) -> dict[str, Any]:
             core_schema.any_schema(),  # Accept any type; adjust if needed
             serialization=core_schema.plain_serializer_function_ser_schema(serialize),
         )
-
-
-def _convert_base64_to_data_uri(base64_image: str) -> str:
-    def _get_mime_type_from_data_uri(base64_image: str) -> str:
-        # Decode the base64 string
-        image_data = base64.b64decode(base64_image)
-        # Check the first few bytes for known signatures
-        if image_data.startswith(b"\xff\xd8\xff"):
-            return "image/jpeg"
-        elif image_data.startswith(b"\x89PNG\r\n\x1a\n"):
-            return "image/png"
-        elif image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
-            return "image/gif"
-        elif image_data.startswith(b"RIFF") and image_data[8:12] == b"WEBP":
-            return "image/webp"
-        return "image/jpeg"  # use jpeg for unknown formats, best guess.
-
-    mime_type = _get_mime_type_from_data_uri(base64_image)
-    data_uri = f"data:{mime_type};base64,{base64_image}"
-    return data_uri
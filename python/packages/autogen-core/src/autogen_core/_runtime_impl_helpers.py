@@ -1,11 +1,22 @@
-from collections import defaultdict
-from typing import Awaitable, Callable, DefaultDict, List, Sequence, Set
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, DefaultDict, Dict, Iterable, Iterator, List, Mapping, Sequence, Set, Tuple
+
+from typing_extensions import TypeGuard
 
 from ._agent import Agent
 from ._agent_id import AgentId
+from ._agent_lifecycle import AgentCacheStats, AgentLifecyclePolicy
 from ._agent_type import AgentType
+from ._cache_store import CacheStore, InMemoryStore
 from ._subscription import Subscription
 from ._topic import TopicId
+from ._type_prefix_subscription import TypePrefixSubscription
+from ._type_subscription import TypeSubscription
+
+logger = logging.getLogger("autogen_core")
 
 
 async def get_impl(
@@ -29,11 +40,56 @@ async def get_impl(
     return id
 
 
-class SubscriptionManager:
+class _PrefixTrieNode:
+    __slots__ = ("children", "subscriptions")
+
     def __init__(self) -> None:
+        self.children: Dict[str, _PrefixTrieNode] = {}
+        self.subscriptions: List[Subscription] = []
+
+
+def _is_exact_type_subscription(subscription: Subscription) -> TypeGuard[TypeSubscription]:
+    # Subclasses that override matching cannot be indexed by topic type.
+    return isinstance(subscription, TypeSubscription) and type(subscription).is_match is TypeSubscription.is_match
+
+
+def _is_type_prefix_subscription(subscription: Subscription) -> TypeGuard[TypePrefixSubscription]:
+    return (
+        isinstance(subscription, TypePrefixSubscription)
+        and type(subscription).is_match is TypePrefixSubscription.is_match
+    )
+
+
+class SubscriptionManager:
+    """Maintains the set of subscriptions of a runtime and resolves the recipients of a topic.
+
+    :class:`~autogen_core.TypeSubscription` instances are indexed by their exact topic type and
+    :class:`~autogen_core.TypePrefixSubscription` instances by a prefix trie over their topic type prefix,
+    so resolving a topic does not scan every subscription. Other :class:`~autogen_core.Subscription`
+    implementations are matched with :meth:`~autogen_core.Subscription.is_match`.
+
+    Resolved recipients are kept in a bounded LRU cache keyed by topic. Adding or removing a subscription
+    only refreshes the cached topics it can match.
+
+    Args:
+        max_cached_topics (int | None, optional): The maximum number of topics whose recipients are cached.
+            Least recently used topics are evicted first. ``None`` disables the bound. Defaults to 10000.
+    """
+
+    def __init__(self, max_cached_topics: int | None = 10000) -> None:
+        if max_cached_topics is not None and max_cached_topics < 1:
+            raise ValueError("max_cached_topics must be a positive integer or None")
+        self._max_cached_topics = max_cached_topics
         self._subscriptions: List[Subscription] = []
-        self._seen_topics: Set[TopicId] = set()
-        self._subscribed_recipients: DefaultDict[TopicId, List[AgentId]] = defaultdict(list)
+        self._subscriptions_by_id: Dict[str, Subscription] = {}
+        # Registration order, used to keep the recipient order identical to a linear scan.
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self._exact_index: DefaultDict[str, List[Subscription]] = defaultdict(list)
+        self._prefix_root = _PrefixTrieNode()
+        self._unindexed: List[Subscription] = []
+        self._subscribed_recipients: OrderedDict[TopicId, List[AgentId]] = OrderedDict()
+        self._cached_topics_by_type: DefaultDict[str, Set[TopicId]] = defaultdict(set)
 
     @property
     def subscriptions(self) -> Sequence[Subscription]:
@@ -41,38 +97,272 @@ def subscriptions(self) -> Sequence[Subscription]:
 
     async def add_subscription(self, subscription: Subscription) -> None:
         # Check if the subscription already exists
-        if any(sub == subscription for sub in self._subscriptions):
+        if self._is_duplicate(subscription):
             raise ValueError("Subscription already exists")
 
         self._subscriptions.append(subscription)
-        self._rebuild_subscriptions(self._seen_topics)
+        self._subscriptions_by_id[subscription.id] = subscription
+        self._order[subscription.id] = self._next_order
+        self._next_order += 1
+        self._index(subscription)
+        self._refresh_cached_topics(subscription)
 
     async def remove_subscription(self, id: str) -> None:
         # Check if the subscription exists
-        if not any(sub.id == id for sub in self._subscriptions):
+        subscription = self._subscriptions_by_id.pop(id, None)
+        if subscription is None:
             raise ValueError("Subscription does not exist")
 
-        def is_not_sub(x: Subscription) -> bool:
-            return x.id != id
+        self._subscriptions = [x for x in self._subscriptions if x.id != id]
+        self._unindex(subscription)
+        del self._order[id]
+        self._refresh_cached_topics(subscription)
+
+    async def get_subscribed_recipients(self, topic: TopicId) -> List[AgentId]:
+        recipients = self._subscribed_recipients.get(topic)
+        if recipients is None:
+            recipients = self._resolve(topic)
+            self._cache(topic, recipients)
+        else:
+            self._subscribed_recipients.move_to_end(topic)
+        return recipients
 
-        self._subscriptions = list(filter(is_not_sub, self._subscriptions))
+    def _is_duplicate(self, subscription: Subscription) -> bool:
+        if subscription.id in self._subscriptions_by_id:
+            return True
+        if _is_exact_type_subscription(subscription):
+            candidates: Iterable[Subscription] = self._exact_index.get(subscription.topic_type, [])
+        elif _is_type_prefix_subscription(subscription):
+            node = self._find_prefix_node(subscription.topic_type_prefix)
+            candidates = node.subscriptions if node is not None else []
+        else:
+            candidates = self._subscriptions
+        if any(sub == subscription for sub in candidates):
+            return True
+        return any(sub == subscription for sub in self._unindexed)
 
-        # Rebuild the subscriptions
-        self._rebuild_subscriptions(self._seen_topics)
+    def _index(self, subscription: Subscription) -> None:
+        if _is_exact_type_subscription(subscription):
+            self._exact_index[subscription.topic_type].append(subscription)
+        elif _is_type_prefix_subscription(subscription):
+            node = self._prefix_root
+            for char in subscription.topic_type_prefix:
+                node = node.children.setdefault(char, _PrefixTrieNode())
+            node.subscriptions.append(subscription)
+        else:
+            self._unindexed.append(subscription)
 
-    async def get_subscribed_recipients(self, topic: TopicId) -> List[AgentId]:
-        if topic not in self._seen_topics:
-            self._build_for_new_topic(topic)
-        return self._subscribed_recipients[topic]
-
-    # TODO: optimize this...
-    def _rebuild_subscriptions(self, topics: Set[TopicId]) -> None:
-        self._subscribed_recipients.clear()
-        for topic in topics:
-            self._build_for_new_topic(topic)
-
-    def _build_for_new_topic(self, topic: TopicId) -> None:
-        self._seen_topics.add(topic)
-        for subscription in self._subscriptions:
-            if subscription.is_match(topic):
-                self._subscribed_recipients[topic].append(subscription.map_to_agent(topic))
+    def _unindex(self, subscription: Subscription) -> None:
+        if _is_exact_type_subscription(subscription):
+            bucket = self._exact_index[subscription.topic_type]
+            bucket.remove(subscription)
+            if not bucket:
+                del self._exact_index[subscription.topic_type]
+        elif _is_type_prefix_subscription(subscription):
+            path = [self._prefix_root]
+            for char in subscription.topic_type_prefix:
+                path.append(path[-1].children[char])
+            path[-1].subscriptions.remove(subscription)
+            # Prune nodes that no longer lead to any subscription.
+            for parent, char, node in zip(
+                reversed(path[:-1]), reversed(subscription.topic_type_prefix), reversed(path[1:]), strict=True
+            ):
+                if node.subscriptions or node.children:
+                    break
+                del parent.children[char]
+        else:
+            self._unindexed.remove(subscription)
+
+    def _find_prefix_node(self, prefix: str) -> _PrefixTrieNode | None:
+        node: _PrefixTrieNode | None = self._prefix_root
+        for char in prefix:
+            assert node is not None
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _matching_subscriptions(self, topic: TopicId) -> List[Subscription]:
+        matches: List[Subscription] = list(self._exact_index.get(topic.type, []))
+        node = self._prefix_root
+        matches.extend(node.subscriptions)
+        for char in topic.type:
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            matches.extend(node.subscriptions)
+        matches.extend(sub for sub in self._unindexed if sub.is_match(topic))
+        matches.sort(key=lambda sub: self._order[sub.id])
+        return matches
+
+    def _resolve(self, topic: TopicId) -> List[AgentId]:
+        return [subscription.map_to_agent(topic) for subscription in self._matching_subscriptions(topic)]
+
+    def _cache(self, topic: TopicId, recipients: List[AgentId]) -> None:
+        self._subscribed_recipients[topic] = recipients
+        self._cached_topics_by_type[topic.type].add(topic)
+        if self._max_cached_topics is not None and len(self._subscribed_recipients) > self._max_cached_topics:
+            evicted, _ = self._subscribed_recipients.popitem(last=False)
+            topics = self._cached_topics_by_type[evicted.type]
+            topics.discard(evicted)
+            if not topics:
+                del self._cached_topics_by_type[evicted.type]
+
+    def _refresh_cached_topics(self, subscription: Subscription) -> None:
+        """Recompute the cached recipients of every cached topic the given subscription can match."""
+        if _is_exact_type_subscription(subscription):
+            affected: Iterable[TopicId] = list(self._cached_topics_by_type.get(subscription.topic_type, ()))
+        elif _is_type_prefix_subscription(subscription):
+            prefix = subscription.topic_type_prefix
+            affected = [
+                topic
+                for topic_type, topics in self._cached_topics_by_type.items()
+                if topic_type.startswith(prefix)
+                for topic in topics
+            ]
+        else:
+            affected = [topic for topic in self._subscribed_recipients if subscription.is_match(topic)]
+        for topic in affected:
+            # Assign a new list so callers holding the previous result are not affected.
+            self._subscribed_recipients[topic] = self._resolve(topic)
+
+
+class AgentInstanceCache:
+    """Holds the live agent instances of a runtime and applies an :class:`~autogen_core.AgentLifecyclePolicy`.
+
+    Without a policy, agents are kept alive until the runtime is closed.
+    """
+
+    def __init__(self, policy: AgentLifecyclePolicy | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        self._policy = policy
+        self._clock = clock
+        self._store: CacheStore[Mapping[str, Any]] = (
+            policy.state_store if policy is not None and policy.state_store is not None else InMemoryStore()
+        )
+        # Ordered from least to most recently used.
+        self._agents: OrderedDict[AgentId, Agent] = OrderedDict()
+        self._last_used: Dict[AgentId, float] = {}
+        self._pinned: Counter[AgentId] = Counter()
+        self._spilled: Set[AgentId] = set()
+        self._evicting: Dict[AgentId, asyncio.Event] = {}
+        self.stats = AgentCacheStats()
+
+    def __contains__(self, agent_id: AgentId) -> bool:
+        return agent_id in self._agents
+
+    def __iter__(self) -> Iterator[AgentId]:
+        return iter(list(self._agents))
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def items(self) -> List[Tuple[AgentId, Agent]]:
+        return list(self._agents.items())
+
+    def spilled_states(self) -> List[Tuple[AgentId, Mapping[str, Any]]]:
+        """Return the stored state of every evicted agent that has not been re-created."""
+        states: List[Tuple[AgentId, Mapping[str, Any]]] = []
+        for agent_id in self._spilled:
+            state = self._store.get(str(agent_id))
+            if state is not None:
+                states.append((agent_id, state))
+        return states
+
+    async def get(self, agent_id: AgentId) -> Agent | None:
+        """Return the live instance of the agent, or None if the agent factory must be run."""
+        evicting = self._evicting.get(agent_id)
+        if evicting is not None:
+            # Wait for the state to be saved before the agent is re-created.
+            await evicting.wait()
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self._touch(agent_id)
+        await self.evict(exclude=agent_id)
+        return agent
+
+    async def add(self, agent_id: AgentId, agent: Agent) -> None:
+        """Add a newly created agent instance, restoring its state if it was evicted before."""
+        if agent_id in self._spilled:
+            state = self._store.get(str(agent_id))
+            if state is not None:
+                await agent.load_state(state)
+                self.stats.restores += 1
+            self._spilled.discard(agent_id)
+        self._agents[agent_id] = agent
+        self._touch(agent_id)
+        await self.evict(exclude=agent_id)
+
+    async def remove(self, agent_id: AgentId) -> None:
+        """Close and remove the live instance of the agent, and forget its evicted state, if any.
+
+        The agent factory runs again if the agent is needed later."""
+        evicting = self._evicting.get(agent_id)
+        if evicting is not None:
+            await evicting.wait()
+        self._spilled.discard(agent_id)
+        self._last_used.pop(agent_id, None)
+        agent = self._agents.pop(agent_id, None)
+        if agent is not None:
+            await agent.close()
+
+    def pin(self, agent_id: AgentId) -> None:
+        """Prevent the agent from being evicted until :meth:`unpin` is called."""
+        self._pinned[agent_id] += 1
+
+    def unpin(self, agent_id: AgentId) -> None:
+        self._pinned[agent_id] -= 1
+        if self._pinned[agent_id] <= 0:
+            del self._pinned[agent_id]
+
+    async def evict(self, exclude: AgentId | None = None) -> None:
+        """Evict the agents that exceed the live agent limit or the idle TTL."""
+        if self._policy is None:
+            return
+        max_live_agents = self._policy.max_live_agents
+        idle_ttl = self._policy.idle_ttl
+        now = self._clock()
+        victims: List[AgentId] = []
+        for agent_id in self._agents:
+            if agent_id == exclude or agent_id in self._pinned:
+                continue
+            over_limit = max_live_agents is not None and len(self._agents) - len(victims) > max_live_agents
+            expired = idle_ttl is not None and now - self._last_used[agent_id] > idle_ttl
+            if not over_limit and not expired:
+                # Agents are ordered by last use, so later agents are neither expired nor over the limit.
+                break
+            victims.append(agent_id)
+        for agent_id in victims:
+            await self._evict_one(agent_id)
+
+    async def _evict_one(self, agent_id: AgentId) -> None:
+        agent = self._agents.pop(agent_id)
+        last_used = self._last_used.pop(agent_id)
+        evicting = asyncio.Event()
+        self._evicting[agent_id] = evicting
+        try:
+            try:
+                state = await agent.save_state()
+            except Exception:
+                logger.error(f"Error saving the state of agent {agent_id}, keeping it alive", exc_info=True)
+                self._agents[agent_id] = agent
+                self._agents.move_to_end(agent_id, last=False)
+                self._last_used[agent_id] = last_used
+                return
+            self._store.set(str(agent_id), dict(state))
+            self._spilled.add(agent_id)
+            self.stats.evictions += 1
+            try:
+                await agent.close()
+            except Exception:
+                logger.error(f"Error closing evicted agent {agent_id}", exc_info=True)
+        finally:
+            del self._evicting[agent_id]
+            evicting.set()
+
+    def _touch(self, agent_id: AgentId) -> None:
+        self._agents.move_to_end(agent_id)
+        self._last_used[agent_id] = self._clock()
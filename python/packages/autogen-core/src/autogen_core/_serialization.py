@@ -23,6 +23,17 @@ def deserialize(self, payload: bytes) -> T: ...
     def serialize(self, message: T) -> bytes: ...
 
 
+@runtime_checkable
+class ProtobufAnySerializer(Protocol[T]):
+    """Capability of a :class:`MessageSerializer` that converts messages to and from
+    :class:`google.protobuf.any_pb2.Any` directly, so runtimes that carry ``Any`` payloads
+    do not have to encode the ``Any`` to bytes and parse it back."""
+
+    def serialize_to_any(self, message: T) -> any_pb2.Any: ...
+
+    def deserialize_from_any(self, payload: any_pb2.Any) -> T: ...
+
+
 @runtime_checkable
 class IsDataclass(Protocol):
     # as already noted in comments, checking for this attribute is currently
@@ -170,18 +181,23 @@ def deserialize(self, payload: bytes) -> ProtobufT:
         # Parse payload into a proto any
         any_proto = any_pb2.Any()
         any_proto.ParseFromString(payload)
+        return self.deserialize_from_any(any_proto)
 
+    def serialize(self, message: ProtobufT) -> bytes:
+        return self.serialize_to_any(message).SerializeToString()
+
+    def deserialize_from_any(self, payload: any_pb2.Any) -> ProtobufT:
         destination_message = self.cls()
 
-        if not any_proto.Unpack(destination_message):  # type: ignore
+        if not payload.Unpack(destination_message):  # type: ignore
             raise ValueError(f"Failed to unpack payload into {self.cls}")
 
         return destination_message
 
-    def serialize(self, message: ProtobufT) -> bytes:
+    def serialize_to_any(self, message: ProtobufT) -> any_pb2.Any:
         any_proto = any_pb2.Any()
         any_proto.Pack(message)  # type: ignore
-        return any_proto.SerializeToString()
+        return any_proto
 
 
 @dataclass
@@ -228,6 +244,8 @@ class SerializationRegistry:
     def __init__(self) -> None:
         # type_name, data_content_type -> serializer
         self._serializers: dict[tuple[str, str], MessageSerializer[Any]] = {}
+        # type_name -> protobuf serializer that works on Any messages directly
+        self._any_serializers: dict[str, ProtobufAnySerializer[Any]] = {}
 
     def add_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
         if isinstance(serializer, Sequence):
@@ -236,6 +254,12 @@ def add_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSe
             return
 
         self._serializers[(serializer.type_name, serializer.data_content_type)] = serializer
+        if serializer.data_content_type == PROTOBUF_DATA_CONTENT_TYPE:
+            # Checked once here, as isinstance on a runtime protocol is slow on the message path.
+            if isinstance(serializer, ProtobufAnySerializer):
+                self._any_serializers[serializer.type_name] = cast(ProtobufAnySerializer[Any], serializer)
+            else:
+                self._any_serializers.pop(serializer.type_name, None)
 
     def deserialize(self, payload: bytes, *, type_name: str, data_content_type: str) -> Any:
         serializer = self._serializers.get((type_name, data_content_type))
@@ -251,6 +275,32 @@ def serialize(self, message: Any, *, type_name: str, data_content_type: str) ->
 
         return serializer.serialize(message)
 
+    def serialize_to_any(self, message: Any, *, type_name: str) -> any_pb2.Any:
+        """Serialize a message with its protobuf serializer into an ``Any``.
+
+        Serializers that implement :class:`ProtobufAnySerializer` produce the ``Any`` directly,
+        others are serialized to bytes and parsed."""
+        any_serializer = self._any_serializers.get(type_name)
+        if any_serializer is not None:
+            return any_serializer.serialize_to_any(message)
+        any_proto = any_pb2.Any()
+        any_proto.ParseFromString(
+            self.serialize(message, type_name=type_name, data_content_type=PROTOBUF_DATA_CONTENT_TYPE)
+        )
+        return any_proto
+
+    def deserialize_from_any(self, payload: any_pb2.Any, *, type_name: str) -> Any:
+        """Deserialize an ``Any`` with the protobuf serializer of the type.
+
+        Serializers that implement :class:`ProtobufAnySerializer` unpack the ``Any`` directly,
+        others are given its serialized bytes."""
+        any_serializer = self._any_serializers.get(type_name)
+        if any_serializer is not None:
+            return any_serializer.deserialize_from_any(payload)
+        return self.deserialize(
+            payload.SerializeToString(), type_name=type_name, data_content_type=PROTOBUF_DATA_CONTENT_TYPE
+        )
+
     def is_registered(self, type_name: str, data_content_type: str) -> bool:
         return (type_name, data_content_type) in self._serializers
 
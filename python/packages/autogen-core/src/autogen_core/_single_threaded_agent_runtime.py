@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import logging
 import sys
@@ -31,6 +32,7 @@
 from ._agent import Agent
 from ._agent_id import AgentId
 from ._agent_instantiation import AgentInstantiationContext
+from ._agent_lifecycle import AgentCacheStats, AgentLifecyclePolicy
 from ._agent_metadata import AgentMetadata
 from ._agent_runtime import AgentRuntime
 from ._agent_type import AgentType
@@ -38,7 +40,7 @@
 from ._intervention import DropMessage, InterventionHandler
 from ._message_context import MessageContext
 from ._message_handler_context import MessageHandlerContext
-from ._runtime_impl_helpers import SubscriptionManager, get_impl
+from ._runtime_impl_helpers import AgentInstanceCache, SubscriptionManager, get_impl
 from ._serialization import JSON_DATA_CONTENT_TYPE, MessageSerializer, SerializationRegistry
 from ._subscription import Subscription
 from ._telemetry import EnvelopeMetadata, MessageRuntimeTracingConfig, TraceHelper, get_telemetry_envelope_metadata
@@ -160,6 +162,9 @@ class SingleThreadedAgentRuntime(AgentRuntime):
             handlers that can intercept messages before they are sent or published. Defaults to None.
         tracer_provider (TracerProvider, optional): The tracer provider to use for tracing. Defaults to None.
         ignore_unhandled_exceptions (bool, optional): Whether to ignore unhandled exceptions in that occur in agent event handlers. Any background exceptions will be raised on the next call to `process_next` or from an awaited `stop`, `stop_when_idle` or `stop_when`. Note, this does not apply to RPC handlers. Defaults to True.
+        agent_lifecycle_policy (AgentLifecyclePolicy, optional): Bounds the number of live agent instances by evicting
+            least recently used or idle agents and restoring their state when they are needed again. Defaults to None,
+            in which case agents are kept alive until the runtime is closed.
 
     Examples:
 
@@ -250,6 +255,7 @@ def __init__(
         intervention_handlers: List[InterventionHandler] | None = None,
         tracer_provider: TracerProvider | None = None,
         ignore_unhandled_exceptions: bool = True,
+        agent_lifecycle_policy: AgentLifecyclePolicy | None = None,
     ) -> None:
         self._tracer_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("SingleThreadedAgentRuntime"))
         self._message_queue: Queue[PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope] = Queue()
@@ -257,7 +263,7 @@ def __init__(
         self._agent_factories: Dict[
             str, Callable[[], Agent | Awaitable[Agent]] | Callable[[AgentRuntime, AgentId], Agent | Awaitable[Agent]]
         ] = {}
-        self._instantiated_agents: Dict[AgentId, Agent] = {}
+        self._instantiated_agents = AgentInstanceCache(agent_lifecycle_policy)
         self._intervention_handlers = intervention_handlers
         self._background_tasks: Set[Task[Any]] = set()
         self._subscription_manager = SubscriptionManager()
@@ -272,6 +278,11 @@ def unprocessed_messages_count(
     ) -> int:
         return self._message_queue.qsize()
 
+    @property
+    def agent_cache_stats(self) -> AgentCacheStats:
+        """Hit, miss, eviction and restore counters of the agent instance cache."""
+        return self._instantiated_agents.stats
+
     @property
     def _known_agent_names(self) -> Set[str]:
         return set(self._agent_factories.keys())
@@ -292,15 +303,16 @@ async def send_message(
         if message_id is None:
             message_id = str(uuid.uuid4())
 
-        event_logger.info(
-            MessageEvent(
-                payload=self._try_serialize(message),
-                sender=sender,
-                receiver=recipient,
-                kind=MessageKind.DIRECT,
-                delivery_stage=DeliveryStage.SEND,
+        if event_logger.isEnabledFor(logging.INFO):
+            event_logger.info(
+                MessageEvent(
+                    payload=self._lazy_serialize(message),
+                    sender=sender,
+                    receiver=recipient,
+                    kind=MessageKind.DIRECT,
+                    delivery_stage=DeliveryStage.SEND,
+                )
             )
-        )
 
         with self._tracer_helper.trace_block(
             "create",
@@ -312,8 +324,9 @@ async def send_message(
             if recipient.type not in self._known_agent_names:
                 future.set_exception(Exception("Recipient not found"))
 
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info("Sending message of type %s to %s: %s", type(message).__name__, recipient.type, content)
 
             await self._message_queue.put(
                 SendMessageEnvelope(
@@ -348,21 +361,23 @@ async def publish_message(
         ):
             if cancellation_token is None:
                 cancellation_token = CancellationToken()
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info("Publishing message of type %s to all subscribers: %s", type(message).__name__, content)
 
             if message_id is None:
                 message_id = str(uuid.uuid4())
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message),
-                    sender=sender,
-                    receiver=topic_id,
-                    kind=MessageKind.PUBLISH,
-                    delivery_stage=DeliveryStage.SEND,
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_serialize(message),
+                        sender=sender,
+                        receiver=topic_id,
+                        kind=MessageKind.PUBLISH,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
 
             await self._message_queue.put(
                 PublishMessageEnvelope(
@@ -389,8 +404,10 @@ async def save_state(self) -> Mapping[str, Any]:
 
         """
         state: Dict[str, Dict[str, Any]] = {}
-        for agent_id in self._instantiated_agents:
-            state[str(agent_id)] = dict(await (await self._get_agent(agent_id)).save_state())
+        for agent_id, agent_state in self._instantiated_agents.spilled_states():
+            state[str(agent_id)] = dict(agent_state)
+        for agent_id, agent in self._instantiated_agents.items():
+            state[str(agent_id)] = dict(await agent.save_state())
         return state
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
@@ -418,19 +435,24 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
                 raise LookupError(f"Agent type '{recipient.type}' does not exist.")
 
             try:
-                sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
-                logger.info(
-                    f"Calling message handler for {recipient} with message type {type(message_envelope.message).__name__} sent by {sender_id}"
-                )
-                event_logger.info(
-                    MessageEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        sender=message_envelope.sender,
-                        receiver=recipient,
-                        kind=MessageKind.DIRECT,
-                        delivery_stage=DeliveryStage.DELIVER,
+                if logger.isEnabledFor(logging.INFO):
+                    sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
+                    logger.info(
+                        "Calling message handler for %s with message type %s sent by %s",
+                        recipient,
+                        type(message_envelope.message).__name__,
+                        sender_id,
+                    )
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageEvent(
+                            payload=self._lazy_serialize(message_envelope.message),
+                            sender=message_envelope.sender,
+                            receiver=recipient,
+                            kind=MessageKind.DIRECT,
+                            delivery_stage=DeliveryStage.DELIVER,
+                        )
                     )
-                )
                 recipient_agent = await self._get_agent(recipient)
 
                 message_context = MessageContext(
@@ -440,19 +462,26 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
                     cancellation_token=message_envelope.cancellation_token,
                     message_id=message_envelope.message_id,
                 )
-                with self._tracer_helper.trace_block("process", recipient_agent.id, parent=message_envelope.metadata):
-                    with MessageHandlerContext.populate_context(recipient_agent.id):
-                        response = await recipient_agent.on_message(
-                            message_envelope.message,
-                            ctx=message_context,
-                        )
+                # Keep the recipient alive while it handles the message.
+                self._instantiated_agents.pin(recipient)
+                try:
+                    with self._tracer_helper.trace_block(
+                        "process", recipient_agent.id, parent=message_envelope.metadata
+                    ):
+                        with MessageHandlerContext.populate_context(recipient_agent.id):
+                            response = await recipient_agent.on_message(
+                                message_envelope.message,
+                                ctx=message_context,
+                            )
+                finally:
+                    self._instantiated_agents.unpin(recipient)
             except CancelledError as e:
                 if not message_envelope.future.cancelled():
                     message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
                 event_logger.info(
                     MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
+                        payload=self._lazy_serialize(message_envelope.message),
                         handling_agent=recipient,
                         exception=e,
                     )
@@ -463,22 +492,23 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
                 self._message_queue.task_done()
                 event_logger.info(
                     MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
+                        payload=self._lazy_serialize(message_envelope.message),
                         handling_agent=recipient,
                         exception=e,
                     )
                 )
                 return
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(response),
-                    sender=message_envelope.recipient,
-                    receiver=message_envelope.sender,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.SEND,
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_serialize(response),
+                        sender=message_envelope.recipient,
+                        receiver=message_envelope.sender,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
 
             await self._message_queue.put(
                 ResponseMessageEnvelope(
@@ -493,9 +523,13 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
 
     async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> None:
         with self._tracer_helper.trace_block("publish", message_envelope.topic_id, parent=message_envelope.metadata):
+            # Recipients are pinned until all handlers finish so they are not evicted mid-delivery.
+            pinned: List[AgentId] = []
             try:
                 responses: List[Awaitable[Any]] = []
                 recipients = await self._subscription_manager.get_subscribed_recipients(message_envelope.topic_id)
+                # Serialize the payload at most once for all recipients, and only if an event is emitted.
+                payload = self._lazy_serialize(message_envelope.message)
                 for agent_id in recipients:
                     # Avoid sending the message back to the sender
                     if message_envelope.sender is not None and agent_id == message_envelope.sender:
@@ -504,19 +538,24 @@ async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> No
                     sender_agent = (
                         await self._get_agent(message_envelope.sender) if message_envelope.sender is not None else None
                     )
-                    sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
-                    logger.info(
-                        f"Calling message handler for {agent_id.type} with message type {type(message_envelope.message).__name__} published by {sender_name}"
-                    )
-                    event_logger.info(
-                        MessageEvent(
-                            payload=self._try_serialize(message_envelope.message),
-                            sender=message_envelope.sender,
-                            receiver=None,
-                            kind=MessageKind.PUBLISH,
-                            delivery_stage=DeliveryStage.DELIVER,
+                    if logger.isEnabledFor(logging.INFO):
+                        sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
+                        logger.info(
+                            "Calling message handler for %s with message type %s published by %s",
+                            agent_id.type,
+                            type(message_envelope.message).__name__,
+                            sender_name,
+                        )
+                    if event_logger.isEnabledFor(logging.INFO):
+                        event_logger.info(
+                            MessageEvent(
+                                payload=payload,
+                                sender=message_envelope.sender,
+                                receiver=None,
+                                kind=MessageKind.PUBLISH,
+                                delivery_stage=DeliveryStage.DELIVER,
+                            )
                         )
-                    )
                     message_context = MessageContext(
                         sender=message_envelope.sender,
                         topic_id=message_envelope.topic_id,
@@ -525,6 +564,8 @@ async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> No
                         message_id=message_envelope.message_id,
                     )
                     agent = await self._get_agent(agent_id)
+                    self._instantiated_agents.pin(agent_id)
+                    pinned.append(agent_id)
 
                     async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
                         with self._tracer_helper.trace_block("process", agent.id, parent=message_envelope.metadata):
@@ -538,7 +579,7 @@ async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
                                     logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
                                     event_logger.info(
                                         MessageHandlerExceptionEvent(
-                                            payload=self._try_serialize(message_envelope.message),
+                                            payload=payload,
                                             handling_agent=agent.id,
                                             exception=e,
                                         )
@@ -553,28 +594,36 @@ async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
                 if not self._ignore_unhandled_handler_exceptions:
                     self._background_exception = e
             finally:
+                for agent_id in pinned:
+                    self._instantiated_agents.unpin(agent_id)
                 self._message_queue.task_done()
             # TODO if responses are given for a publish
 
     async def _process_response(self, message_envelope: ResponseMessageEnvelope) -> None:
         with self._tracer_helper.trace_block("ack", message_envelope.recipient, parent=message_envelope.metadata):
-            content = (
-                message_envelope.message.__dict__
-                if hasattr(message_envelope.message, "__dict__")
-                else message_envelope.message
-            )
-            logger.info(
-                f"Resolving response with message type {type(message_envelope.message).__name__} for recipient {message_envelope.recipient} from {message_envelope.sender.type}: {content}"
-            )
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message_envelope.message),
-                    sender=message_envelope.sender,
-                    receiver=message_envelope.recipient,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.DELIVER,
+            if logger.isEnabledFor(logging.INFO):
+                content = (
+                    message_envelope.message.__dict__
+                    if hasattr(message_envelope.message, "__dict__")
+                    else message_envelope.message
+                )
+                logger.info(
+                    "Resolving response with message type %s for recipient %s from %s: %s",
+                    type(message_envelope.message).__name__,
+                    message_envelope.recipient,
+                    message_envelope.sender.type,
+                    content,
+                )
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_serialize(message_envelope.message),
+                        sender=message_envelope.sender,
+                        receiver=message_envelope.recipient,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.DELIVER,
+                    )
                 )
-            )
             if not message_envelope.future.cancelled():
                 message_envelope.future.set_result(message_envelope.message)
             self._message_queue.task_done()
@@ -629,7 +678,7 @@ async def _process_next(self) -> None:
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
                                 event_logger.info(
                                     MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
+                                        payload=self._lazy_serialize(message),
                                         sender=sender,
                                         receiver=recipient,
                                         kind=MessageKind.DIRECT,
@@ -669,7 +718,7 @@ async def _process_next(self) -> None:
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
                                 event_logger.info(
                                     MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
+                                        payload=self._lazy_serialize(message),
                                         sender=sender,
                                         receiver=topic_id,
                                         kind=MessageKind.PUBLISH,
@@ -695,7 +744,7 @@ async def _process_next(self) -> None:
                         if temp_message is DropMessage or isinstance(temp_message, DropMessage):
                             event_logger.info(
                                 MessageDroppedEvent(
-                                    payload=self._try_serialize(message),
+                                    payload=self._lazy_serialize(message),
                                     sender=sender,
                                     receiver=recipient,
                                     kind=MessageKind.RESPOND,
@@ -744,8 +793,7 @@ async def close(self) -> None:
         if self._run_context is not None:
             await self.stop()
         # close all the agents that have been instantiated
-        for agent_id in self._instantiated_agents:
-            agent = await self._get_agent(agent_id)
+        for _, agent in self._instantiated_agents.items():
             await agent.close()
 
     async def stop(self) -> None:
@@ -866,15 +914,16 @@ async def _invoke_agent_factory(
                 raise
 
     async def _get_agent(self, agent_id: AgentId) -> Agent:
-        if agent_id in self._instantiated_agents:
-            return self._instantiated_agents[agent_id]
+        agent = await self._instantiated_agents.get(agent_id)
+        if agent is not None:
+            return agent
 
         if agent_id.type not in self._agent_factories:
             raise LookupError(f"Agent with name {agent_id.type} not found.")
 
         agent_factory = self._agent_factories[agent_id.type]
         agent = await self._invoke_agent_factory(agent_factory, agent_id)
-        self._instantiated_agents[agent_id] = agent
+        await self._instantiated_agents.add(agent_id, agent)
         return agent
 
     # TODO: uncomment out the following type ignore when this is fixed in mypy: https://github.com/python/mypy/issues/3737
@@ -892,6 +941,11 @@ async def try_get_underlying_agent_instance(self, id: AgentId, type: Type[T] = A
 
         return agent_instance
 
+    async def remove_agent(self, id: AgentId) -> None:
+        """Close and remove the instance of an agent, along with its state saved by the agent lifecycle policy.
+        The agent is created again by its factory if it receives another message."""
+        await self._instantiated_agents.remove(id)
+
     async def add_subscription(self, subscription: Subscription) -> None:
         await self._subscription_manager.add_subscription(subscription)
 
@@ -911,6 +965,10 @@ async def get(
     def add_message_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
         self._serialization_registry.add_serializer(serializer)
 
+    def _lazy_serialize(self, message: Any) -> Callable[[], str]:
+        """Return a callable that serializes the message on first use and caches the result."""
+        return functools.cache(functools.partial(self._try_serialize, message))
+
     def _try_serialize(self, message: Any) -> str:
         try:
             type_name = self._serialization_registry.type_name(message)
@@ -6,7 +6,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from types import TracebackType
-from typing import List, Optional, Type
+from typing import AsyncGenerator, List, Optional, Type, Union
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -71,6 +71,24 @@ async def execute_code_blocks(
         """
         ...
 
+    async def execute_code_blocks_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[str, CodeResult], None]:
+        """Execute code blocks, yielding the output as it is produced, then the result.
+
+        The default implementation calls :meth:`execute_code_blocks` and yields only its result.
+        Code executors that can read the output of the code as it runs override this method.
+
+        Args:
+            code_blocks (List[CodeBlock]): The code blocks to execute.
+            cancellation_token (CancellationToken): A token to cancel the operation.
+
+        Returns:
+            AsyncGenerator[Union[str, CodeResult], None]: The chunks of output as they are produced,
+            followed by the result of the code execution as the last item.
+        """
+        yield await self.execute_code_blocks(code_blocks, cancellation_token)
+
     @abstractmethod
     async def start(self) -> None:
         """Start the code executor."""
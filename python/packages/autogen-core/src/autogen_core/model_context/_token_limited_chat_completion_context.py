@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, Iterator, List, Sequence, Tuple
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -9,6 +9,24 @@
 from ._chat_completion_context import ChatCompletionContext
 
 
+def _middle_removal_order(num_messages: int) -> Iterator[int]:
+    """Yield the indices of the messages in the order :meth:`TokenLimitedChatCompletionContext.get_messages`
+    removes them: repeatedly the middle message of the remaining list. The remaining messages are always a
+    prefix and a suffix of the original list, so each step is O(1)."""
+    if num_messages == 0:
+        return
+    yield num_messages // 2
+    prefix = num_messages // 2
+    suffix = num_messages - prefix - 1
+    while prefix + suffix > 0:
+        if (prefix + suffix) // 2 < prefix:
+            prefix -= 1
+            yield prefix
+        else:
+            yield num_messages - suffix
+            suffix -= 1
+
+
 class TokenLimitedChatCompletionContextConfig(BaseModel):
     model_client: ComponentModel
     token_limit: int | None = None
@@ -53,23 +71,73 @@ def __init__(
         self._token_limit = token_limit
         self._model_client = model_client
         self._tool_schema = tool_schema or []
+        # id(message) -> (message, tokens of the message alone). The message is kept so its id is not reused.
+        self._message_tokens: Dict[int, Tuple[LLMMessage, int]] = {}
+        self._empty_tokens: int | None = None
 
-    async def get_messages(self) -> List[LLMMessage]:
-        """Get at most `token_limit` tokens in recent messages. If the token limit is not
-        provided, then return as many messages as the remaining token allowed by the model client."""
-        messages = list(self._messages)
+    async def add_message(self, message: LLMMessage) -> None:
+        await super().add_message(message)
+        self._count_message_tokens(message)
+
+    def _count_message_tokens(self, message: LLMMessage) -> int:
+        """Count the tokens a message adds to a prompt, caching the count per message."""
+        cached = self._message_tokens.get(id(message))
+        if cached is not None and cached[0] is message:
+            return cached[1]
+        if self._empty_tokens is None:
+            self._empty_tokens = self._model_client.count_tokens([])
+        tokens = self._model_client.count_tokens([message]) - self._empty_tokens
+        self._message_tokens[id(message)] = (message, tokens)
+        return tokens
+
+    def _estimate_removed_count(self, messages: Sequence[LLMMessage], removal_order: Sequence[int]) -> int:
+        """Estimate how many messages to remove from cached per-message counts, without re-tokenizing."""
+        # Drop counts of messages that left the context, e.g. after clear() or load_state().
+        self._message_tokens = {
+            id(message): self._message_tokens[id(message)]
+            for message in messages
+            if id(message) in self._message_tokens and self._message_tokens[id(message)][0] is message
+        }
+        token_counts = [self._count_message_tokens(message) for message in messages]
         if self._token_limit is None:
-            remaining_tokens = self._model_client.remaining_tokens(messages, tools=self._tool_schema)
-            while remaining_tokens < 0 and len(messages) > 0:
-                middle_index = len(messages) // 2
-                messages.pop(middle_index)
-                remaining_tokens = self._model_client.remaining_tokens(messages, tools=self._tool_schema)
+            budget = self._model_client.remaining_tokens([], tools=self._tool_schema)
         else:
-            token_count = self._model_client.count_tokens(messages, tools=self._tool_schema)
-            while token_count > self._token_limit and len(messages) > 0:
-                middle_index = len(messages) // 2
-                messages.pop(middle_index)
-                token_count = self._model_client.count_tokens(messages, tools=self._tool_schema)
+            budget = self._token_limit - self._model_client.count_tokens([], tools=self._tool_schema)
+        total = sum(token_counts)
+        num_removed = 0
+        while total > budget and num_removed < len(messages):
+            total -= token_counts[removal_order[num_removed]]
+            num_removed += 1
+        return num_removed
+
+    async def get_messages(self) -> List[LLMMessage]:
+        """Get at most `token_limit` tokens in recent messages. If the token limit is not
+        provided, then return as many messages as the remaining token allowed by the model client.
+
+        Messages are removed from the middle of the list, one at a time, until the rest fits."""
+        all_messages = list(self._messages)
+        removal_order = list(_middle_removal_order(len(all_messages)))
+
+        def trimmed(num_removed: int) -> List[LLMMessage]:
+            removed = set(removal_order[:num_removed])
+            return [message for index, message in enumerate(all_messages) if index not in removed]
+
+        def is_trimmed_enough(num_removed: int) -> bool:
+            if num_removed == len(all_messages):
+                return True
+            kept = trimmed(num_removed)
+            if self._token_limit is None:
+                return self._model_client.remaining_tokens(kept, tools=self._tool_schema) >= 0
+            return self._model_client.count_tokens(kept, tools=self._tool_schema) <= self._token_limit
+
+        # Token counts are usually additive over messages, so the estimate is exact and two counts of the
+        # trimmed list confirm it. Otherwise, step from the estimate to the first count that fits.
+        num_removed = self._estimate_removed_count(all_messages, removal_order)
+        while not is_trimmed_enough(num_removed):
+            num_removed += 1
+        while num_removed > 0 and is_trimmed_enough(num_removed - 1):
+            num_removed -= 1
+        messages = trimmed(num_removed)
         if messages and isinstance(messages[0], FunctionExecutionResultMessage):
             # Handle the first message is a function call result message.
             # Remove the first message from the list.
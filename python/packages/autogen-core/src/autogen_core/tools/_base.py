@@ -175,6 +175,12 @@ async def save_state_json(self) -> Mapping[str, Any]:
     async def load_state_json(self, state: Mapping[str, Any]) -> None:
         pass
 
+    async def close(self) -> None:
+        """Release any resources held by the tool, such as network connections.
+        This is a no-op by default. Subclasses can override this method to
+        implement custom close behavior."""
+        pass
+
 
 class BaseToolWithState(BaseTool[ArgsT, ReturnT], ABC, Generic[ArgsT, ReturnT, StateT], ComponentBase[BaseModel]):
     def __init__(
@@ -24,6 +24,10 @@ class StaticWorkbench(Workbench, Component[StaticWorkbenchConfig]):
     A workbench that provides a static set of tools that do not change after
     each tool execution.
 
+    The list of tool schemas is cached after the first call to :meth:`list_tools`.
+    Call :meth:`~autogen_core.tools.Workbench.invalidate_tools_cache` after changing the tools
+    or their schemas.
+
     Args:
         tools (List[BaseTool[Any, Any]]): A list of tools to be included in the workbench.
             The tools should be subclasses of :class:`~autogen_core.tools.BaseTool`.
@@ -36,7 +40,11 @@ def __init__(self, tools: List[BaseTool[Any, Any]]) -> None:
         self._tools = tools
 
     async def list_tools(self) -> List[ToolSchema]:
-        return [tool.schema for tool in self._tools]
+        tools = self._get_cached_tools()
+        if tools is None:
+            tools = [tool.schema for tool in self._tools]
+            self._cache_tools(tools, self._tools_cache_version)
+        return tools
 
     async def call_tool(
         self, name: str, arguments: Mapping[str, Any] | None = None, cancellation_token: CancellationToken | None = None
@@ -67,7 +75,8 @@ async def start(self) -> None:
         return None
 
     async def stop(self) -> None:
-        return None
+        for tool in self._tools:
+            await tool.close()
 
     async def reset(self) -> None:
         return None
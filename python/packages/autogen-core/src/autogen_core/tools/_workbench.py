@@ -1,3 +1,4 @@
+import time
 from abc import ABC, abstractmethod
 from types import TracebackType
 from typing import Any, List, Literal, Mapping, Optional, Type
@@ -88,10 +89,21 @@ class Workbench(ABC, ComponentBase[BaseModel]):
     and stopped by calling the :meth:`~autogen_core.tools.Workbench.stop` method.
     It can also be used as an asynchronous context manager, which will automatically
     start and stop the workbench when entering and exiting the context.
+
+    A workbench may cache the list of tools returned by :meth:`~autogen_core.tools.Workbench.list_tools`,
+    as the list is usually requested before every model call. A workbench that caches the list
+    must discard it when the tools change, and when :meth:`~autogen_core.tools.Workbench.invalidate_tools_cache`
+    is called. Subclasses can use :meth:`_get_cached_tools` and :meth:`_cache_tools` to implement the cache.
     """
 
     component_type = "workbench"
 
+    # The cached list of tools, the monotonic time at which it expires, and the version of the cache,
+    # which is incremented every time the cache is invalidated.
+    _tools_cache: List[ToolSchema] | None = None
+    _tools_cache_expires_at: float | None = None
+    _tools_cache_version: int = 0
+
     @abstractmethod
     async def list_tools(self) -> List[ToolSchema]:
         """
@@ -99,10 +111,43 @@ async def list_tools(self) -> List[ToolSchema]:
         objects.
 
         The list of tools may be dynamic, and their content may change after
-        tool execution.
+        tool execution. The list may be cached by the workbench until the tools change.
         """
         ...
 
+    def invalidate_tools_cache(self) -> None:
+        """
+        Discard the cached list of tools, if any, so that the next call to
+        :meth:`~autogen_core.tools.Workbench.list_tools` gets the list of tools again.
+        """
+        self._tools_cache = None
+        self._tools_cache_expires_at = None
+        self._tools_cache_version += 1
+
+    def _get_cached_tools(self) -> List[ToolSchema] | None:
+        """Return a copy of the cached list of tools, or None if there is no cached list or it has expired."""
+        if self._tools_cache is None:
+            return None
+        if self._tools_cache_expires_at is not None and time.monotonic() >= self._tools_cache_expires_at:
+            self.invalidate_tools_cache()
+            return None
+        return list(self._tools_cache)
+
+    def _cache_tools(self, tools: List[ToolSchema], version: int, ttl: float | None = None) -> None:
+        """Cache a list of tools.
+
+        Args:
+            tools (List[ToolSchema]): The list of tools to cache.
+            version (int): The value of :attr:`_tools_cache_version` when the list of tools was requested.
+                The list is not cached if the cache has been invalidated since then.
+            ttl (float | None): The number of seconds after which the cached list expires.
+                Defaults to None, meaning the list is kept until the cache is invalidated.
+        """
+        if version != self._tools_cache_version:
+            return
+        self._tools_cache = list(tools)
+        self._tools_cache_expires_at = time.monotonic() + ttl if ttl is not None else None
+
     @abstractmethod
     async def call_tool(
         self, name: str, arguments: Mapping[str, Any] | None = None, cancellation_token: CancellationToken | None = None
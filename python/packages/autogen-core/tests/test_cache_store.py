@@ -1,5 +1,6 @@
 from unittest.mock import Mock
 
+import pytest
 from autogen_core import CacheStore, InMemoryStore
 
 
@@ -46,3 +47,65 @@ def test_inmemory_store() -> None:
     key = "non_existent_key"
     default_value = 99
     assert store.get(key, default_value) == default_value
+
+
+def test_inmemory_store_ttl() -> None:
+    now = 0.0
+    store = InMemoryStore[int](ttl=10, clock=lambda: now)
+    store.set("a", 1)
+    store.set("b", 2, ttl=30)
+    now = 9.0
+    assert store.get("a") == 1
+    now = 10.0
+    assert store.get("a") is None
+    assert store.get("b") == 2
+    now = 30.0
+    assert store.get("b", -1) == -1
+
+
+def test_inmemory_store_purges_expired_items_on_set() -> None:
+    now = 0.0
+    store = InMemoryStore[int](ttl=10, clock=lambda: now)
+    for i in range(100):
+        store.set(str(i), i)
+    store.set("kept", -1, ttl=100)
+    now = 10.0
+    # Items that are never read again are dropped when another item is set.
+    store.set("new", 0)
+    assert store.store == {"kept": -1, "new": 0}
+    # Setting an item again extends its expiry.
+    store.set("new", 1)
+    now = 15.0
+    store.set("new", 2)
+    now = 20.0
+    store.set("other", 3)
+    assert store.get("new") == 2
+    now = 25.0
+    store.set("other", 4)
+    assert set(store.store) == {"kept", "other"}
+
+
+def test_inmemory_store_max_size() -> None:
+    store = InMemoryStore[int](max_size=2)
+    store.set("a", 1)
+    store.set("b", 2)
+    # Reading "a" makes "b" the least recently used item.
+    assert store.get("a") == 1
+    store.set("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_inmemory_store_async() -> None:
+    store = InMemoryStore[int]()
+    await store.aset("a", 1)
+    assert await store.aget("a") == 1
+    assert await store.aget("b", 2) == 2
+
+
+def test_inmemory_store_config() -> None:
+    store = InMemoryStore[int](max_size=8, ttl=1.5)
+    loaded = InMemoryStore[int].load_component(store.dump_component())
+    assert loaded._to_config() == store._to_config()  # type: ignore[reportPrivateUsage]
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+import sys
+from typing import Any, Dict, List
 
 import pytest
-from autogen_core import CancellationToken, Component, ComponentBase, ComponentLoader, ComponentModel
+from autogen_core import (
+    CancellationToken,
+    Component,
+    ComponentBase,
+    ComponentCache,
+    ComponentLoader,
+    ComponentModel,
+)
 from autogen_core._component_config import _type_to_provider_str  # type: ignore
 from autogen_core.code_executor import ImportFromModule
 from autogen_core.models import ChatCompletionClient
 from autogen_core.tools import FunctionTool
 from autogen_test_utils import MyInnerComponent, MyOuterComponent
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ValidationError, model_validator
 from typing_extensions import Self
 
 
@@ -367,3 +375,95 @@ def test_component_descriptions() -> None:
     assert ComponentWithDocstring("test").dump_component().description == "A component using just docstring."
     assert ComponentWithDescription("test").dump_component().description == "Explicit description"
     assert ComponentWithDescription("test").dump_component().label == "Custom Component"
+
+
+def test_component_class_resolution_is_cached() -> None:
+    comp = MyComponent("test")
+    dumped = comp.dump_component()
+    assert isinstance(MyComponent.load_component(dumped), MyComponent)
+    assert isinstance(MyComponent.load_component(dumped), MyComponent)
+
+    # A cached provider still fails once its class is no longer a component.
+    module = sys.modules[__name__]
+    original = module.MyComponent
+    try:
+        module.MyComponent = str  # type: ignore
+        with pytest.raises(TypeError):
+            _ = ComponentLoader.load_component(dumped)
+    finally:
+        module.MyComponent = original  # type: ignore
+
+
+validated_infos: List[str] = []
+
+
+class CountedConfig(BaseModel):
+    info: str
+
+    @model_validator(mode="after")
+    def count_validation(self) -> Self:
+        validated_infos.append(self.info)
+        return self
+
+
+class CountedComponent(ComponentBase[CountedConfig], Component[CountedConfig]):
+    component_config_schema = CountedConfig
+    component_type = "counted"
+
+    def __init__(self, info: str) -> None:
+        self.info = info
+
+    def _to_config(self) -> CountedConfig:
+        return CountedConfig(info=self.info)
+
+    @classmethod
+    def _from_config(cls, config: CountedConfig) -> Self:
+        return cls(info=config.info)
+
+
+def test_component_cache_reuses_validated_configs() -> None:
+    dumped = CountedComponent("test").dump_component()
+    other_dumped = CountedComponent("other").dump_component()
+    validated_infos.clear()
+
+    with ComponentCache().activate():
+        comp1 = CountedComponent.load_component(dumped)
+        comp2 = CountedComponent.load_component(dumped)
+        comp3 = CountedComponent.load_component(other_dumped)
+    assert validated_infos == ["test", "other"]
+    assert comp1 is not comp2
+    assert comp3.info == "other"
+
+    _ = CountedComponent.load_component(dumped)
+    assert validated_infos == ["test", "other", "test"]
+
+
+def test_component_cache_shares_component_types() -> None:
+    cache = ComponentCache(share_component_types=["counted"])
+    with cache.activate():
+        counted1 = CountedComponent.load_component(CountedComponent("test").dump_component())
+        counted2 = CountedComponent.load_component(CountedComponent("test").dump_component())
+        counted3 = CountedComponent.load_component(CountedComponent("other").dump_component())
+        custom1 = MyComponent.load_component(MyComponent("test").dump_component())
+        custom2 = MyComponent.load_component(MyComponent("test").dump_component())
+    assert counted1 is counted2
+    assert counted1 is not counted3
+    assert custom1 is not custom2
+
+    # Instances are only shared while the cache is active.
+    counted4 = CountedComponent.load_component(CountedComponent("test").dump_component())
+    assert counted4 is not counted1
+    with cache.activate():
+        assert CountedComponent.load_component(CountedComponent("test").dump_component()) is counted1
+    cache.clear()
+    with cache.activate():
+        assert CountedComponent.load_component(CountedComponent("test").dump_component()) is not counted1
+
+
+def test_component_cache_nested_components() -> None:
+    dumped = MyOuterComponent("outer", MyInnerComponent("inner")).dump_component()
+    with ComponentCache(share_component_types=["custom"]).activate():
+        comp1 = MyOuterComponent.load_component(dumped)
+        comp2 = MyOuterComponent.load_component(dumped)
+    assert comp1 is comp2
+    assert comp1.inner_class.inner_message == "inner"
@@ -0,0 +1,62 @@
+import base64
+from io import BytesIO
+from pathlib import Path
+
+from autogen_core import Image
+from PIL import Image as PILImage
+from pydantic import BaseModel
+
+
+def _encode(pil_image: PILImage.Image, format: str) -> bytes:
+    buffered = BytesIO()
+    pil_image.save(buffered, format=format)
+    return buffered.getvalue()
+
+
+def test_image_keeps_original_encoding() -> None:
+    data = _encode(PILImage.new("RGB", (40, 30), color="red"), "JPEG")
+    image = Image.from_base64(base64.b64encode(data).decode())
+
+    assert image.width == 40 and image.height == 30
+    assert image.mime_type == "image/jpeg"
+    assert image.to_bytes() == data
+    assert image.data_uri == f"data:image/jpeg;base64,{base64.b64encode(data).decode()}"
+    assert image.to_base64() is image.to_base64()
+    # The pixels are only decoded when they are accessed.
+    assert image._image is None  # type: ignore[reportPrivateUsage]
+    assert image.image.size == (40, 30) and image.image.mode == "RGB"
+
+    assert Image.from_uri(image.data_uri).to_bytes() == data
+
+
+def test_image_from_pil_is_encoded_once_as_png() -> None:
+    image = Image.from_pil(PILImage.new("RGBA", (10, 20)))
+
+    assert image.image.mode == "RGB"
+    assert image.mime_type == "image/png"
+    assert image.to_bytes().startswith(b"\x89PNG\r\n\x1a\n")
+    assert image.data_uri is image.data_uri
+
+    # Assigning a new image resets the encoding.
+    image.image = PILImage.new("RGB", (5, 5))
+    assert image.width == 5
+    assert PILImage.open(BytesIO(image.to_bytes())).size == (5, 5)
+
+
+def test_image_from_unsupported_format_is_converted_to_png(tmp_path: Path) -> None:
+    file_path = tmp_path / "image.bmp"
+    file_path.write_bytes(_encode(PILImage.new("RGB", (8, 8)), "BMP"))
+
+    image = Image.from_file(file_path)
+    assert image.mime_type == "image/png"
+    assert image.width == 8 and image.height == 8
+
+
+def test_image_serialization_keeps_encoding() -> None:
+    class ImageMessage(BaseModel):
+        image: Image
+
+    data = _encode(PILImage.new("RGB", (16, 16), color="blue"), "JPEG")
+    message = ImageMessage(image=Image.from_bytes(data))
+    restored = ImageMessage.model_validate_json(message.model_dump_json())
+    assert restored.image.to_bytes() == data
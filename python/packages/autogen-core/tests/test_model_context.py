@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 import pytest
 from autogen_core.model_context import (
@@ -14,8 +14,10 @@
     LLMMessage,
     UserMessage,
 )
+from autogen_core.tools import Tool, ToolSchema
 from autogen_ext.models.ollama import OllamaChatCompletionClient
 from autogen_ext.models.openai import OpenAIChatCompletionClient
+from autogen_ext.models.replay import ReplayChatCompletionClient
 
 
 @pytest.mark.asyncio
@@ -205,3 +207,55 @@ async def test_token_limited_model_context_openai_with_function_result(
     assert type(retrieved[0]) == UserMessage  # Function result should be removed
     assert type(retrieved[1]) == AssistantMessage
     assert type(retrieved[2]) == UserMessage
+
+
+class CountingReplayChatCompletionClient(ReplayChatCompletionClient):
+    """Counts the tokens of a prompt as words, optionally with a per-prompt overhead that makes the count
+    non-additive over messages, and records how many messages it tokenized."""
+
+    def __init__(self, prompt_overhead: int = 0) -> None:
+        super().__init__(chat_completions=[])
+        self.prompt_overhead = prompt_overhead
+        self.tokenized_messages = 0
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        self.tokenized_messages += len(messages)
+        overhead = self.prompt_overhead if len(messages) > 1 else 0
+        return super().count_tokens(messages, tools=tools) + overhead
+
+
+def _pop_middle_until_fits(
+    model_client: ChatCompletionClient, messages: List[LLMMessage], token_limit: int
+) -> List[LLMMessage]:
+    messages = list(messages)
+    while model_client.count_tokens(messages) > token_limit and len(messages) > 0:
+        messages.pop(len(messages) // 2)
+    return messages
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prompt_overhead", [0, 7], ids=["additive", "non_additive"])
+async def test_token_limited_model_context_matches_pop_middle(prompt_overhead: int) -> None:
+    model_client = CountingReplayChatCompletionClient(prompt_overhead=prompt_overhead)
+    messages: List[LLMMessage] = [
+        UserMessage(content=" ".join(["word"] * (1 + i % 5)), source="user") for i in range(40)
+    ]
+    for token_limit in [1, 3, 10, 25, 60, 200]:
+        model_context = TokenLimitedChatCompletionContext(model_client=model_client, token_limit=token_limit)
+        for message in messages:
+            await model_context.add_message(message)
+        assert await model_context.get_messages() == _pop_middle_until_fits(model_client, messages, token_limit)
+
+
+@pytest.mark.asyncio
+async def test_token_limited_model_context_counts_messages_once() -> None:
+    model_client = CountingReplayChatCompletionClient()
+    model_context = TokenLimitedChatCompletionContext(model_client=model_client, token_limit=100)
+    for i in range(500):
+        await model_context.add_message(UserMessage(content=f"message number {i}", source="user"))
+
+    model_client.tokenized_messages = 0
+    retrieved = await model_context.get_messages()
+    assert len(retrieved) == 33
+    # Two counts of the trimmed list confirm the estimate, instead of one count per removed message.
+    assert model_client.tokenized_messages <= 2 * len(retrieved) + 1
@@ -2,6 +2,7 @@
 
 import pytest
 from autogen_core import (
+    EVENT_LOGGER_NAME,
     AgentId,
     AgentInstantiationContext,
     AgentType,
@@ -141,6 +142,48 @@ async def agent_factory() -> LoopbackAgent:
     await runtime.close()
 
 
+@pytest.mark.asyncio
+async def test_publish_event_payload_serialized_lazily(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    for name in ["name1", "name2", "name3"]:
+        await runtime.register_factory(
+            type=AgentType(name), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+        )
+        await runtime.add_subscription(TypeSubscription("default", name))
+
+    num_serializations = 0
+    try_serialize = runtime._try_serialize  # type: ignore[reportPrivateUsage]
+
+    def counting_try_serialize(message: object) -> str:
+        nonlocal num_serializations
+        num_serializations += 1
+        return try_serialize(message)
+
+    monkeypatch.setattr(runtime, "_try_serialize", counting_try_serialize)
+
+    # No payload is serialized when the event logger does not emit.
+    with caplog.at_level(logging.WARNING, logger=EVENT_LOGGER_NAME):
+        runtime.start()
+        await runtime.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+        await runtime.stop_when_idle()
+    assert num_serializations == 0
+
+    # The payload is serialized once for sending and once for delivery to all recipients.
+    with caplog.at_level(logging.INFO, logger=EVENT_LOGGER_NAME):
+        runtime.start()
+        await runtime.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+        await runtime.stop_when_idle()
+    assert num_serializations == 2
+    deliveries = [r for r in caplog.records if r.name == EVENT_LOGGER_NAME and "DELIVER" in r.getMessage()]
+    assert len(deliveries) == 3
+    assert all('"payload": "{}"' in r.getMessage() for r in deliveries)
+
+    await runtime.close()
+
+
 @pytest.mark.asyncio
 async def test_register_receives_publish_cascade() -> None:
     num_agents = 5
@@ -2,7 +2,7 @@
 from typing import Union
 
 import pytest
-from autogen_core import Image
+from autogen_core import Image, UnknownPayload
 from autogen_core._serialization import (
     JSON_DATA_CONTENT_TYPE,
     PROTOBUF_DATA_CONTENT_TYPE,
@@ -12,6 +12,7 @@
     SerializationRegistry,
     try_get_known_serializers_for_type,
 )
+from google.protobuf import any_pb2
 from PIL import Image as PILImage
 from protos.serialization_test_pb2 import NestingProtoMessage, ProtoMessage
 from pydantic import BaseModel
@@ -110,6 +111,57 @@ def test_nested_proto() -> None:
     assert deserialized.nested.message == message.nested.message
 
 
+def test_proto_any() -> None:
+    serde = SerializationRegistry()
+    serde.add_serializer(try_get_known_serializers_for_type(NestingProtoMessage))
+
+    message = NestingProtoMessage(message="hello", nested=ProtoMessage(message="world"))
+    name = serde.type_name(message)
+    any_proto = serde.serialize_to_any(message, type_name=name)
+    # The Any matches the bytes of the protobuf content type, so both paths interoperate.
+    assert any_proto.SerializeToString() == serde.serialize(
+        message, type_name=name, data_content_type=PROTOBUF_DATA_CONTENT_TYPE
+    )
+    deserialized = serde.deserialize_from_any(any_proto, type_name=name)
+    assert deserialized == message
+
+    unknown = serde.deserialize_from_any(any_proto, type_name="agents.Unknown")
+    assert isinstance(unknown, UnknownPayload)
+    assert unknown.payload == any_proto.SerializeToString()
+
+
+def test_proto_any_bytes_only_serializer() -> None:
+    class BytesOnlyProtoSerializer(MessageSerializer[ProtoMessage]):
+        @property
+        def data_content_type(self) -> str:
+            return PROTOBUF_DATA_CONTENT_TYPE
+
+        @property
+        def type_name(self) -> str:
+            return "agents.ProtoMessage"
+
+        def deserialize(self, payload: bytes) -> ProtoMessage:
+            any_proto = any_pb2.Any()
+            any_proto.ParseFromString(payload)
+            message = ProtoMessage()
+            any_proto.Unpack(message)
+            return message
+
+        def serialize(self, message: ProtoMessage) -> bytes:
+            any_proto = any_pb2.Any()
+            any_proto.Pack(message)
+            return any_proto.SerializeToString()
+
+    serde = SerializationRegistry()
+    serde.add_serializer(try_get_known_serializers_for_type(ProtoMessage))
+    # Replacing the serializer with one that only handles bytes falls back to the byte path.
+    serde.add_serializer(BytesOnlyProtoSerializer())
+
+    message = ProtoMessage(message="hello")
+    any_proto = serde.serialize_to_any(message, type_name="agents.ProtoMessage")
+    assert serde.deserialize_from_any(any_proto, type_name="agents.ProtoMessage") == message
+
+
 @dataclass
 class DataclassNestedUnionSyntaxOldMessage:
     message: Union[str, int]
@@ -1,7 +1,16 @@
 from typing import Any, Mapping
 
 import pytest
-from autogen_core import AgentId, BaseAgent, MessageContext, SingleThreadedAgentRuntime
+from autogen_core import (
+    AgentId,
+    AgentInstantiationContext,
+    AgentLifecyclePolicy,
+    BaseAgent,
+    InMemoryStore,
+    MessageContext,
+    SingleThreadedAgentRuntime,
+)
+from autogen_core._runtime_impl_helpers import AgentInstanceCache
 
 
 class StatefulAgent(BaseAgent):
@@ -59,3 +68,101 @@ async def test_runtime_can_save_state() -> None:
 
     await runtime2.load_state(runtime_state)
     assert agent2.state == 1
+
+
+class CountingAgent(BaseAgent):
+    num_closed = 0
+
+    def __init__(self) -> None:
+        super().__init__("An agent counting the messages it receives")
+        self.count = 0
+
+    async def on_message_impl(self, message: Any, ctx: MessageContext) -> int:
+        self.count += 1
+        return self.count
+
+    async def save_state(self) -> Mapping[str, Any]:
+        return {"count": self.count}
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        self.count = state["count"]
+
+    async def close(self) -> None:
+        CountingAgent.num_closed += 1
+
+
+@pytest.mark.asyncio
+async def test_runtime_evicts_and_restores_agents() -> None:
+    CountingAgent.num_closed = 0
+    store: InMemoryStore[Mapping[str, Any]] = InMemoryStore()
+    runtime = SingleThreadedAgentRuntime(
+        agent_lifecycle_policy=AgentLifecyclePolicy(max_live_agents=2, state_store=store)
+    )
+    await CountingAgent.register(runtime, "counter", CountingAgent)
+    runtime.start()
+
+    for key in ["a", "b", "c"]:
+        assert await runtime.send_message("hello", AgentId("counter", key)) == 1
+
+    # The least recently used agent was evicted and its state spilled to the store.
+    stats = runtime.agent_cache_stats
+    assert stats.evictions == 1
+    assert CountingAgent.num_closed == 1
+    assert store.get("counter/a") == {"count": 1}
+
+    # The evicted agent is re-created with its state on the next message.
+    assert await runtime.send_message("hello", AgentId("counter", "a")) == 2
+    assert stats.restores == 1
+    assert stats.evictions == 2
+
+    state = await runtime.save_state()
+    assert state == {"counter/a": {"count": 2}, "counter/b": {"count": 1}, "counter/c": {"count": 1}}
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_agent_instance_cache_idle_ttl() -> None:
+    now = 0.0
+    cache = AgentInstanceCache(AgentLifecyclePolicy(idle_ttl=10), clock=lambda: now)
+    runtime = SingleThreadedAgentRuntime()
+    with AgentInstantiationContext.populate_context((runtime, AgentId("counter", "1"))):
+        agent1 = CountingAgent()
+    with AgentInstantiationContext.populate_context((runtime, AgentId("counter", "2"))):
+        agent2 = CountingAgent()
+    await cache.add(AgentId("counter", "1"), agent1)
+    now = 5
+    await cache.add(AgentId("counter", "2"), agent2)
+
+    # Pinned agents are kept even when idle.
+    cache.pin(AgentId("counter", "1"))
+    now = 20
+    assert await cache.get(AgentId("counter", "2")) is agent2
+    assert AgentId("counter", "1") in cache
+    cache.unpin(AgentId("counter", "1"))
+
+    now = 29
+    assert await cache.get(AgentId("counter", "2")) is agent2
+    assert AgentId("counter", "1") not in cache
+    assert await cache.get(AgentId("counter", "1")) is None
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_runtime_remove_agent() -> None:
+    CountingAgent.num_closed = 0
+    runtime = SingleThreadedAgentRuntime(agent_lifecycle_policy=AgentLifecyclePolicy(max_live_agents=1))
+    await CountingAgent.register(runtime, "counter", CountingAgent)
+    runtime.start()
+
+    assert await runtime.send_message("hello", AgentId("counter", "a")) == 1
+    assert await runtime.send_message("hello", AgentId("counter", "b")) == 1
+    assert await runtime.send_message("hello", AgentId("counter", "b")) == 2
+
+    # The live agent is closed, and the evicted agent does not get its state back.
+    await runtime.remove_agent(AgentId("counter", "b"))
+    await runtime.remove_agent(AgentId("counter", "a"))
+    assert CountingAgent.num_closed == 2
+    assert await runtime.save_state() == {}
+    assert await runtime.send_message("hello", AgentId("counter", "a")) == 1
+    assert await runtime.send_message("hello", AgentId("counter", "b")) == 1
+    await runtime.stop()
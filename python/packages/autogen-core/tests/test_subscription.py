@@ -5,8 +5,10 @@
     DefaultTopicId,
     SingleThreadedAgentRuntime,
     TopicId,
+    TypePrefixSubscription,
     TypeSubscription,
 )
+from autogen_core._runtime_impl_helpers import SubscriptionManager
 from autogen_core.exceptions import CantHandleException
 from autogen_test_utils import LoopbackAgent, MessageType
 
@@ -120,3 +122,51 @@ async def test_subscription_deduplication() -> None:
     default_subscription = DefaultSubscription(agent_type=agent_type)
     with pytest.raises(ValueError, match="Subscription already exists"):
         await runtime.add_subscription(default_subscription)
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_indexed_recipients() -> None:
+    manager = SubscriptionManager()
+    exact = TypeSubscription("chat", "a1")
+    prefix = TypePrefixSubscription("ch", "a2")
+    other_prefix = TypePrefixSubscription("x", "a3")
+    await manager.add_subscription(prefix)
+    await manager.add_subscription(exact)
+    await manager.add_subscription(other_prefix)
+
+    topic = TopicId("chat", "s1")
+    # Recipients follow subscription registration order.
+    assert await manager.get_subscribed_recipients(topic) == [AgentId("a2", "s1"), AgentId("a1", "s1")]
+    assert await manager.get_subscribed_recipients(TopicId("chatter", "s1")) == [AgentId("a2", "s1")]
+    assert await manager.get_subscribed_recipients(TopicId("c", "s1")) == []
+
+    # Cached topics are refreshed when subscriptions change.
+    late = TypeSubscription("chat", "a4")
+    await manager.add_subscription(late)
+    assert await manager.get_subscribed_recipients(topic) == [
+        AgentId("a2", "s1"),
+        AgentId("a1", "s1"),
+        AgentId("a4", "s1"),
+    ]
+    await manager.remove_subscription(prefix.id)
+    assert await manager.get_subscribed_recipients(topic) == [AgentId("a1", "s1"), AgentId("a4", "s1")]
+    assert await manager.get_subscribed_recipients(TopicId("chatter", "s1")) == []
+
+    with pytest.raises(ValueError, match="Subscription already exists"):
+        await manager.add_subscription(TypePrefixSubscription("x", "a3"))
+    with pytest.raises(ValueError, match="Subscription does not exist"):
+        await manager.remove_subscription(prefix.id)
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_topic_cache_is_bounded() -> None:
+    manager = SubscriptionManager(max_cached_topics=2)
+    await manager.add_subscription(TypeSubscription("t", "a"))
+
+    for i in range(10):
+        assert await manager.get_subscribed_recipients(TopicId("t", f"s{i}")) == [AgentId("a", f"s{i}")]
+    assert len(manager._subscribed_recipients) == 2  # type: ignore[reportPrivateUsage]
+
+    # Evicted topics are resolved again on demand.
+    await manager.add_subscription(TypeSubscription("t", "b"))
+    assert await manager.get_subscribed_recipients(TopicId("t", "s0")) == [AgentId("a", "s0"), AgentId("b", "s0")]
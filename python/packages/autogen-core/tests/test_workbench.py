@@ -121,3 +121,24 @@ def test_tool_func_2(x: Annotated[int, "The number to add 2."]) -> int:
         assert result_2.result[0].content == "This is a test error"
         assert result_2.to_text() == "This is a test error"
         assert result_2.is_error is True
+
+
+@pytest.mark.asyncio
+async def test_static_workbench_tools_cache() -> None:
+    def test_tool_func(x: Annotated[int, "The number to double."]) -> int:
+        return x * 2
+
+    tools = [FunctionTool(test_tool_func, name="test_tool_1", description="A test tool.")]
+    workbench = StaticWorkbench(tools=tools)
+    assert [tool["name"] for tool in await workbench.list_tools()] == ["test_tool_1"]
+
+    # The cached list is returned until the cache is invalidated.
+    tools.append(FunctionTool(test_tool_func, name="test_tool_2", description="Another test tool."))
+    listed_tools = await workbench.list_tools()
+    assert [tool["name"] for tool in listed_tools] == ["test_tool_1"]
+    # Changing the returned list does not change the cache.
+    listed_tools.clear()
+    assert len(await workbench.list_tools()) == 1
+
+    workbench.invalidate_tools_cache()
+    assert [tool["name"] for tool in await workbench.list_tools()] == ["test_tool_1", "test_tool_2"]
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Optional, TypeVar, cast
 
 import diskcache
@@ -23,6 +24,8 @@ class DiskCacheStore(CacheStore[T], Component[DiskCacheStoreConfig]):
     Args:
         cache_instance: An instance of diskcache.Cache.
                         The user is responsible for managing the DiskCache instance's lifetime.
+
+    :meth:`aget` and :meth:`aset` run the disk I/O in a worker thread so the event loop is not blocked.
     """
 
     component_config_schema = DiskCacheStoreConfig
@@ -37,6 +40,12 @@ def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
     def set(self, key: str, value: T) -> None:
         self.cache.set(key, cast(Any, value))  # type: ignore[reportUnknownMemberType]
 
+    async def aget(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(self, key: str, value: T) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
     def _to_config(self) -> DiskCacheStoreConfig:
         # Get directory from cache instance
         return DiskCacheStoreConfig(directory=self.cache.directory)
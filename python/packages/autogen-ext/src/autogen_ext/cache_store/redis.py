@@ -1,6 +1,8 @@
+import asyncio
 from typing import Any, Dict, Optional, TypeVar, cast
 
 import redis
+import redis.asyncio
 from autogen_core import CacheStore, Component
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -29,13 +31,18 @@ class RedisStore(CacheStore[T], Component[RedisStoreConfig]):
     Args:
         cache_instance: An instance of `redis.Redis`.
                         The user is responsible for managing the Redis instance's lifetime.
+        async_redis_instance (optional): An instance of `redis.asyncio.Redis` connected to the same server,
+                        used by :meth:`aget` and :meth:`aset`. Without it, the async methods run the
+                        synchronous client in a worker thread so the event loop is not blocked.
+                        The user is responsible for managing its lifetime.
     """
 
     component_config_schema = RedisStoreConfig
     component_provider_override = "autogen_ext.cache_store.redis.RedisStore"
 
-    def __init__(self, redis_instance: redis.Redis):
+    def __init__(self, redis_instance: redis.Redis, async_redis_instance: Optional[redis.asyncio.Redis] = None):
         self.cache = redis_instance
+        self.async_cache = async_redis_instance
 
     def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
         value = cast(Optional[T], self.cache.get(key))
@@ -46,6 +53,20 @@ def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
     def set(self, key: str, value: T) -> None:
         self.cache.set(key, cast(Any, value))
 
+    async def aget(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        if self.async_cache is None:
+            return await asyncio.to_thread(self.get, key, default)
+        value = cast(Optional[T], await self.async_cache.get(key))
+        if value is None:
+            return default
+        return value
+
+    async def aset(self, key: str, value: T) -> None:
+        if self.async_cache is None:
+            await asyncio.to_thread(self.set, key, value)
+            return
+        await self.async_cache.set(key, cast(Any, value))
+
     def _to_config(self) -> RedisStoreConfig:
         # Extract connection info from redis instance
         connection_pool = self.cache.connection_pool
@@ -67,8 +88,8 @@ def _to_config(self) -> RedisStoreConfig:
 
     @classmethod
     def _from_config(cls, config: RedisStoreConfig) -> Self:
-        # Create new redis instance from config
-        redis_instance = redis.Redis(
+        # Create new redis instances from config
+        connection_kwargs: Dict[str, Any] = dict(
             host=config.host,
             port=config.port,
             db=config.db,
@@ -77,4 +98,7 @@ def _from_config(cls, config: RedisStoreConfig) -> Self:
             ssl=config.ssl,
             socket_timeout=config.socket_timeout,
         )
-        return cls(redis_instance=redis_instance)
+        return cls(
+            redis_instance=redis.Redis(**connection_kwargs),
+            async_redis_instance=redis.asyncio.Redis(**connection_kwargs),
+        )
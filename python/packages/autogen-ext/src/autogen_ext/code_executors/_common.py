@@ -1,10 +1,12 @@
+import asyncio
+import codecs
 import inspect
 import re
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent, indent
-from typing import Any, Callable, Optional, Sequence, Set, TypeVar, Union
+from typing import IO, Any, AsyncGenerator, Awaitable, Callable, Optional, Sequence, Set, TypeVar, Union
 
 from autogen_core.code_executor import Alias, CodeResult, FunctionWithRequirements, FunctionWithRequirementsStr, Import
 from typing_extensions import ParamSpec
@@ -197,3 +199,135 @@ def infer_lang(code: str) -> str:
     except SyntaxError:
         # not a valid python code
         return "unknown"
+
+
+_READ_SIZE = 65536
+
+
+class OutputCapture:
+    """Captures the output of a command, keeping at most `max_bytes` of it in memory.
+
+    If the output is longer than `max_bytes`, only its first and last `max_bytes // 2` bytes are kept,
+    with a note of the number of bytes left out in between. If `spill_file` is set, the whole output
+    is then written to that file, and the note names it.
+
+    Args:
+        max_bytes (Optional[int]): The maximum number of bytes of output kept, or None to keep all the output.
+        spill_file (Optional[Path]): The file the whole output is written to if it is longer than `max_bytes`.
+        on_output (Optional[Callable[[str], None]]): Called with each chunk of output as it is captured.
+
+    :meta private:
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        spill_file: Optional[Path] = None,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._spill_file = spill_file
+        self._on_output = on_output
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._num_bytes = 0
+        self._truncated = False
+        self._spill: Optional[IO[bytes]] = None
+
+    @property
+    def truncated(self) -> bool:
+        """Whether some of the output was left out."""
+        return self._truncated
+
+    def write(self, data: bytes) -> None:
+        if not data:
+            return
+        self._num_bytes += len(data)
+        if self._on_output is not None:
+            text = self._decoder.decode(data)
+            if text:
+                self._on_output(text)
+        if self._max_bytes is None:
+            self._head += data
+            return
+        if self._spill is not None:
+            self._spill.write(data)
+        if not self._truncated:
+            self._head += data
+            if len(self._head) <= self._max_bytes:
+                return
+            # The output is over the limit: keep its head and tail from now on.
+            self._truncated = True
+            if self._spill_file is not None:
+                self._spill = self._spill_file.open("wb")
+                self._spill.write(self._head)
+            data = bytes(self._head[self._max_bytes // 2 :])
+            del self._head[self._max_bytes // 2 :]
+        tail_size = self._max_bytes - self._max_bytes // 2
+        self._tail += data
+        # Trim the tail once it is twice its size, so each byte is moved a bounded number of times.
+        if len(self._tail) > 2 * tail_size:
+            del self._tail[:-tail_size]
+
+    def close(self) -> None:
+        """Flush the output to the spill file, if any, and close it."""
+        if self._on_output is not None:
+            text = self._decoder.decode(b"", final=True)
+            if text:
+                self._on_output(text)
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def getvalue(self) -> str:
+        """Return the captured output, with a note in place of the bytes left out."""
+        if not self._truncated:
+            return self._head.decode("utf-8", errors="replace")
+        assert self._max_bytes is not None
+        tail = bytes(self._tail[-(self._max_bytes - self._max_bytes // 2) :])
+        num_skipped = self._num_bytes - len(self._head) - len(tail)
+        note = f"\n[... {num_skipped} bytes of output truncated"
+        if self._spill_file is not None:
+            note += f", the full output is in {self._spill_file.name} in the working directory"
+        note += " ...]\n"
+        return self._head.decode("utf-8", errors="replace") + note + tail.decode("utf-8", errors="replace")
+
+
+async def read_stream(stream: asyncio.StreamReader, capture: OutputCapture) -> None:
+    """Read a stream to its end into an output capture.
+
+    :meta private:
+    """
+    while True:
+        data = await stream.read(_READ_SIZE)
+        if not data:
+            return
+        capture.write(data)
+
+
+async def stream_output(
+    execute: Callable[[Callable[[str], None]], Awaitable[T]],
+) -> AsyncGenerator[Union[str, T], None]:
+    """Run an execution that reports its output to a callback, and yield each chunk of output
+    as it arrives, then the result of the execution.
+
+    :meta private:
+    """
+    chunks: asyncio.Queue[str] = asyncio.Queue()
+    task = asyncio.ensure_future(execute(chunks.put_nowait))
+    try:
+        while True:
+            next_chunk = asyncio.ensure_future(chunks.get())
+            await asyncio.wait([next_chunk, task], return_when=asyncio.FIRST_COMPLETED)
+            if not next_chunk.done():
+                next_chunk.cancel()
+                break
+            yield next_chunk.result()
+        while not chunks.empty():
+            yield chunks.get_nowait()
+        yield await task
+    finally:
+        if not task.done():
+            # The caller stopped reading before the execution completed.
+            task.cancel()
@@ -14,7 +14,7 @@
 from concurrent.futures import Future as ConcurrentFuture
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Dict, List, Optional, ParamSpec, Tuple, Union
+from typing import Any, AsyncGenerator, Callable, ClassVar, Dict, List, Optional, ParamSpec, Tuple, Union
 
 from autogen_core import CancellationToken, Component
 from autogen_core.code_executor import (
@@ -30,10 +30,12 @@
 
 from .._common import (
     CommandLineCodeResult,
+    OutputCapture,
     build_python_functions_file,
     get_file_name_from_content,
     lang_to_cmd,
     silence_pip,
+    stream_output,
 )
 
 if sys.version_info >= (3, 11):
@@ -82,6 +84,8 @@ class DockerCommandLineCodeExecutorConfig(BaseModel):
     extra_hosts: Dict[str, str] = {}
     init_command: Optional[str] = None
     delete_tmp_files: bool = False
+    max_output_bytes: Optional[int] = None
+    spill_output: bool = False
 
 
 class DockerCommandLineCodeExecutor(CodeExecutor, Component[DockerCommandLineCodeExecutorConfig]):
@@ -130,10 +134,20 @@ class DockerCommandLineCodeExecutor(CodeExecutor, Component[DockerCommandLineCod
         init_command (Optional[str], optional): A shell command to run before each shell operation execution. Defaults to None.
             Example: init_command="kubectl config use-context docker-hub"
         delete_tmp_files (bool, optional): If true, will delete temporary files after execution. Defaults to False.
+        max_output_bytes (Optional[int], optional): The maximum number of bytes of output kept from each code block.
+            Longer output is truncated in the middle, keeping its beginning and its end. Defaults to None,
+            meaning all the output is kept.
+        spill_output (bool, optional): If true, the full output of a code block that is truncated is written to a file
+            in the working directory, named after the code file, for example `tmp_code_<hash>.output.log`.
+            Defaults to False.
 
     .. note::
         Using the current directory (".") as working directory is deprecated. Using it will raise a deprecation warning.
 
+    .. note::
+        The output of a code block is read from the container as it is written, so `max_output_bytes` also bounds
+        the memory used for it. Use :meth:`execute_code_blocks_stream` to receive the output as it is written.
+
     """
 
     component_config_schema = DockerCommandLineCodeExecutorConfig
@@ -180,9 +194,13 @@ def __init__(
         extra_hosts: Optional[Dict[str, str]] = None,
         init_command: Optional[str] = None,
         delete_tmp_files: bool = False,
+        max_output_bytes: Optional[int] = None,
+        spill_output: bool = False,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
+        if max_output_bytes is not None and max_output_bytes < 1:
+            raise ValueError("max_output_bytes must be greater than or equal to 1.")
 
         # Handle working directory logic
         if work_dir is None:
@@ -234,6 +252,8 @@ def __init__(
         self._extra_hosts = extra_hosts if extra_hosts is not None else {}
         self._init_command = init_command
         self._delete_tmp_files = delete_tmp_files
+        self._max_output_bytes = max_output_bytes
+        self._spill_output = spill_output
         self._device_requests = device_requests
 
         # Setup could take some time so we intentionally wait for the first code block to do it.
@@ -291,18 +311,52 @@ async def _kill_running_command(self, command: List[str]) -> None:
             return
         await asyncio.to_thread(self._container.exec_run, ["pkill", "-f", " ".join(command)])
 
-    async def _execute_command(self, command: List[str], cancellation_token: CancellationToken) -> Tuple[str, int]:
+    def _run_command(self, command: List[str], output: OutputCapture) -> int:
+        """Run a command in the container, reading its output into the capture as it is written."""
+        assert self._container is not None
+        api = self._container.client.api
+        exec_id = api.exec_create(self._container.id, command)["Id"]
+        try:
+            for chunk in api.exec_start(exec_id, stream=True):
+                output.write(chunk)
+        finally:
+            output.close()
+        return int(api.exec_inspect(exec_id)["ExitCode"])
+
+    async def _execute_command(
+        self,
+        command: List[str],
+        cancellation_token: CancellationToken,
+        code_file: Optional[Path] = None,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[str, int]:
         if self._container is None or not self._running:
             raise ValueError("Container is not running. Must first be started with either start or a context manager.")
 
-        exec_task = asyncio.create_task(asyncio.to_thread(self._container.exec_run, command))
+        loop = asyncio.get_running_loop()
+
+        def on_output_threadsafe(text: str) -> None:
+            # The output is read in a worker thread, so the callback is scheduled on the event loop.
+            assert on_output is not None
+            loop.call_soon_threadsafe(on_output, text)
+
+        spill_file = (
+            code_file.with_name(f"{code_file.stem}.output.log")
+            if self._spill_output and code_file is not None
+            else None
+        )
+        capture = OutputCapture(
+            max_bytes=self._max_output_bytes,
+            spill_file=spill_file,
+            on_output=on_output_threadsafe if on_output is not None else None,
+        )
+        exec_task = asyncio.create_task(asyncio.to_thread(self._run_command, command, capture))
         cancellation_token.link_future(exec_task)
 
         # Wait for the exec task to finish.
         try:
-            result = await exec_task
-            exit_code = result.exit_code
-            output = result.output.decode("utf-8")
+            exit_code = await exec_task
+            output = capture.getvalue()
             if exit_code == 124:
                 output += "\n Timeout"
             return output, exit_code
@@ -327,7 +381,10 @@ async def _execute_command(self, command: List[str], cancellation_token: Cancell
             return "Code execution was cancelled.", 1
 
     async def _execute_code_dont_check_setup(
-        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+        self,
+        code_blocks: List[CodeBlock],
+        cancellation_token: CancellationToken,
+        on_output: Optional[Callable[[str], None]] = None,
     ) -> CommandLineCodeResult:
         if self._container is None or not self._running:
             raise ValueError("Container is not running. Must first be started with either start or a context manager.")
@@ -361,7 +418,7 @@ async def _execute_code_dont_check_setup(
 
                 command = ["timeout", str(self._timeout), lang_to_cmd(lang), filename]
 
-                output, exit_code = await self._execute_command(command, cancellation_token)
+                output, exit_code = await self._execute_command(command, cancellation_token, code_path, on_output)
                 outputs.append(output)
                 last_exit_code = exit_code
                 if exit_code != 0:
@@ -420,6 +477,27 @@ async def execute_code_blocks(
 
         return await self._execute_code_dont_check_setup(code_blocks, cancellation_token)
 
+    async def execute_code_blocks_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[str, CommandLineCodeResult], None]:
+        """(Experimental) Execute the code blocks, yielding the output as it is written, then the result.
+
+        Args:
+            code_blocks (List[CodeBlock]): The code blocks to execute.
+
+        Returns:
+            AsyncGenerator[Union[str, CommandLineCodeResult], None]: The chunks of output of the code blocks
+            as they are written, followed by the result of the code execution. The result holds the output
+            truncated to `max_output_bytes`, while the chunks hold all of it."""
+
+        if not self._setup_functions_complete:
+            await self._setup_functions(cancellation_token)
+
+        async for item in stream_output(
+            lambda on_output: self._execute_code_dont_check_setup(code_blocks, cancellation_token, on_output)
+        ):
+            yield item
+
     async def restart(self) -> None:
         """(Experimental) Restart the Docker container code executor."""
         if self._container is None or not self._running:
@@ -590,6 +668,8 @@ def _to_config(self) -> DockerCommandLineCodeExecutorConfig:
             extra_hosts=self._extra_hosts,
             init_command=self._init_command,
             delete_tmp_files=self._delete_tmp_files,
+            max_output_bytes=self._max_output_bytes,
+            spill_output=self._spill_output,
         )
 
     @classmethod
@@ -610,4 +690,6 @@ def _from_config(cls, config: DockerCommandLineCodeExecutorConfig) -> Self:
             extra_hosts=config.extra_hosts,
             init_command=config.init_command,
             delete_tmp_files=config.delete_tmp_files,
+            max_output_bytes=config.max_output_bytes,
+            spill_output=config.spill_output,
         )
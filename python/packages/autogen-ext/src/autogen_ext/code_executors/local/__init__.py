@@ -11,7 +11,7 @@
 from pathlib import Path
 from string import Template
 from types import SimpleNamespace
-from typing import Any, Callable, ClassVar, List, Optional, Sequence, Union
+from typing import Any, AsyncGenerator, Callable, ClassVar, List, Optional, Sequence, Union
 
 from autogen_core import CancellationToken, Component
 from autogen_core.code_executor import CodeBlock, CodeExecutor, FunctionWithRequirements, FunctionWithRequirementsStr
@@ -21,12 +21,16 @@
 from .._common import (
     PYTHON_VARIANTS,
     CommandLineCodeResult,
+    OutputCapture,
     build_python_functions_file,
     get_file_name_from_content,
     lang_to_cmd,
+    read_stream,
     silence_pip,
+    stream_output,
     to_stub,
 )
+from ._worker_pool import PythonWorkerPool
 
 __all__ = ("LocalCommandLineCodeExecutor",)
 
@@ -39,6 +43,11 @@ class LocalCommandLineCodeExecutorConfig(BaseModel):
     timeout: int = 60
     work_dir: Optional[str] = None
     functions_module: str = "functions"
+    warm_workers: int = 0
+    warm_worker_max_uses: int = 1
+    preload_modules: List[str] = []
+    max_output_bytes: Optional[int] = None
+    spill_output: bool = False
 
 
 class LocalCommandLineCodeExecutor(CodeExecutor, Component[LocalCommandLineCodeExecutorConfig]):
@@ -79,10 +88,33 @@ class LocalCommandLineCodeExecutor(CodeExecutor, Component[LocalCommandLineCodeE
         functions (List[Union[FunctionWithRequirements[Any, A], Callable[..., Any]]]): A list of functions that are available to the code executor. Default is an empty list.
         functions_module (str, optional): The name of the module that will be created to store the functions. Defaults to "functions".
         virtual_env_context (Optional[SimpleNamespace], optional): The virtual environment context. Defaults to None.
+        warm_workers (int, optional): The number of warm Python processes kept ready to run Python code blocks.
+            Defaults to 0, meaning each Python code block is run in a new process.
+        warm_worker_max_uses (int, optional): The number of Python code blocks a warm process runs before it is replaced.
+            Defaults to 1, meaning each code block runs in a fresh process.
+        preload_modules (Sequence[str], optional): The modules imported by the warm processes when they start,
+            for example `["numpy", "pandas"]`. Defaults to an empty list.
+        max_output_bytes (Optional[int], optional): The maximum number of bytes of output kept from each of stdout and stderr
+            of a code block. Longer output is truncated in the middle, keeping its beginning and its end. Defaults to None,
+            meaning all the output is kept.
+        spill_output (bool, optional): If true, the full stdout or stderr of a code block that is truncated is written to a file
+            in the working directory, named after the code file, for example `tmp_code_<hash>.stdout.log`. Defaults to False.
 
     .. note::
         Using the current directory (".") as working directory is deprecated. Using it will raise a deprecation warning.
 
+    .. note::
+        The output of a code block is read as it is written, so `max_output_bytes` also bounds the memory used for it.
+        Use :meth:`execute_code_blocks_stream` to receive the output as it is written.
+
+    .. note::
+        With `warm_workers`, Python code blocks are run in processes started ahead of time in the working directory,
+        with the preloaded modules already imported, which saves the interpreter startup and the imports.
+        A process is replaced after `warm_worker_max_uses` code blocks, after a code block fails, and on timeout
+        or cancellation. A process that runs more than one code block keeps the modules imported and any changes
+        to the environment made by the previous code blocks. The environment variables of a warm process
+        are those of the executor when the process was started. Shell code blocks are not affected.
+
 
     Example:
 
@@ -155,9 +187,20 @@ def __init__(
         ] = [],
         functions_module: str = "functions",
         virtual_env_context: Optional[SimpleNamespace] = None,
+        warm_workers: int = 0,
+        warm_worker_max_uses: int = 1,
+        preload_modules: Sequence[str] = (),
+        max_output_bytes: Optional[int] = None,
+        spill_output: bool = False,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
+        if warm_workers < 0:
+            raise ValueError("warm_workers must be greater than or equal to 0.")
+        if warm_worker_max_uses < 1:
+            raise ValueError("warm_worker_max_uses must be greater than or equal to 1.")
+        if max_output_bytes is not None and max_output_bytes < 1:
+            raise ValueError("max_output_bytes must be greater than or equal to 1.")
 
         self._work_dir: Optional[Path] = None
         if work_dir is not None:
@@ -190,6 +233,14 @@ def __init__(
 
         self._virtual_env_context: Optional[SimpleNamespace] = virtual_env_context
 
+        self._warm_workers = warm_workers
+        self._warm_worker_max_uses = warm_worker_max_uses
+        self._preload_modules = list(preload_modules)
+        self._worker_pool: Optional[PythonWorkerPool] = None
+
+        self._max_output_bytes = max_output_bytes
+        self._spill_output = spill_output
+
         self._temp_dir: Optional[tempfile.TemporaryDirectory[str]] = None
         self._started = False
 
@@ -322,8 +373,33 @@ async def execute_code_blocks(
 
         return await self._execute_code_dont_check_setup(code_blocks, cancellation_token)
 
-    async def _execute_code_dont_check_setup(
+    async def execute_code_blocks_stream(
         self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[str, CommandLineCodeResult], None]:
+        """(Experimental) Execute the code blocks, yielding the output as it is written, then the result.
+
+        Args:
+            code_blocks (List[CodeBlock]): The code blocks to execute.
+            cancellation_token (CancellationToken): a token to cancel the operation
+
+        Returns:
+            AsyncGenerator[Union[str, CommandLineCodeResult], None]: The chunks of stdout and stderr of the code blocks
+            as they are written, followed by the result of the code execution. The result holds the output
+            truncated to `max_output_bytes`, while the chunks hold all of it."""
+
+        if not self._setup_functions_complete:
+            await self._setup_functions(cancellation_token)
+
+        async for item in stream_output(
+            lambda on_output: self._execute_code_dont_check_setup(code_blocks, cancellation_token, on_output)
+        ):
+            yield item
+
+    async def _execute_code_dont_check_setup(
+        self,
+        code_blocks: List[CodeBlock],
+        cancellation_token: CancellationToken,
+        on_output: Optional[Callable[[str], None]] = None,
     ) -> CommandLineCodeResult:
         """
         Execute the provided code blocks in the local command line without re-checking setup.
@@ -377,17 +453,40 @@ async def _execute_code_dont_check_setup(
                 f.write(code)
             file_names.append(written_file)
 
+            stdout = self._output_capture(written_file, "stdout", on_output)
+            stderr = self._output_capture(written_file, "stderr", on_output)
+
+            if lang == "python" and self._warm_workers > 0:
+                # Run the script in a warm Python process.
+                worker_task = asyncio.ensure_future(
+                    self._get_worker_pool().run(written_file.absolute(), stdout.write, stderr.write)
+                )
+                cancellation_token.link_future(worker_task)
+                try:
+                    exitcode = await asyncio.wait_for(worker_task, self._timeout)
+                except asyncio.TimeoutError:
+                    logs_all += "\nTimeout"
+                    exitcode = 124
+                    break
+                except asyncio.CancelledError:
+                    logs_all += "\nCancelled"
+                    exitcode = 125
+                    break
+                finally:
+                    stdout.close()
+                    stderr.close()
+                logs_all += stderr.getvalue()
+                logs_all += stdout.getvalue()
+                if exitcode != 0:
+                    break
+                continue
+
             # Build environment
-            env = os.environ.copy()
-            if self._virtual_env_context:
-                virtual_env_bin_abs_path = os.path.abspath(self._virtual_env_context.bin_path)
-                env["PATH"] = f"{virtual_env_bin_abs_path}{os.pathsep}{env['PATH']}"
+            env = self._build_env()
 
             # Decide how to invoke the script
             if lang == "python":
-                program = (
-                    os.path.abspath(self._virtual_env_context.env_exe) if self._virtual_env_context else sys.executable
-                )
+                program = self._python_executable()
                 extra_args = [str(written_file.absolute())]
             else:
                 # Get the appropriate command for the language
@@ -422,7 +521,12 @@ async def _execute_code_dont_check_setup(
             proc = None  # Track the process
             try:
                 proc = await task
-                stdout, stderr = await asyncio.wait_for(proc.communicate(), self._timeout)
+                assert proc.stdout is not None and proc.stderr is not None
+                # Read the output as it is written, so that only the captured part of it is kept in memory.
+                await asyncio.wait_for(
+                    asyncio.gather(read_stream(proc.stdout, stdout), read_stream(proc.stderr, stderr), proc.wait()),
+                    self._timeout,
+                )
                 exitcode = proc.returncode or 0
             except asyncio.TimeoutError:
                 logs_all += "\nTimeout"
@@ -438,9 +542,12 @@ async def _execute_code_dont_check_setup(
                     proc.terminate()
                     await proc.wait()
                 break
+            finally:
+                stdout.close()
+                stderr.close()
 
-            logs_all += stderr.decode()
-            logs_all += stdout.decode()
+            logs_all += stderr.getvalue()
+            logs_all += stdout.getvalue()
 
             if exitcode != 0:
                 break
@@ -448,6 +555,36 @@ async def _execute_code_dont_check_setup(
         code_file = str(file_names[0]) if file_names else None
         return CommandLineCodeResult(exit_code=exitcode, output=logs_all, code_file=code_file)
 
+    def _output_capture(
+        self, code_file: Path, stream: str, on_output: Optional[Callable[[str], None]]
+    ) -> OutputCapture:
+        spill_file = code_file.with_name(f"{code_file.stem}.{stream}.log") if self._spill_output else None
+        return OutputCapture(max_bytes=self._max_output_bytes, spill_file=spill_file, on_output=on_output)
+
+    def _build_env(self) -> dict[str, str]:
+        env = os.environ.copy()
+        if self._virtual_env_context:
+            virtual_env_bin_abs_path = os.path.abspath(self._virtual_env_context.bin_path)
+            env["PATH"] = f"{virtual_env_bin_abs_path}{os.pathsep}{env['PATH']}"
+        return env
+
+    def _python_executable(self) -> str:
+        return os.path.abspath(self._virtual_env_context.env_exe) if self._virtual_env_context else sys.executable
+
+    def _get_worker_pool(self) -> PythonWorkerPool:
+        """Return the pool of warm Python processes, starting it if needed."""
+        if self._worker_pool is None:
+            self._worker_pool = PythonWorkerPool(
+                program=self._python_executable(),
+                cwd=self.work_dir,
+                env=self._build_env(),
+                size=self._warm_workers,
+                max_uses=self._warm_worker_max_uses,
+                preload_modules=self._preload_modules,
+            )
+            self._worker_pool.start()
+        return self._worker_pool
+
     async def restart(self) -> None:
         """(Experimental) Restart the code executor."""
         warnings.warn(
@@ -465,6 +602,9 @@ async def start(self) -> None:
         if self._work_dir is None and self._temp_dir is None:
             self._temp_dir = tempfile.TemporaryDirectory()
         self._started = True
+        if self._warm_workers > 0:
+            # Start the warm processes ahead of the first code block.
+            self._get_worker_pool()
 
     async def stop(self) -> None:
         """(Experimental) Stop the code executor.
@@ -472,6 +612,9 @@ async def stop(self) -> None:
         Stops the local code executor and performs the cleanup of the temporary working directory (if it was created).
         The executor's internal state is markes as no longer started.
         """
+        if self._worker_pool is not None:
+            await self._worker_pool.close()
+            self._worker_pool = None
         if self._temp_dir is not None:
             self._temp_dir.cleanup()
             self._temp_dir = None
@@ -488,6 +631,11 @@ def _to_config(self) -> LocalCommandLineCodeExecutorConfig:
             timeout=self._timeout,
             work_dir=str(self.work_dir),
             functions_module=self._functions_module,
+            warm_workers=self._warm_workers,
+            warm_worker_max_uses=self._warm_worker_max_uses,
+            preload_modules=self._preload_modules,
+            max_output_bytes=self._max_output_bytes,
+            spill_output=self._spill_output,
         )
 
     @classmethod
@@ -496,4 +644,9 @@ def _from_config(cls, config: LocalCommandLineCodeExecutorConfig) -> Self:
             timeout=config.timeout,
             work_dir=Path(config.work_dir) if config.work_dir is not None else None,
             functions_module=config.functions_module,
+            warm_workers=config.warm_workers,
+            warm_worker_max_uses=config.warm_worker_max_uses,
+            preload_modules=config.preload_modules,
+            max_output_bytes=config.max_output_bytes,
+            spill_output=config.spill_output,
         )
@@ -0,0 +1,254 @@
+import asyncio
+import secrets
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+# The source of a warm worker. It imports the preloaded modules, then runs the script files whose paths it
+# reads from stdin, one per line. After each script, it writes a marker line to stderr and a marker line
+# with the exit code of the script to stdout, so the output of each script can be told apart.
+_WORKER_SOURCE = """
+import importlib
+import os
+import runpy
+import sys
+import traceback
+
+marker = sys.argv[1]
+for module in sys.argv[2:]:
+    try:
+        importlib.import_module(module)
+    except Exception:
+        pass  # The script reports the error if it imports the module.
+control = sys.stdin
+sys.stdin = open(os.devnull)
+cwd = os.getcwd()
+base_path = sys.path[1:]
+
+
+def finish(exit_code):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    sys.stderr.write("\\n" + marker + "\\n")
+    sys.stderr.flush()
+    sys.stdout.write("\\n" + marker + " " + str(exit_code) + "\\n")
+    sys.stdout.flush()
+
+
+finish(0)
+for line in control:
+    path = line.rstrip("\\n")
+    os.chdir(cwd)
+    sys.argv = [path]
+    sys.path[:] = [os.path.dirname(path)] + base_path
+    exit_code = 0
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            exit_code = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException as e:
+        # Only show the frames of the script, as the interpreter does.
+        tb = e.__traceback__
+        while tb is not None and tb.tb_frame.f_code.co_filename != path:
+            tb = tb.tb_next
+        traceback.print_exception(type(e), e, tb)
+        exit_code = 1
+    finish(exit_code)
+"""
+
+_READ_SIZE = 65536
+
+
+async def _read_until_marker(
+    stream: asyncio.StreamReader, marker: bytes, write: Callable[[bytes], None]
+) -> Optional[bytes]:
+    """Read a stream up to the next marker line, passing the data before the marker to `write` as it is read.
+
+    Returns the rest of the marker line, or None if the stream ended before the marker."""
+    separator = b"\n" + marker
+    buffer = bytearray()
+    while True:
+        index = buffer.find(separator)
+        if index >= 0:
+            end = buffer.find(b"\n", index + len(separator))
+            if end >= 0:
+                write(bytes(buffer[:index]))
+                return bytes(buffer[index + len(separator) : end]).strip()
+        else:
+            # Pass on the data that cannot be the start of the separator.
+            start = buffer.rfind(b"\n", max(0, len(buffer) - len(separator) + 1))
+            if start < 0 or not separator.startswith(buffer[start:]):
+                start = len(buffer)
+            write(bytes(buffer[:start]))
+            del buffer[:start]
+        chunk = await stream.read(_READ_SIZE)
+        if not chunk:
+            write(bytes(buffer))
+            return None
+        buffer += chunk
+
+
+def _discard(data: bytes) -> None:
+    pass
+
+
+class PythonWorker:
+    """A warm Python process that runs script files."""
+
+    def __init__(self, process: asyncio.subprocess.Process, marker: str) -> None:
+        self._process = process
+        self._marker = marker.encode()
+        self.uses = 0
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process.returncode is None
+
+    async def wait_ready(self) -> None:
+        """Wait until the preloaded modules are imported, and discard the output of the imports."""
+        assert self._process.stdout is not None and self._process.stderr is not None
+        status, _ = await asyncio.gather(
+            _read_until_marker(self._process.stdout, self._marker, _discard),
+            _read_until_marker(self._process.stderr, self._marker, _discard),
+        )
+        if status is None:
+            raise RuntimeError(f"Python worker exited on startup with code {await self._process.wait()}.")
+
+    async def run(self, file: Path, stdout: Callable[[bytes], None], stderr: Callable[[bytes], None]) -> int:
+        """Run a script file, passing its stdout and stderr to the given callbacks as they are read,
+        and return its exit code."""
+        assert self._process.stdin is not None
+        assert self._process.stdout is not None and self._process.stderr is not None
+        self.uses += 1
+        self._process.stdin.write(f"{file}\n".encode())
+        await self._process.stdin.drain()
+        status, _ = await asyncio.gather(
+            _read_until_marker(self._process.stdout, self._marker, stdout),
+            _read_until_marker(self._process.stderr, self._marker, stderr),
+        )
+        if status is None:
+            # The script ended the worker, for example with os._exit().
+            return await self._process.wait()
+        return int(status)
+
+    async def kill(self) -> None:
+        if self.is_alive:
+            self._process.kill()
+        await self._process.wait()
+
+
+class PythonWorkerPool:
+    """A pool of warm Python processes that run script files.
+
+    The pool keeps `size` idle workers ready, each started in the working directory with the preloaded
+    modules imported. Each script runs in an idle worker. A worker is reused for at most `max_uses` scripts,
+    and is discarded after a script fails; a replacement is started as soon as a worker is discarded,
+    or when it starts its last script.
+
+    Args:
+        program (str): The Python executable.
+        cwd (Path): The working directory of the workers.
+        env (Dict[str, str]): The environment variables of the workers.
+        size (int): The number of idle workers kept ready.
+        max_uses (int): The number of scripts a worker runs before it is replaced.
+        preload_modules (Sequence[str]): The modules imported by each worker when it starts.
+    """
+
+    def __init__(
+        self,
+        program: str,
+        cwd: Path,
+        env: Dict[str, str],
+        size: int,
+        max_uses: int,
+        preload_modules: Sequence[str],
+    ) -> None:
+        self._program = program
+        self._cwd = cwd
+        self._env = env
+        self._size = size
+        self._max_uses = max_uses
+        self._preload_modules = list(preload_modules)
+        self._idle: Deque[asyncio.Future[PythonWorker]] = deque()
+        self._closed = False
+
+    def start(self) -> None:
+        """Start the idle workers in the background."""
+        while len(self._idle) < self._size:
+            self._idle.append(asyncio.ensure_future(self._spawn()))
+
+    async def _spawn(self) -> PythonWorker:
+        marker = f"__autogen_worker_{secrets.token_hex(16)}__"
+        process = await asyncio.create_subprocess_exec(
+            self._program,
+            "-c",
+            _WORKER_SOURCE,
+            marker,
+            *self._preload_modules,
+            cwd=self._cwd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._env,
+        )
+        worker = PythonWorker(process, marker)
+        try:
+            await worker.wait_ready()
+        except BaseException:
+            await worker.kill()
+            raise
+        return worker
+
+    async def _acquire(self) -> PythonWorker:
+        worker: PythonWorker | None = None
+        while self._idle and worker is None:
+            try:
+                worker = await self._idle.popleft()
+            except Exception:
+                continue
+            if not worker.is_alive:
+                worker = None
+        if worker is None:
+            worker = await self._spawn()
+        if worker.uses + 1 >= self._max_uses:
+            # The worker is replaced after this run, so start its replacement now.
+            self.start()
+        return worker
+
+    async def run(self, file: Path, stdout: Callable[[bytes], None], stderr: Callable[[bytes], None]) -> int:
+        """Run a script file in a warm worker, passing its stdout and stderr to the given callbacks
+        as they are read, and return its exit code.
+
+        If the run is cancelled, for example on timeout, the worker is killed."""
+        if self._closed:
+            raise RuntimeError("The worker pool is closed.")
+        worker = await self._acquire()
+        reusable = False
+        try:
+            exit_code = await worker.run(file, stdout, stderr)
+            reusable = exit_code == 0 and worker.is_alive and worker.uses < self._max_uses
+            return exit_code
+        finally:
+            if reusable and not self._closed and len(self._idle) < self._size:
+                reused_worker: asyncio.Future[PythonWorker] = asyncio.get_running_loop().create_future()
+                reused_worker.set_result(worker)
+                self._idle.appendleft(reused_worker)
+            else:
+                await worker.kill()
+                if not self._closed:
+                    self.start()
+
+    async def close(self) -> None:
+        """Kill the idle workers."""
+        self._closed = True
+        pending_workers: List[asyncio.Future[PythonWorker]] = list(self._idle)
+        self._idle.clear()
+        for pending_worker in pending_workers:
+            pending_worker.cancel()
+        for result in await asyncio.gather(*pending_workers, return_exceptions=True):
+            if isinstance(result, PythonWorker):
+                await result.kill()
@@ -0,0 +1,83 @@
+import math
+import weakref
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from autogen_core import Image
+from autogen_core.models import LLMMessage, UserMessage
+from PIL import Image as PILImage
+
+ImageSize = Tuple[int, int]
+
+
+def fit_image_size(
+    width: int,
+    height: int,
+    *,
+    max_long_edge: Optional[int] = None,
+    max_short_edge: Optional[int] = None,
+    max_pixels: Optional[int] = None,
+) -> ImageSize:
+    """Return the largest size with the aspect ratio of an image that fits the limits,
+    or the size of the image if it already fits."""
+    scale = 1.0
+    if max_long_edge is not None:
+        scale = min(scale, max_long_edge / max(width, height))
+    if max_short_edge is not None:
+        scale = min(scale, max_short_edge / min(width, height))
+    if max_pixels is not None:
+        scale = min(scale, math.sqrt(max_pixels / (width * height)))
+    if scale >= 1.0:
+        return width, height
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def _resize(image: Image, size: ImageSize) -> Image:
+    resized = image.image.resize(size, PILImage.Resampling.LANCZOS)
+    if image.mime_type == "image/jpeg":
+        # Keep photos in JPEG, as they would be much larger in PNG.
+        buffered = BytesIO()
+        resized.save(buffered, format="JPEG", quality=90)
+        return Image.from_bytes(buffered.getvalue())
+    return Image.from_pil(resized)
+
+
+class ImageDownscaler:
+    """Downscales the images of the messages sent to a model to the size returned by `target_size`.
+
+    A downscaled image is cached by the original image and the target size for as long as the original image
+    is alive, so the images of a conversation are only resized once.
+    """
+
+    def __init__(self, target_size: Callable[[Image], ImageSize]) -> None:
+        self._target_size = target_size
+        self._cache: weakref.WeakKeyDictionary[Image, Dict[ImageSize, Image]] = weakref.WeakKeyDictionary()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cache holds weak references, which cannot be pickled.
+        return {"target_size": self._target_size}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._target_size = state["target_size"]
+        self._cache = weakref.WeakKeyDictionary()
+
+    def downscale(self, image: Image) -> Image:
+        size = self._target_size(image)
+        if size[0] >= image.width and size[1] >= image.height:
+            return image
+        resized_images = self._cache.setdefault(image, {})
+        resized_image = resized_images.get(size)
+        if resized_image is None:
+            resized_image = resized_images[size] = _resize(image, size)
+        return resized_image
+
+    def downscale_messages(self, messages: Sequence[LLMMessage]) -> Sequence[LLMMessage]:
+        """Return the messages with their images downscaled. Messages without images to downscale are kept as is."""
+        result: List[LLMMessage] = []
+        for message in messages:
+            if isinstance(message, UserMessage) and isinstance(message.content, list):
+                content = [self.downscale(part) if isinstance(part, Image) else part for part in message.content]
+                if any(new is not old for new, old in zip(content, message.content, strict=True)):
+                    message = message.model_copy(update={"content": content})
+            result.append(message)
+        return result
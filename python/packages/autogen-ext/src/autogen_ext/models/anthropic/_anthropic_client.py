@@ -1,5 +1,5 @@
 import asyncio
-import base64
+import functools
 import inspect
 import json
 import logging
@@ -66,6 +66,7 @@
 from pydantic import BaseModel, SecretStr
 from typing_extensions import Self, Unpack
 
+from .._utils.downscale_images import ImageDownscaler, ImageSize, fit_image_size
 from . import _model_info
 from .config import (
     AnthropicBedrockClientConfiguration,
@@ -128,26 +129,17 @@ def type_to_role(message: LLMMessage) -> str:
         return "tool"
 
 
+def _anthropic_image_size(image: Image, max_tokens: Optional[int] = None) -> ImageSize:
+    """Return the size Anthropic scales an image down to, at most 1568 pixels on the long side and about
+    1600 tokens, reduced further so that the image uses at most `max_tokens` tokens if given.
+    An image uses about width * height / 750 tokens."""
+    max_pixels = 1600 * 750 if max_tokens is None else min(1600, max_tokens) * 750
+    return fit_image_size(image.width, image.height, max_long_edge=1568, max_pixels=max_pixels)
+
+
 def get_mime_type_from_image(image: Image) -> Literal["image/jpeg", "image/png", "image/gif", "image/webp"]:
     """Get a valid Anthropic media type from an Image object."""
-    # Get base64 data first
-    base64_data = image.to_base64()
-
-    # Decode the base64 string
-    image_data = base64.b64decode(base64_data)
-
-    # Check the first few bytes for known signatures
-    if image_data.startswith(b"\xff\xd8\xff"):
-        return "image/jpeg"
-    elif image_data.startswith(b"\x89PNG\r\n\x1a\n"):
-        return "image/png"
-    elif image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
-        return "image/gif"
-    elif image_data.startswith(b"RIFF") and image_data[8:12] == b"WEBP":
-        return "image/webp"
-    else:
-        # Default to JPEG as a fallback
-        return "image/jpeg"
+    return image.mime_type
 
 
 @overload
@@ -420,8 +412,15 @@ def __init__(
         *,
         create_args: Dict[str, Any],
         model_info: Optional[ModelInfo] = None,
+        downscale_images: bool = False,
+        max_image_tokens: Optional[int] = None,
     ):
         self._client = client
+        self._image_downscaler: Optional[ImageDownscaler] = None
+        if downscale_images or max_image_tokens is not None:
+            self._image_downscaler = ImageDownscaler(
+                functools.partial(_anthropic_image_size, max_tokens=max_image_tokens)
+            )
 
         if model_info is None:
             try:
@@ -534,6 +533,9 @@ async def create(
         # Merge continuous system messages into a single message
         messages = self._merge_system_messages(messages)
         messages = self._rstrip_last_assistant_message(messages)
+        if self._image_downscaler is not None:
+            # Send images at the size the model processes them at, instead of at full resolution.
+            messages = self._image_downscaler.downscale_messages(messages)
 
         for message in messages:
             if isinstance(message, SystemMessage):
@@ -702,6 +704,9 @@ async def create_stream(
         # Merge continuous system messages into a single message
         messages = self._merge_system_messages(messages)
         messages = self._rstrip_last_assistant_message(messages)
+        if self._image_downscaler is not None:
+            # Send images at the size the model processes them at, instead of at full resolution.
+            messages = self._image_downscaler.downscale_messages(messages)
 
         for message in messages:
             if isinstance(message, SystemMessage):
@@ -1025,6 +1030,10 @@ class AnthropicChatCompletionClient(
         top_p (float, optional): Controls diversity via nucleus sampling. Default is 1.0.
         top_k (int, optional): Controls diversity via top-k sampling. Default is -1 (disabled).
         model_info (ModelInfo, optional): The capabilities of the model. Required if using a custom model.
+        downscale_images (bool, optional): Whether to scale images down to the resolution the model processes them at
+            before sending them: at most 1568 pixels on the long side and about 1600 tokens. Default is False.
+        max_image_tokens (int, optional): The maximum number of tokens per image. Larger images are scaled down
+            to use at most this many tokens. Setting it also enables `downscale_images`.
 
     To use this client, you must install the Anthropic extension:
 
@@ -1091,6 +1100,8 @@ def __init__(self, **kwargs: Unpack[AnthropicClientConfiguration]):
             client=client,
             create_args=create_args,
             model_info=model_info,
+            downscale_images=kwargs.get("downscale_images", False),
+            max_image_tokens=kwargs.get("max_image_tokens", None),
         )
 
     def __getstate__(self) -> Dict[str, Any]:
@@ -1132,6 +1143,10 @@ class AnthropicBedrockChatCompletionClient(
         top_p (float, optional): Controls diversity via nucleus sampling. Default is 1.0.
         top_k (int, optional): Controls diversity via top-k sampling. Default is -1 (disabled).
         model_info (ModelInfo, optional): The capabilities of the model. Required if using a custom model.
+        downscale_images (bool, optional): Whether to scale images down to the resolution the model processes them at
+            before sending them: at most 1568 pixels on the long side and about 1600 tokens. Default is False.
+        max_image_tokens (int, optional): The maximum number of tokens per image. Larger images are scaled down
+            to use at most this many tokens. Setting it also enables `downscale_images`.
         bedrock_info (BedrockInfo, optional): The capabilities of the model in bedrock. Required if using a model from AWS bedrock.
 
     To use this client, you must install the Anthropic extension:
@@ -1217,6 +1232,8 @@ def __init__(self, **kwargs: Unpack[AnthropicBedrockClientConfiguration]):
             client=client,
             create_args=create_args,
             model_info=model_info,
+            downscale_images=kwargs.get("downscale_images", False),
+            max_image_tokens=kwargs.get("max_image_tokens", None),
         )
 
     def __getstate__(self) -> Dict[str, Any]:
@@ -45,6 +45,8 @@ class BaseAnthropicClientConfiguration(CreateArguments, total=False):
     timeout: Optional[float]
     max_retries: Optional[int]
     default_headers: Optional[Dict[str, str]]
+    downscale_images: bool
+    max_image_tokens: Optional[int]
 
 
 class AnthropicClientConfiguration(BaseAnthropicClientConfiguration, total=False):
@@ -76,6 +78,8 @@ class BaseAnthropicClientConfigurationConfigModel(CreateArgumentsConfigModel):
     timeout: float | None = None
     max_retries: int | None = None
     default_headers: Dict[str, str] | None = None
+    downscale_images: bool | None = None
+    max_image_tokens: int | None = None
 
 
 class AnthropicClientConfigurationConfigModel(BaseAnthropicClientConfigurationConfigModel):
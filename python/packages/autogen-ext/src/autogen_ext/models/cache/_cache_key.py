@@ -0,0 +1,137 @@
+import hashlib
+import json
+import struct
+import weakref
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from autogen_core import Image
+from autogen_core.models import LLMMessage
+from autogen_core.tools import Tool, ToolSchema
+from pydantic import BaseModel
+
+CACHE_KEY_VERSION = 3
+"""Version of the cache key scheme. It is part of every key, so entries written under another scheme are not read."""
+
+
+def _feed_bytes(h: "hashlib._Hash", tag: bytes, data: bytes) -> None:
+    # Tagged and length prefixed, so that different values never produce the same byte stream.
+    h.update(tag)
+    h.update(struct.pack(">Q", len(data)))
+    h.update(data)
+
+
+class CacheKeyBuilder:
+    """Computes :class:`ChatCompletionCache` keys from the digests of the messages, tools and arguments of a request.
+
+    The digest of a message, tool, image or ``json_output`` type is computed once and memoized by the identity of
+    the object for as long as the object is alive, so a conversation that grows by one message only digests the new
+    message. Messages and tools must therefore not be modified after they have been used in a request.
+
+    Images are digested from their encoded bytes, so computing a key does not decode them. The same picture in two
+    different encodings therefore gets two keys. Keys only depend on the content of the request, so they are the
+    same in every process and can be shared through a store like Redis.
+    """
+
+    def __init__(self) -> None:
+        # id(obj) -> (weak reference to obj, digest). Entries are removed when the object is collected.
+        self._digests: Dict[int, Tuple[weakref.ReferenceType[Any], bytes]] = {}
+
+    def request_key(
+        self,
+        messages: Sequence[LLMMessage],
+        tools: Sequence[Tool | ToolSchema],
+        json_output: Optional[bool | type[BaseModel]],
+        extra_create_args: Mapping[str, Any],
+    ) -> str:
+        h = hashlib.sha256()
+        h.update(b"messages")
+        h.update(struct.pack(">Q", len(messages)))
+        for message in messages:
+            h.update(self._memoized_digest(message, self._model_digest))
+        h.update(b"tools")
+        h.update(struct.pack(">Q", len(tools)))
+        for tool in tools:
+            if isinstance(tool, Tool):
+                h.update(self._memoized_digest(tool, self._tool_digest))
+            else:
+                h.update(self._value_digest(tool))
+        h.update(b"json_output")
+        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
+            h.update(self._memoized_digest(json_output, self._json_output_digest))
+        else:
+            h.update(self._value_digest(json_output))
+        h.update(b"extra_create_args")
+        h.update(self._value_digest(extra_create_args))
+        return f"v{CACHE_KEY_VERSION}-{h.hexdigest()}"
+
+    def _memoized_digest(self, obj: Any, compute: Callable[[Any], bytes]) -> bytes:
+        key = id(obj)
+        entry = self._digests.get(key)
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        digest = compute(obj)
+        try:
+            ref = weakref.ref(obj, lambda _, key=key: self._digests.pop(key, None))  # type: ignore[misc]
+        except TypeError:
+            # The object does not support weak references, so its digest is not memoized.
+            return digest
+        self._digests[key] = (ref, digest)
+        return digest
+
+    def _model_digest(self, model: BaseModel) -> bytes:
+        h = hashlib.sha256()
+        self._feed(h, model)
+        return h.digest()
+
+    def _tool_digest(self, tool: Tool) -> bytes:
+        return self._value_digest(tool.schema)
+
+    def _json_output_digest(self, json_output: type[BaseModel]) -> bytes:
+        return self._value_digest(json_output.model_json_schema())
+
+    def _value_digest(self, value: Any) -> bytes:
+        h = hashlib.sha256()
+        self._feed(h, value)
+        return h.digest()
+
+    @staticmethod
+    def _image_digest(image: Image) -> bytes:
+        h = hashlib.sha256()
+        _feed_bytes(h, b"t", image.mime_type.encode())
+        _feed_bytes(h, b"b", image.to_bytes())
+        return h.digest()
+
+    def _feed(self, h: "hashlib._Hash", value: Any) -> None:
+        if value is None:
+            h.update(b"n")
+        elif isinstance(value, bool):
+            h.update(b"t" if value else b"f")
+        elif isinstance(value, (int, float)):
+            _feed_bytes(h, b"d", repr(value).encode())
+        elif isinstance(value, str):
+            _feed_bytes(h, b"s", value.encode())
+        elif isinstance(value, bytes):
+            _feed_bytes(h, b"b", value)
+        elif isinstance(value, Image):
+            _feed_bytes(h, b"i", self._memoized_digest(value, self._image_digest))
+        elif isinstance(value, BaseModel):
+            _feed_bytes(h, b"m", type(value).__name__.encode())
+            fields = sorted(type(value).model_fields)
+            h.update(struct.pack(">Q", len(fields)))
+            for name in fields:
+                _feed_bytes(h, b"k", name.encode())
+                self._feed(h, getattr(value, name))
+        elif isinstance(value, Mapping):
+            items = sorted(((str(k), v) for k, v in value.items()), key=lambda item: item[0])  # type: ignore[misc]
+            h.update(b"{")
+            h.update(struct.pack(">Q", len(items)))
+            for k, v in items:
+                _feed_bytes(h, b"k", k.encode())
+                self._feed(h, v)
+        elif isinstance(value, (list, tuple)):
+            h.update(b"[")
+            h.update(struct.pack(">Q", len(value)))  # type: ignore[arg-type]
+            for item in value:  # type: ignore[union-attr]
+                self._feed(h, item)
+        else:
+            _feed_bytes(h, b"j", json.dumps(value, sort_keys=True, default=str).encode())
@@ -1,7 +1,6 @@
-import hashlib
-import json
+import asyncio
 import warnings
-from typing import Any, AsyncGenerator, List, Mapping, Optional, Sequence, Union, cast
+from typing import Any, AsyncGenerator, Dict, List, Mapping, Optional, Sequence, Union, cast
 
 from autogen_core import CacheStore, CancellationToken, Component, ComponentModel, InMemoryStore
 from autogen_core.models import (
@@ -16,6 +15,8 @@
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from ._cache_key import CacheKeyBuilder
+
 CHAT_CACHE_VALUE_TYPE = Union[CreateResult, List[Union[str, CreateResult]]]
 
 
@@ -26,6 +27,29 @@ class ChatCompletionCacheConfig(BaseModel):
     store: Optional[ComponentModel] = None
 
 
+class _StreamFlight:
+    """A ``create_stream`` call to the underlying client that is shared by concurrent identical requests."""
+
+    def __init__(self) -> None:
+        self.results: List[Union[str, CreateResult]] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.readers = 0
+        self.task: asyncio.Task[None] | None = None
+        # Resolved and replaced every time a result is added or the stream ends.
+        self.progress: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def notify(self) -> None:
+        self.progress.set_result(None)
+        self.progress = asyncio.get_running_loop().create_future()
+
+
+def _as_cached(result: Union[str, CreateResult]) -> Union[str, CreateResult]:
+    if isinstance(result, CreateResult):
+        return result.model_copy(update={"cached": True})
+    return result
+
+
 class ChatCompletionCache(ChatCompletionClient, Component[ChatCompletionCacheConfig]):
     """
     A wrapper around a :class:`~autogen_ext.models.cache.ChatCompletionClient` that caches
@@ -79,6 +103,11 @@ async def main():
 
     You can now use the `cached_client` as you would the original client, but with caching enabled.
 
+    Concurrent identical requests that miss the cache are coalesced: only the first one calls the underlying client,
+    and the others wait for its result, which they receive with ``cached`` set to True. The store is accessed with
+    :meth:`~autogen_core.CacheStore.aget` and :meth:`~autogen_core.CacheStore.aset`, so stores backed by
+    network or disk I/O do not block the event loop.
+
     Args:
         client (ChatCompletionClient): The original ChatCompletionClient to wrap.
         store (CacheStore): A store object that implements get and set methods.
@@ -97,8 +126,12 @@ def __init__(
     ):
         self.client = client
         self.store = store or InMemoryStore[CHAT_CACHE_VALUE_TYPE]()
+        # cache key -> the pending call to the underlying client
+        self._pending_creates: Dict[str, asyncio.Future[CreateResult]] = {}
+        self._pending_streams: Dict[str, _StreamFlight] = {}
+        self._key_builder = CacheKeyBuilder()
 
-    def _check_cache(
+    async def _check_cache(
         self,
         messages: Sequence[LLMMessage],
         tools: Sequence[Tool | ToolSchema],
@@ -110,23 +143,9 @@ def _check_cache(
         Returns a tuple of (cached_result, cache_key).
         """
 
-        json_output_data: str | bool | None = None
-
-        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
-            json_output_data = json.dumps(json_output.model_json_schema())
-        elif isinstance(json_output, bool):
-            json_output_data = json_output
+        cache_key = self._key_builder.request_key(messages, tools, json_output, extra_create_args)
 
-        data = {
-            "messages": [message.model_dump() for message in messages],
-            "tools": [(tool.schema if isinstance(tool, Tool) else tool) for tool in tools],
-            "json_output": json_output_data,
-            "extra_create_args": extra_create_args,
-        }
-        serialized_data = json.dumps(data, sort_keys=True)
-        cache_key = hashlib.sha256(serialized_data.encode()).hexdigest()
-
-        cached_result = cast(Optional[CreateResult], self.store.get(cache_key))
+        cached_result = cast(Optional[CreateResult], await self.store.aget(cache_key))
         if cached_result is not None:
             return cached_result, cache_key
 
@@ -148,20 +167,49 @@ async def create(
 
         NOTE: cancellation_token is ignored for cached results.
         """
-        cached_result, cache_key = self._check_cache(messages, tools, json_output, extra_create_args)
+        cached_result, cache_key = await self._check_cache(messages, tools, json_output, extra_create_args)
         if cached_result:
             assert isinstance(cached_result, CreateResult)
             cached_result.cached = True
             return cached_result
 
-        result = await self.client.create(
-            messages,
-            tools=tools,
-            json_output=json_output,
-            extra_create_args=extra_create_args,
-            cancellation_token=cancellation_token,
-        )
-        self.store.set(cache_key, result)
+        while (pending := self._pending_creates.get(cache_key)) is not None:
+            # Shielded so that cancelling this caller does not cancel the shared call.
+            waiter = asyncio.shield(pending)
+            if cancellation_token is not None:
+                cancellation_token.link_future(waiter)
+            try:
+                result = await waiter
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The caller that made the shared call was cancelled; make the call again.
+                continue
+            return result.model_copy(update={"cached": True})
+
+        pending = asyncio.get_running_loop().create_future()
+        self._pending_creates[cache_key] = pending
+        try:
+            result = await self.client.create(
+                messages,
+                tools=tools,
+                json_output=json_output,
+                extra_create_args=extra_create_args,
+                cancellation_token=cancellation_token,
+            )
+            await self.store.aset(cache_key, result)
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except BaseException as e:
+            pending.set_exception(e)
+            # Mark the exception as retrieved, it is raised to this caller below.
+            pending.exception()
+            raise
+        else:
+            pending.set_result(result)
+        finally:
+            del self._pending_creates[cache_key]
         return result
 
     def create_stream(
@@ -182,7 +230,7 @@ def create_stream(
         """
 
         async def _generator() -> AsyncGenerator[Union[str, CreateResult], None]:
-            cached_result, cache_key = self._check_cache(
+            cached_result, cache_key = await self._check_cache(
                 messages,
                 tools,
                 json_output,
@@ -196,22 +244,72 @@ async def _generator() -> AsyncGenerator[Union[str, CreateResult], None]:
                     yield result
                 return
 
-            result_stream = self.client.create_stream(
-                messages,
-                tools=tools,
-                json_output=json_output,
-                extra_create_args=extra_create_args,
-                cancellation_token=cancellation_token,
-            )
+            while True:
+                flight = self._pending_streams.get(cache_key)
+                is_leader = flight is None
+                if flight is None:
+                    flight = _StreamFlight()
+                    self._pending_streams[cache_key] = flight
+                    result_stream = self.client.create_stream(
+                        messages,
+                        tools=tools,
+                        json_output=json_output,
+                        extra_create_args=extra_create_args,
+                        cancellation_token=cancellation_token,
+                    )
+                    flight.task = asyncio.create_task(self._run_stream(cache_key, flight, result_stream))
+
+                index = 0
+                flight.readers += 1
+                try:
+                    while True:
+                        while index < len(flight.results):
+                            result = flight.results[index]
+                            index += 1
+                            yield result if is_leader else _as_cached(result)
+                        if flight.done:
+                            break
+                        waiter = asyncio.shield(flight.progress)
+                        if cancellation_token is not None:
+                            cancellation_token.link_future(waiter)
+                        await waiter
+                finally:
+                    flight.readers -= 1
+                    if flight.readers == 0 and not flight.done:
+                        # Nobody is reading the shared stream any more.
+                        assert flight.task is not None
+                        flight.task.cancel()
+                        if self._pending_streams.get(cache_key) is flight:
+                            del self._pending_streams[cache_key]
+
+                if isinstance(flight.error, asyncio.CancelledError) and not is_leader and index == 0:
+                    # The caller that started the shared stream cancelled it; start it again.
+                    continue
+                if flight.error is not None:
+                    raise flight.error
+                return
 
-            output_results: List[Union[str, CreateResult]] = []
-            self.store.set(cache_key, output_results)
+        return _generator()
 
+    async def _run_stream(
+        self,
+        cache_key: str,
+        flight: _StreamFlight,
+        result_stream: AsyncGenerator[Union[str, CreateResult], None],
+    ) -> None:
+        try:
             async for result in result_stream:
-                output_results.append(result)
-                yield result
-
-        return _generator()
+                flight.results.append(result)
+                flight.notify()
+            # Only complete streams are cached.
+            await self.store.aset(cache_key, flight.results)
+        except BaseException as e:
+            flight.error = e
+        finally:
+            flight.done = True
+            flight.notify()
+            if self._pending_streams.get(cache_key) is flight:
+                del self._pending_streams[cache_key]
 
     async def close(self) -> None:
         await self.client.close()
@@ -240,7 +338,7 @@ def total_usage(self) -> RequestUsage:
     def _to_config(self) -> ChatCompletionCacheConfig:
         return ChatCompletionCacheConfig(
             client=self.client.dump_component(),
-            store=self.store.dump_component() if not isinstance(self.store, InMemoryStore) else None,
+            store=self.store.dump_component(),
         )
 
     @classmethod
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import inspect
 import json
 import logging
@@ -52,6 +53,7 @@
 from pydantic.json_schema import JsonSchemaValue
 from typing_extensions import Self, Unpack
 
+from .._utils.downscale_images import ImageDownscaler, ImageSize, fit_image_size
 from . import _model_info
 from .config import BaseOllamaClientConfiguration, BaseOllamaClientConfigurationConfigModel
 
@@ -253,7 +255,7 @@ def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
     if detail == "low":
         return BASE_TOKEN_COUNT
 
-    width, height = image.image.size
+    width, height = image.width, image.height
 
     # Scale down to fit within a MAX_LONG_EDGE x MAX_LONG_EDGE square if necessary
 
@@ -292,6 +294,10 @@ def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
     return total_tokens
 
 
+def _ollama_image_size(image: Image, max_long_edge: int) -> ImageSize:
+    return fit_image_size(image.width, image.height, max_long_edge=max_long_edge)
+
+
 def _add_usage(usage1: RequestUsage, usage2: RequestUsage) -> RequestUsage:
     return RequestUsage(
         prompt_tokens=usage1.prompt_tokens + usage2.prompt_tokens,
@@ -463,9 +469,15 @@ def __init__(
         create_args: Dict[str, Any],
         model_capabilities: Optional[ModelCapabilities] = None,  # type: ignore
         model_info: Optional[ModelInfo] = None,
+        max_image_size: Optional[int] = None,
     ):
         self._client = client
         self._model_name = create_args["model"]
+        self._image_downscaler: Optional[ImageDownscaler] = None
+        if max_image_size is not None:
+            self._image_downscaler = ImageDownscaler(
+                functools.partial(_ollama_image_size, max_long_edge=max_image_size)
+            )
         if model_capabilities is None and model_info is None:
             try:
                 self._model_info = _model_info.get_info(create_args["model"])
@@ -578,6 +590,10 @@ def _process_create_args(
         if self.model_info["json_output"] is False and json_output is True:
             raise ValueError("Model does not support JSON output.")
 
+        if self._image_downscaler is not None:
+            # Send images at the size the model processes them at, instead of at full resolution.
+            messages = self._image_downscaler.downscale_messages(messages)
+
         ollama_messages_nested = [to_ollama_type(m) for m in messages]
         ollama_messages = [item for sublist in ollama_messages_nested for item in sublist]
 
@@ -882,6 +898,9 @@ class OllamaChatCompletionClient(BaseOllamaChatCompletionClient, Component[BaseO
         response_format (optional, pydantic.BaseModel): The format of the response. If provided, the response will be parsed into this format as json.
         options (optional, Mapping[str, Any] | Options): Additional options to pass to the Ollama client.
         model_info (optional, ModelInfo): The capabilities of the model. **Required if the model is not listed in the ollama model info.**
+        max_image_size (optional, int): The maximum size in pixels of the long side of the images sent to the model.
+            Larger images are scaled down to it before they are sent. Vision models resize images to their own
+            resolution, so setting it to that resolution saves encoding and transfer time without changing the result.
 
     Note:
         Only models with 200k+ downloads (as of Jan 21, 2025), + phi4, deepseek-r1 have pre-defined model infos. See `this file <https://github.com/microsoft/autogen/blob/main/python/packages/autogen-ext/src/autogen_ext/models/ollama/_model_info.py>`__ for the full list. An entry for one model encompases all parameter variants of that model.
@@ -970,7 +989,11 @@ def __init__(self, **kwargs: Unpack[BaseOllamaClientConfiguration]):
         create_args = _create_args_from_config(copied_args)
         self._raw_config: Dict[str, Any] = copied_args
         super().__init__(
-            client=client, create_args=create_args, model_capabilities=model_capabilities, model_info=model_info
+            client=client,
+            create_args=create_args,
+            model_capabilities=model_capabilities,
+            model_info=model_info,
+            max_image_size=kwargs.get("max_image_size"),
         )
 
     def __getstate__(self) -> Dict[str, Any]:
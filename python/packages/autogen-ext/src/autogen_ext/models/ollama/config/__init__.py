@@ -23,6 +23,7 @@ class BaseOllamaClientConfiguration(CreateArguments, total=False):
     model_info: ModelInfo
     """What functionality the model supports, determined by default from model name but is overriden if value passed."""
     options: Optional[Union[Mapping[str, Any], Options]]
+    max_image_size: Optional[int]
 
 
 # Pydantic equivalents of the above TypedDicts
@@ -41,3 +42,4 @@ class BaseOllamaClientConfigurationConfigModel(CreateArgumentsConfigModel):
     model_capabilities: ModelCapabilities | None = None  # type: ignore
     model_info: ModelInfo | None = None
     options: Mapping[str, Any] | Options | None = None
+    max_image_size: int | None = None
@@ -1,4 +1,6 @@
 import asyncio
+import functools
+import hashlib
 import inspect
 import json
 import logging
@@ -7,6 +9,7 @@
 import re
 import warnings
 from asyncio import Task
+from collections import OrderedDict
 from dataclasses import dataclass
 from importlib.metadata import PackageNotFoundError, version
 from typing import (
@@ -19,6 +22,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -72,6 +76,7 @@
 from pydantic import BaseModel, SecretStr
 from typing_extensions import Self, Unpack
 
+from .._utils.downscale_images import ImageDownscaler, ImageSize, fit_image_size
 from .._utils.normalize_stop_reason import normalize_stop_reason
 from .._utils.parse_r1_content import parse_r1_content
 from . import _model_info
@@ -179,6 +184,23 @@ def raise_value_error(message: LLMMessage, context: Dict[str, Any]) -> Sequence[
     return result
 
 
+def _openai_image_size(image: Image, max_tokens: Optional[int] = None) -> ImageSize:
+    """Return the size OpenAI scales an image down to with the "auto" detail level, reduced further
+    so that the image uses at most `max_tokens` vision tokens if given."""
+    width, height = fit_image_size(image.width, image.height, max_long_edge=2048, max_short_edge=768)
+    if max_tokens is not None:
+        # Each 512 x 512 tile costs 170 tokens, on top of a base of 85 tokens. An image has at least one tile.
+        max_tiles = max(1, (max_tokens - 85) // 170)
+        while True:
+            tiles_width, tiles_height = math.ceil(width / 512), math.ceil(height / 512)
+            if tiles_width * tiles_height <= max_tiles:
+                break
+            # Drop a column or a row of tiles, whichever keeps the image larger.
+            scale = max((tiles_width - 1) * 512 / width, (tiles_height - 1) * 512 / height)
+            width, height = max(1, int(width * scale)), max(1, int(height * scale))
+    return width, height
+
+
 def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
     MAX_LONG_EDGE = 2048
     BASE_TOKEN_COUNT = 85
@@ -189,7 +211,7 @@ def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
     if detail == "low":
         return BASE_TOKEN_COUNT
 
-    width, height = image.image.size
+    width, height = image.width, image.height
 
     # Scale down to fit within a MAX_LONG_EDGE x MAX_LONG_EDGE square if necessary
 
@@ -274,6 +296,170 @@ def normalize_name(name: str) -> str:
     return re.sub(r"[^a-zA-Z0-9_-]", "_", name)[:64]
 
 
+class TokenCountCache:
+    """A least recently used cache of token counts, keyed by the content of messages and tool schemas.
+
+    Args:
+        maxsize (int, optional): The maximum number of cached counts. Defaults to 4096.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self._maxsize = maxsize
+        self._counts: OrderedDict[Tuple[Any, ...], int] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def get(self, key: Tuple[Any, ...]) -> int | None:
+        count = self._counts.get(key)
+        if count is not None:
+            self._counts.move_to_end(key)
+        return count
+
+    def put(self, key: Tuple[Any, ...], count: int) -> None:
+        self._counts[key] = count
+        self._counts.move_to_end(key)
+        if len(self._counts) > self._maxsize:
+            self._counts.popitem(last=False)
+
+
+def _content_key(content: str) -> bytes:
+    # A digest keeps the cache small for long messages; collisions are negligible at 16 bytes.
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=64)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _message_token_parts(
+    message: LLMMessage, model: str, *, add_name_prefixes: bool, model_family: str
+) -> Tuple[int, List[str]]:
+    """Split the token count of a message into a fixed number of tokens and the texts to encode."""
+    tokens_per_message = 3
+    tokens_per_name = 1
+    num_tokens = tokens_per_message
+    texts: List[str] = []
+    oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
+    for oai_message_part in oai_message:
+        for key, value in oai_message_part.items():
+            if value is None:
+                continue
+
+            if isinstance(message, UserMessage) and isinstance(value, list):
+                typed_message_value = cast(List[ChatCompletionContentPartParam], value)
+
+                assert len(typed_message_value) == len(
+                    message.content
+                ), "Mismatch in message content and typed message value"
+
+                # We need image properties that are only in the original message
+                for part, content_part in zip(typed_message_value, message.content, strict=False):
+                    if isinstance(content_part, Image):
+                        # TODO: add detail parameter
+                        num_tokens += calculate_vision_tokens(content_part)
+                    elif isinstance(part, str):
+                        texts.append(part)
+                    else:
+                        try:
+                            texts.append(json.dumps(part))
+                        except TypeError:
+                            trace_logger.warning(f"Could not convert {part} to string, skipping.")
+            else:
+                if not isinstance(value, str):
+                    try:
+                        value = json.dumps(value)
+                    except TypeError:
+                        trace_logger.warning(f"Could not convert {value} to string, skipping.")
+                        continue
+                texts.append(value)
+                if key == "name":
+                    num_tokens += tokens_per_name
+    return num_tokens, texts
+
+
+def _count_tool_tokens(tool: ChatCompletionToolParam, encoding: tiktoken.Encoding) -> int:
+    function = tool["function"]
+    tool_tokens = len(encoding.encode(function["name"]))
+    if "description" in function:
+        tool_tokens += len(encoding.encode(function["description"]))
+    tool_tokens -= 2
+    if "parameters" in function:
+        parameters = function["parameters"]
+        if "properties" in parameters:
+            assert isinstance(parameters["properties"], dict)
+            for propertiesKey in parameters["properties"]:  # pyright: ignore
+                assert isinstance(propertiesKey, str)
+                tool_tokens += len(encoding.encode(propertiesKey))
+                v = parameters["properties"][propertiesKey]  # pyright: ignore
+                for field in v:  # pyright: ignore
+                    if field == "type":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
+                    elif field == "description":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
+                    elif field == "enum":
+                        tool_tokens -= 3
+                        for o in v["enum"]:  # pyright: ignore
+                            tool_tokens += 3
+                            tool_tokens += len(encoding.encode(o))  # pyright: ignore
+                    else:
+                        trace_logger.warning(f"Not supported field {field}")
+            tool_tokens += 11
+            if len(parameters["properties"]) == 0:  # pyright: ignore
+                tool_tokens -= 2
+    return tool_tokens
+
+
+def count_message_tokens_openai(
+    messages: Sequence[LLMMessage],
+    model: str,
+    *,
+    add_name_prefixes: bool = False,
+    model_family: str = ModelFamily.UNKNOWN,
+    cache: TokenCountCache | None = None,
+) -> List[int]:
+    """Count the tokens of each message, as :func:`count_tokens_openai` counts them.
+
+    The texts of all messages that are not in the cache are encoded in one
+    :meth:`tiktoken.Encoding.encode_batch` call.
+    """
+    encoding = _get_encoding(model)
+    counts: List[int | None] = [None] * len(messages)
+    keys: List[Tuple[Any, ...] | None] = [None] * len(messages)
+    missing: List[Tuple[int, int, int, int]] = []
+    texts: List[str] = []
+    for index, message in enumerate(messages):
+        if cache is not None:
+            key = (model, add_name_prefixes, model_family, _content_key(message.model_dump_json()))
+            keys[index] = key
+            counts[index] = cache.get(key)
+            if counts[index] is not None:
+                continue
+        fixed_tokens, message_texts = _message_token_parts(
+            message, model, add_name_prefixes=add_name_prefixes, model_family=model_family
+        )
+        missing.append((index, fixed_tokens, len(texts), len(texts) + len(message_texts)))
+        texts.extend(message_texts)
+
+    encoded = encoding.encode_batch(texts) if len(texts) > 1 else [encoding.encode(text) for text in texts]
+    for index, fixed_tokens, texts_start, texts_end in missing:
+        count = fixed_tokens + sum(len(tokens) for tokens in encoded[texts_start:texts_end])
+        counts[index] = count
+        cache_key = keys[index]
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, count)
+    return cast(List[int], counts)
+
+
 def count_tokens_openai(
     messages: Sequence[LLMMessage],
     model: str,
@@ -281,90 +467,40 @@ def count_tokens_openai(
     add_name_prefixes: bool = False,
     tools: Sequence[Tool | ToolSchema] = [],
     model_family: str = ModelFamily.UNKNOWN,
+    cache: TokenCountCache | None = None,
 ) -> int:
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
-    tokens_per_message = 3
-    tokens_per_name = 1
-    num_tokens = 0
-
-    # Message tokens.
-    for message in messages:
-        num_tokens += tokens_per_message
-        oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
-        for oai_message_part in oai_message:
-            for key, value in oai_message_part.items():
-                if value is None:
-                    continue
-
-                if isinstance(message, UserMessage) and isinstance(value, list):
-                    typed_message_value = cast(List[ChatCompletionContentPartParam], value)
-
-                    assert len(typed_message_value) == len(
-                        message.content
-                    ), "Mismatch in message content and typed message value"
-
-                    # We need image properties that are only in the original message
-                    for part, content_part in zip(typed_message_value, message.content, strict=False):
-                        if isinstance(content_part, Image):
-                            # TODO: add detail parameter
-                            num_tokens += calculate_vision_tokens(content_part)
-                        elif isinstance(part, str):
-                            num_tokens += len(encoding.encode(part))
-                        else:
-                            try:
-                                serialized_part = json.dumps(part)
-                                num_tokens += len(encoding.encode(serialized_part))
-                            except TypeError:
-                                trace_logger.warning(f"Could not convert {part} to string, skipping.")
-                else:
-                    if not isinstance(value, str):
-                        try:
-                            value = json.dumps(value)
-                        except TypeError:
-                            trace_logger.warning(f"Could not convert {value} to string, skipping.")
-                            continue
-                    num_tokens += len(encoding.encode(value))
-                    if key == "name":
-                        num_tokens += tokens_per_name
+    """Count the tokens of a prompt with the messages and tools.
+
+    Args:
+        messages (Sequence[LLMMessage]): The messages of the prompt.
+        model (str): The model whose tokenizer is used.
+        add_name_prefixes (bool, optional): Whether the source of messages is prepended to their content.
+        tools (Sequence[Tool | ToolSchema], optional): The tools of the prompt.
+        model_family (str, optional): The model family, which affects how messages are converted.
+        cache (TokenCountCache | None, optional): A cache of per-message and per-tool counts. Messages and tools
+            with the same content are only tokenized once. Defaults to None, no caching.
+    """
+    num_tokens = sum(
+        count_message_tokens_openai(
+            messages, model, add_name_prefixes=add_name_prefixes, model_family=model_family, cache=cache
+        )
+    )
     num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
 
     # Tool tokens.
-    oai_tools = convert_tools(tools)
-    for tool in oai_tools:
-        function = tool["function"]
-        tool_tokens = len(encoding.encode(function["name"]))
-        if "description" in function:
-            tool_tokens += len(encoding.encode(function["description"]))
-        tool_tokens -= 2
-        if "parameters" in function:
-            parameters = function["parameters"]
-            if "properties" in parameters:
-                assert isinstance(parameters["properties"], dict)
-                for propertiesKey in parameters["properties"]:  # pyright: ignore
-                    assert isinstance(propertiesKey, str)
-                    tool_tokens += len(encoding.encode(propertiesKey))
-                    v = parameters["properties"][propertiesKey]  # pyright: ignore
-                    for field in v:  # pyright: ignore
-                        if field == "type":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
-                        elif field == "description":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
-                        elif field == "enum":
-                            tool_tokens -= 3
-                            for o in v["enum"]:  # pyright: ignore
-                                tool_tokens += 3
-                                tool_tokens += len(encoding.encode(o))  # pyright: ignore
-                        else:
-                            trace_logger.warning(f"Not supported field {field}")
-                tool_tokens += 11
-                if len(parameters["properties"]) == 0:  # pyright: ignore
-                    tool_tokens -= 2
+    encoding = _get_encoding(model)
+    for tool in tools:
+        key: Tuple[Any, ...] | None = None
+        if cache is not None:
+            schema = tool.schema if isinstance(tool, Tool) else tool
+            key = ("tool", model, _content_key(json.dumps(schema, sort_keys=True, default=str)))
+            tool_tokens = cache.get(key)
+            if tool_tokens is not None:
+                num_tokens += tool_tokens
+                continue
+        tool_tokens = _count_tool_tokens(convert_tools([tool])[0], encoding)
+        if cache is not None and key is not None:
+            cache.put(key, tool_tokens)
         num_tokens += tool_tokens
     num_tokens += 12
     return num_tokens
@@ -387,9 +523,15 @@ def __init__(
         model_capabilities: Optional[ModelCapabilities] = None,  # type: ignore
         model_info: Optional[ModelInfo] = None,
         add_name_prefixes: bool = False,
+        downscale_images: bool = False,
+        max_image_tokens: Optional[int] = None,
     ):
         self._client = client
         self._add_name_prefixes = add_name_prefixes
+        self._image_downscaler: Optional[ImageDownscaler] = None
+        if downscale_images or max_image_tokens is not None:
+            self._image_downscaler = ImageDownscaler(functools.partial(_openai_image_size, max_tokens=max_image_tokens))
+        self._token_count_cache = TokenCountCache()
         if model_capabilities is None and model_info is None:
             try:
                 self._model_info = _model_info.get_info(create_args["model"])
@@ -522,6 +664,10 @@ def _process_create_args(
                     if isinstance(message.content, list) and any(isinstance(x, Image) for x in message.content):
                         raise ValueError("Model does not support vision and image was provided")
 
+        if self._image_downscaler is not None:
+            # Send images at the size the model processes them at, instead of at full resolution.
+            messages = self._image_downscaler.downscale_messages(messages)
+
         if self.model_info["json_output"] is False and json_output is True:
             raise ValueError("Model does not support JSON output.")
 
@@ -739,11 +885,16 @@ async def create_stream(
         extra_create_args: Mapping[str, Any] = {},
         cancellation_token: Optional[CancellationToken] = None,
         max_consecutive_empty_chunk_tolerance: int = 0,
+        on_function_call: Callable[[FunctionCall], None] | None = None,
     ) -> AsyncGenerator[Union[str, CreateResult], None]:
         """Create a stream of string chunks from the model ending with a :class:`~autogen_core.models.CreateResult`.
 
         Extends :meth:`autogen_core.models.ChatCompletionClient.create_stream` to support OpenAI API.
 
+        If `on_function_call` is set, it is called with each function call of the response as soon as
+        its arguments have been streamed, before the stream ends. The function calls are passed in the order
+        of the final :class:`~autogen_core.models.CreateResult`.
+
         In streaming, the default behaviour is not return token usage counts.
         See: `OpenAI API reference for possible args <https://platform.openai.com/docs/api-reference/chat/create>`_.
 
@@ -799,6 +950,8 @@ async def create_stream(
         content_deltas: List[str] = []
         thought_deltas: List[str] = []
         full_tool_calls: Dict[int, FunctionCall] = {}
+        # The number of tool calls passed to on_function_call.
+        num_completed_tool_calls = 0
         logprobs: Optional[List[ChatCompletionTokenLogprob]] = None
 
         empty_chunk_warning_has_been_issued: bool = False
@@ -883,6 +1036,11 @@ async def create_stream(
                 for tool_call_chunk in choice.delta.tool_calls:
                     idx = tool_call_chunk.index
                     if idx not in full_tool_calls:
+                        if on_function_call is not None:
+                            # The arguments of the previous tool calls are complete when a new tool call starts.
+                            for tool_call in list(full_tool_calls.values())[num_completed_tool_calls:]:
+                                on_function_call(tool_call)
+                            num_completed_tool_calls = len(full_tool_calls)
                         # We ignore the type hint here because we want to fill in type when the delta provides it
                         full_tool_calls[idx] = FunctionCall(id="", arguments="", name="")
 
@@ -905,6 +1063,10 @@ async def create_stream(
                     for x in choice.logprobs.content
                 ]
 
+        if on_function_call is not None:
+            for tool_call in list(full_tool_calls.values())[num_completed_tool_calls:]:
+                on_function_call(tool_call)
+
         # Finalize the CreateResult.
 
         # TODO: can we remove this?
@@ -1058,6 +1220,7 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
             add_name_prefixes=self._add_name_prefixes,
             tools=tools,
             model_family=self._model_info["family"],
+            cache=self._token_count_cache,
         )
 
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
@@ -1159,6 +1322,11 @@ class OpenAIChatCompletionClient(BaseOpenAIChatCompletionClient, Component[OpenA
             This can be useful for models that do not support the `name` field in
             message. Defaults to False.
         stream_options (optional, dict): Additional options for streaming. Currently only `include_usage` is supported.
+        downscale_images (optional, bool): Whether to scale images down to the resolution the model processes them at
+            before sending them: at most 2048 pixels on the long side and 768 pixels on the short side.
+            This reduces the size of requests without changing the number of vision tokens. Defaults to False.
+        max_image_tokens (optional, int): The maximum number of vision tokens per image. Larger images are scaled down
+            to use at most this many tokens. Setting it also enables `downscale_images`. Defaults to None.
 
     Examples:
 
@@ -1357,6 +1525,9 @@ def __init__(self, **kwargs: Unpack[OpenAIClientConfiguration]):
         if "add_name_prefixes" in kwargs:
             add_name_prefixes = kwargs["add_name_prefixes"]
 
+        downscale_images = kwargs.get("downscale_images", False)
+        max_image_tokens = kwargs.get("max_image_tokens", None)
+
         # Special handling for Gemini model.
         assert "model" in copied_args and isinstance(copied_args["model"], str)
         if copied_args["model"].startswith("gemini-"):
@@ -1379,6 +1550,8 @@ def __init__(self, **kwargs: Unpack[OpenAIClientConfiguration]):
             model_capabilities=model_capabilities,
             model_info=model_info,
             add_name_prefixes=add_name_prefixes,
+            downscale_images=downscale_images,
+            max_image_tokens=max_image_tokens,
         )
 
     def __getstate__(self) -> Dict[str, Any]:
@@ -1480,6 +1653,11 @@ class AzureOpenAIChatCompletionClient(
         top_p (optional, float):
         user (optional, str):
         default_headers (optional, dict[str, str]):  Custom headers; useful for authentication or other custom requirements.
+        downscale_images (optional, bool): Whether to scale images down to the resolution the model processes them at
+            before sending them: at most 2048 pixels on the long side and 768 pixels on the short side.
+            This reduces the size of requests without changing the number of vision tokens. Defaults to False.
+        max_image_tokens (optional, int): The maximum number of vision tokens per image. Larger images are scaled down
+            to use at most this many tokens. Setting it also enables `downscale_images`. Defaults to None.
 
 
     To use the client, you need to provide your deployment name, Azure Cognitive Services endpoint, and api version.
@@ -1571,6 +1749,9 @@ def __init__(self, **kwargs: Unpack[AzureOpenAIClientConfiguration]):
         if "add_name_prefixes" in kwargs:
             add_name_prefixes = kwargs["add_name_prefixes"]
 
+        downscale_images = kwargs.get("downscale_images", False)
+        max_image_tokens = kwargs.get("max_image_tokens", None)
+
         client = _azure_openai_client_from_config(copied_args)
         create_args = _create_args_from_config(copied_args)
         self._raw_config: Dict[str, Any] = copied_args
@@ -1580,6 +1761,8 @@ def __init__(self, **kwargs: Unpack[AzureOpenAIClientConfiguration]):
             model_capabilities=model_capabilities,
             model_info=model_info,
             add_name_prefixes=add_name_prefixes,
+            downscale_images=downscale_images,
+            max_image_tokens=max_image_tokens,
         )
 
     def __getstate__(self) -> Dict[str, Any]:
@@ -64,6 +64,8 @@ class BaseOpenAIClientConfiguration(CreateArguments, total=False):
     add_name_prefixes: bool
     """What functionality the model supports, determined by default from model name but is overriden if value passed."""
     default_headers: Dict[str, str] | None
+    downscale_images: bool
+    max_image_tokens: Optional[int]
 
 
 # See OpenAI docs for explanation of these parameters
@@ -106,6 +108,8 @@ class BaseOpenAIClientConfigurationConfigModel(CreateArgumentsConfigModel):
     model_info: ModelInfo | None = None
     add_name_prefixes: bool | None = None
     default_headers: Dict[str, str] | None = None
+    downscale_images: bool | None = None
+    max_image_tokens: int | None = None
 
 
 # See OpenAI docs for explanation of these parameters
@@ -7,7 +7,9 @@
 AGENT_SENDER_TYPE_ATTR = "agagentsendertype"
 AGENT_SENDER_KEY_ATTR = "agagentsenderkey"
 MESSAGE_KIND_ATTR = "agmsgkind"
+AGENT_RECIPIENTS_ATTR = "agrecipients"
 MESSAGE_KIND_VALUE_PUBLISH = "publish"
 MESSAGE_KIND_VALUE_RPC_REQUEST = "rpc_request"
 MESSAGE_KIND_VALUE_RPC_RESPONSE = "rpc_response"
 MESSAGE_KIND_VALUE_RPC_ERROR = "error"
+MESSAGE_BATCH_SIZE_METADATA_KEY = "message-batch-size"
@@ -0,0 +1,68 @@
+import bisect
+import hashlib
+from typing import Dict, Generic, List, Sequence, TypeVar
+
+NodeT = TypeVar("NodeT", bound=str)
+
+
+def _hash(value: str) -> int:
+    # A stable hash, so placement does not depend on PYTHONHASHSEED or the host process.
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing(Generic[NodeT]):
+    """Maps keys to nodes so that few keys change node when nodes are added or removed.
+
+    Each node is placed on the ring at several virtual points. Adding or removing a node only
+    moves the keys whose closest point belongs to that node, roughly ``1 / len(nodes)`` of them.
+    A key stays on its node only as long as no node is added whose points take it over.
+
+    Args:
+        virtual_nodes (int, optional): The number of points per node. More points spread keys more evenly. Defaults to 128.
+    """
+
+    def __init__(self, virtual_nodes: int = 128) -> None:
+        if virtual_nodes < 1:
+            raise ValueError("virtual_nodes must be a positive integer")
+        self._virtual_nodes = virtual_nodes
+        self._points: List[int] = []
+        self._point_to_node: Dict[int, NodeT] = {}
+        self._nodes: List[NodeT] = []
+
+    @property
+    def nodes(self) -> Sequence[NodeT]:
+        return self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._nodes
+
+    def add(self, node: NodeT) -> None:
+        if node in self._nodes:
+            raise ValueError(f"Node {node} is already in the ring.")
+        self._nodes.append(node)
+        for i in range(self._virtual_nodes):
+            point = _hash(f"{node}#{i}")
+            # Collisions are astronomically unlikely; the first node keeps the point.
+            if point in self._point_to_node:
+                continue
+            self._point_to_node[point] = node
+            bisect.insort(self._points, point)
+
+    def remove(self, node: NodeT) -> None:
+        if node not in self._nodes:
+            raise ValueError(f"Node {node} is not in the ring.")
+        self._nodes.remove(node)
+        self._points = [point for point in self._points if self._point_to_node[point] != node]
+        self._point_to_node = {point: self._point_to_node[point] for point in self._points}
+
+    def get(self, key: str) -> NodeT:
+        """Return the node responsible for the key."""
+        if not self._nodes:
+            raise LookupError("The ring has no nodes.")
+        if len(self._nodes) == 1:
+            return self._nodes[0]
+        index = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._point_to_node[self._points[index]]
@@ -1,9 +1,15 @@
+import asyncio
+from collections import deque
+from typing import Any, Callable, Coroutine, Deque, List, Sequence, TypeVar
+
 from autogen_core._subscription import Subscription
 from autogen_core._type_prefix_subscription import TypePrefixSubscription
 from autogen_core._type_subscription import TypeSubscription
 
 from .protos import agent_worker_pb2
 
+T = TypeVar("T")
+
 
 def subscription_to_proto(subscription: Subscription) -> agent_worker_pb2.Subscription:
     match subscription:
@@ -43,3 +49,75 @@ def subscription_from_proto(subscription: agent_worker_pb2.Subscription) -> Subs
             )
         case None:
             raise ValueError("Invalid subscription message.")
+
+
+def drain_queue(queue: asyncio.Queue[T], limit: int) -> List[T]:
+    """Get up to ``limit`` items that are already in the queue without waiting."""
+    items: List[T] = []
+    while len(items) < limit:
+        try:
+            items.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return items
+
+
+def batch_messages(messages: Sequence[agent_worker_pb2.Message]) -> agent_worker_pb2.Message:
+    """Wrap several messages in one :class:`MessageBatch` envelope. A single message is returned as is."""
+    if len(messages) == 1:
+        return messages[0]
+    return agent_worker_pb2.Message(batch=agent_worker_pb2.MessageBatch(messages=messages))
+
+
+def unbatch_message(message: agent_worker_pb2.Message) -> Sequence[agent_worker_pb2.Message]:
+    """Return the messages in a :class:`MessageBatch` envelope, or the message itself if it is not a batch."""
+    if message.WhichOneof("message") == "batch":
+        return message.batch.messages
+    return (message,)
+
+
+class HandlerQueue:
+    """Run message handlers as background tasks, at most ``max_running`` of them at the same time.
+
+    Handlers submitted while the limit is reached wait in a queue and start as running handlers finish.
+    Submitting never blocks, so the loop reading messages keeps reading the responses that running
+    handlers may be waiting for. ``max_running`` of 0 means unbounded.
+    """
+
+    def __init__(self, max_running: int, start: Callable[[Coroutine[Any, Any, None]], asyncio.Task[None]]) -> None:
+        self._max_running = max_running
+        self._start = start
+        self._num_running = 0
+        self._waiting: Deque[Coroutine[Any, Any, None]] = deque()
+        self._closed = False
+
+    @property
+    def num_running(self) -> int:
+        return self._num_running
+
+    @property
+    def num_waiting(self) -> int:
+        return len(self._waiting)
+
+    def submit(self, handler: Coroutine[Any, Any, None]) -> None:
+        if self._closed:
+            handler.close()
+        elif self._max_running > 0 and self._num_running >= self._max_running:
+            self._waiting.append(handler)
+        else:
+            self._run(handler)
+
+    def close(self) -> None:
+        """Drop the waiting handlers. Running handlers are left to finish."""
+        self._closed = True
+        while self._waiting:
+            self._waiting.popleft().close()
+
+    def _run(self, handler: Coroutine[Any, Any, None]) -> None:
+        self._num_running += 1
+        self._start(handler).add_done_callback(self._on_done)
+
+    def _on_done(self, _: asyncio.Task[None]) -> None:
+        self._num_running -= 1
+        if self._waiting and not self._closed:
+            self._run(self._waiting.popleft())
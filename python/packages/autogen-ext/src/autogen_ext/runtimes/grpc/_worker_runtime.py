@@ -17,6 +17,7 @@
     Awaitable,
     Callable,
     ClassVar,
+    Coroutine,
     DefaultDict,
     Dict,
     List,
@@ -35,8 +36,10 @@
     JSON_DATA_CONTENT_TYPE,
     PROTOBUF_DATA_CONTENT_TYPE,
     Agent,
+    AgentCacheStats,
     AgentId,
     AgentInstantiationContext,
+    AgentLifecyclePolicy,
     AgentMetadata,
     AgentRuntime,
     AgentType,
@@ -47,16 +50,21 @@
     Subscription,
     TopicId,
 )
-from autogen_core._runtime_impl_helpers import SubscriptionManager, get_impl
+from autogen_core._runtime_impl_helpers import AgentInstanceCache, SubscriptionManager, get_impl
 from autogen_core._serialization import (
     SerializationRegistry,
 )
 from autogen_core._telemetry import MessageRuntimeTracingConfig, TraceHelper, get_telemetry_grpc_metadata
-from google.protobuf import any_pb2
 from opentelemetry.trace import TracerProvider
 from typing_extensions import Self
 
-from autogen_ext.runtimes.grpc._utils import subscription_to_proto
+from autogen_ext.runtimes.grpc._utils import (
+    HandlerQueue,
+    batch_messages,
+    drain_queue,
+    subscription_to_proto,
+    unbatch_message,
+)
 
 from . import _constants
 from ._constants import GRPC_IMPORT_ERROR_STR
@@ -115,10 +123,20 @@ class HostConnection:
         )
     ]
 
-    def __init__(self, channel: grpc.aio.Channel, stub: Any) -> None:  # type: ignore
+    def __init__(  # type: ignore
+        self,
+        channel: grpc.aio.Channel,  # type: ignore
+        stub: Any,
+        max_queue_size: int = 0,
+        max_batch_size: int = 1,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
         self._channel = channel
-        self._send_queue = asyncio.Queue[agent_worker_pb2.Message]()
-        self._recv_queue = asyncio.Queue[agent_worker_pb2.Message]()
+        # Bounded queues make senders wait when the host or the read loop falls behind.
+        self._send_queue = asyncio.Queue[agent_worker_pb2.Message](maxsize=max_queue_size)
+        self._recv_queue = asyncio.Queue[agent_worker_pb2.Message](maxsize=max_queue_size)
+        self._max_batch_size = max_batch_size
         self._connection_task: Task[None] | None = None
         self._stub: AgentRpcAsyncStub = stub
         self._client_id = str(uuid.uuid4())
@@ -133,7 +151,11 @@ def metadata(self) -> Sequence[Tuple[str, str]]:
 
     @classmethod
     async def from_host_address(
-        cls, host_address: str, extra_grpc_config: ChannelArgumentType = DEFAULT_GRPC_CONFIG
+        cls,
+        host_address: str,
+        extra_grpc_config: ChannelArgumentType = DEFAULT_GRPC_CONFIG,
+        max_queue_size: int = 0,
+        max_batch_size: int = 1,
     ) -> Self:
         logger.info("Connecting to %s", host_address)
         #  Always use DEFAULT_GRPC_CONFIG and override it with provided grpc_config
@@ -146,10 +168,10 @@ async def from_host_address(
             options=merged_options,
         )
         stub: AgentRpcAsyncStub = agent_worker_pb2_grpc.AgentRpcStub(channel)  # type: ignore
-        instance = cls(channel, stub)
+        instance = cls(channel, stub, max_queue_size=max_queue_size, max_batch_size=max_batch_size)
 
         instance._connection_task = await instance._connect(
-            stub, instance._send_queue, instance._recv_queue, instance._client_id
+            stub, instance._send_queue, instance._recv_queue, instance._client_id, instance._max_batch_size
         )
 
         return instance
@@ -166,36 +188,49 @@ async def _connect(
         send_queue: asyncio.Queue[agent_worker_pb2.Message],
         receive_queue: asyncio.Queue[agent_worker_pb2.Message],
         client_id: str,
+        max_batch_size: int = 1,
     ) -> Task[None]:
         from grpc.aio import StreamStreamCall
 
+        async def send_loop() -> AsyncIterator[agent_worker_pb2.Message]:
+            while True:
+                message = await send_queue.get()
+                # Send whatever else is already queued in the same frame.
+                messages = [message, *drain_queue(send_queue, max_batch_size - 1)]
+                if len(messages) > 1:
+                    logger.debug("Sending a batch of %d messages to host", len(messages))
+                yield batch_messages(messages)
+
+        metadata = [("client-id", client_id)]
+        if max_batch_size > 1:
+            # Tell the host that this worker can receive batches.
+            metadata.append((_constants.MESSAGE_BATCH_SIZE_METADATA_KEY, str(max_batch_size)))
+
         # TODO: where do exceptions from reading the iterable go? How do we recover from those?
         stream: StreamStreamCall[agent_worker_pb2.Message, agent_worker_pb2.Message] = stub.OpenChannel(  # type: ignore
-            QueueAsyncIterable(send_queue), metadata=[("client-id", client_id)]
+            send_loop() if max_batch_size > 1 else QueueAsyncIterable(send_queue), metadata=metadata
         )
 
         await stream.wait_for_connection()
 
         async def read_loop() -> None:
             while True:
-                logger.info("Waiting for message from host")
                 message = cast(agent_worker_pb2.Message, await stream.read())  # type: ignore
                 if message == grpc.aio.EOF:  # type: ignore
                     logger.info("EOF")
                     break
-                logger.info(f"Received a message from host: {message}")
-                await receive_queue.put(message)
-                logger.info("Put message in receive queue")
+                for received in unbatch_message(message):
+                    logger.debug("Received a message from host: %s", received)
+                    # Waits when the receive queue is full, which stops reading from the stream.
+                    await receive_queue.put(received)
 
         return asyncio.create_task(read_loop())
 
     async def send(self, message: agent_worker_pb2.Message) -> None:
-        logger.info(f"Send message to host: {message}")
+        logger.debug("Send message to host: %s", message)
         await self._send_queue.put(message)
-        logger.info("Put message in send queue")
 
     async def recv(self) -> agent_worker_pb2.Message:
-        logger.info("Getting message from queue")
         return await self._recv_queue.get()
 
 
@@ -223,6 +258,24 @@ class GrpcWorkerAgentRuntime(AgentRuntime):
 
     .. _cloudevent.proto: https://github.com/microsoft/autogen/blob/main/protos/cloudevent.proto
 
+    Args:
+        host_address (str): The address of the host to connect to.
+        tracer_provider (TracerProvider, optional): The tracer provider to use for tracing. Defaults to None.
+        extra_grpc_config (ChannelArgumentType, optional): Extra gRPC channel options. Defaults to None.
+        payload_serialization_format (str, optional): The content type used to serialize published messages.
+            Defaults to JSON.
+        agent_lifecycle_policy (AgentLifecyclePolicy, optional): Bounds the number of live agent instances in this
+            worker by evicting least recently used or idle agents and restoring their state when they are needed again.
+            Defaults to None, in which case agents are kept alive for the lifetime of the worker.
+        message_queue_size (int, optional): The maximum number of messages buffered in each direction between the
+            worker and the host, and of received events handled at the same time. Sending waits while the buffer
+            is full. Events received while all event handlers are busy wait in memory until one finishes, so the
+            worker keeps reading the requests and responses its handlers wait for. 0 means unbounded.
+            Defaults to 1000.
+        message_batch_size (int, optional): The maximum number of queued messages sent to the host in one frame.
+            Values above 1 also let the host batch messages sent to this worker. Batching needs a
+            :class:`GrpcWorkerAgentRuntimeHost` host. Defaults to 1, no batching.
+
     """
 
     # TODO: Needs to handle agent close() call
@@ -232,6 +285,9 @@ def __init__(
         tracer_provider: TracerProvider | None = None,
         extra_grpc_config: ChannelArgumentType | None = None,
         payload_serialization_format: str = JSON_DATA_CONTENT_TYPE,
+        agent_lifecycle_policy: AgentLifecyclePolicy | None = None,
+        message_queue_size: int = 1000,
+        message_batch_size: int = 1,
     ) -> None:
         self._host_address = host_address
         self._trace_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("Worker Runtime"))
@@ -239,7 +295,7 @@ def __init__(
         self._agent_factories: Dict[
             str, Callable[[], Agent | Awaitable[Agent]] | Callable[[AgentRuntime, AgentId], Agent | Awaitable[Agent]]
         ] = {}
-        self._instantiated_agents: Dict[AgentId, Agent] = {}
+        self._instantiated_agents = AgentInstanceCache(agent_lifecycle_policy)
         self._known_namespaces: set[str] = set()
         self._read_task: None | Task[None] = None
         self._running = False
@@ -251,6 +307,15 @@ def __init__(
         self._subscription_manager = SubscriptionManager()
         self._serialization_registry = SerializationRegistry()
         self._extra_grpc_config = extra_grpc_config or []
+        if message_queue_size < 0:
+            raise ValueError("message_queue_size must be a non-negative integer")
+        if message_batch_size < 1:
+            raise ValueError("message_batch_size must be a positive integer")
+        self._message_queue_size = message_queue_size
+        self._message_batch_size = message_batch_size
+        # Caps the received events being handled. Requests and responses are not capped: running handlers
+        # may be waiting for them, and each request has a sender waiting for its response.
+        self._event_handlers = HandlerQueue(message_queue_size, self._start_handler)
 
         if payload_serialization_format not in {JSON_DATA_CONTENT_TYPE, PROTOBUF_DATA_CONTENT_TYPE}:
             raise ValueError(f"Unsupported payload serialization format: {payload_serialization_format}")
@@ -263,7 +328,10 @@ async def start(self) -> None:
             raise ValueError("Runtime is already running.")
         logger.info(f"Connecting to host: {self._host_address}")
         self._host_connection = await HostConnection.from_host_address(
-            self._host_address, extra_grpc_config=self._extra_grpc_config
+            self._host_address,
+            extra_grpc_config=self._extra_grpc_config,
+            max_queue_size=self._message_queue_size,
+            max_batch_size=self._message_batch_size,
         )
         logger.info("Connection established")
         if self._read_task is None:
@@ -285,30 +353,31 @@ async def _run_read_loop(self) -> None:
                 oneofcase = agent_worker_pb2.Message.WhichOneof(message, "message")
                 match oneofcase:
                     case "request":
-                        task = asyncio.create_task(self._process_request(message.request))
-                        self._background_tasks.add(task)
-                        task.add_done_callback(self._raise_on_exception)
-                        task.add_done_callback(self._background_tasks.discard)
+                        self._start_handler(self._process_request(message.request))
                     case "response":
-                        task = asyncio.create_task(self._process_response(message.response))
-                        self._background_tasks.add(task)
-                        task.add_done_callback(self._raise_on_exception)
-                        task.add_done_callback(self._background_tasks.discard)
+                        self._start_handler(self._process_response(message.response))
                     case "cloudEvent":
-                        task = asyncio.create_task(self._process_event(message.cloudEvent))
-                        self._background_tasks.add(task)
-                        task.add_done_callback(self._raise_on_exception)
-                        task.add_done_callback(self._background_tasks.discard)
+                        self._event_handlers.submit(self._process_event(message.cloudEvent))
                     case None:
                         logger.warning("No message")
             except Exception as e:
                 logger.error("Error in read loop", exc_info=e)
 
+    def _start_handler(self, handler: Coroutine[Any, Any, None]) -> Task[None]:
+        """Run a message handler in the background."""
+        task = asyncio.create_task(handler)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._raise_on_exception)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
     async def stop(self) -> None:
         """Stop the runtime immediately."""
         if not self._running:
             raise RuntimeError("Runtime is not running.")
         self._running = False
+        # Drop the events still waiting for a handler.
+        self._event_handlers.close()
         # Wait for all background tasks to finish.
         final_tasks_results = await asyncio.gather(*self._background_tasks, return_exceptions=True)
         for task_result in final_tasks_results:
@@ -346,6 +415,11 @@ def signal_handler() -> None:
         # Stop the runtime.
         await self.stop()
 
+    @property
+    def agent_cache_stats(self) -> AgentCacheStats:
+        """Hit, miss, eviction and restore counters of the agent instance cache."""
+        return self._instantiated_agents.stats
+
     @property
     def _known_agent_names(self) -> Set[str]:
         return set(self._agent_factories.keys())
@@ -429,10 +503,6 @@ async def publish_message(
         with self._trace_helper.trace_block(
             "create", topic_id, parent=None, extraAttributes={"message_type": message_type}
         ):
-            serialized_message = self._serialization_registry.serialize(
-                message, type_name=message_type, data_content_type=self._payload_serialization_format
-            )
-
             sender_id = sender or AgentId("unknown", "unknown")
             attributes = {
                 _constants.DATA_CONTENT_TYPE_ATTR: cloudevent_pb2.CloudEvent.CloudEventAttributeValue(
@@ -455,6 +525,9 @@ async def publish_message(
             # TODO: add an encoding field for serializer
 
             if self._payload_serialization_format == JSON_DATA_CONTENT_TYPE:
+                serialized_message = self._serialization_registry.serialize(
+                    message, type_name=message_type, data_content_type=JSON_DATA_CONTENT_TYPE
+                )
                 runtime_message = agent_worker_pb2.Message(
                     cloudEvent=cloudevent_pb2.CloudEvent(
                         id=message_id,
@@ -467,10 +540,8 @@ async def publish_message(
                     )
                 )
             else:
-                # We need to unpack the serialized proto back into an Any
-                # TODO: find a way to prevent the roundtrip serialization
-                any_proto = any_pb2.Any()
-                any_proto.ParseFromString(serialized_message)
+                # Serialize straight into an Any, without encoding it to bytes and parsing it back.
+                any_proto = self._serialization_registry.serialize_to_any(message, type_name=message_type)
                 runtime_message = agent_worker_pb2.Message(
                     cloudEvent=cloudevent_pb2.CloudEvent(
                         id=message_id,
@@ -536,6 +607,7 @@ async def _process_request(self, request: agent_worker_pb2.RpcRequest) -> None:
         )
 
         # Call the receiving agent.
+        self._instantiated_agents.pin(recipient)
         try:
             with MessageHandlerContext.populate_context(rec_agent.id):
                 with self._trace_helper.trace_block(
@@ -557,6 +629,8 @@ async def _process_request(self, request: agent_worker_pb2.RpcRequest) -> None:
             # Send the error response.
             await self._host_connection.send(response_message)
             return
+        finally:
+            self._instantiated_agents.unpin(recipient)
 
         # Serialize the result.
         result_type = self._serialization_registry.type_name(result)
@@ -615,6 +689,10 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         topic_id = TopicId(event.type, event.source)
         # Get the recipients for the topic.
         recipients = await self._subscription_manager.get_subscribed_recipients(topic_id)
+        if _constants.AGENT_RECIPIENTS_ATTR in event_attributes:
+            # The host shards agent types over several workers and lists the agents placed on this worker.
+            placed = set(json.loads(event_attributes[_constants.AGENT_RECIPIENTS_ATTR].ce_string))
+            recipients = [agent_id for agent_id in recipients if str(agent_id) in placed]
 
         message_content_type = event_attributes[_constants.DATA_CONTENT_TYPE_ATTR].ce_string
         message_type = event_attributes[_constants.DATA_SCHEMA_ATTR].ce_string
@@ -624,11 +702,7 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
                 event.binary_data, type_name=message_type, data_content_type=message_content_type
             )
         elif message_content_type == PROTOBUF_DATA_CONTENT_TYPE:
-            # TODO: find a way to prevent the roundtrip serialization
-            proto_binary_data = event.proto_data.SerializeToString()
-            message = self._serialization_registry.deserialize(
-                proto_binary_data, type_name=message_type, data_content_type=message_content_type
-            )
+            message = self._serialization_registry.deserialize_from_any(event.proto_data, type_name=message_type)
         else:
             raise ValueError(f"Unsupported message content type: {message_content_type}")
 
@@ -644,62 +718,70 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
 
         # Send the message to each recipient.
         responses: List[Awaitable[Any]] = []
-        for agent_id in recipients:
-            if agent_id == sender:
-                continue
-            message_context = MessageContext(
-                sender=sender,
-                topic_id=topic_id,
-                is_rpc=is_rpc,
-                cancellation_token=CancellationToken(),
-                message_id=event.id,
-            )
-            agent = await self._get_agent(agent_id)
-            with MessageHandlerContext.populate_context(agent.id):
-
-                def stringify_attributes(
-                    attributes: Mapping[str, cloudevent_pb2.CloudEvent.CloudEventAttributeValue],
-                ) -> Mapping[str, str]:
-                    result: Dict[str, str] = {}
-                    for key, value in attributes.items():
-                        item = None
-                        match value.WhichOneof("attr"):
-                            case "ce_boolean":
-                                item = str(value.ce_boolean)
-                            case "ce_integer":
-                                item = str(value.ce_integer)
-                            case "ce_string":
-                                item = value.ce_string
-                            case "ce_bytes":
-                                item = str(value.ce_bytes)
-                            case "ce_uri":
-                                item = value.ce_uri
-                            case "ce_uri_ref":
-                                item = value.ce_uri_ref
-                            case "ce_timestamp":
-                                item = str(value.ce_timestamp)
-                            case _:
-                                raise ValueError("Unknown attribute kind")
-                        result[key] = item
-
-                    return result
-
-                async def send_message(agent: Agent, message_context: MessageContext) -> Any:
-                    with self._trace_helper.trace_block(
-                        "process",
-                        agent.id,
-                        parent=stringify_attributes(event.attributes),
-                        extraAttributes={"message_type": message_type},
-                    ):
-                        await agent.on_message(message, ctx=message_context)
-
-                future = send_message(agent, message_context)
-            responses.append(future)
-        # Wait for all responses.
+        # Recipients are pinned until all handlers finish so they are not evicted mid-delivery.
+        pinned: List[AgentId] = []
         try:
-            await asyncio.gather(*responses)
-        except BaseException as e:
-            logger.error("Error handling event", exc_info=e)
+            for agent_id in recipients:
+                if agent_id == sender:
+                    continue
+                message_context = MessageContext(
+                    sender=sender,
+                    topic_id=topic_id,
+                    is_rpc=is_rpc,
+                    cancellation_token=CancellationToken(),
+                    message_id=event.id,
+                )
+                agent = await self._get_agent(agent_id)
+                self._instantiated_agents.pin(agent_id)
+                pinned.append(agent_id)
+                with MessageHandlerContext.populate_context(agent.id):
+
+                    def stringify_attributes(
+                        attributes: Mapping[str, cloudevent_pb2.CloudEvent.CloudEventAttributeValue],
+                    ) -> Mapping[str, str]:
+                        result: Dict[str, str] = {}
+                        for key, value in attributes.items():
+                            item = None
+                            match value.WhichOneof("attr"):
+                                case "ce_boolean":
+                                    item = str(value.ce_boolean)
+                                case "ce_integer":
+                                    item = str(value.ce_integer)
+                                case "ce_string":
+                                    item = value.ce_string
+                                case "ce_bytes":
+                                    item = str(value.ce_bytes)
+                                case "ce_uri":
+                                    item = value.ce_uri
+                                case "ce_uri_ref":
+                                    item = value.ce_uri_ref
+                                case "ce_timestamp":
+                                    item = str(value.ce_timestamp)
+                                case _:
+                                    raise ValueError("Unknown attribute kind")
+                            result[key] = item
+
+                        return result
+
+                    async def send_message(agent: Agent, message_context: MessageContext) -> Any:
+                        with self._trace_helper.trace_block(
+                            "process",
+                            agent.id,
+                            parent=stringify_attributes(event.attributes),
+                            extraAttributes={"message_type": message_type},
+                        ):
+                            await agent.on_message(message, ctx=message_context)
+
+                    future = send_message(agent, message_context)
+                responses.append(future)
+            # Wait for all responses.
+            try:
+                await asyncio.gather(*responses)
+            except BaseException as e:
+                logger.error("Error handling event", exc_info=e)
+        finally:
+            for agent_id in pinned:
+                self._instantiated_agents.unpin(agent_id)
 
     async def register_factory(
         self,
@@ -762,15 +844,16 @@ async def _invoke_agent_factory(
         return agent
 
     async def _get_agent(self, agent_id: AgentId) -> Agent:
-        if agent_id in self._instantiated_agents:
-            return self._instantiated_agents[agent_id]
+        agent = await self._instantiated_agents.get(agent_id)
+        if agent is not None:
+            return agent
 
         if agent_id.type not in self._agent_factories:
             raise ValueError(f"Agent with name {agent_id.type} not found.")
 
         agent_factory = self._agent_factories[agent_id.type]
         agent = await self._invoke_agent_factory(agent_factory, agent_id)
-        self._instantiated_agents[agent_id] = agent
+        await self._instantiated_agents.add(agent_id, agent)
         return agent
 
     # TODO: uncomment out the following type ignore when this is fixed in mypy: https://github.com/python/mypy/issues/3737
@@ -786,6 +869,11 @@ async def try_get_underlying_agent_instance(self, id: AgentId, type: Type[T] = A
 
         return agent_instance
 
+    async def remove_agent(self, id: AgentId) -> None:
+        """Close and remove the instance of an agent, along with its state saved by the agent lifecycle policy.
+        The agent is created again by its factory if it receives another message. Only the instance in this worker is removed."""
+        await self._instantiated_agents.remove(id)
+
     async def add_subscription(self, subscription: Subscription) -> None:
         if self._host_connection is None:
             raise RuntimeError("Host connection is not set.")
@@ -17,9 +17,63 @@
 
 
 class GrpcWorkerAgentRuntimeHost:
-    def __init__(self, address: str, extra_grpc_config: Optional[ChannelArgumentType] = None) -> None:
+    """A gRPC server that routes messages between :class:`GrpcWorkerAgentRuntime` workers.
+
+    Args:
+        address (str): The address to listen on.
+        extra_grpc_config (ChannelArgumentType, optional): Extra gRPC server options. Defaults to None.
+        shard_agent_types (bool, optional): Allow several workers to register the same agent type. Each
+            :class:`~autogen_core.AgentId` is routed to one of those workers by consistent hashing on its key. Adding
+            a worker moves about ``1 / workers`` of the keys to it, and the keys of a disconnected worker are spread
+            over the remaining ones. Agent state is not migrated when a key moves: the agent is created again on its
+            new worker without its previous state. Defaults to False.
+        message_queue_size (int, optional): The maximum number of messages buffered for each connected worker.
+            Delivering a message to a worker with a full buffer waits until the worker catches up. 0 means unbounded.
+            Defaults to 1000.
+        message_batch_size (int, optional): The maximum number of queued messages sent to a worker in one frame.
+            Only workers created with ``message_batch_size`` above 1 receive batches. Defaults to 64.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+
+
+            async def main() -> None:
+                host = GrpcWorkerAgentRuntimeHost(address="localhost:50051", shard_agent_types=True)
+                host.start()
+
+                # Both workers can register the same agent type; each key is handled by one of them.
+                workers = [GrpcWorkerAgentRuntime(host_address="localhost:50051") for _ in range(2)]
+                for worker in workers:
+                    await worker.start()
+                    # Register the same agent type on every worker here.
+
+                for worker in workers:
+                    await worker.stop()
+                await host.stop()
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        address: str,
+        extra_grpc_config: Optional[ChannelArgumentType] = None,
+        shard_agent_types: bool = False,
+        message_queue_size: int = 1000,
+        message_batch_size: int = 64,
+    ) -> None:
         self._server = grpc.aio.server(options=extra_grpc_config)
-        self._servicer = GrpcWorkerAgentRuntimeHostServicer()
+        self._servicer = GrpcWorkerAgentRuntimeHostServicer(
+            shard_agent_types=shard_agent_types,
+            message_queue_size=message_queue_size,
+            message_batch_size=message_batch_size,
+        )
         agent_worker_pb2_grpc.add_AgentRpcServicer_to_server(self._servicer, self._server)
         self._server.add_insecure_port(address)
         self._address = address
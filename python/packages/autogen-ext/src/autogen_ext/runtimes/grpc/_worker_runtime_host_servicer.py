@@ -1,17 +1,33 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 from abc import ABC, abstractmethod
 from asyncio import Future, Task
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Sequence, Set, Tuple, TypeVar
-
-from autogen_core import TopicId
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Generic,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from autogen_core import Subscription, TopicId
 from autogen_core._agent_id import AgentId
 from autogen_core._runtime_impl_helpers import SubscriptionManager
 
+from . import _constants
 from ._constants import GRPC_IMPORT_ERROR_STR
-from ._utils import subscription_from_proto, subscription_to_proto
+from ._hash_ring import ConsistentHashRing
+from ._utils import HandlerQueue, batch_messages, drain_queue, subscription_from_proto, subscription_to_proto
 
 try:
     import grpc
@@ -41,21 +57,31 @@ async def get_client_id_or_abort(context: grpc.aio.ServicerContext[Any, Any]) ->
     return client_id  # type: ignore
 
 
+def get_client_batch_size(context: grpc.aio.ServicerContext[Any, Any]) -> int:  # type: ignore
+    """The maximum batch size the client accepts, 1 if the client does not support batches."""
+    metadata = metadata_to_dict(context.invocation_metadata())  # type: ignore
+    try:
+        return max(1, int(metadata.get(_constants.MESSAGE_BATCH_SIZE_METADATA_KEY, 1)))
+    except ValueError:
+        return 1
+
+
 SendT = TypeVar("SendT")
 ReceiveT = TypeVar("ReceiveT")
 
 
 class ChannelConnection(ABC, Generic[SendT, ReceiveT]):
-    def __init__(self, request_iterator: AsyncIterator[ReceiveT], client_id: str) -> None:
+    def __init__(self, request_iterator: AsyncIterator[ReceiveT], client_id: str, max_queue_size: int = 0) -> None:
         self._request_iterator = request_iterator
         self._client_id = client_id
-        self._send_queue: asyncio.Queue[SendT] = asyncio.Queue()
+        # A full queue makes senders wait until the client catches up.
+        self._send_queue: asyncio.Queue[SendT] = asyncio.Queue(maxsize=max_queue_size)
         self._receiving_task = asyncio.create_task(self._receive_messages(client_id, request_iterator))
 
     async def _receive_messages(self, client_id: ClientConnectionId, request_iterator: AsyncIterator[ReceiveT]) -> None:
         # Receive messages from the client and process them.
         async for message in request_iterator:
-            logger.info(f"Received message from client {client_id}: {message}")
+            logger.debug("Received message from client %s: %s", client_id, message)
             await self._handle_message(message)
 
     def __aiter__(self) -> AsyncIterator[SendT]:
@@ -79,6 +105,10 @@ async def _handle_message(self, message: ReceiveT) -> None:
     async def send(self, message: SendT) -> None:
         await self._send_queue.put(message)
 
+    def drain(self, limit: int) -> List[SendT]:
+        """Take up to ``limit`` messages that are already queued, without waiting."""
+        return drain_queue(self._send_queue, limit)
+
 
 class CallbackChannelConnection(ChannelConnection[SendT, ReceiveT]):
     def __init__(
@@ -86,30 +116,61 @@ def __init__(
         request_iterator: AsyncIterator[ReceiveT],
         client_id: str,
         handle_callback: Callable[[ReceiveT], Awaitable[None]],
+        max_queue_size: int = 0,
     ) -> None:
         self._handle_callback = handle_callback
-        super().__init__(request_iterator, client_id)
+        super().__init__(request_iterator, client_id, max_queue_size=max_queue_size)
 
     async def _handle_message(self, message: ReceiveT) -> None:
         await self._handle_callback(message)
 
 
 class GrpcWorkerAgentRuntimeHostServicer(agent_worker_pb2_grpc.AgentRpcServicer):
-    """A gRPC servicer that hosts message delivery service for agents."""
+    """A gRPC servicer that hosts message delivery service for agents.
+
+    Args:
+        shard_agent_types (bool, optional): Allow several workers to register the same agent type. Messages for an
+            agent are routed to one of the workers by consistent hashing on the agent key. When a worker registers
+            the agent type, about ``1 / workers`` of the keys move to it, and when a worker disconnects, its keys
+            are spread over the remaining workers of the agent type. The state of the agents is not migrated: an
+            agent whose key moves is created again on its new worker without its previous state. Defaults to False,
+            in which case an agent type can only be registered by one worker.
+        message_queue_size (int, optional): The maximum number of messages buffered for each client, and of
+            events from each client being delivered at the same time. Delivering a message to a client with a full
+            buffer waits until the client catches up. Events received from a client while all its deliveries are
+            waiting are held in memory until one completes, so the host keeps reading the requests and responses
+            of the client. 0 means unbounded. Defaults to 1000.
+        message_batch_size (int, optional): The maximum number of queued messages sent to a client in one frame.
+            Messages are only batched for clients that advertise batch support when they open the channel.
+            Defaults to 64.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, shard_agent_types: bool = False, message_queue_size: int = 1000, message_batch_size: int = 64
+    ) -> None:
+        if message_queue_size < 0:
+            raise ValueError("message_queue_size must be a non-negative integer")
+        if message_batch_size < 1:
+            raise ValueError("message_batch_size must be a positive integer")
+        self._message_queue_size = message_queue_size
+        self._message_batch_size = message_batch_size
         self._data_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message]
         ] = {}
         self._control_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.ControlMessage, agent_worker_pb2.ControlMessage]
         ] = {}
+        self._shard_agent_types = shard_agent_types
         self._agent_type_to_client_id_lock = asyncio.Lock()
-        self._agent_type_to_client_id: Dict[str, ClientConnectionId] = {}
+        self._agent_type_to_client_ids: Dict[str, ConsistentHashRing[ClientConnectionId]] = {}
         self._pending_responses: Dict[ClientConnectionId, Dict[str, Future[Any]]] = {}
         self._background_tasks: Set[Task[Any]] = set()
         self._subscription_manager = SubscriptionManager()
         self._client_id_to_subscription_id_mapping: Dict[ClientConnectionId, set[str]] = {}
+        # Workers sharing an agent type add equal subscriptions. Only the first one is added to the
+        # subscription manager; the others are aliases of it, and it is removed with its last owner.
+        self._subscription_aliases: Dict[str, str] = {}
+        self._subscription_owners: Dict[str, Set[ClientConnectionId]] = {}
 
     async def OpenChannel(  # type: ignore
         self,
@@ -117,22 +178,27 @@ async def OpenChannel(  # type: ignore
         context: grpc.aio.ServicerContext[agent_worker_pb2.Message, agent_worker_pb2.Message],
     ) -> AsyncIterator[agent_worker_pb2.Message]:
         client_id = await get_client_id_or_abort(context)
+        max_batch_size = min(self._message_batch_size, get_client_batch_size(context))
+        # Caps the events of the client being delivered at the same time.
+        event_handlers = HandlerQueue(self._message_queue_size, self._start_handler)
 
         async def handle_callback(message: agent_worker_pb2.Message) -> None:
-            await self._receive_message(client_id, message)
+            await self._receive_message(client_id, message, event_handlers)
 
         connection = CallbackChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message](
-            request_iterator, client_id, handle_callback=handle_callback
+            request_iterator, client_id, handle_callback=handle_callback, max_queue_size=self._message_queue_size
         )
         self._data_connections[client_id] = connection
         logger.info(f"Client {client_id} connected.")
 
         try:
             async for message in connection:
-                yield message
+                # Send whatever else is already queued for the client in the same frame.
+                yield batch_messages([message, *connection.drain(max_batch_size - 1)])
         finally:
             # Clean up the client connection.
             del self._data_connections[client_id]
+            event_handlers.close()
             # Cancel pending requests sent to this client.
             for future in self._pending_responses.pop(client_id, {}).values():
                 future.cancel()
@@ -150,7 +216,7 @@ async def handle_callback(message: agent_worker_pb2.ControlMessage) -> None:
             await self._receive_control_message(client_id, message)
 
         connection = CallbackChannelConnection[agent_worker_pb2.ControlMessage, agent_worker_pb2.ControlMessage](
-            request_iterator, client_id, handle_callback=handle_callback
+            request_iterator, client_id, handle_callback=handle_callback, max_queue_size=self._message_queue_size
         )
         self._control_connections[client_id] = connection
         logger.info(f"Client {client_id} connected.")
@@ -164,56 +230,94 @@ async def handle_callback(message: agent_worker_pb2.ControlMessage) -> None:
 
     async def _on_client_disconnect(self, client_id: ClientConnectionId) -> None:
         async with self._agent_type_to_client_id_lock:
-            agent_types = [agent_type for agent_type, id_ in self._agent_type_to_client_id.items() if id_ == client_id]
+            agent_types = [
+                agent_type
+                for agent_type, client_ids in self._agent_type_to_client_ids.items()
+                if client_id in client_ids
+            ]
             for agent_type in agent_types:
-                logger.info(f"Removing agent type {agent_type} from agent type to client id mapping")
-                del self._agent_type_to_client_id[agent_type]
-            for sub_id in self._client_id_to_subscription_id_mapping.get(client_id, set()):
-                logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {id}")
+                client_ids = self._agent_type_to_client_ids[agent_type]
+                client_ids.remove(client_id)
+                if len(client_ids) == 0:
+                    logger.info(f"Removing agent type {agent_type} from agent type to client id mapping")
+                    del self._agent_type_to_client_ids[agent_type]
+                else:
+                    logger.info(
+                        f"Rebalancing agent type {agent_type} over {len(client_ids)} remaining client(s) after {client_id} disconnected"
+                    )
+            for sub_id in self._client_id_to_subscription_id_mapping.pop(client_id, set()):
+                logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {sub_id}")
                 try:
-                    await self._subscription_manager.remove_subscription(sub_id)
+                    await self._release_subscription(sub_id, client_id)
                 # Catch and ignore if the subscription does not exist.
                 except ValueError:
                     continue
         logger.info(f"Client {client_id} disconnected successfully")
 
+    def _get_client_id(self, agent_id: AgentId) -> ClientConnectionId | None:
+        """Get the client hosting the agent. Must be called while holding the agent type lock."""
+        client_ids = self._agent_type_to_client_ids.get(agent_id.type)
+        if client_ids is None:
+            return None
+        return client_ids.get(agent_id.key)
+
+    async def _release_subscription(self, subscription_id: str, client_id: ClientConnectionId) -> None:
+        canonical_id = self._subscription_aliases.pop(subscription_id, subscription_id)
+        owners = self._subscription_owners.get(canonical_id)
+        if owners is not None:
+            owners.discard(client_id)
+            if owners:
+                return
+            del self._subscription_owners[canonical_id]
+        await self._subscription_manager.remove_subscription(canonical_id)
+
     def _raise_on_exception(self, task: Task[Any]) -> None:
         exception = task.exception()
         if exception is not None:
             raise exception
 
-    async def _receive_message(self, client_id: ClientConnectionId, message: agent_worker_pb2.Message) -> None:
-        logger.info(f"Received message from client {client_id}: {message}")
+    def _start_handler(self, handler: Coroutine[Any, Any, None]) -> Task[None]:
+        """Run a message handler in the background."""
+        task = asyncio.create_task(handler)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._raise_on_exception)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _receive_message(
+        self,
+        client_id: ClientConnectionId,
+        message: agent_worker_pb2.Message,
+        event_handlers: HandlerQueue | None = None,
+    ) -> None:
         oneofcase = message.WhichOneof("message")
         match oneofcase:
+            case "batch":
+                for batched_message in message.batch.messages:
+                    await self._receive_message(client_id, batched_message, event_handlers)
             case "request":
                 request: agent_worker_pb2.RpcRequest = message.request
-                task = asyncio.create_task(self._process_request(request, client_id))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._raise_on_exception)
-                task.add_done_callback(self._background_tasks.discard)
+                # Requests and responses are not capped: running handlers may be waiting for them.
+                self._start_handler(self._process_request(request, client_id))
             case "response":
                 response: agent_worker_pb2.RpcResponse = message.response
-                task = asyncio.create_task(self._process_response(response, client_id))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._raise_on_exception)
-                task.add_done_callback(self._background_tasks.discard)
+                self._start_handler(self._process_response(response, client_id))
             case "cloudEvent":
-                task = asyncio.create_task(self._process_event(message.cloudEvent))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._raise_on_exception)
-                task.add_done_callback(self._background_tasks.discard)
+                if event_handlers is None:
+                    self._start_handler(self._process_event(message.cloudEvent))
+                else:
+                    event_handlers.submit(self._process_event(message.cloudEvent))
             case None:
                 logger.warning("Received empty message")
 
     async def _receive_control_message(
         self, client_id: ClientConnectionId, message: agent_worker_pb2.ControlMessage
     ) -> None:
-        logger.info(f"Received message from client {client_id}: {message}")
         destination = message.destination
         if destination.startswith("agentid="):
             agent_id = AgentId.from_str(destination[len("agentid=") :])
-            target_client_id = self._agent_type_to_client_id.get(agent_id.type)
+            async with self._agent_type_to_client_id_lock:
+                target_client_id = self._get_client_id(agent_id)
             if target_client_id is None:
                 logger.error(f"Agent client id not found for agent type {agent_id.type}.")
                 return
@@ -232,7 +336,7 @@ async def _receive_control_message(
     async def _process_request(self, request: agent_worker_pb2.RpcRequest, client_id: ClientConnectionId) -> None:
         # Deliver the message to a client given the target agent type.
         async with self._agent_type_to_client_id_lock:
-            target_client_id = self._agent_type_to_client_id.get(request.target.type)
+            target_client_id = self._get_client_id(AgentId(request.target.type, request.target.key))
         if target_client_id is None:
             logger.error(f"Agent {request.target.type} not found, failed to deliver message.")
             return
@@ -273,16 +377,28 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         recipients = await self._subscription_manager.get_subscribed_recipients(topic_id)
         # Get the client ids of the recipients.
         async with self._agent_type_to_client_id_lock:
-            client_ids: Set[ClientConnectionId] = set()
+            client_recipients: Dict[ClientConnectionId, List[AgentId]] = {}
+            is_sharded = False
             for recipient in recipients:
-                client_id = self._agent_type_to_client_id.get(recipient.type)
+                client_id = self._get_client_id(recipient)
                 if client_id is not None:
-                    client_ids.add(client_id)
+                    client_recipients.setdefault(client_id, []).append(recipient)
+                    is_sharded = is_sharded or len(self._agent_type_to_client_ids[recipient.type]) > 1
                 else:
                     logger.error(f"Agent {recipient.type} and its client not found for topic {topic_id}.")
         # Deliver the event to clients.
-        for client_id in client_ids:
-            await self._data_connections[client_id].send(agent_worker_pb2.Message(cloudEvent=event))
+        for client_id, client_recipient_ids in client_recipients.items():
+            if is_sharded:
+                # Workers sharing an agent type must only deliver to the agents placed on them.
+                client_event = cloudevent_pb2.CloudEvent()
+                client_event.CopyFrom(event)
+                client_event.attributes[_constants.AGENT_RECIPIENTS_ATTR].ce_string = json.dumps(
+                    [str(agent_id) for agent_id in client_recipient_ids]
+                )
+                message = agent_worker_pb2.Message(cloudEvent=client_event)
+            else:
+                message = agent_worker_pb2.Message(cloudEvent=event)
+            await self._data_connections[client_id].send(message)
 
     async def RegisterAgent(  # type: ignore
         self,
@@ -294,14 +410,20 @@ async def RegisterAgent(  # type: ignore
         client_id = await get_client_id_or_abort(context)
 
         async with self._agent_type_to_client_id_lock:
-            if request.type in self._agent_type_to_client_id:
-                existing_client_id = self._agent_type_to_client_id[request.type]
+            client_ids = self._agent_type_to_client_ids.get(request.type)
+            if client_ids is not None and (not self._shard_agent_types or client_id in client_ids):
+                existing_client_id = client_id if client_id in client_ids else client_ids.nodes[0]
                 await context.abort(
                     grpc.StatusCode.INVALID_ARGUMENT,
                     f"Agent type {request.type} already registered with client {existing_client_id}.",
                 )
+            elif client_ids is not None:
+                logger.info(f"Sharding agent type {request.type} over {len(client_ids) + 1} clients")
+                client_ids.add(client_id)
             else:
-                self._agent_type_to_client_id[request.type] = client_id
+                client_ids = ConsistentHashRing[ClientConnectionId]()
+                client_ids.add(client_id)
+                self._agent_type_to_client_ids[request.type] = client_ids
 
         return agent_worker_pb2.RegisterAgentTypeResponse()
 
@@ -317,12 +439,35 @@ async def AddSubscription(  # type: ignore
         subscription = subscription_from_proto(request.subscription)
         try:
             await self._subscription_manager.add_subscription(subscription)
-            subscription_ids = self._client_id_to_subscription_id_mapping.setdefault(client_id, set())
-            subscription_ids.add(subscription.id)
+            self._subscription_owners[subscription.id] = {client_id}
         except ValueError as e:
-            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            async with self._agent_type_to_client_id_lock:
+                existing = self._find_shared_subscription(subscription, client_id)
+            if existing is None:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+                return agent_worker_pb2.AddSubscriptionResponse()
+            self._subscription_aliases[subscription.id] = existing.id
+            self._subscription_owners[existing.id].add(client_id)
+        subscription_ids = self._client_id_to_subscription_id_mapping.setdefault(client_id, set())
+        subscription_ids.add(subscription.id)
         return agent_worker_pb2.AddSubscriptionResponse()
 
+    def _find_shared_subscription(
+        self, subscription: Subscription, client_id: ClientConnectionId
+    ) -> Subscription | None:
+        """Find the equal subscription added by another client that shares the agent type of the subscription.
+        Must be called while holding the agent type lock."""
+        if not self._shard_agent_types:
+            return None
+        for existing in self._subscription_manager.subscriptions:
+            if existing == subscription and existing.id != subscription.id:
+                owners = self._subscription_owners.get(existing.id, set())
+                agent_type = getattr(existing, "agent_type", None)
+                client_ids = self._agent_type_to_client_ids.get(agent_type) if isinstance(agent_type, str) else None
+                if client_id not in owners and client_ids is not None and client_id in client_ids:
+                    return existing
+        return None
+
     async def RemoveSubscription(  # type: ignore
         self,
         request: agent_worker_pb2.RemoveSubscriptionRequest,
@@ -330,8 +475,9 @@ async def RemoveSubscription(  # type: ignore
             agent_worker_pb2.RemoveSubscriptionRequest, agent_worker_pb2.RemoveSubscriptionResponse
         ],
     ) -> agent_worker_pb2.RemoveSubscriptionResponse:
-        _client_id = await get_client_id_or_abort(context)
-        await self._subscription_manager.remove_subscription(request.id)
+        client_id = await get_client_id_or_abort(context)
+        await self._release_subscription(request.id, client_id)
+        self._client_id_to_subscription_id_mapping.get(client_id, set()).discard(request.id)
         return agent_worker_pb2.RemoveSubscriptionResponse()
 
     async def GetSubscriptions(  # type: ignore
@@ -0,0 +1,77 @@
+import asyncio
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+
+@dataclass(frozen=True)
+class HttpClientSettings:
+    """The settings of a pooled client. Tools with equal settings share a client."""
+
+    base_url: str
+    timeout: float
+    max_connections: Optional[int]
+    max_keepalive_connections: Optional[int]
+    keepalive_expiry: Optional[float]
+    http2: bool
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    num_users: int = 0
+
+
+class HttpClientPool:
+    """Shares :class:`httpx.AsyncClient` instances, and so their keep-alive connections,
+    between the HTTP tools that send requests to the same base URL with the same client settings.
+
+    A client is created for the first tool that acquires it, and closed when the last tool releases it.
+    Clients are bound to the event loop they were created in, so each event loop has its own clients.
+    """
+
+    def __init__(self) -> None:
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[HttpClientSettings, _PooledClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def acquire(self, settings: HttpClientSettings) -> httpx.AsyncClient:
+        """Return the client for the settings in the running event loop, creating it if needed."""
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        pooled_client = clients.get(settings)
+        if pooled_client is None or pooled_client.client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=settings.timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.max_connections,
+                    max_keepalive_connections=settings.max_keepalive_connections,
+                    keepalive_expiry=settings.keepalive_expiry,
+                ),
+                http2=settings.http2,
+            )
+            pooled_client = clients[settings] = _PooledClient(client=client)
+        pooled_client.num_users += 1
+        return pooled_client.client
+
+    async def release(
+        self, settings: HttpClientSettings, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> None:
+        """Release a client acquired in the event loop, closing it if no other tool uses it."""
+        clients = self._clients.get(loop, {})
+        pooled_client = clients.get(settings)
+        if pooled_client is None or pooled_client.client is not client:
+            # The client was closed and replaced in the pool already.
+            return
+        pooled_client.num_users -= 1
+        if pooled_client.num_users <= 0:
+            del clients[settings]
+            # The connections of a client can only be closed in the event loop they were opened in.
+            if loop is asyncio.get_running_loop():
+                await client.aclose()
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+http_client_pool = HttpClientPool()
@@ -1,3 +1,5 @@
+import asyncio
+import json
 import re
 from typing import Any, Literal, Optional, Type
 
@@ -8,6 +10,8 @@
 from pydantic import BaseModel, Field
 from typing_extensions import Self
 
+from ._client_pool import HttpClientSettings, http_client_pool
+
 
 class HttpToolConfig(BaseModel):
     name: str
@@ -53,6 +57,32 @@ class HttpToolConfig(BaseModel):
     """
     The type of response to return from the tool.
     """
+    timeout: float = 60.0
+    """
+    The timeout of the requests in seconds. Defaults to 60 seconds.
+    """
+    max_connections: Optional[int] = 100
+    """
+    The maximum number of concurrent connections to the server, shared by the tools with the same client settings.
+    None means no limit.
+    """
+    max_keepalive_connections: Optional[int] = 20
+    """
+    The maximum number of idle connections kept alive for reuse. None means no limit.
+    """
+    keepalive_expiry: Optional[float] = 5.0
+    """
+    The number of seconds an idle connection is kept alive for. None means no limit.
+    """
+    http2: bool = False
+    """
+    Whether to use HTTP/2 if the server supports it. Requires the :code:`h2` package (:code:`httpx[http2]`).
+    """
+    max_response_bytes: Optional[int] = Field(default=None, ge=1)
+    """
+    The maximum number of bytes read from the response body. A longer text response is truncated,
+    and a longer JSON response raises an error. None means no limit.
+    """
 
 
 class HttpTool(BaseTool[BaseModel, Any], Component[HttpToolConfig]):
@@ -73,6 +103,19 @@ class HttpTool(BaseTool[BaseModel, Any], Component[HttpToolConfig]):
             Path parameters must also be included in the schema and must be strings.
         return_type (Literal["text", "json"], optional): The type of response to return from the tool.
             Defaults to "text".
+        timeout (float, optional): The timeout of the requests in seconds. Defaults to 60 seconds.
+        max_connections (int, optional): The maximum number of concurrent connections to the server. Defaults to 100.
+        max_keepalive_connections (int, optional): The maximum number of idle connections kept alive. Defaults to 20.
+        keepalive_expiry (float, optional): The number of seconds an idle connection is kept alive for. Defaults to 5 seconds.
+        http2 (bool, optional): Whether to use HTTP/2 if the server supports it. Requires the :code:`h2` package.
+            Defaults to False.
+        max_response_bytes (int, optional): The maximum number of bytes read from the response body.
+            A longer text response is truncated, and a longer JSON response raises an error.
+            Defaults to None, meaning the whole response is read.
+
+    The tools with the same scheme, host, port and client settings share an HTTP client, and so
+    reuse its keep-alive connections. Call :meth:`close` to release the client when the tool is no longer used;
+    the tool acquires it again if it is used after that.
 
     .. note::
         This tool requires the :code:`http-tool` extra for the :code:`autogen-ext` package.
@@ -148,6 +191,12 @@ def __init__(
         scheme: Literal["http", "https"] = "http",
         method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"] = "POST",
         return_type: Literal["text", "json"] = "text",
+        timeout: float = 60.0,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        max_response_bytes: Optional[int] = None,
     ) -> None:
         self.server_params = HttpToolConfig(
             name=name,
@@ -160,7 +209,24 @@ def __init__(
             headers=headers,
             json_schema=json_schema,
             return_type=return_type,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            max_response_bytes=max_response_bytes,
+        )
+        self._client_settings = HttpClientSettings(
+            base_url=f"{scheme}://{host}:{port}",
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
         )
+        # The pooled client used by the tool, and the event loop it was acquired in.
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
 
         # Use regex to find all path parameters, we will need those later to template the path
         path_params = {match.group(1) for match in re.finditer(r"{([^}]*)}", path)}
@@ -183,6 +249,22 @@ def _from_config(cls, config: HttpToolConfig) -> Self:
         copied_config = config.model_copy().model_dump()
         return cls(**copied_config)
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop or self._client.is_closed:
+            # Release the client acquired in another event loop first, so it is closed when no other tool uses it.
+            await self.close()
+            self._client = http_client_pool.acquire(self._client_settings)
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Release the HTTP client of the tool. The client is closed if no other tool uses it."""
+        if self._client is not None and self._client_loop is not None:
+            await http_client_pool.release(self._client_settings, self._client_loop, self._client)
+        self._client = None
+        self._client_loop = None
+
     async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> Any:
         """Execute the HTTP tool with the given arguments.
 
@@ -211,23 +293,44 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
             port=self.server_params.port,
             path=path,
         )
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            match self.server_params.method:
-                case "GET":
-                    response = await client.get(url, headers=self.server_params.headers, params=model_dump)
-                case "PUT":
-                    response = await client.put(url, headers=self.server_params.headers, json=model_dump)
-                case "DELETE":
-                    response = await client.delete(url, headers=self.server_params.headers, params=model_dump)
-                case "PATCH":
-                    response = await client.patch(url, headers=self.server_params.headers, json=model_dump)
-                case _:  # Default case POST
-                    response = await client.post(url, headers=self.server_params.headers, json=model_dump)
+        client = await self._get_client()
+        method = self.server_params.method or "POST"
+        match method:
+            case "GET" | "DELETE":
+                request = client.build_request(method, url, headers=self.server_params.headers, params=model_dump)
+            case _:  # POST, PUT and PATCH send the arguments in the body
+                request = client.build_request(method, url, headers=self.server_params.headers, json=model_dump)
+
+        response = await client.send(request, stream=True)
+        try:
+            content, truncated = await self._read_response(response)
+        finally:
+            await response.aclose()
 
         match self.server_params.return_type:
             case "text":
-                return response.text
+                text = content.decode(response.encoding or "utf-8", errors="replace")
+                if truncated:
+                    text += f"\n[Response truncated to {self.server_params.max_response_bytes} bytes]"
+                return text
             case "json":
-                return response.json()
+                if truncated:
+                    raise ValueError(f"The JSON response is longer than {self.server_params.max_response_bytes} bytes.")
+                return json.loads(content)
             case _:
                 raise ValueError(f"Invalid return type: {self.server_params.return_type}")
+
+    async def _read_response(self, response: httpx.Response) -> tuple[bytes, bool]:
+        """Read the body of a streamed response up to the size limit, and return it with whether it was truncated."""
+        max_bytes = self.server_params.max_response_bytes
+        if max_bytes is None:
+            return await response.aread(), False
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                # Stop reading, the rest of the body is discarded when the response is closed.
+                return b"".join(chunks)[:max_bytes], True
+        return b"".join(chunks), False
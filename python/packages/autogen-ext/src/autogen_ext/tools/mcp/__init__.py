@@ -1,4 +1,4 @@
-from ._actor import McpSessionActor
+from ._actor import McpSessionActor, McpSessionStats
 from ._config import McpServerParams, SseServerParams, StdioServerParams
 from ._factory import mcp_server_tools
 from ._session import create_mcp_server_session
@@ -9,6 +9,7 @@
 __all__ = [
     "create_mcp_server_session",
     "McpSessionActor",
+    "McpSessionStats",
     "StdioMcpToolAdapter",
     "StdioServerParams",
     "SseMcpToolAdapter",
@@ -1,19 +1,48 @@
 import asyncio
 import atexit
-from typing import Any, Coroutine, Dict, Mapping, TypedDict
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Coroutine, Dict, Mapping, Set, TypedDict
 
 from autogen_core import Component, ComponentBase
-from mcp.types import CallToolResult, ListToolsResult
+from mcp.shared.session import RequestResponder
+from mcp.types import (
+    CallToolResult,
+    ClientResult,
+    ListToolsResult,
+    ServerNotification,
+    ServerRequest,
+    ToolListChangedNotification,
+)
 from pydantic import BaseModel
 from typing_extensions import Self
 
 from ._config import McpServerParams
 from ._session import create_mcp_server_session
 
-McpResult = Coroutine[Any, Any, ListToolsResult] | Coroutine[Any, Any, CallToolResult]
+McpResult = ListToolsResult | CallToolResult
 McpFuture = asyncio.Future[McpResult]
 
 
+@dataclass
+class McpSessionStats:
+    """Request metrics of an MCP session."""
+
+    in_flight: int = 0
+    """The number of requests that have been sent and have not completed yet."""
+    num_requests: int = 0
+    """The number of completed requests."""
+    num_errors: int = 0
+    """The number of completed requests that raised an error or were cancelled."""
+    total_latency: float = 0.0
+    """The total time in seconds taken by the completed requests."""
+
+    @property
+    def mean_latency(self) -> float:
+        """The mean time in seconds taken by the completed requests."""
+        return self.total_latency / self.num_requests if self.num_requests else 0.0
+
+
 class McpActorArgs(TypedDict):
     name: str | None
     kargs: Mapping[str, Any]
@@ -24,6 +53,16 @@ class McpSessionActorConfig(BaseModel):
 
 
 class McpSessionActor(ComponentBase[BaseModel], Component[McpSessionActorConfig]):
+    """Runs an MCP client session in a background task and sends requests to it.
+
+    Requests are pipelined: each request is sent as soon as it is received, and several
+    requests can be waiting for their responses on the session at the same time.
+
+    Args:
+        server_params (McpServerParams): The parameters to connect to the MCP server.
+        on_tools_changed (Callable[[], None] | None): Called when the server notifies that its list of tools changed.
+    """
+
     component_type = "mcp_session_actor"
     component_config_schema = McpSessionActorConfig
     component_provider_override = "autogen_ext.tools.mcp.McpSessionActor"
@@ -32,30 +71,51 @@ class McpSessionActor(ComponentBase[BaseModel], Component[McpSessionActorConfig]
 
     # model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def __init__(self, server_params: McpServerParams) -> None:
+    def __init__(self, server_params: McpServerParams, on_tools_changed: Callable[[], None] | None = None) -> None:
         self.server_params: McpServerParams = server_params
+        self._on_tools_changed = on_tools_changed
         self.name = "mcp_session_actor"
         self.description = "MCP session actor"
         self._command_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
         self._actor_task: asyncio.Task[Any] | None = None
         self._shutdown_future: asyncio.Future[Any] | None = None
         self._active = False
+        self._requests: Set[asyncio.Task[McpResult]] = set()
+        self._stats = McpSessionStats()
+        self._last_used = time.monotonic()
         atexit.register(self._sync_shutdown)
 
+    @property
+    def stats(self) -> McpSessionStats:
+        """A snapshot of the request metrics of the session."""
+        return replace(self._stats)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the session is running and can take requests."""
+        return self._active and self._actor_task is not None and not self._actor_task.done()
+
+    @property
+    def idle_time(self) -> float:
+        """The number of seconds since the session last had a request in flight."""
+        if self._stats.in_flight > 0:
+            return 0.0
+        return time.monotonic() - self._last_used
+
     async def initialize(self) -> None:
         if not self._active:
             self._active = True
             self._actor_task = asyncio.create_task(self._run_actor())
 
     async def call(self, type: str, args: McpActorArgs | None = None) -> McpFuture:
+        """Send a request to the session and return a future of its result."""
         if not self._active:
             raise RuntimeError("MCP Actor not running, call initialize() first")
         if self._actor_task and self._actor_task.done():
             raise RuntimeError("MCP actor task crashed", self._actor_task.exception())
         fut: asyncio.Future[McpFuture] = asyncio.Future()
         if type in {"list_tools", "shutdown"}:
-            await self._command_queue.put({"type": type, "future": fut})
-            res = await fut
+            command: Dict[str, Any] = {"type": type, "future": fut}
         elif type == "call_tool":
             if args is None:
                 raise ValueError("args is required for call_tool")
@@ -63,49 +123,95 @@ async def call(self, type: str, args: McpActorArgs | None = None) -> McpFuture:
             kwargs = args.get("kargs", {})
             if name is None:
                 raise ValueError("name is required for call_tool")
-            await self._command_queue.put({"type": type, "name": name, "args": kwargs, "future": fut})
-            res = await fut
+            command = {"type": type, "name": name, "args": kwargs, "future": fut}
         else:
             raise ValueError(f"Unknown command type: {type}")
-        return res
+        if type != "shutdown":
+            # Count the request as soon as it is queued, so that a pool of sessions sees the load.
+            self._stats.in_flight += 1
+        await self._command_queue.put(command)
+        return await fut
 
     async def close(self) -> None:
         if not self._active or self._actor_task is None:
             return
+        # The actor task clears its reference when it exits, which may happen before the shutdown is awaited.
+        actor_task = self._actor_task
         self._shutdown_future = asyncio.Future()
         await self._command_queue.put({"type": "shutdown", "future": self._shutdown_future})
         await self._shutdown_future
-        await self._actor_task
+        await actor_task
         self._active = False
 
     async def _run_actor(self) -> None:
-        result: McpResult
+        result: Coroutine[Any, Any, McpResult]
         try:
-            async with create_mcp_server_session(self.server_params) as session:
+            async with create_mcp_server_session(self.server_params, message_handler=self._handle_message) as session:
                 await session.initialize()
                 while True:
                     cmd = await self._command_queue.get()
                     if cmd["type"] == "shutdown":
+                        # Requests still in flight cannot complete once the session is closed.
+                        for request in list(self._requests):
+                            request.cancel()
+                        await asyncio.gather(*self._requests, return_exceptions=True)
                         cmd["future"].set_result("ok")
                         break
                     elif cmd["type"] == "call_tool":
-                        try:
-                            result = session.call_tool(name=cmd["name"], arguments=cmd["args"])
-                            cmd["future"].set_result(result)
-                        except Exception as e:
-                            cmd["future"].set_exception(e)
+                        result = session.call_tool(name=cmd["name"], arguments=cmd["args"])
                     elif cmd["type"] == "list_tools":
-                        try:
-                            result = session.list_tools()
-                            cmd["future"].set_result(result)
-                        except Exception as e:
-                            cmd["future"].set_exception(e)
+                        result = session.list_tools()
+                    else:
+                        continue
+                    if cmd["future"].done():
+                        # The caller was cancelled before the request was sent.
+                        result.close()
+                        self._stats.in_flight -= 1
+                        continue
+                    # The session matches responses to requests by their id, so the request is sent without
+                    # waiting for the previous ones to complete.
+                    request = asyncio.ensure_future(self._send_request(result))
+                    self._requests.add(request)
+                    request.add_done_callback(self._requests.discard)
+                    cmd["future"].set_result(request)
         except Exception as e:
             if self._shutdown_future and not self._shutdown_future.done():
                 self._shutdown_future.set_exception(e)
         finally:
             self._active = False
             self._actor_task = None
+            # Fail the requests that were queued and never sent.
+            while not self._command_queue.empty():
+                cmd = self._command_queue.get_nowait()
+                if not cmd["future"].done():
+                    cmd["future"].set_exception(RuntimeError("MCP actor stopped before sending the request."))
+                if cmd["type"] != "shutdown":
+                    self._stats.in_flight -= 1
+
+    async def _send_request(self, request: Coroutine[Any, Any, McpResult]) -> McpResult:
+        """Await a request on the session and record its metrics."""
+        start_time = time.monotonic()
+        try:
+            return await request
+        except BaseException:
+            self._stats.num_errors += 1
+            raise
+        finally:
+            self._last_used = time.monotonic()
+            self._stats.in_flight -= 1
+            self._stats.num_requests += 1
+            self._stats.total_latency += self._last_used - start_time
+
+    async def _handle_message(
+        self, message: RequestResponder[ServerRequest, ClientResult] | ServerNotification | Exception
+    ) -> None:
+        """Handle the messages sent by the server outside of a response."""
+        if (
+            isinstance(message, ServerNotification)
+            and isinstance(message.root, ToolListChangedNotification)
+            and self._on_tools_changed is not None
+        ):
+            self._on_tools_changed()
 
     def _sync_shutdown(self) -> None:
         if not self._active or self._actor_task is None:
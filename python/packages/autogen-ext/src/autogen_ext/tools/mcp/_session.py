@@ -3,6 +3,7 @@
 from typing import AsyncGenerator
 
 from mcp import ClientSession
+from mcp.client.session import MessageHandlerFnT
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 
@@ -12,17 +13,21 @@
 @asynccontextmanager
 async def create_mcp_server_session(
     server_params: McpServerParams,
+    message_handler: MessageHandlerFnT | None = None,
 ) -> AsyncGenerator[ClientSession, None]:
-    """Create an MCP client session for the given server parameters."""
+    """Create an MCP client session for the given server parameters.
+
+    The optional `message_handler` receives the requests, notifications and errors sent by the server."""
     if isinstance(server_params, StdioServerParams):
         async with stdio_client(server_params) as (read, write):
             async with ClientSession(
                 read_stream=read,
                 write_stream=write,
                 read_timeout_seconds=timedelta(seconds=server_params.read_timeout_seconds),
+                message_handler=message_handler,
             ) as session:
                 yield session
     elif isinstance(server_params, SseServerParams):
         async with sse_client(**server_params.model_dump(exclude={"type"})) as (read, write):
-            async with ClientSession(read_stream=read, write_stream=write) as session:
+            async with ClientSession(read_stream=read, write_stream=write, message_handler=message_handler) as session:
                 yield session
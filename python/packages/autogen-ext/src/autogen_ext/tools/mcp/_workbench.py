@@ -15,12 +15,15 @@
 from pydantic import BaseModel
 from typing_extensions import Self
 
-from ._actor import McpSessionActor
+from ._actor import McpSessionActor, McpSessionStats
 from ._config import McpServerParams, SseServerParams, StdioServerParams
 
 
 class McpWorkbenchConfig(BaseModel):
     server_params: McpServerParams
+    tools_cache_ttl: float | None = None
+    max_sessions: int = 1
+    session_idle_timeout: float | None = None
 
 
 class McpWorkbenchState(BaseModel):
@@ -32,9 +35,25 @@ class McpWorkbench(Workbench, Component[McpWorkbenchConfig]):
     A workbench that wraps an MCP server and provides an interface
     to list and call tools provided by the server.
 
+    The list of tools is cached for the session with the server. The cache is discarded when the server
+    sends a `tools/list_changed` notification, when the workbench is restarted or reset, and
+    after `tools_cache_ttl` seconds if set.
+
     Args:
         server_params (McpServerParams): The parameters to connect to the MCP server.
             This can be either a :class:`StdioServerParams` or :class:`SseServerParams`.
+        tools_cache_ttl (float | None): The number of seconds the list of tools is cached for.
+            Defaults to None, meaning the list is cached until the tools change or the session ends.
+            Set to 0 to disable the cache.
+        max_sessions (int): The maximum number of sessions to the server used to call tools. Defaults to 1.
+            Requests are pipelined on each session. When every session has requests in flight and the limit
+            is not reached, a new session is started, which for a stdio server starts a new server process.
+            Tool calls are sent to the session with the fewest requests in flight.
+            Only use more than one session with servers that do not keep state between tool calls.
+        session_idle_timeout (float | None): The number of seconds after which an additional session without
+            requests in flight is closed. It is checked when a tool is called.
+            Defaults to None, meaning additional sessions are kept until the workbench is stopped.
+            The first session is always kept.
 
     Examples:
 
@@ -148,10 +167,27 @@ async def main() -> None:
     component_provider_override = "autogen_ext.tools.mcp.McpWorkbench"
     component_config_schema = McpWorkbenchConfig
 
-    def __init__(self, server_params: McpServerParams) -> None:
+    def __init__(
+        self,
+        server_params: McpServerParams,
+        tools_cache_ttl: float | None = None,
+        max_sessions: int = 1,
+        session_idle_timeout: float | None = None,
+    ) -> None:
+        if tools_cache_ttl is not None and tools_cache_ttl < 0:
+            raise ValueError("tools_cache_ttl must be non-negative.")
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1.")
+        if session_idle_timeout is not None and session_idle_timeout < 0:
+            raise ValueError("session_idle_timeout must be non-negative.")
         self._server_params = server_params
+        self._tools_cache_ttl = tools_cache_ttl
+        self._max_sessions = max_sessions
+        self._session_idle_timeout = session_idle_timeout
         # self._session: ClientSession | None = None
         self._actor: McpSessionActor | None = None
+        # The additional sessions used to call tools when max_sessions is more than 1.
+        self._pool_actors: List[McpSessionActor] = []
         self._read = None
         self._write = None
 
@@ -159,6 +195,12 @@ def __init__(self, server_params: McpServerParams) -> None:
     def server_params(self) -> McpServerParams:
         return self._server_params
 
+    @property
+    def session_stats(self) -> List[McpSessionStats]:
+        """The request metrics of each running session to the server, starting with the first session."""
+        actors = [self._actor, *self._pool_actors] if self._actor else []
+        return [actor.stats for actor in actors]
+
     async def list_tools(self) -> List[ToolSchema]:
         if not self._actor:
             await self.start()  # fallback to start the actor if not initialized instead of raising an error
@@ -166,6 +208,10 @@ async def list_tools(self) -> List[ToolSchema]:
             # raise RuntimeError("Actor is not initialized. Call start() first.")
         if self._actor is None:
             raise RuntimeError("Actor is not initialized. Please check the server connection.")
+        cached_tools = self._get_cached_tools()
+        if cached_tools is not None:
+            return cached_tools
+        cache_version = self._tools_cache_version
         result_future = await self._actor.call("list_tools", None)
         list_tool_result = await result_future
         assert isinstance(
@@ -187,6 +233,7 @@ async def list_tools(self) -> List[ToolSchema]:
                 parameters=parameters,
             )
             schema.append(tool_schema)
+        self._cache_tools(schema, cache_version, self._tools_cache_ttl)
         return schema
 
     async def call_tool(
@@ -203,7 +250,8 @@ async def call_tool(
         if not arguments:
             arguments = {}
         try:
-            result_future = await self._actor.call("call_tool", {"name": name, "kargs": arguments})
+            actor = await self._select_actor(self._actor)
+            result_future = await actor.call("call_tool", {"name": name, "kargs": arguments})
             cancellation_token.link_future(result_future)
             result = await result_future
             assert isinstance(
@@ -228,6 +276,32 @@ async def call_tool(
             result_parts = [TextResultContent(content=error_message)]
         return ToolResult(name=name, result=result_parts, is_error=is_error)
 
+    async def _select_actor(self, actor: McpSessionActor) -> McpSessionActor:
+        """Return the session with the fewest requests in flight, starting a new one if all of them are busy."""
+        # Close the additional sessions that stopped or have been idle for too long. They are all removed
+        # from the pool before any is closed, so concurrent callers do not find and remove them again.
+        stale_actors = [
+            pool_actor
+            for pool_actor in self._pool_actors
+            if not pool_actor.is_running
+            or (
+                self._session_idle_timeout is not None
+                and pool_actor.stats.in_flight == 0
+                and pool_actor.idle_time >= self._session_idle_timeout
+            )
+        ]
+        if stale_actors:
+            self._pool_actors = [pool_actor for pool_actor in self._pool_actors if pool_actor not in stale_actors]
+            for pool_actor in stale_actors:
+                await pool_actor.close()
+        actors = [actor, *self._pool_actors]
+        selected_actor = min(actors, key=lambda candidate: candidate.stats.in_flight)
+        if selected_actor.stats.in_flight > 0 and len(actors) < self._max_sessions:
+            selected_actor = McpSessionActor(self._server_params, on_tools_changed=self.invalidate_tools_cache)
+            self._pool_actors.append(selected_actor)
+            await selected_actor.initialize()
+        return selected_actor
+
     def _format_errors(self, error: Exception) -> str:
         """Recursively format errors into a string."""
 
@@ -251,7 +325,9 @@ async def start(self) -> None:
             return  # Already initialized, no need to start again
 
         if isinstance(self._server_params, (StdioServerParams, SseServerParams)):
-            self._actor = McpSessionActor(self._server_params)
+            # The tools of a new session may differ from the tools of a previous one.
+            self.invalidate_tools_cache()
+            self._actor = McpSessionActor(self._server_params, on_tools_changed=self.invalidate_tools_cache)
             await self._actor.initialize()
         else:
             raise ValueError(f"Unsupported server params type: {type(self._server_params)}")
@@ -261,11 +337,15 @@ async def stop(self) -> None:
             # Close the actor
             await self._actor.close()
             self._actor = None
+            for pool_actor in self._pool_actors:
+                await pool_actor.close()
+            self._pool_actors = []
+            self.invalidate_tools_cache()
         else:
             raise RuntimeError("McpWorkbench is not started. Call start() first.")
 
     async def reset(self) -> None:
-        pass
+        self.invalidate_tools_cache()
 
     async def save_state(self) -> Mapping[str, Any]:
         return McpWorkbenchState().model_dump()
@@ -274,8 +354,18 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
         pass
 
     def _to_config(self) -> McpWorkbenchConfig:
-        return McpWorkbenchConfig(server_params=self._server_params)
+        return McpWorkbenchConfig(
+            server_params=self._server_params,
+            tools_cache_ttl=self._tools_cache_ttl,
+            max_sessions=self._max_sessions,
+            session_idle_timeout=self._session_idle_timeout,
+        )
 
     @classmethod
     def _from_config(cls, config: McpWorkbenchConfig) -> Self:
-        return cls(server_params=config.server_params)
+        return cls(
+            server_params=config.server_params,
+            tools_cache_ttl=config.tools_cache_ttl,
+            max_sessions=config.max_sessions,
+            session_idle_timeout=config.session_idle_timeout,
+        )
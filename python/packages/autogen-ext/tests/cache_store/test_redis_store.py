@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -56,3 +56,27 @@ def test_redis_with_different_instances() -> None:
     store_1_config = store_1.dump_component()
     assert store_1_config.component_type == "cache_store"
     assert store_1_config.component_version == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_store_async() -> None:
+    from autogen_ext.cache_store.redis import RedisStore
+
+    redis_instance = MagicMock()
+    async_redis_instance = AsyncMock()
+    store = RedisStore[int](redis_instance, async_redis_instance)
+    await store.aset("test_key", 42)
+    async_redis_instance.set.assert_awaited_with("test_key", 42)
+    async_redis_instance.get.return_value = 42
+    assert await store.aget("test_key") == 42
+    async_redis_instance.get.return_value = None
+    assert await store.aget("non_existent_key", 99) == 99
+    redis_instance.set.assert_not_called()
+    redis_instance.get.assert_not_called()
+
+    # Without an async client the synchronous one is used from a worker thread.
+    store = RedisStore[int](redis_instance)
+    await store.aset("test_key", 5)
+    redis_instance.set.assert_called_with("test_key", 5)
+    redis_instance.get.return_value = 5
+    assert await store.aget("test_key") == 5
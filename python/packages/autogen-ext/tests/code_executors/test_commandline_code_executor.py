@@ -18,6 +18,7 @@
 from aiofiles import open
 from autogen_core import CancellationToken
 from autogen_core.code_executor import CodeBlock
+from autogen_ext.code_executors._common import CommandLineCodeResult
 from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
 
 HAS_POWERSHELL: bool = platform.system() == "Windows" and (
@@ -109,16 +110,20 @@ async def executor_and_temp_dir(
     request: pytest.FixtureRequest,
 ) -> AsyncGenerator[tuple[LocalCommandLineCodeExecutor, str], None]:
     with tempfile.TemporaryDirectory() as temp_dir:
-        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir)
+        if request.param == "warm":
+            executor = LocalCommandLineCodeExecutor(work_dir=temp_dir, warm_workers=1, warm_worker_max_uses=2)
+        else:
+            executor = LocalCommandLineCodeExecutor(work_dir=temp_dir)
         await executor.start()
         yield executor, temp_dir
+        await executor.stop()
 
 
 ExecutorFixture: TypeAlias = tuple[LocalCommandLineCodeExecutor, str]
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("executor_and_temp_dir", ["local"], indirect=True)
+@pytest.mark.parametrize("executor_and_temp_dir", ["local", "warm"], indirect=True)
 async def test_execute_code(executor_and_temp_dir: ExecutorFixture) -> None:
     executor, _temp_dir = executor_and_temp_dir
     cancellation_token = CancellationToken()
@@ -177,10 +182,11 @@ async def test_commandline_code_executor_timeout(executor_and_temp_dir: Executor
 
 
 @pytest.mark.asyncio
-async def test_commandline_code_executor_cancellation() -> None:
+@pytest.mark.parametrize("warm_workers", [0, 1])
+async def test_commandline_code_executor_cancellation(warm_workers: int) -> None:
     with tempfile.TemporaryDirectory() as temp_dir:
         cancellation_token = CancellationToken()
-        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir)
+        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir, warm_workers=warm_workers)
         await executor.start()
         # Write code that sleep for 10 seconds and then write "hello world!"
         # to a file.
@@ -202,6 +208,121 @@ async def test_commandline_code_executor_cancellation() -> None:
         # Check if the file is not created.
         hello_file = Path(temp_dir) / "hello.txt"
         assert not hello_file.exists()
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_warm_workers() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cancellation_token = CancellationToken()
+        executor = LocalCommandLineCodeExecutor(
+            timeout=2, work_dir=temp_dir, warm_workers=1, warm_worker_max_uses=2, preload_modules=["json"]
+        )
+        await executor.start()
+        try:
+            pid_code = "import os, sys; print(os.getpid(), 'json' in sys.modules, os.getcwd(), __name__)"
+            first = await executor.execute_code_blocks(
+                [CodeBlock(code=pid_code, language="python")], cancellation_token
+            )
+            assert first.exit_code == 0
+            pid, preloaded, cwd, name = first.output.split()
+            assert preloaded == "True"
+            assert Path(cwd).resolve() == Path(temp_dir).resolve()
+            assert name == "__main__"
+
+            # The process is reused once, then replaced.
+            second = await executor.execute_code_blocks(
+                [CodeBlock(code="import os; os.chdir('/'); " + pid_code, language="python")], cancellation_token
+            )
+            assert second.output.split()[0] == pid
+            third = await executor.execute_code_blocks(
+                [CodeBlock(code=pid_code, language="python")], cancellation_token
+            )
+            assert third.output.split()[0] != pid
+            # The working directory is restored for each code block.
+            assert Path(third.output.split()[2]).resolve() == Path(temp_dir).resolve()
+
+            # Exit codes and errors are reported as with a new process.
+            result = await executor.execute_code_blocks(
+                [CodeBlock(code="import sys; print('out'); sys.exit(3)", language="python")], cancellation_token
+            )
+            assert result.exit_code == 3 and "out" in result.output
+            result = await executor.execute_code_blocks(
+                [CodeBlock(code="raise ValueError('bad value')", language="python")], cancellation_token
+            )
+            assert result.exit_code == 1 and "ValueError: bad value" in result.output
+            assert "runpy" not in result.output
+
+            # Timeout kills the process.
+            result = await executor.execute_code_blocks(
+                [CodeBlock(code="import time; time.sleep(10)", language="python")], cancellation_token
+            )
+            assert result.exit_code == 124 and "Timeout" in result.output
+            result = await executor.execute_code_blocks(
+                [CodeBlock(code="print('hello world!')", language="python")], cancellation_token
+            )
+            assert result.exit_code == 0 and "hello world!" in result.output
+        finally:
+            await executor.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("warm_workers", [0, 1])
+async def test_max_output_bytes(warm_workers: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cancellation_token = CancellationToken()
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=temp_dir, warm_workers=warm_workers, max_output_bytes=100, spill_output=True
+        )
+        await executor.start()
+        try:
+            code = "print('start'); print('x' * 100000); print('end')"
+            result = await executor.execute_code_blocks([CodeBlock(code=code, language="python")], cancellation_token)
+            assert result.exit_code == 0
+            assert result.output.startswith("start\n")
+            assert result.output.endswith("end\n")
+            assert "bytes of output truncated" in result.output
+            assert len(result.output) < 300
+            assert result.code_file is not None
+            spill_file = Path(result.code_file).with_suffix(".stdout.log")
+            assert spill_file.read_text() == "start\n" + "x" * 100000 + "\nend\n"
+            assert spill_file.name in result.output
+
+            # Short output is kept whole.
+            result = await executor.execute_code_blocks(
+                [CodeBlock(code="print('hello world!')", language="python")], cancellation_token
+            )
+            assert result.output == "hello world!\n"
+        finally:
+            await executor.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("warm_workers", [0, 1])
+async def test_execute_code_blocks_stream(warm_workers: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cancellation_token = CancellationToken()
+        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir, warm_workers=warm_workers, max_output_bytes=20)
+        await executor.start()
+        try:
+            code = "import time\nfor i in range(3):\n    print('line', i, flush=True)\n    time.sleep(0.1)"
+            chunks: list[str] = []
+            results: list[CommandLineCodeResult] = []
+            async for item in executor.execute_code_blocks_stream(
+                [CodeBlock(code=code, language="python")], cancellation_token
+            ):
+                if isinstance(item, str):
+                    assert not results
+                    chunks.append(item)
+                else:
+                    results.append(item)
+            # The chunks hold the whole output, while the result holds the truncated output.
+            assert len(chunks) >= 3
+            assert "".join(chunks) == "line 0\nline 1\nline 2\n"
+            assert len(results) == 1 and results[0].exit_code == 0
+            assert "truncated" in results[0].output and results[0].output.endswith("line 2\n")
+        finally:
+            await executor.stop()
 
 
 @pytest.mark.asyncio
@@ -374,6 +374,34 @@ async def test_delete_tmp_files() -> None:
             assert not Path(result.code_file).exists()
 
 
+@pytest.mark.asyncio
+async def test_max_output_bytes_and_stream() -> None:
+    if not docker_tests_enabled():
+        pytest.skip("Docker tests are disabled")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        async with DockerCommandLineCodeExecutor(
+            work_dir=temp_dir, max_output_bytes=100, spill_output=True
+        ) as executor:
+            cancellation_token = CancellationToken()
+            code_blocks = [CodeBlock(code="print('start'); print('x' * 100000); print('end')", language="python")]
+            result = await executor.execute_code_blocks(code_blocks, cancellation_token)
+            assert result.exit_code == 0
+            assert result.output.startswith("start\n") and result.output.endswith("end\n")
+            assert "bytes of output truncated" in result.output
+            assert result.code_file is not None
+            spill_file = Path(result.code_file).with_suffix(".output.log")
+            assert spill_file.read_text() == "start\n" + "x" * 100000 + "\nend\n"
+
+            chunks: list[str] = []
+            async for item in executor.execute_code_blocks_stream(code_blocks, cancellation_token):
+                if isinstance(item, str):
+                    chunks.append(item)
+                else:
+                    assert item.exit_code == 0 and "truncated" in item.output
+            assert "".join(chunks) == "start\n" + "x" * 100000 + "\nend\n"
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("executor_and_temp_dir", ["docker"], indirect=True)
 async def test_docker_commandline_code_executor_with_multiple_tasks(
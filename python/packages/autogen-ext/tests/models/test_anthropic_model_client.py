@@ -2,9 +2,11 @@
 import logging
 import os
 from typing import List, Sequence
+from unittest.mock import AsyncMock
 
 import pytest
-from autogen_core import CancellationToken, FunctionCall
+from anthropic.types import Message, TextBlock, Usage
+from autogen_core import CancellationToken, FunctionCall, Image
 from autogen_core.models import (
     AssistantMessage,
     CreateResult,
@@ -16,6 +18,7 @@
 from autogen_core.models._types import LLMMessage
 from autogen_core.tools import FunctionTool
 from autogen_ext.models.anthropic import AnthropicChatCompletionClient
+from PIL import Image as PILImage
 
 
 def _pass_function(input: str) -> str:
@@ -652,3 +655,36 @@ def test_rstrip_railing_whitespace_at_last_assistant_content() -> None:
 
     assert isinstance(result[-1].content, str)
     assert result[-1].content == "foobar"
+
+
+@pytest.mark.asyncio
+async def test_anthropic_downscale_images() -> None:
+    client = AnthropicChatCompletionClient(
+        model="claude-3-5-sonnet-20241022", api_key="dummy-key", downscale_images=True, max_image_tokens=400
+    )
+    mock_create = AsyncMock(
+        return_value=Message(
+            id="msg_1",
+            content=[TextBlock(type="text", text="A black image.")],
+            model="claude-3-5-sonnet-20241022",
+            role="assistant",
+            stop_reason="end_turn",
+            type="message",
+            usage=Usage(input_tokens=10, output_tokens=5),
+        )
+    )
+    client._client.messages.create = mock_create  # type: ignore
+    image = Image.from_pil(PILImage.new("RGB", (4000, 3000)))
+
+    result = await client.create([UserMessage(content=["Describe the image.", image], source="user")])
+
+    assert result.content == "A black image."
+    sent_content = mock_create.call_args.kwargs["messages"][0]["content"]
+    sent_image = Image.from_base64(sent_content[1]["source"]["data"])
+    # About 400 tokens, at width * height / 750 tokens per image.
+    assert (sent_image.width, sent_image.height) == (632, 474)
+    assert sent_image.width * sent_image.height / 750 <= 400
+
+    config = client.dump_component().config
+    assert config["downscale_images"] is True
+    assert config["max_image_tokens"] == 400
@@ -1,7 +1,12 @@
+import asyncio
+import base64
 import copy
-from typing import List, Tuple, Union
+from io import BytesIO
+from typing import Any, AsyncGenerator, List, Tuple, Union, cast
+from unittest.mock import patch
 
 import pytest
+from autogen_core import Image, InMemoryStore
 from autogen_core.models import (
     ChatCompletionClient,
     CreateResult,
@@ -9,11 +14,29 @@
     SystemMessage,
     UserMessage,
 )
-from autogen_ext.models.cache import ChatCompletionCache
+from autogen_ext.models.cache import CHAT_CACHE_VALUE_TYPE, ChatCompletionCache
 from autogen_ext.models.replay import ReplayChatCompletionClient
+from PIL import Image as PILImage
 from pydantic import BaseModel
 
 
+class SlowReplayChatCompletionClient(ReplayChatCompletionClient):
+    """Replay client that counts upstream calls and waits before each response and streamed chunk."""
+
+    calls = 0
+
+    async def create(self, *args: Any, **kwargs: Any) -> CreateResult:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return await super().create(*args, **kwargs)
+
+    async def create_stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[Union[str, CreateResult], None]:
+        self.calls += 1
+        async for chunk in super().create_stream(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            yield chunk
+
+
 def get_test_data(
     num_messages: int = 3,
 ) -> Tuple[list[str], list[str], SystemMessage, ChatCompletionClient, ChatCompletionCache]:
@@ -184,3 +207,135 @@ async def test_cache_create_stream() -> None:
     # cached_client_config = cached_client.dump_component()
     # loaded_client = ChatCompletionCache.load_component(cached_client_config)
     # assert loaded_client.client == cached_client.client
+
+
+@pytest.mark.asyncio
+async def test_cache_create_single_flight() -> None:
+    responses = ["first", "second"]
+    replay_client = SlowReplayChatCompletionClient(responses)
+    replay_client.set_cached_bool_value(False)
+    cached_client = ChatCompletionCache(replay_client)
+    messages: List[LLMMessage] = [UserMessage(content="prompt", source="user")]
+
+    results = await asyncio.gather(*[cached_client.create(messages) for _ in range(5)])
+    assert replay_client.calls == 1
+    assert all(result.content == responses[0] for result in results)
+    assert [result.cached for result in results].count(False) == 1
+
+    # A waiter that is cancelled does not cancel the shared call.
+    leader = asyncio.create_task(cached_client.create([UserMessage(content="other", source="user")]))
+    waiter = asyncio.create_task(cached_client.create([UserMessage(content="other", source="user")]))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    assert (await leader).content == responses[1]
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert replay_client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_create_single_flight_leader_cancelled() -> None:
+    replay_client = SlowReplayChatCompletionClient(["first", "second"])
+    replay_client.set_cached_bool_value(False)
+    cached_client = ChatCompletionCache(replay_client)
+    messages: List[LLMMessage] = [UserMessage(content="prompt", source="user")]
+
+    leader = asyncio.create_task(cached_client.create(messages))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(cached_client.create(messages))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    # The waiter makes the call itself.
+    result = await waiter
+    assert not result.cached
+    assert replay_client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_single_flight() -> None:
+    replay_client = SlowReplayChatCompletionClient(["This is the streamed response", "second"])
+    replay_client.set_cached_bool_value(False)
+    store = InMemoryStore[CHAT_CACHE_VALUE_TYPE]()
+    cached_client = ChatCompletionCache(replay_client, store)
+    messages: List[LLMMessage] = [UserMessage(content="prompt", source="user")]
+
+    async def consume() -> List[Union[str, CreateResult]]:
+        return [copy.copy(chunk) async for chunk in cached_client.create_stream(messages)]
+
+    _, cache_key = await cached_client._check_cache(messages, [], None, {})  # type: ignore[reportPrivateUsage]
+    leader = asyncio.create_task(consume())
+    await asyncio.sleep(0.025)
+    # Nothing is cached until the stream is complete.
+    assert store.get(cache_key) is None
+    # A late joiner still receives the chunks that were already streamed.
+    results = await asyncio.gather(leader, consume(), consume())
+    assert replay_client.calls == 1
+    assert store.get(cache_key) is not None
+    for chunks in results:
+        assert chunks[:-1] == results[0][:-1]
+        final = chunks[-1]
+        assert isinstance(final, CreateResult)
+        assert final.content == "This is the streamed response"
+    assert [cast(CreateResult, chunks[-1]).cached for chunks in results] == [False, True, True]
+
+
+def test_cache_key() -> None:
+    from autogen_ext.models.cache._cache_key import CacheKeyBuilder
+
+    builder = CacheKeyBuilder()
+    pixels = PILImage.new("RGB", (8, 8), color=(10, 20, 30))
+
+    def request(text: str, color: Tuple[int, int, int] = (10, 20, 30)) -> List[LLMMessage]:
+        return [
+            SystemMessage(content="This is a system prompt"),
+            UserMessage(content=[text, Image.from_pil(PILImage.new("RGB", (8, 8), color=color))], source="user"),
+        ]
+
+    # Keys are versioned and do not depend on the process or on object identity.
+    text_key = builder.request_key([SystemMessage(content="This is a system prompt")], [], None, {"temperature": 0.5})
+    assert text_key == "v3-c8b59beb8cc45078d318f9b2d5310ff0f6508fca95b7a3fd265e6c7a2e173c54"
+    key = builder.request_key(request("hello"), [], None, {"temperature": 0.5})
+    assert key == CacheKeyBuilder().request_key(request("hello"), [], None, {"temperature": 0.5})
+    assert key == builder.request_key(
+        [request("hello")[0], UserMessage(content=["hello", Image.from_pil(pixels)], source="user")],
+        [],
+        None,
+        {"temperature": 0.5},
+    )
+    assert key != builder.request_key(request("hello!"), [], None, {"temperature": 0.5})
+    assert key != builder.request_key(request("hello", color=(10, 20, 31)), [], None, {"temperature": 0.5})
+    assert key != builder.request_key(request("hello"), [], True, {"temperature": 0.5})
+    assert key != builder.request_key(request("hello"), [], None, {"temperature": 0.6})
+
+
+def test_cache_config_keeps_store_limits() -> None:
+    replay_client = ReplayChatCompletionClient(["response"])
+    cached_client = ChatCompletionCache(replay_client, InMemoryStore[CHAT_CACHE_VALUE_TYPE](max_size=8, ttl=60))
+    loaded = ChatCompletionCache.load_component(cached_client.dump_component())
+    assert isinstance(loaded.store, InMemoryStore)
+    assert loaded.store.dump_component().config == {"max_size": 8, "ttl": 60}
+
+
+def test_cache_key_does_not_decode_images() -> None:
+    from autogen_ext.models.cache._cache_key import CacheKeyBuilder
+
+    buffer = BytesIO()
+    PILImage.new("RGB", (8, 8), color=(10, 20, 30)).save(buffer, format="JPEG")
+    image = Image.from_base64(base64.b64encode(buffer.getvalue()).decode())
+    key = CacheKeyBuilder().request_key([UserMessage(content=["hello", image], source="user")], [], None, {})
+    assert key.startswith("v3-")
+    # The key is computed from the encoded image, which is kept as is.
+    assert image._image is None  # type: ignore[reportPrivateUsage]
+
+
+def test_cache_key_memoized() -> None:
+    from autogen_ext.models.cache._cache_key import CacheKeyBuilder
+
+    builder = CacheKeyBuilder()
+    messages: List[LLMMessage] = [UserMessage(content=f"message {i}", source="user") for i in range(3)]
+    builder.request_key(messages, [], None, {})
+    with patch.object(builder, "_model_digest", wraps=builder._model_digest) as model_digest:  # type: ignore[reportPrivateUsage]
+        messages.append(UserMessage(content="message 3", source="user"))
+        builder.request_key(messages, [], None, {})
+        # Only the new message is digested.
+        assert model_digest.call_count == 1
@@ -5,7 +5,7 @@
 import httpx
 import pytest
 import pytest_asyncio
-from autogen_core import FunctionCall
+from autogen_core import FunctionCall, Image
 from autogen_core.models import (
     AssistantMessage,
     CreateResult,
@@ -18,6 +18,7 @@
 from autogen_ext.models.ollama._ollama_client import OLLAMA_VALID_CREATE_KWARGS_KEYS, convert_tools
 from httpx import Response
 from ollama import AsyncClient, ChatResponse, Message, Tool
+from PIL import Image as PILImage
 from pydantic import BaseModel
 
 
@@ -98,6 +99,34 @@ async def _mock_chat(*args: Any, **kwargs: Any) -> ChatResponse:
     assert create_result.content == content_raw
 
 
+@pytest.mark.asyncio
+async def test_create_with_max_image_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = "llava"
+    chat_kwargs: Dict[str, Any] = {}
+
+    async def _mock_chat(*args: Any, **kwargs: Any) -> ChatResponse:
+        chat_kwargs.update(kwargs)
+        return ChatResponse(
+            model=model,
+            done=True,
+            done_reason="stop",
+            message=Message(role="assistant", content="A black image."),
+        )
+
+    monkeypatch.setattr(AsyncClient, "chat", _mock_chat)
+    client = OllamaChatCompletionClient(model=model, max_image_size=672)
+    image = Image.from_pil(PILImage.new("RGB", (2000, 1000)))
+    create_result = await client.create(
+        messages=[UserMessage(content=["Describe the image.", image], source="user")],
+    )
+    assert create_result.content == "A black image."
+    sent_images = chat_kwargs["messages"][0].images
+    assert sent_images is not None
+    sent_image = Image.from_base64(sent_images[0].value)
+    assert (sent_image.width, sent_image.height) == (672, 336)
+    assert client.dump_component().config["max_image_size"] == 672
+
+
 @pytest.mark.asyncio
 async def test_create_stream(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
     model = "llama3.2"
@@ -7,6 +7,7 @@
 
 import httpx
 import pytest
+import tiktoken
 from autogen_core import CancellationToken, FunctionCall, Image
 from autogen_core.models import (
     AssistantMessage,
@@ -25,8 +26,11 @@
 from autogen_ext.models.openai._model_info import resolve_model
 from autogen_ext.models.openai._openai_client import (
     BaseOpenAIChatCompletionClient,
+    TokenCountCache,
     calculate_vision_tokens,
     convert_tools,
+    count_message_tokens_openai,
+    count_tokens_openai,
     to_oai_type,
 )
 from autogen_ext.models.openai._transformation import TransformerMap, get_transformer
@@ -58,6 +62,7 @@
 from openai.types.chat.parsed_chat_completion import ParsedChatCompletion, ParsedChatCompletionMessage, ParsedChoice
 from openai.types.chat.parsed_function_tool_call import ParsedFunction, ParsedFunctionToolCall
 from openai.types.completion_usage import CompletionUsage
+from PIL import Image as PILImage
 from pydantic import BaseModel, Field
 
 ResponseFormatT = TypeVar("ResponseFormatT", bound=BaseModel)
@@ -407,6 +412,73 @@ def tool2(test1: int, test2: List[int]) -> str:
     assert remaining_tokens
 
 
+def test_count_tokens_openai_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A byte level encoding, so the test does not download a tokenizer.
+    encoding = tiktoken.Encoding(
+        name="test_bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+    encode = MagicMock(wraps=encoding.encode)
+    encode_batch = MagicMock(wraps=encoding.encode_batch)
+    monkeypatch.setattr(encoding, "encode", encode)
+    monkeypatch.setattr(encoding, "encode_batch", encode_batch)
+    monkeypatch.setattr("autogen_ext.models.openai._openai_client._get_encoding", lambda model: encoding)
+    monkeypatch.setattr("autogen_ext.models.openai._openai_client.calculate_vision_tokens", lambda image: 85)
+
+    messages: List[LLMMessage] = [
+        SystemMessage(content="Hello"),
+        UserMessage(content="Hello", source="user"),
+        AssistantMessage(content="Hello", source="assistant"),
+        UserMessage(
+            content=[
+                "str1",
+                Image.from_base64(
+                    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAIAAACQd1PeAAAADElEQVR4nGP4z8AAAAMBAQDJ/pLvAAAAAElFTkSuQmCC"
+                ),
+            ],
+            source="user",
+        ),
+        FunctionExecutionResultMessage(
+            content=[FunctionExecutionResult(content="Hello", call_id="1", is_error=False, name="tool1")]
+        ),
+        AssistantMessage(content=[FunctionCall(id="1", arguments='{"a": 1}', name="tool1")], source="assistant"),
+    ]
+
+    def tool1(test: str, test2: str) -> str:
+        return test + test2
+
+    def tool2(test1: int, test2: List[int]) -> str:
+        return str(test1) + str(test2)
+
+    tools = [FunctionTool(tool1, description="example tool 1"), FunctionTool(tool2, description="example tool 2")]
+
+    # The count without a cache is the count of the implementation before caching.
+    assert count_tokens_openai(messages, "gpt-4o", tools=tools, model_family=ModelFamily.GPT_4O) == 442
+
+    cache = TokenCountCache()
+    assert count_tokens_openai(messages, "gpt-4o", tools=tools, model_family=ModelFamily.GPT_4O, cache=cache) == 442
+    assert len(cache) == len(messages) + len(tools)
+    # Texts of uncached messages are encoded in one batch.
+    assert encode_batch.call_count == 2
+
+    encode.reset_mock()
+    encode_batch.reset_mock()
+    assert count_tokens_openai(messages, "gpt-4o", tools=tools, model_family=ModelFamily.GPT_4O, cache=cache) == 442
+    encode.assert_not_called()
+    encode_batch.assert_not_called()
+
+    # Per-message counts add up to the prompt count without the reply priming and tools.
+    per_message = count_message_tokens_openai(messages, "gpt-4o", model_family=ModelFamily.GPT_4O, cache=cache)
+    assert len(per_message) == len(messages)
+    assert sum(per_message) + 15 == count_tokens_openai(messages, "gpt-4o", model_family=ModelFamily.GPT_4O)
+
+    small_cache = TokenCountCache(maxsize=2)
+    count_message_tokens_openai(messages, "gpt-4o", model_family=ModelFamily.GPT_4O, cache=small_cache)
+    assert len(small_cache) == 2
+
+
 @pytest.mark.parametrize(
     "mock_size, expected_num_tokens",
     [
@@ -418,18 +490,52 @@ def tool2(test1: int, test2: List[int]) -> str:
     ],
 )
 def test_openai_count_image_tokens(mock_size: Tuple[int, int], expected_num_tokens: int) -> None:
-    # Step 1: Mock the Image class with only the 'image' attribute
-    mock_image_attr = MagicMock()
-    mock_image_attr.size = mock_size
-
+    # Step 1: Mock the Image class with only the 'width' and 'height' attributes
     mock_image = MagicMock()
-    mock_image.image = mock_image_attr
+    mock_image.width, mock_image.height = mock_size
 
     # Directly call calculate_vision_tokens and check the result
     calculated_tokens = calculate_vision_tokens(mock_image, detail="auto")
     assert calculated_tokens == expected_num_tokens
 
 
+@pytest.mark.parametrize(
+    "max_image_tokens, expected_size",
+    [
+        (None, (1024, 768)),
+        (500, (682, 512)),
+        (100, (512, 384)),
+    ],
+)
+def test_openai_downscale_images(max_image_tokens: int | None, expected_size: Tuple[int, int]) -> None:
+    client = OpenAIChatCompletionClient(
+        model="gpt-4o", api_key="api_key", downscale_images=True, max_image_tokens=max_image_tokens
+    )
+    image = Image.from_pil(PILImage.new("RGB", (4000, 3000)))
+    small_image = Image.from_pil(PILImage.new("RGB", (200, 100)))
+    messages: List[LLMMessage] = [
+        UserMessage(content=["Describe the images.", image, small_image], source="user"),
+        UserMessage(content="Thanks!", source="user"),
+    ]
+
+    create_params = client._process_create_args(messages, [], None, {})  # pyright: ignore[reportPrivateUsage]
+    content = create_params.messages[0]["content"]
+    assert isinstance(content, list)
+    sent_image = Image.from_uri(content[1]["image_url"]["url"])  # type: ignore
+    assert (sent_image.width, sent_image.height) == expected_size
+    # Images that are small enough are sent as is, and the messages passed in are left unchanged.
+    assert content[2]["image_url"]["url"] == small_image.data_uri  # type: ignore
+    assert messages[0].content[1] is image  # type: ignore
+
+    # The downscaled image is cached, so it is not resized again for the next request.
+    create_params = client._process_create_args(messages, [], None, {})  # pyright: ignore[reportPrivateUsage]
+    assert create_params.messages[0]["content"][1]["image_url"]["url"] == content[1]["image_url"]["url"]  # type: ignore
+
+    config = client.dump_component().config
+    assert config["downscale_images"] is True
+    assert config.get("max_image_tokens") == max_image_tokens
+
+
 def test_convert_tools_accepts_both_func_tool_and_schema() -> None:
     def my_function(arg: str, other: Annotated[int, "int arg"], nonrequired: int = 5) -> MyResult:
         return MyResult(result="test")
@@ -1596,6 +1702,71 @@ async def _mock_create(*args: Any, **kwargs: Any) -> ChatCompletion | AsyncGener
     assert chunks[-1].thought == "Hello Another Hello Yet Another Hello"
 
 
+@pytest.mark.asyncio
+async def test_tool_calling_with_stream_on_function_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _tool_call_chunk(index: int, call_id: str | None, name: str | None, arguments: str) -> ChunkChoice:
+        return ChunkChoice(
+            finish_reason=None,
+            index=0,
+            delta=ChoiceDelta(
+                content=None,
+                role="assistant",
+                tool_calls=[
+                    ChoiceDeltaToolCall(
+                        index=index,
+                        id=call_id,
+                        type="function" if call_id else None,
+                        function=ChoiceDeltaToolCallFunction(name=name, arguments=arguments),
+                    )
+                ],
+            ),
+        )
+
+    chunk_choices = [
+        _tool_call_chunk(0, "1", "_pass_function", '{"input": '),
+        _tool_call_chunk(0, None, None, '"task1"}'),
+        _tool_call_chunk(1, "2", "_pass_function", '{"input": '),
+        _tool_call_chunk(1, None, None, '"task2"}'),
+        ChunkChoice(finish_reason="tool_calls", index=0, delta=ChoiceDelta(content=None, role="assistant")),
+    ]
+    num_chunks_sent = 0
+
+    async def _mock_create_stream(*args: Any, **kwargs: Any) -> AsyncGenerator[ChatCompletionChunk, None]:
+        nonlocal num_chunks_sent
+        model = resolve_model(kwargs.get("model", "gpt-4o"))
+        for chunk_choice in chunk_choices:
+            num_chunks_sent += 1
+            yield ChatCompletionChunk(
+                id="id",
+                choices=[chunk_choice],
+                created=0,
+                model=model,
+                object="chat.completion.chunk",
+                usage=None,
+            )
+
+    async def _mock_create(*args: Any, **kwargs: Any) -> AsyncGenerator[ChatCompletionChunk, None]:
+        return _mock_create_stream(*args, **kwargs)
+
+    monkeypatch.setattr(AsyncCompletions, "create", _mock_create)
+
+    model_client = OpenAIChatCompletionClient(model="gpt-4o", api_key="")
+    pass_tool = FunctionTool(_pass_function, description="pass tool.")
+    received: List[Tuple[int, FunctionCall]] = []
+    chunks: List[str | CreateResult] = []
+    async for chunk in model_client.create_stream(
+        messages=[UserMessage(content="Hello", source="user")],
+        tools=[pass_tool],
+        on_function_call=lambda call: received.append((num_chunks_sent, call)),
+    ):
+        chunks.append(chunk)
+    # The first function call is passed on as soon as the second one starts.
+    assert received[0] == (3, FunctionCall(id="1", arguments='{"input": "task1"}', name="_pass_function"))
+    assert received[1] == (5, FunctionCall(id="2", arguments='{"input": "task2"}', name="_pass_function"))
+    assert isinstance(chunks[-1], CreateResult)
+    assert chunks[-1].content == [call for _, call in received]
+
+
 @pytest.fixture()
 def openai_client(request: pytest.FixtureRequest) -> OpenAIChatCompletionClient:
     model = request.node.callspec.params["model"]  # type: ignore
@@ -21,6 +21,9 @@
     type_subscription,
 )
 from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+from autogen_ext.runtimes.grpc._hash_ring import ConsistentHashRing
+from autogen_ext.runtimes.grpc._utils import batch_messages, drain_queue, unbatch_message
+from autogen_ext.runtimes.grpc.protos import agent_worker_pb2
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -513,6 +516,72 @@ async def test_proto_payloads() -> None:
     await host.stop()
 
 
+def test_consistent_hash_ring_placement() -> None:
+    ring = ConsistentHashRing[str]()
+    for node in ["w1", "w2", "w3"]:
+        ring.add(node)
+    keys = [f"session-{i}" for i in range(1000)]
+    placement = {key: ring.get(key) for key in keys}
+    # Every node gets a share of the keys.
+    assert set(placement.values()) == {"w1", "w2", "w3"}
+
+    # Removing a node only moves the keys that were placed on it.
+    ring.remove("w2")
+    for key in keys:
+        if placement[key] != "w2":
+            assert ring.get(key) == placement[key]
+        else:
+            assert ring.get(key) in {"w1", "w3"}
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_sharded_agent_type_multiple_workers() -> None:
+    host_address = "localhost:50062"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, shard_agent_types=True)
+    host.start()
+    workers = [GrpcWorkerAgentRuntime(host_address=host_address) for _ in range(2)]
+    publisher = GrpcWorkerAgentRuntime(host_address=host_address)
+    publisher.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    try:
+        for worker in workers:
+            await worker.start()
+            worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+            await worker.register_factory(
+                type=AgentType("shared"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+            )
+            await worker.add_subscription(TypeSubscription("default", "shared"))
+        await publisher.start()
+
+        keys = [f"key{i}" for i in range(20)]
+        for key in keys:
+            await publisher.publish_message(MessageType(), topic_id=TopicId("default", key))
+        # Direct messages follow the same placement as published ones.
+        for key in keys:
+            await publisher.send_message(MessageType(), AgentId("shared", key))
+
+        calls_per_worker: List[int] = [0, 0]
+        for key in keys:
+            calls: List[int] = []
+            for worker in workers:
+                agent = await worker.try_get_underlying_agent_instance(AgentId("shared", key), type=LoopbackAgent)
+                calls.append(agent.num_calls)
+            # Each key is handled by exactly one worker, which receives both messages.
+            assert sorted(calls) == [0, 2]
+            calls_per_worker[calls.index(2)] += 1
+        assert all(calls > 0 for calls in calls_per_worker)
+
+        # The remaining worker takes over all keys when the other one disconnects.
+        await workers[0].stop()
+        await asyncio.sleep(1)
+        for key in keys:
+            await publisher.send_message(MessageType(), AgentId("shared", key))
+    finally:
+        await workers[1].stop()
+        await publisher.stop()
+        await host.stop()
+
+
 # TODO add tests for failure to deserialize
 
 
@@ -577,6 +646,163 @@ async def test_grpc_max_message_size() -> None:
         await host.stop()
 
 
+def test_message_batch_envelope() -> None:
+    messages = [agent_worker_pb2.Message(request=agent_worker_pb2.RpcRequest(request_id=str(i))) for i in range(3)]
+    assert batch_messages(messages[:1]) is messages[0]
+    assert unbatch_message(messages[0]) == (messages[0],)
+
+    batch = batch_messages(messages)
+    assert batch.WhichOneof("message") == "batch"
+    assert [message.request.request_id for message in unbatch_message(batch)] == ["0", "1", "2"]
+
+    queue = asyncio.Queue[int]()
+    for i in range(5):
+        queue.put_nowait(i)
+    assert drain_queue(queue, 3) == [0, 1, 2]
+    assert drain_queue(queue, 3) == [3, 4]
+    assert drain_queue(queue, 3) == []
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_batched_bounded_streams() -> None:
+    host_address = "localhost:50063"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, message_queue_size=4, message_batch_size=16)
+    host.start()
+
+    # Worker 1 batches and uses small queues, worker 2 does not batch.
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address, message_queue_size=4, message_batch_size=16)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address, message_queue_size=4)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+    await worker2.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker2.add_subscription(TypeSubscription("default", "name2"))
+
+    try:
+        # A burst larger than the queues: senders wait for room instead of buffering without bound.
+        await asyncio.gather(
+            *[worker1.publish_message(MessageType(), topic_id=TopicId("default", "default")) for _ in range(50)]
+        )
+        await asyncio.sleep(2)
+
+        worker1_agent = await worker1.try_get_underlying_agent_instance(AgentId("name1", "default"), LoopbackAgent)
+        assert worker1_agent.num_calls == 50
+        worker2_agent = await worker2.try_get_underlying_agent_instance(AgentId("name2", "default"), LoopbackAgent)
+        assert worker2_agent.num_calls == 50
+    finally:
+        await worker1.stop()
+        await worker2.stop()
+        await host.stop()
+
+
+class _SlowAgent(RoutedAgent):
+    def __init__(self, release: asyncio.Event) -> None:
+        super().__init__("A slow agent")
+        self._release = release
+        self.num_started = 0
+        self.num_finished = 0
+
+    @event
+    async def on_message_type(self, message: MessageType, ctx: MessageContext) -> None:
+        self.num_started += 1
+        await self._release.wait()
+        self.num_finished += 1
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_slow_handlers_are_capped() -> None:
+    host_address = "localhost:50064"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    publisher = GrpcWorkerAgentRuntime(host_address=host_address)
+    worker = GrpcWorkerAgentRuntime(host_address=host_address, message_queue_size=2)
+    for runtime in (publisher, worker):
+        await runtime.start()
+        runtime.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    release = asyncio.Event()
+    await worker.register_factory(
+        type=AgentType("slow"), agent_factory=lambda: _SlowAgent(release), expected_class=_SlowAgent
+    )
+    await worker.add_subscription(TypeSubscription("default", "slow"))
+
+    try:
+        for _ in range(10):
+            await publisher.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+        await asyncio.sleep(1)
+
+        # Only two handlers run, and the read loop keeps reading: the other events wait for a handler.
+        agent = await worker.try_get_underlying_agent_instance(AgentId("slow", "default"), _SlowAgent)
+        assert agent.num_started == 2
+        assert worker._event_handlers.num_waiting == 8  # type: ignore[reportPrivateUsage]
+
+        release.set()
+        await asyncio.sleep(1)
+        assert agent.num_finished == 10
+    finally:
+        release.set()
+        await publisher.stop()
+        await worker.stop()
+        await host.stop()
+
+
+class _NestedRpcAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent sending a request for each event")
+        self.num_finished = 0
+
+    @event
+    async def on_message_type(self, message: MessageType, ctx: MessageContext) -> None:
+        await self.send_message(MessageType(), AgentId("loopback", "default"))
+        self.num_finished += 1
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_nested_rpc_with_all_handlers_busy() -> None:
+    host_address = "localhost:50065"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, message_queue_size=4)
+    host.start()
+
+    publisher = GrpcWorkerAgentRuntime(host_address=host_address)
+    worker = GrpcWorkerAgentRuntime(host_address=host_address, message_queue_size=4)
+    for runtime in (publisher, worker):
+        await runtime.start()
+        runtime.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await worker.register_factory(
+        type=AgentType("nested"), agent_factory=lambda: _NestedRpcAgent(), expected_class=_NestedRpcAgent
+    )
+    await worker.add_subscription(TypeSubscription("default", "nested"))
+    await worker.register_factory(
+        type=AgentType("loopback"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+
+    try:
+        # More events than handler slots, each waiting for a request to an agent of the same worker:
+        # the requests and their responses must still be read while all the handlers are busy.
+        for _ in range(8):
+            await publisher.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+        agent = await worker.try_get_underlying_agent_instance(AgentId("nested", "default"), _NestedRpcAgent)
+
+        async def _wait_for_handlers() -> None:
+            while agent.num_finished < 8:
+                await asyncio.sleep(0.1)
+
+        await asyncio.wait_for(_wait_for_handlers(), timeout=10)
+    finally:
+        await publisher.stop()
+        await worker.stop()
+        await host.stop()
+
+
 if __name__ == "__main__":
     os.environ["GRPC_VERBOSITY"] = "DEBUG"
     os.environ["GRPC_TRACE"] = "all"
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 
@@ -180,6 +181,67 @@ async def test_invalid_request(test_config: ComponentModel, test_server: None) -
         await tool.run_json({"query": "test query", "value": 42}, CancellationToken())
 
 
+@pytest.mark.asyncio
+async def test_shared_client(test_config: ComponentModel, test_server: None) -> None:
+    tool_1 = HttpTool.load_component(test_config)
+    tool_2 = HttpTool.load_component(test_config)
+
+    await tool_1.run_json({"query": "test query", "value": 1}, CancellationToken())
+    await tool_2.run_json({"query": "test query", "value": 2}, CancellationToken())
+    # The tools with the same base URL and client settings share a client.
+    client = tool_1._client  # type: ignore[reportPrivateUsage]
+    assert client is not None
+    assert client is tool_2._client  # type: ignore[reportPrivateUsage]
+
+    # The client is closed when the last tool releases it.
+    await tool_1.close()
+    assert not client.is_closed
+    await tool_2.close()
+    assert client.is_closed
+
+    # A closed tool acquires a new client.
+    result = await tool_1.run_json({"query": "test query", "value": 3}, CancellationToken())
+    assert json.loads(result)["result"] == "Received: test query with value 3"
+    await tool_1.close()
+
+
+@pytest.mark.asyncio
+async def test_max_response_bytes(test_config: ComponentModel, test_server: None) -> None:
+    config = test_config.model_copy()
+    config.config["max_response_bytes"] = 10
+    tool = HttpTool.load_component(config)
+    result = await tool.run_json({"query": "test query", "value": 42}, CancellationToken())
+    assert result == '{"result":\n[Response truncated to 10 bytes]'
+    await tool.close()
+
+    config.config["return_type"] = "json"
+    tool = HttpTool.load_component(config)
+    with pytest.raises(ValueError):
+        await tool.run_json({"query": "test query", "value": 42}, CancellationToken())
+    await tool.close()
+
+
+@pytest.mark.asyncio
+async def test_client_released_in_other_event_loop(test_config: ComponentModel, test_server: None) -> None:
+    tool = HttpTool.load_component(test_config)
+    await tool.run_json({"query": "test query", "value": 1}, CancellationToken())
+    client = tool._client  # type: ignore[reportPrivateUsage]
+    assert client is not None
+
+    # Running the tool in another event loop releases the client of this loop, which closes it.
+    result = await asyncio.to_thread(
+        asyncio.run, tool.run_json({"query": "test query", "value": 2}, CancellationToken())
+    )
+    assert json.loads(result)["result"] == "Received: test query with value 2"
+    assert tool._client is not client  # type: ignore[reportPrivateUsage]
+    await asyncio.sleep(0.1)
+    assert client.is_closed
+
+    result = await tool.run_json({"query": "test query", "value": 3}, CancellationToken())
+    assert json.loads(result)["result"] == "Received: test query with value 3"
+    await tool.close()
+
+
 def test_config_serialization(test_config: ComponentModel) -> None:
     tool = HttpTool.load_component(test_config)
     config = tool.dump_component()
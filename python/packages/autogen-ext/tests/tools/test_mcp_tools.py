@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+from typing import Any, List
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -18,10 +20,14 @@
 from mcp import ClientSession, Tool
 from mcp.types import (
     Annotations,
+    CallToolResult,
     EmbeddedResource,
     ImageContent,
+    ListToolsResult,
+    ServerNotification,
     TextContent,
     TextResourceContents,
+    ToolListChangedNotification,
 )
 from pydantic.networks import AnyUrl
 
@@ -284,6 +290,152 @@ async def test_adapter_from_factory_existing_session(
     assert isinstance(tools[0], StdioMcpToolAdapter)
 
 
+@pytest.mark.asyncio
+async def test_mcp_workbench_tools_cache(
+    sample_tool: Tool,
+    sample_server_params: StdioServerParams,
+    mock_session: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the workbench caches the list of tools until the server notifies a change."""
+    message_handlers: List[Any] = []
+
+    def _create_session(*args: Any, message_handler: Any = None, **kwargs: Any) -> AsyncMock:
+        message_handlers.append(message_handler)
+        mock_context = AsyncMock()
+        mock_context.__aenter__.return_value = mock_session
+        return mock_context
+
+    monkeypatch.setattr("autogen_ext.tools.mcp._actor.create_mcp_server_session", _create_session)
+    mock_session.list_tools.return_value = ListToolsResult(tools=[sample_tool])
+
+    workbench = McpWorkbench(server_params=sample_server_params)
+    await workbench.start()
+    try:
+        tools = await workbench.list_tools()
+        assert [tool["name"] for tool in tools] == ["test_tool"]
+        assert await workbench.list_tools() == tools
+        assert mock_session.list_tools.call_count == 1
+
+        # The server notifies that the list of tools changed.
+        await message_handlers[0](
+            ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed"))
+        )
+        await workbench.list_tools()
+        assert mock_session.list_tools.call_count == 2
+    finally:
+        await workbench.stop()
+
+    # A new session lists the tools again.
+    await workbench.start()
+    try:
+        await workbench.list_tools()
+        assert mock_session.list_tools.call_count == 3
+    finally:
+        await workbench.stop()
+
+    # The cache is disabled with a TTL of 0.
+    workbench = McpWorkbench(server_params=sample_server_params, tools_cache_ttl=0)
+    await workbench.start()
+    try:
+        await workbench.list_tools()
+        await workbench.list_tools()
+        assert mock_session.list_tools.call_count == 5
+    finally:
+        await workbench.stop()
+
+
+@pytest.mark.asyncio
+async def test_mcp_workbench_session_pool(
+    sample_server_params: StdioServerParams,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that tool calls are pipelined on a session and spread over a pool of sessions."""
+    release = asyncio.Event()
+    sessions: List[AsyncMock] = []
+
+    async def _call_tool(*args: Any, **kwargs: Any) -> CallToolResult:
+        await release.wait()
+        return CallToolResult(content=[TextContent(type="text", text="test_output")])
+
+    def _create_session(*args: Any, **kwargs: Any) -> AsyncMock:
+        session = AsyncMock(spec=ClientSession)
+        session.initialize = AsyncMock()
+        session.call_tool = AsyncMock(side_effect=_call_tool)
+        sessions.append(session)
+        mock_context = AsyncMock()
+        mock_context.__aenter__.return_value = session
+        return mock_context
+
+    monkeypatch.setattr("autogen_ext.tools.mcp._actor.create_mcp_server_session", _create_session)
+
+    workbench = McpWorkbench(server_params=sample_server_params, max_sessions=2, session_idle_timeout=0)
+    await workbench.start()
+    try:
+        calls = [asyncio.ensure_future(workbench.call_tool("test_tool", {"test_param": str(i)})) for i in range(3)]
+        while sum(session.call_tool.call_count for session in sessions) < 3:
+            await asyncio.sleep(0.01)
+        # The calls are spread over two sessions, and pipelined on them.
+        assert len(sessions) == 2
+        assert [stats.in_flight for stats in workbench.session_stats] == [2, 1]
+
+        release.set()
+        results = await asyncio.gather(*calls)
+        assert [result.to_text() for result in results] == ["test_output"] * 3
+        assert [stats.num_requests for stats in workbench.session_stats] == [2, 1]
+
+        # The idle additional session is closed at the next call.
+        await workbench.call_tool("test_tool", {"test_param": "3"})
+        assert len(workbench.session_stats) == 1
+    finally:
+        await workbench.stop()
+
+    with pytest.raises(ValueError):
+        McpWorkbench(server_params=sample_server_params, max_sessions=0)
+
+
+@pytest.mark.asyncio
+async def test_mcp_workbench_session_pool_concurrent_cleanup(
+    sample_server_params: StdioServerParams,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that concurrent calls closing idle sessions do not close the same session twice."""
+    release = asyncio.Event()
+    sessions: List[AsyncMock] = []
+
+    async def _call_tool(*args: Any, **kwargs: Any) -> CallToolResult:
+        await release.wait()
+        return CallToolResult(content=[TextContent(type="text", text="test_output")])
+
+    def _create_session(*args: Any, **kwargs: Any) -> AsyncMock:
+        session = AsyncMock(spec=ClientSession)
+        session.initialize = AsyncMock()
+        session.call_tool = AsyncMock(side_effect=_call_tool)
+        sessions.append(session)
+        mock_context = AsyncMock()
+        mock_context.__aenter__.return_value = session
+        return mock_context
+
+    monkeypatch.setattr("autogen_ext.tools.mcp._actor.create_mcp_server_session", _create_session)
+
+    workbench = McpWorkbench(server_params=sample_server_params, max_sessions=3, session_idle_timeout=0)
+    await workbench.start()
+    try:
+        calls = [asyncio.ensure_future(workbench.call_tool("test_tool", {"test_param": str(i)})) for i in range(3)]
+        while sum(session.call_tool.call_count for session in sessions) < 3:
+            await asyncio.sleep(0.01)
+        assert len(workbench.session_stats) == 3
+        release.set()
+        await asyncio.gather(*calls)
+
+        # Both calls find the two idle additional sessions and close them.
+        results = await asyncio.gather(*[workbench.call_tool("test_tool", {"test_param": str(i)}) for i in range(2)])
+        assert [result.is_error for result in results] == [False, False]
+        assert len(workbench.session_stats) == 1
+    finally:
+        await workbench.stop()
+
+
 @pytest.mark.asyncio
 async def test_sse_adapter_config_serialization(sample_sse_tool: Tool) -> None:
     """Test that SSE adapter can be saved to and loaded from config."""
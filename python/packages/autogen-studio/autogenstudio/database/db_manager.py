@@ -1,12 +1,18 @@
+import asyncio
+import functools
+import hashlib
 import json
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
 
 from loguru import logger
-from sqlalchemy import exc, inspect, text
-from sqlmodel import Session, SQLModel, and_, create_engine, select
+from pydantic import BaseModel
+from sqlalchemy import URL, exc, inspect, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import Session, SQLModel, and_, create_engine, delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..datamodel import BaseDBModel, Response, Team
 from ..teammanager import TeamManager
@@ -20,6 +26,38 @@ def default(self, obj):
         return super().default(obj)
 
 
+_T = TypeVar("_T")
+
+
+def _async_engine_url(engine_uri: str) -> Optional[URL]:
+    """Return the URL of the database with an async driver, or None if it has no supported async driver"""
+    url = make_url(engine_uri)
+    backend = url.get_backend_name()
+    if backend == "sqlite" and url.database not in (None, "", ":memory:"):
+        return url.set(drivername="sqlite+aiosqlite")
+    if backend == "postgresql":
+        # psycopg 3 supports asyncio natively
+        return url.set(drivername="postgresql+psycopg")
+    return None
+
+
+def _component_hash(component: Union[BaseModel, dict]) -> str:
+    """Return a hash of a component config, equal for configs with equal content"""
+    if isinstance(component, BaseModel):
+        component = component.model_dump(mode="json")
+    content = json.dumps(component, sort_keys=True, cls=CustomJSONEncoder)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _filter_conditions(model_class: type[BaseDBModel], filters: Optional[dict]) -> List[Any]:
+    """Return the conditions matching the filters. A list of values matches any of the values."""
+    conditions = []
+    for col, value in (filters or {}).items():
+        column = getattr(model_class, col)
+        conditions.append(column.in_(value) if isinstance(value, (list, tuple, set)) else column == value)
+    return conditions
+
+
 class DatabaseManager:
     _init_lock = threading.Lock()
 
@@ -28,11 +66,16 @@ def __init__(self, engine_uri: str, base_dir: Optional[Union[str, Path]] = None)
         Initialize DatabaseManager with database connection settings.
         Does not perform any database operations.
 
+        The `*_async` methods run on a pooled async engine (aiosqlite for SQLite, psycopg for PostgreSQL),
+        or in a worker thread for databases without a supported async driver, so they do not block the event loop.
+
         Args:
             engine_uri: Database connection URI (e.g. sqlite:///db.sqlite3)
             base_dir: Base directory for migration files. If None, uses current directory
         """
-        connection_args = {"check_same_thread": True} if "sqlite" in engine_uri else {}
+        # Sessions are short-lived and may be opened from worker threads, so pooled SQLite connections
+        # must be usable from threads other than the one that created them.
+        connection_args = {"check_same_thread": False} if "sqlite" in engine_uri else {}
 
         if base_dir is not None and isinstance(base_dir, str):
             base_dir = Path(base_dir)
@@ -40,6 +83,15 @@ def __init__(self, engine_uri: str, base_dir: Optional[Union[str, Path]] = None)
         self.engine = create_engine(
             engine_uri, connect_args=connection_args, json_serializer=lambda obj: json.dumps(obj, cls=CustomJSONEncoder)
         )
+        self.async_engine: Optional[AsyncEngine] = None
+        async_url = _async_engine_url(engine_uri)
+        if async_url is not None:
+            try:
+                self.async_engine = create_async_engine(
+                    async_url, json_serializer=lambda obj: json.dumps(obj, cls=CustomJSONEncoder)
+                )
+            except ImportError as e:
+                logger.warning(f"Async database driver not available, async calls will use worker threads: {e}")
         self.schema_manager = SchemaManager(
             engine=self.engine,
             base_dir=base_dir,
@@ -151,6 +203,19 @@ def reset_db(self, recreate_tables: bool = True) -> Response:
                 self._init_lock.release()
                 logger.info("Database reset lock released")
 
+    async def _run_async(self, operation: Callable[[Session], _T]) -> _T:
+        """Run a database operation on a new session without blocking the event loop"""
+        if self.async_engine is None:
+
+            def run() -> _T:
+                with Session(self.engine) as session:
+                    return operation(session)
+
+            return await asyncio.to_thread(run)
+
+        async with AsyncSession(self.async_engine) as session:
+            return await session.run_sync(operation)
+
     def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
         """Create or update an entity
 
@@ -162,27 +227,37 @@ def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
         Returns:
             Response: Contains status, message and data (either dict or SQLModel based on return_json)
         """
+        with Session(self.engine) as session:
+            return self._upsert(session, model, return_json)
+
+    async def upsert_async(self, model: BaseDBModel, return_json: bool = True) -> Response:
+        """Create or update an entity without blocking the event loop, see `upsert`"""
+        return await self._run_async(functools.partial(self._upsert, model=model, return_json=return_json))
+
+    def _upsert(self, session: Session, model: BaseDBModel, return_json: bool) -> Response:
         status = True
         model_class = type(model)
         existing_model = None
 
-        with Session(self.engine) as session:
-            try:
-                existing_model = session.exec(select(model_class).where(model_class.id == model.id)).first()
-                if existing_model:
-                    model.updated_at = datetime.now()
-                    for key, value in model.model_dump().items():
-                        setattr(existing_model, key, value)
-                    model = existing_model
-                    session.add(model)
-                else:
-                    session.add(model)
-                session.commit()
-                session.refresh(model)
-            except Exception as e:
-                session.rollback()
-                logger.error("Error while updating/creating " + str(model_class.__name__) + ": " + str(e))
-                status = False
+        if isinstance(model, Team):
+            model.component_hash = _component_hash(model.component)
+
+        try:
+            existing_model = session.exec(select(model_class).where(model_class.id == model.id)).first()
+            if existing_model:
+                model.updated_at = datetime.now()
+                for key, value in model.model_dump().items():
+                    setattr(existing_model, key, value)
+                model = existing_model
+                session.add(model)
+            else:
+                session.add(model)
+            session.commit()
+            session.refresh(model)
+        except Exception as e:
+            session.rollback()
+            logger.error("Error while updating/creating " + str(model_class.__name__) + ": " + str(e))
+            status = False
 
         return Response(
             message=(
@@ -194,6 +269,31 @@ def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
             data=model.model_dump() if return_json else model,
         )
 
+    def bulk_insert(self, models: Sequence[BaseDBModel]) -> Response:
+        """Create entities in a single transaction
+
+        Args:
+            models (Sequence[SQLModel]): The new model instances to create
+
+        Returns:
+            Response: Contains status and message. No entity is created if any of them fails.
+        """
+        status = True
+        status_message = f"{len(models)} entities Created Successfully"
+
+        # The instances are not refreshed after the commit, so keep their loaded attributes usable.
+        with Session(self.engine, expire_on_commit=False) as session:
+            try:
+                session.add_all(models)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                status = False
+                status_message = f"Error while creating entities: {e}"
+                logger.error(status_message)
+
+        return Response(message=status_message, status=status, data=None)
+
     def _model_to_dict(self, model_obj):
         return {col.name: getattr(model_obj, col.name) for col in model_obj.__table__.columns}
 
@@ -204,69 +304,177 @@ def get(
         return_json: bool = False,
         order: str = "desc",
     ):
-        """List entities"""
+        """List entities
+
+        Args:
+            model_class: The model class of the entities
+            filters: Column values the entities must have. A list of values matches any of the values.
+            return_json: If True, returns the entities as dictionaries
+            order: Order of the entities by creation time, "asc" or "desc"
+        """
         with Session(self.engine) as session:
-            result = []
-            status = True
-            status_message = ""
+            return self._get(session, model_class, filters, return_json, order)
 
-            try:
-                statement = select(model_class)  # type: ignore
-                if filters:
-                    conditions = [getattr(model_class, col) == value for col, value in filters.items()]
-                    statement = statement.where(and_(*conditions))
-
-                if hasattr(model_class, "created_at") and order:
-                    order_by_clause = getattr(model_class.created_at, order)()  # Dynamically apply asc/desc
-                    statement = statement.order_by(order_by_clause)
-
-                items = session.exec(statement).all()
-                result = [self._model_to_dict(item) if return_json else item for item in items]
-                status_message = f"{model_class.__name__} Retrieved Successfully"
-            except Exception as e:
-                session.rollback()
-                status = False
-                status_message = f"Error while fetching {model_class.__name__}"
-                logger.error("Error while getting items: " + str(model_class.__name__) + " " + str(e))
+    async def get_async(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict | None = None,
+        return_json: bool = False,
+        order: str = "desc",
+    ) -> Response:
+        """List entities without blocking the event loop, see `get`"""
+        return await self._run_async(
+            functools.partial(self._get, model_class=model_class, filters=filters, return_json=return_json, order=order)
+        )
+
+    def _get(
+        self, session: Session, model_class: type[BaseDBModel], filters: dict | None, return_json: bool, order: str
+    ) -> Response:
+        result = []
+        status = True
+        status_message = ""
+
+        try:
+            statement = select(model_class)  # type: ignore
+            if filters:
+                statement = statement.where(and_(*_filter_conditions(model_class, filters)))
+
+            if hasattr(model_class, "created_at") and order:
+                order_by_clause = getattr(model_class.created_at, order)()  # Dynamically apply asc/desc
+                statement = statement.order_by(order_by_clause)
+
+            items = session.exec(statement).all()
+            result = [self._model_to_dict(item) if return_json else item for item in items]
+            status_message = f"{model_class.__name__} Retrieved Successfully"
+        except Exception as e:
+            session.rollback()
+            status = False
+            status_message = f"Error while fetching {model_class.__name__}"
+            logger.error("Error while getting items: " + str(model_class.__name__) + " " + str(e))
+
+        return Response(message=status_message, status=status, data=result)
+
+    async def get_page(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict | None = None,
+        limit: Optional[int] = None,
+        cursor: Optional[int] = None,
+        return_json: bool = False,
+        order: str = "desc",
+    ) -> Response:
+        """List a page of entities without blocking the event loop
+
+        Entities are ordered by id, which follows their creation order, and paged with keyset pagination:
+        a page starts after the entity whose id is `cursor`, so each page is read with an index lookup
+        however far it is in the list.
+
+        Args:
+            model_class: The model class of the entities
+            filters: Column values the entities must have. A list of values matches any of the values.
+            limit: Maximum number of entities in the page. If None, all the remaining entities are returned.
+            cursor: The `next_cursor` of the previous page, or None for the first page
+            return_json: If True, returns the entities as dictionaries
+            order: Order of the entities, "asc" or "desc"
 
-            return Response(message=status_message, status=status, data=result)
+        Returns:
+            Response: Contains status, message and data with the entities in "items",
+                and in "next_cursor" the cursor of the next page, or None if this is the last page
+        """
+        return await self._run_async(
+            functools.partial(
+                self._get_page,
+                model_class=model_class,
+                filters=filters,
+                limit=limit,
+                cursor=cursor,
+                return_json=return_json,
+                order=order,
+            )
+        )
+
+    def _get_page(
+        self,
+        session: Session,
+        model_class: type[BaseDBModel],
+        filters: dict | None,
+        limit: Optional[int],
+        cursor: Optional[int],
+        return_json: bool,
+        order: str,
+    ) -> Response:
+        data: Dict[str, Any] = {"items": [], "next_cursor": None}
+        status = True
+        status_message = ""
+
+        try:
+            conditions = _filter_conditions(model_class, filters)
+            if cursor is not None:
+                conditions.append(model_class.id < cursor if order == "desc" else model_class.id > cursor)  # type: ignore
+            statement = select(model_class)  # type: ignore
+            if conditions:
+                statement = statement.where(and_(*conditions))
+            statement = statement.order_by(getattr(model_class.id, order)())
+            if limit is not None:
+                # Read one more entity to know if there is a next page
+                statement = statement.limit(limit + 1)
+
+            items = list(session.exec(statement).all())
+            if limit is not None and len(items) > limit:
+                items = items[:limit]
+                data["next_cursor"] = items[-1].id
+            data["items"] = [self._model_to_dict(item) if return_json else item for item in items]
+            status_message = f"{model_class.__name__} Retrieved Successfully"
+        except Exception as e:
+            session.rollback()
+            status = False
+            status_message = f"Error while fetching {model_class.__name__}"
+            logger.error("Error while getting items: " + str(model_class.__name__) + " " + str(e))
+
+        return Response(message=status_message, status=status, data=data)
 
     def delete(self, model_class: type[BaseDBModel], filters: dict | None = None) -> Response:
-        """Delete an entity"""
+        """Delete the entities matching the filters with a single DELETE statement"""
+        with Session(self.engine) as session:
+            return self._delete(session, model_class, filters)
+
+    async def delete_async(self, model_class: type[BaseDBModel], filters: dict | None = None) -> Response:
+        """Delete entities without blocking the event loop, see `delete`"""
+        return await self._run_async(functools.partial(self._delete, model_class=model_class, filters=filters))
+
+    def _delete(self, session: Session, model_class: type[BaseDBModel], filters: dict | None) -> Response:
         status_message = ""
         status = True
 
-        with Session(self.engine) as session:
-            try:
-                if "sqlite" in str(self.engine.url):
-                    session.exec(text("PRAGMA foreign_keys=ON"))  # type: ignore
-                statement = select(model_class)  # type: ignore
-                if filters:
-                    conditions = [getattr(model_class, col) == value for col, value in filters.items()]
-                    statement = statement.where(and_(*conditions))
-
-                rows = session.exec(statement).all()
-
-                if rows:
-                    for row in rows:
-                        session.delete(row)
-                    session.commit()
-                    status_message = f"{model_class.__name__} Deleted Successfully"
-                else:
-                    status_message = "Row not found"
-                    logger.info(f"Row with filters {filters} not found")
+        try:
+            if "sqlite" in str(self.engine.url):
+                session.exec(text("PRAGMA foreign_keys=ON"))  # type: ignore
+            statement = delete(model_class)  # type: ignore
+            if filters:
+                statement = statement.where(and_(*_filter_conditions(model_class, filters)))
 
-            except exc.IntegrityError as e:
-                session.rollback()
-                status = False
-                status_message = f"Integrity error: The {model_class.__name__} is linked to another entity and cannot be deleted. {e}"
-                # Log the specific integrity error
-                logger.error(status_message)
-            except Exception as e:
-                session.rollback()
-                status = False
-                status_message = f"Error while deleting: {e}"
-                logger.error(status_message)
+            result = session.exec(statement)  # type: ignore
+            session.commit()
+
+            if result.rowcount:
+                status_message = f"{model_class.__name__} Deleted Successfully"
+            else:
+                status_message = "Row not found"
+                logger.info(f"Row with filters {filters} not found")
+
+        except exc.IntegrityError as e:
+            session.rollback()
+            status = False
+            status_message = (
+                f"Integrity error: The {model_class.__name__} is linked to another entity and cannot be deleted. {e}"
+            )
+            # Log the specific integrity error
+            logger.error(status_message)
+        except Exception as e:
+            session.rollback()
+            status = False
+            status_message = f"Error while deleting: {e}"
+            logger.error(status_message)
 
         return Response(message=status_message, status=status, data=None)
 
@@ -291,7 +499,7 @@ async def import_team(
             # Store in database
             team_db = Team(user_id=user_id, component=config)
 
-            result = self.upsert(team_db)
+            result = await self.upsert_async(team_db)
             return result
 
         except Exception as e:
@@ -342,21 +550,29 @@ async def import_teams_from_directory(
 
     async def _check_team_exists(self, config: dict, user_id: str) -> Optional[Team]:
         """Check if identical team config already exists"""
-        response = self.get(Team, {"user_id": user_id})
-        teams = response.data if response.status and response.data is not None else []
+        response = await self.get_async(Team, {"user_id": user_id, "component_hash": _component_hash(config)})
+        if response.status and response.data:
+            return response.data[0]
 
-        for team in teams:
-            if team.component == config:
-                return team
+        # Teams saved before config hashes were stored have none: compare their configs, and store their hashes
+        # so they are found by hash from now on.
+        response = await self.get_async(Team, {"user_id": user_id, "component_hash": None})
+        existing = None
+        for team in response.data if response.status and response.data is not None else []:
+            if existing is None and team.component == config:
+                existing = team
+            await self.upsert_async(team, return_json=False)
 
-        return None
+        return existing
 
     async def close(self):
         """Close database connections and cleanup resources"""
         logger.info("Closing database connections...")
         try:
-            # Dispose of the SQLAlchemy engine
+            # Dispose of the SQLAlchemy engines
             self.engine.dispose()
+            if self.async_engine is not None:
+                await self.async_engine.dispose()
             logger.info("Database connections closed successfully")
         except Exception as e:
             logger.error(f"Error closing database connections: {str(e)}")
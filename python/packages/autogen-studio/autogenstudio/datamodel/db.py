@@ -51,6 +51,8 @@ class BaseDBModel(SQLModel, table=False):
 class Team(BaseDBModel, table=True):
     __table_args__ = {"sqlite_autoincrement": True}
     component: Union[ComponentModel, dict] = Field(sa_column=Column(JSON))
+    # Hash of the component config, to find teams with identical configs without comparing them
+    component_hash: Optional[str] = Field(default=None, index=True)
 
 
 class Message(BaseDBModel, table=True):
@@ -62,7 +64,9 @@ class Message(BaseDBModel, table=True):
     session_id: Optional[int] = Field(
         default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="NO ACTION"))
     )
-    run_id: Optional[int] = Field(default=None, sa_column=Column(Integer, ForeignKey("run.id", ondelete="CASCADE")))
+    run_id: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, ForeignKey("run.id", ondelete="CASCADE"), index=True)
+    )
 
     message_meta: Optional[Union[MessageMeta, dict]] = Field(default={}, sa_column=Column(JSON))
 
@@ -94,7 +98,8 @@ class Run(BaseDBModel, table=True):
     __table_args__ = {"sqlite_autoincrement": True}
 
     session_id: Optional[int] = Field(
-        default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False)
+        default=None,
+        sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False, index=True),
     )
     status: RunStatus = Field(default=RunStatus.CREATED)
 
@@ -12,7 +12,7 @@
 from autogen_agentchat.base import TaskResult
 from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage
 from autogen_agentchat.teams import BaseGroupChat
-from autogen_core import EVENT_LOGGER_NAME, CancellationToken, ComponentModel
+from autogen_core import EVENT_LOGGER_NAME, CancellationToken, ComponentCache, ComponentModel
 from autogen_core.logging import LLMCallEvent
 
 from ..datamodel.types import EnvironmentVariable, LLMCallEventMessage, TeamResult
@@ -92,7 +92,10 @@ async def _create_team(
             for var in env_vars:
                 os.environ[var.name] = var.value
 
-        self._team = BaseGroupChat.load_component(config)
+        # Agents with identical model client configs share one client. The cache lives for this build only,
+        # as the environment variables the clients are created with can change between runs.
+        with ComponentCache(share_component_types=["model"]).activate():
+            self._team = BaseGroupChat.load_component(config)
 
         for agent in self._team._participants:
             if hasattr(agent, "input_func") and isinstance(agent, UserProxyAgent) and input_func:
@@ -11,6 +11,8 @@ class Settings(BaseSettings):
     CONFIG_DIR: str = "configs"  # Default config directory relative to app_root
     DEFAULT_USER_ID: str = "guestuser@gmail.com"
     UPGRADE_DATABASE: bool = False
+    MESSAGE_BATCH_SIZE: int = 50  # Messages of a run written to the database per transaction
+    MESSAGE_FLUSH_INTERVAL: float = 0.5  # Seconds a run message waits before it is written
 
     model_config = {"env_prefix": "AUTOGENSTUDIO_"}
 
@@ -131,7 +131,11 @@ async def init_managers(database_uri: str, config_dir: str | Path, app_root: str
         await _db_manager.import_teams_from_directory(config_dir, settings.DEFAULT_USER_ID, check_exists=True)
 
         # Initialize connection manager
-        _websocket_manager = WebSocketManager(db_manager=_db_manager)
+        _websocket_manager = WebSocketManager(
+            db_manager=_db_manager,
+            message_batch_size=settings.MESSAGE_BATCH_SIZE,
+            message_flush_interval=settings.MESSAGE_FLUSH_INTERVAL,
+        )
         logger.info("Connection manager initialized")
 
         # Initialize team manager
@@ -33,6 +33,7 @@
     TeamResult,
 )
 from ...teammanager import TeamManager
+from .message_writer import RunMessageWriter
 from .run_context import RunContext
 
 logger = logging.getLogger(__name__)
@@ -41,9 +42,14 @@
 class WebSocketManager:
     """Manages WebSocket connections and message streaming for team task execution"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, message_batch_size: int = 50, message_flush_interval: float = 0.5):
         self.db_manager = db_manager
+        self._message_batch_size = message_batch_size
+        self._message_flush_interval = message_flush_interval
         self._connections: Dict[int, WebSocket] = {}
+        # Runs being streamed, kept for the life of the stream instead of being queried for each message
+        self._runs: Dict[int, Run] = {}
+        self._message_writers: Dict[int, RunMessageWriter] = {}
         self._cancellation_tokens: Dict[int, CancellationToken] = {}
         # Track explicitly closed connections
         self._closed_connections: set[int] = set()
@@ -97,6 +103,13 @@ async def start_stream(
             try:
                 # Update run with task and status
                 run = await self._get_run(run_id)
+                if run is not None:
+                    self._runs[run_id] = run
+                self._message_writers[run_id] = RunMessageWriter(
+                    self.db_manager,
+                    batch_size=self._message_batch_size,
+                    flush_interval=self._message_flush_interval,
+                )
 
                 if run is not None and run.user_id:
                     # get user Settings
@@ -104,7 +117,7 @@ async def start_stream(
                     env_vars = SettingsConfig(**user_settings.config).environment if user_settings else None  # type: ignore
                     run.task = self._convert_images_in_dict(MessageConfig(content=task, source="user").model_dump())
                     run.status = RunStatus.ACTIVE
-                    self.db_manager.upsert(run)
+                    await asyncio.to_thread(self.db_manager.upsert, run)
 
                 input_func = self.create_input_func(run_id)
 
@@ -165,11 +178,15 @@ async def start_stream(
                 await self._handle_stream_error(run_id, e)
             finally:
                 self._cancellation_tokens.pop(run_id, None)
+                message_writer = self._message_writers.pop(run_id, None)
+                if message_writer is not None:
+                    await message_writer.close()
+                self._runs.pop(run_id, None)
 
     async def _save_message(
         self, run_id: int, message: Union[BaseAgentEvent | BaseChatMessage, BaseChatMessage]
     ) -> None:
-        """Save a message to the database"""
+        """Save a message to the database, in the background with the next batch if the run is being streamed"""
 
         run = await self._get_run(run_id)
         if run:
@@ -179,12 +196,23 @@ async def _save_message(
                 config=self._convert_images_in_dict(message.model_dump()),
                 user_id=None,  # You might want to pass this from somewhere
             )
-            self.db_manager.upsert(db_message)
+            message_writer = self._message_writers.get(run_id)
+            if message_writer is not None:
+                message_writer.add(db_message)
+            else:
+                await asyncio.to_thread(self.db_manager.upsert, db_message)
+
+    async def _flush_messages(self, run_id: int) -> None:
+        """Write the buffered messages of a run, so they are saved before the run is updated"""
+        message_writer = self._message_writers.get(run_id)
+        if message_writer is not None:
+            await message_writer.flush()
 
     async def _update_run(
         self, run_id: int, status: RunStatus, team_result: Optional[dict] = None, error: Optional[str] = None
     ) -> None:
         """Update run status and result"""
+        await self._flush_messages(run_id)
         run = await self._get_run(run_id)
         if run:
             run.status = status
@@ -192,7 +220,7 @@ async def _update_run(
                 run.team_result = self._convert_images_in_dict(team_result)
             if error:
                 run.error_message = error
-            self.db_manager.upsert(run)
+            await asyncio.to_thread(self.db_manager.upsert, run)
 
     def create_input_func(self, run_id: int) -> Callable:
         """Creates an input function for a specific run"""
@@ -283,7 +311,7 @@ def _convert_images_in_dict(self, obj: Any) -> Any:
             return [self._convert_images_in_dict(item) for item in obj]
         elif isinstance(obj, AGImage):  # Assuming you've imported AGImage
             # Convert the Image object to a serializable format
-            return {"type": "image", "url": f"data:image/png;base64,{obj.to_base64()}", "alt": "Image"}
+            return {"type": "image", "url": obj.data_uri, "alt": "Image"}
         else:
             return obj
 
@@ -394,7 +422,7 @@ def _format_message(self, message: Any) -> Optional[dict]:
             return None
 
     async def _get_run(self, run_id: int) -> Optional[Run]:
-        """Get run from database
+        """Get run from database, or from the cache while it is being streamed
 
         Args:
             run_id: id of the run to retrieve
@@ -402,7 +430,9 @@ async def _get_run(self, run_id: int) -> Optional[Run]:
         Returns:
             Optional[Run]: Run object if found, None otherwise
         """
-        response = self.db_manager.get(Run, filters={"id": run_id}, return_json=False)
+        if run_id in self._runs:
+            return self._runs[run_id]
+        response = await asyncio.to_thread(self.db_manager.get, Run, filters={"id": run_id}, return_json=False)
         return response.data[0] if response.status and response.data else None
 
     async def _get_settings(self, user_id: str) -> Optional[Settings]:
@@ -412,7 +442,9 @@ async def _get_settings(self, user_id: str) -> Optional[Settings]:
         Returns:
             Optional[dict]: User settings if found, None otherwise
         """
-        response = self.db_manager.get(filters={"user_id": user_id}, model_class=Settings, return_json=False)
+        response = await asyncio.to_thread(
+            self.db_manager.get, filters={"user_id": user_id}, model_class=Settings, return_json=False
+        )
         return response.data[0] if response.status and response.data else None
 
     async def _update_run_status(self, run_id: int, status: RunStatus, error: Optional[str] = None) -> None:
@@ -423,11 +455,12 @@ async def _update_run_status(self, run_id: int, status: RunStatus, error: Option
             status: New status to set
             error: Optional error message
         """
+        await self._flush_messages(run_id)
         run = await self._get_run(run_id)
         if run:
             run.status = status
             run.error_message = error
-            self.db_manager.upsert(run)
+            await asyncio.to_thread(self.db_manager.upsert, run)
 
     async def cleanup(self) -> None:
         """Clean up all active connections and resources when server is shutting down"""
@@ -451,7 +484,8 @@ async def cleanup(self) -> None:
 
                     run.status = RunStatus.STOPPED
                     run.team_result = interrupted_result
-                    self.db_manager.upsert(run)
+                    await self._flush_messages(run_id)
+                    await asyncio.to_thread(self.db_manager.upsert, run)
 
             # Then disconnect all websockets with timeout
             # 10 second timeout for entire cleanup
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+from ...database import DatabaseManager
+from ...datamodel import Message
+
+logger = logging.getLogger(__name__)
+
+
+class RunMessageWriter:
+    """Writes the messages of a run to the database behind the stream.
+
+    Messages are buffered and inserted in batches, each in a single transaction, from a worker thread
+    so the event loop is not blocked. A batch is written once it holds `batch_size` messages,
+    or `flush_interval` seconds after its first message, whichever comes first. Batches are written in order.
+
+    Args:
+        db_manager: Database manager used to insert the messages
+        batch_size: Number of buffered messages that triggers a write
+        flush_interval: Maximum time in seconds a message is buffered before it is written
+    """
+
+    def __init__(self, db_manager: DatabaseManager, batch_size: int = 50, flush_interval: float = 0.5) -> None:
+        self._db_manager = db_manager
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending: List[Message] = []
+        self._batches: asyncio.Queue[List[Message]] = asyncio.Queue()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._writer_task: Optional[asyncio.Task[None]] = None
+        self._closed = False
+
+    def add(self, message: Message) -> None:
+        """Buffer a message to be written with the next batch"""
+        if self._closed:
+            raise RuntimeError("Cannot add a message to a closed message writer")
+        self._pending.append(message)
+        if len(self._pending) >= self._batch_size:
+            self._queue_pending()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._flush_interval, self._queue_pending)
+
+    def _queue_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        self._batches.put_nowait(self._pending)
+        self._pending = []
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._write_batches())
+
+    async def _write_batches(self) -> None:
+        while True:
+            batch = await self._batches.get()
+            try:
+                response = await asyncio.to_thread(self._db_manager.bulk_insert, batch)
+                if not response.status:
+                    logger.error(f"Failed to save {len(batch)} messages: {response.message}")
+            except Exception as e:
+                logger.error(f"Failed to save {len(batch)} messages: {e}")
+            finally:
+                self._batches.task_done()
+
+    async def flush(self) -> None:
+        """Write the buffered messages, and wait until all messages added so far are written"""
+        self._queue_pending()
+        await self._batches.join()
+
+    async def close(self) -> None:
+        """Write the remaining messages and stop accepting new ones"""
+        self._closed = True
+        try:
+            await self.flush()
+        finally:
+            if self._writer_task is not None:
+                self._writer_task.cancel()
+                await asyncio.gather(self._writer_task, return_exceptions=True)
+                self._writer_task = None
@@ -66,6 +66,6 @@ async def delete_gallery_entry(gallery_id: int, user_id: str, db: DatabaseManage
 
     if not result.status or not result.data:
         raise HTTPException(status_code=404, detail="Gallery entry not found")
-    response = db.delete(Gallery, filters={"id": gallery_id})
+    response = await db.delete_async(Gallery, filters={"id": gallery_id})
     # Delete if authorized
     return response
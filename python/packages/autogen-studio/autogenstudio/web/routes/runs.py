@@ -1,7 +1,7 @@
 # /api/runs routes
-from typing import Dict
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from ...datamodel import Message, Run, RunStatus, Session
@@ -21,7 +21,7 @@ async def create_run(
     db=Depends(get_db),
 ) -> Dict:
     """Create a new run with initial state"""
-    session_response = db.get(
+    session_response = await db.get_async(
         Session, filters={"id": request.session_id, "user_id": request.user_id}, return_json=False
     )
     if not session_response.status or not session_response.data:
@@ -29,7 +29,7 @@ async def create_run(
 
     try:
         # Create run with default state
-        run = db.upsert(
+        run = await db.upsert_async(
             Run(
                 session_id=request.session_id,
                 status=RunStatus.CREATED,
@@ -50,7 +50,7 @@ async def create_run(
 @router.get("/{run_id}")
 async def get_run(run_id: int, db=Depends(get_db)) -> Dict:
     """Get run details including task and result"""
-    run = db.get(Run, filters={"id": run_id}, return_json=False)
+    run = await db.get_async(Run, filters={"id": run_id}, return_json=False)
     if not run.status or not run.data:
         raise HTTPException(status_code=404, detail="Run not found")
 
@@ -58,8 +58,15 @@ async def get_run(run_id: int, db=Depends(get_db)) -> Dict:
 
 
 @router.get("/{run_id}/messages")
-async def get_run_messages(run_id: int, db=Depends(get_db)) -> Dict:
-    """Get all messages for a run"""
-    messages = db.get(Message, filters={"run_id": run_id}, order="created_at asc", return_json=False)
+async def get_run_messages(
+    run_id: int, limit: Optional[int] = Query(None, ge=1), cursor: Optional[int] = None, db=Depends(get_db)
+) -> Dict:
+    """Get the messages of a run, oldest first. If `limit` is set, messages are listed in pages:
+    pass the returned `next_cursor` as `cursor` to get the next page."""
+    messages = await db.get_page(
+        Message, filters={"run_id": run_id}, limit=limit, cursor=cursor, order="asc", return_json=False
+    )
+    if not messages.status:
+        raise HTTPException(status_code=500, detail="Database error while fetching messages")
 
-    return {"status": True, "data": messages.data}
+    return {"status": True, "data": messages.data["items"], "next_cursor": messages.data["next_cursor"]}
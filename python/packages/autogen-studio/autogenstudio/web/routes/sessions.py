@@ -1,8 +1,9 @@
 # api/routes/sessions.py
 import re
-from typing import Dict
+from collections import defaultdict
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from loguru import logger
 
 from ...datamodel import Message, Response, Run, Session
@@ -12,16 +13,21 @@
 
 
 @router.get("/")
-async def list_sessions(user_id: str, db=Depends(get_db)) -> Dict:
-    """List all sessions for a user"""
-    response = db.get(Session, filters={"user_id": user_id})
-    return {"status": True, "data": response.data}
+async def list_sessions(
+    user_id: str, limit: Optional[int] = Query(None, ge=1), cursor: Optional[int] = None, db=Depends(get_db)
+) -> Dict:
+    """List the sessions of a user, newest first. If `limit` is set, sessions are listed in pages:
+    pass the returned `next_cursor` as `cursor` to get the next page."""
+    response = await db.get_page(Session, filters={"user_id": user_id}, limit=limit, cursor=cursor)
+    if not response.status:
+        raise HTTPException(status_code=500, detail="Database error while fetching sessions")
+    return {"status": True, "data": response.data["items"], "next_cursor": response.data["next_cursor"]}
 
 
 @router.get("/{session_id}")
 async def get_session(session_id: int, user_id: str, db=Depends(get_db)) -> Dict:
     """Get a specific session"""
-    response = db.get(Session, filters={"id": session_id, "user_id": user_id})
+    response = await db.get_async(Session, filters={"id": session_id, "user_id": user_id})
     if not response.status or not response.data:
         raise HTTPException(status_code=404, detail="Session not found")
     return {"status": True, "data": response.data[0]}
@@ -31,7 +37,7 @@ async def get_session(session_id: int, user_id: str, db=Depends(get_db)) -> Dict
 async def create_session(session: Session, db=Depends(get_db)) -> Response:
     """Create a new session"""
     try:
-        response = db.upsert(session)
+        response = await db.upsert_async(session)
         if not response.status:
             return Response(status=False, message=f"Failed to create session: {response.message}")
         return Response(status=True, data=response.data, message="Session created successfully")
@@ -44,12 +50,12 @@ async def create_session(session: Session, db=Depends(get_db)) -> Response:
 async def update_session(session_id: int, user_id: str, session: Session, db=Depends(get_db)) -> Dict:
     """Update an existing session"""
     # First verify the session belongs to user
-    existing = db.get(Session, filters={"id": session_id, "user_id": user_id})
+    existing = await db.get_async(Session, filters={"id": session_id, "user_id": user_id})
     if not existing.status or not existing.data:
         raise HTTPException(status_code=404, detail="Session not found")
 
     # Update the session
-    response = db.upsert(session)
+    response = await db.upsert_async(session)
     if not response.status:
         raise HTTPException(status_code=400, detail=response.message)
 
@@ -59,65 +65,78 @@ async def update_session(session_id: int, user_id: str, session: Session, db=Dep
 @router.delete("/{session_id}")
 async def delete_session(session_id: int, user_id: str, db=Depends(get_db)) -> Dict:
     """Delete a session"""
-    db.delete(filters={"id": session_id, "user_id": user_id}, model_class=Session)
+    await db.delete_async(filters={"id": session_id, "user_id": user_id}, model_class=Session)
     return {"status": True, "message": "Session deleted successfully"}
 
 
 @router.get("/{session_id}/runs")
-async def list_session_runs(session_id: int, user_id: str, db=Depends(get_db)) -> Dict:
-    """Get complete session history organized by runs"""
+async def list_session_runs(
+    session_id: int,
+    user_id: str,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[int] = None,
+    db=Depends(get_db),
+) -> Dict:
+    """Get session history organized by runs, oldest first. If `limit` is set, runs are listed in pages:
+    pass the returned `next_cursor` as `cursor` to get the next page."""
 
     try:
         # 1. Verify session exists and belongs to user
-        session = db.get(Session, filters={"id": session_id, "user_id": user_id}, return_json=False)
+        session = await db.get_async(Session, filters={"id": session_id, "user_id": user_id}, return_json=False)
         if not session.status:
             raise HTTPException(status_code=500, detail="Database error while fetching session")
         if not session.data:
             raise HTTPException(status_code=404, detail="Session not found or access denied")
 
         # 2. Get ordered runs for session
-        runs = db.get(Run, filters={"session_id": session_id}, order="asc", return_json=False)
+        runs = await db.get_page(
+            Run, filters={"session_id": session_id}, limit=limit, cursor=cursor, order="asc", return_json=False
+        )
         if not runs.status:
             raise HTTPException(status_code=500, detail="Database error while fetching runs")
 
-        # 3. Build response with messages per run
+        # 3. Get the messages of all the runs in one query
+        messages_by_run: Dict[int, List[Message]] = defaultdict(list)
+        messages_error: Optional[str] = None
+        run_ids = [run.id for run in runs.data["items"]]
+        if run_ids:  # It's ok to have no runs
+            messages = await db.get_async(Message, filters={"run_id": run_ids}, order="asc", return_json=False)
+            if messages.status:
+                for message in messages.data:
+                    messages_by_run[message.run_id].append(message)
+            else:
+                logger.error(f"Failed to fetch messages for runs of session {session_id}")
+                messages_error = messages.message
+
+        # 4. Build response with messages per run
         run_data = []
-        if runs.data:  # It's ok to have no runs
-            for run in runs.data:
-                try:
-                    # Get messages for this specific run
-                    messages = db.get(Message, filters={"run_id": run.id}, order="asc", return_json=False)
-                    if not messages.status:
-                        logger.error(f"Failed to fetch messages for run {run.id}")
-                        # Continue processing other runs even if one fails
-                        messages.data = []
-
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": run.status,
-                            "task": run.task,
-                            "team_result": run.team_result,
-                            "messages": messages.data or [],
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Error processing run {run.id}: {str(e)}")
-                    # Include run with error state instead of failing entirely
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": "ERROR",
-                            "task": run.task,
-                            "team_result": None,
-                            "messages": [],
-                            "error": f"Failed to process run: {str(e)}",
-                        }
-                    )
-
-        return {"status": True, "data": {"runs": run_data}}
+        for run in runs.data["items"]:
+            if messages_error is None:
+                run_data.append(
+                    {
+                        "id": str(run.id),
+                        "created_at": run.created_at,
+                        "status": run.status,
+                        "task": run.task,
+                        "team_result": run.team_result,
+                        "messages": messages_by_run[run.id],
+                    }
+                )
+            else:
+                # Include run with error state instead of failing entirely
+                run_data.append(
+                    {
+                        "id": str(run.id),
+                        "created_at": run.created_at,
+                        "status": "ERROR",
+                        "task": run.task,
+                        "team_result": None,
+                        "messages": [],
+                        "error": f"Failed to process run: {messages_error}",
+                    }
+                )
+
+        return {"status": True, "data": {"runs": run_data, "next_cursor": runs.data["next_cursor"]}}
 
     except HTTPException:
         raise  # Re-raise HTTP exceptions
@@ -46,5 +46,5 @@ async def create_team(team: Team, db=Depends(get_db)) -> Dict:
 @router.delete("/{team_id}")
 async def delete_team(team_id: int, user_id: str, db=Depends(get_db)) -> Dict:
     """Delete a team"""
-    db.delete(filters={"id": team_id, "user_id": user_id}, model_class=Team)
+    await db.delete_async(filters={"id": team_id, "user_id": user_id}, model_class=Team)
     return {"status": True, "message": "Team deleted successfully"}
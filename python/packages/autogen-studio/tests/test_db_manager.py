@@ -9,6 +9,7 @@
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_agentchat.conditions import TextMentionTermination
 from autogenstudio.datamodel.db import Team, Session as SessionModel, Run, Message, RunStatus, MessageConfig
+from autogenstudio.web.managers.message_writer import RunMessageWriter
 
 
 @pytest.fixture
@@ -167,6 +168,160 @@ def test_cascade_delete(self, test_db: DatabaseManager, test_user: str):
         # Clean up
         test_db.delete(Team, {"id": team1.id})
 
+    def test_bulk_insert(self, test_db: DatabaseManager, test_user: str):
+        """Test inserting many messages in a single transaction"""
+        team = Team(user_id=test_user, component={"name": "Team", "type": "team"})
+        test_db.upsert(team)
+        session = SessionModel(user_id=test_user, team_id=team.id, name="Session")
+        test_db.upsert(session)
+        run = Run(
+            user_id=test_user,
+            session_id=session.id,
+            status=RunStatus.ACTIVE,
+            task=MessageConfig(content="Task", source="user").model_dump(),
+        )
+        test_db.upsert(run)
+
+        messages = [
+            Message(
+                user_id=test_user,
+                session_id=session.id,
+                run_id=run.id,
+                config=MessageConfig(content=f"Message{i}", source="assistant").model_dump(),
+            )
+            for i in range(5)
+        ]
+        response = test_db.bulk_insert(messages)
+        assert response.status is True
+        assert all(message.id is not None for message in messages)
+
+        result = test_db.get(Message, {"run_id": run.id}, order="asc")
+        assert [message.config["content"] for message in result.data] == [f"Message{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_run_message_writer(self, test_db: DatabaseManager, test_user: str):
+        """Test that run messages are written in order, in batches or after the flush interval"""
+        team = Team(user_id=test_user, component={"name": "Team", "type": "team"})
+        test_db.upsert(team)
+        session = SessionModel(user_id=test_user, team_id=team.id, name="Session")
+        test_db.upsert(session)
+        run = Run(
+            user_id=test_user,
+            session_id=session.id,
+            status=RunStatus.ACTIVE,
+            task=MessageConfig(content="Task", source="user").model_dump(),
+        )
+        test_db.upsert(run)
+
+        def make_message(i: int) -> Message:
+            return Message(
+                session_id=session.id,
+                run_id=run.id,
+                config=MessageConfig(content=f"Message{i}", source="assistant").model_dump(),
+            )
+
+        def saved_contents() -> list[str]:
+            result = test_db.get(Message, {"run_id": run.id}, order="asc")
+            return [message.config["content"] for message in result.data]
+
+        writer = RunMessageWriter(test_db, batch_size=3, flush_interval=0.1)
+        for i in range(4):
+            writer.add(make_message(i))
+        # The first batch is full, so it is written right away.
+        await asyncio.sleep(0.05)
+        assert saved_contents() == [f"Message{i}" for i in range(3)]
+        # The rest is written after the flush interval.
+        await asyncio.sleep(0.2)
+        assert saved_contents() == [f"Message{i}" for i in range(4)]
+
+        writer.add(make_message(4))
+        await writer.close()
+        assert saved_contents() == [f"Message{i}" for i in range(5)]
+        with pytest.raises(RuntimeError):
+            writer.add(make_message(5))
+
+    @pytest.mark.asyncio
+    async def test_async_operations(self, test_db: DatabaseManager, test_user: str):
+        """Test the async variants of upsert, get and delete"""
+        assert test_db.async_engine is not None
+
+        team = Team(user_id=test_user, component={"name": "AsyncTeam", "type": "team"})
+        response = await test_db.upsert_async(team)
+        assert response.status is True
+        team_id = response.data["id"]
+
+        response = await test_db.get_async(Team, {"id": team_id})
+        assert response.status is True
+        assert response.data[0].component == {"name": "AsyncTeam", "type": "team"}
+
+        response = await test_db.delete_async(Team, {"id": team_id})
+        assert response.status is True
+        assert "Deleted Successfully" in response.message
+        response = await test_db.get_async(Team, {"id": team_id})
+        assert response.data == []
+
+        response = await test_db.delete_async(Team, {"id": team_id})
+        assert response.message == "Row not found"
+
+    @pytest.mark.asyncio
+    async def test_get_page(self, test_db: DatabaseManager, test_user: str):
+        """Test listing entities in pages with a cursor"""
+        session_ids = []
+        for i in range(5):
+            session = SessionModel(user_id=test_user, name=f"Session{i}")
+            test_db.upsert(session)
+            session_ids.append(session.id)
+        test_db.upsert(SessionModel(user_id="other_user", name="Other"))
+
+        listed_ids = []
+        cursor = None
+        pages = 0
+        while True:
+            response = await test_db.get_page(SessionModel, {"user_id": test_user}, limit=2, cursor=cursor)
+            assert response.status is True
+            assert len(response.data["items"]) <= 2
+            listed_ids.extend(session.id for session in response.data["items"])
+            pages += 1
+            cursor = response.data["next_cursor"]
+            if cursor is None:
+                break
+        assert pages == 3
+        assert listed_ids == list(reversed(session_ids))
+
+        response = await test_db.get_page(SessionModel, {"user_id": test_user}, order="asc", return_json=True)
+        assert [session["id"] for session in response.data["items"]] == session_ids
+        assert response.data["next_cursor"] is None
+
+        response = await test_db.get_page(SessionModel, {"id": session_ids[1:3]}, order="asc")
+        assert [session.id for session in response.data["items"]] == session_ids[1:3]
+
+    @pytest.mark.asyncio
+    async def test_import_team_dedupe(self, test_db: DatabaseManager, test_user: str):
+        """Test that identical team configs are found by their hash"""
+        config = {"provider": "autogen_agentchat.teams.RoundRobinGroupChat", "config": {"participants": []}}
+
+        response = await test_db.import_team(config, test_user, check_exists=True)
+        assert response.status is True
+        team_id = response.data["id"]
+        assert response.data["component_hash"] is not None
+
+        # Keys in a different order are the same config
+        reordered_config = {"config": {"participants": []}, "provider": config["provider"]}
+        response = await test_db.import_team(reordered_config, test_user, check_exists=True)
+        assert response.message == "Identical team configuration already exists"
+        assert response.data["id"] == team_id
+
+        # Teams saved without a hash are still found, and get their hash stored
+        with Session(test_db.engine) as session:
+            session.execute(text("UPDATE team SET component_hash = NULL"))
+            session.commit()
+        response = await test_db.import_team(config, test_user, check_exists=True)
+        assert response.data["id"] == team_id
+        assert test_db.get(Team, {"id": team_id}).data[0].component_hash is not None
+
+        response = await test_db.import_team(config, "other_user", check_exists=True)
+        assert response.data["id"] != team_id
+
     def test_initialize_database_scenarios(self, tmp_path, monkeypatch):
         """Test different initialize_database parameters"""
         db_path = tmp_path / "test_init.db"